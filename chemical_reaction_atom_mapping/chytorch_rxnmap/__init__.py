@@ -1,3 +1,3 @@
 """ The 'chemical_reaction_atom_mapping.chytorch_rxnmap' package initialization module. """
 
-from .atom_mapping import ChytorchRxnMapReactionAtomMappingUtilities
+from .atom_mapping import ChytorchRxnMapReactionAtomMapper, ChytorchRxnMapReactionAtomMappingUtilities
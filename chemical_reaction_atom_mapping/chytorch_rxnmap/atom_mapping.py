@@ -1,27 +1,80 @@
 """ The 'chemical_reaction_atom_mapping.chytorch_rxnmap' package 'atom_mapping' module. """
 
 from functools import partial
+from itertools import chain, islice
 from logging import getLogger
-from typing import Iterable, List, Optional, Tuple
+from math import inf
+from typing import Any, Collection, Dict, Iterable, Iterator, List, Optional, Tuple
 from warnings import filterwarnings
 
-from chython.files.daylight.smiles import smiles
-
+from ..utilities.atom_mapper import ReactionAtomMapper
+from ..utilities.caching import AtomMappingResultCache
+from ..utilities.instrumentation import InstrumentationUtilities
 from ..utilities.multiprocessing import MultiprocessingUtilities
+from ..utilities.spectator_compounds import SpectatorCompoundUtilities
 
 
 class ChytorchRxnMapReactionAtomMappingUtilities:
     """ The Chytorch RxnMap library chemical reaction atom mapping utilities class. """
 
+    # ------------------------------------------------------------------------------------------------------------------
+    #  The batched atom mapping relies on the private attributes of the 'chython.algorithms.mapping.attention.Attention'
+    #  class and on the collation utilities of the 'chytorch.utils.data' module, which were verified against these
+    #  versions of the libraries. If any of them is missing, the chemical reaction SMILES strings are mapped one by one.
+    # ------------------------------------------------------------------------------------------------------------------
+
+    _batched_atom_mapping_library_versions = {
+        "chython": "1.75",
+        "chytorch": "1.65",
+    }
+
+    _batched_atom_mapping_attention_attribute_names = (
+        "_Attention__attention_model",
+        "_Attention__autocast",
+        "_Attention__get_attention",
+    )
+
+    @staticmethod
+    def _initialize_worker_process(
+            number_of_threads: int
+    ) -> None:
+        """
+        Initialize a worker process by limiting the number of PyTorch intra-op threads, so that the worker processes do
+        not oversubscribe the CPU cores, and by loading the Chytorch RxnMap model once with a warm-up atom mapping.
+
+        :parameter number_of_threads: The number of PyTorch intra-op threads of the worker process.
+        """
+
+        from torch import set_num_threads
+
+        set_num_threads(number_of_threads)
+
+        filterwarnings(
+            action="ignore"
+        )
+
+        ChytorchRxnMapReactionAtomMappingUtilities.run_atom_mapping_on_reaction_smiles(
+            reaction_smiles="CCO>>CC=O"
+        )
+
     @staticmethod
     def run_atom_mapping_on_reaction_smiles(
             reaction_smiles: str,
+            strip_unchanged_compounds: bool = False,
+            reagent_smiles_strings: Optional[Collection[str]] = None,
             **kwargs
     ) -> Tuple[Optional[str], Optional[float]]:
         """
         Run the Chytorch RxnMap library atom mapping on a chemical reaction SMILES string.
 
         :parameter reaction_smiles: The chemical reaction SMILES string.
+        :parameter strip_unchanged_compounds: The indicator whether the chemical compounds that appear unchanged on both
+                                              sides of the chemical reaction should be stripped before the atom mapping
+                                              and restored without the atom map numbers afterwards.
+        :parameter reagent_smiles_strings: The known reagent chemical compound SMILES strings, such as the solvents and
+                                           the catalysts, that should be stripped from the reactants and the agents
+                                           before the atom mapping and restored without the atom map numbers
+                                           afterwards.
         :parameter kwargs: The default keyword arguments for the adjustment of underlying functions:
                            'chython.files.daylight.smiles.{smiles}' and
                            'chython.algorithms.mapping.attention.Attention.{reset_mapping}'.
@@ -29,26 +82,48 @@ class ChytorchRxnMapReactionAtomMappingUtilities:
         :returns: The mapped chemical reaction SMILES string, and the Chytorch RxnMap library atom mapping score.
         """
 
-        try:
-            reaction_chytorch_rxnmap_rxn = smiles(
-                reaction_smiles,
-                ignore=kwargs["ignore"] if "ignore" in kwargs.keys() else True,
-                remap=kwargs["remap"] if "remap" in kwargs.keys() else False,
-                ignore_stereo=kwargs["ignore_stereo"] if "ignore_stereo" in kwargs.keys() else False,
-                ignore_bad_isotopes=kwargs["ignore_bad_isotopes"] if "ignore_bad_isotopes" in kwargs.keys() else False,
-                keep_implicit=kwargs["keep_implicit"] if "keep_implicit" in kwargs.keys() else False,
-                ignore_carbon_radicals=kwargs["ignore_carbon_radicals"]
-                if "ignore_carbon_radicals" in kwargs.keys() else False
+        if strip_unchanged_compounds or reagent_smiles_strings:
+            return SpectatorCompoundUtilities.run_on_reaction_smiles_with_spectator_compound_stripping(
+                reaction_smiles=reaction_smiles,
+                atom_mapping_procedure=partial(
+                    ChytorchRxnMapReactionAtomMappingUtilities.run_atom_mapping_on_reaction_smiles,
+                    **kwargs
+                ),
+                strip_unchanged_compounds=strip_unchanged_compounds,
+                reagent_smiles_strings=reagent_smiles_strings
             )
 
-            chytorch_rxnmap_atom_mapping_score = reaction_chytorch_rxnmap_rxn.reset_mapping(
-                return_score=True,
-                multiplier=kwargs["multiplier"] if "multiplier" in kwargs.keys() else 1.75,
-                keep_reactants_numbering=kwargs["keep_reactants_numbering"]
-                if "keep_reactants_numbering" in kwargs.keys() else False
-            )
+        from chython.files.daylight.smiles import smiles
 
-            mapped_reaction_smiles = format(reaction_chytorch_rxnmap_rxn, "m")
+        try:
+            with InstrumentationUtilities.measure("chytorch_rxnmap.parsing"):
+                reaction_chytorch_rxnmap_rxn = smiles(
+                    reaction_smiles,
+                    ignore=kwargs["ignore"] if "ignore" in kwargs.keys() else True,
+                    remap=kwargs["remap"] if "remap" in kwargs.keys() else False,
+                    ignore_stereo=kwargs["ignore_stereo"] if "ignore_stereo" in kwargs.keys() else False,
+                    ignore_bad_isotopes=kwargs["ignore_bad_isotopes"]
+                    if "ignore_bad_isotopes" in kwargs.keys() else False,
+                    keep_implicit=kwargs["keep_implicit"] if "keep_implicit" in kwargs.keys() else False,
+                    ignore_carbon_radicals=kwargs["ignore_carbon_radicals"]
+                    if "ignore_carbon_radicals" in kwargs.keys() else False
+                )
+
+            with InstrumentationUtilities.measure("chytorch_rxnmap.atom_mapping"):
+                chytorch_rxnmap_atom_mapping_score = reaction_chytorch_rxnmap_rxn.reset_mapping(
+                    return_score=True,
+                    multiplier=kwargs["multiplier"] if "multiplier" in kwargs.keys() else 1.75,
+                    keep_reactants_numbering=kwargs["keep_reactants_numbering"]
+                    if "keep_reactants_numbering" in kwargs.keys() else False
+                )
+
+            with InstrumentationUtilities.measure("chytorch_rxnmap.canonicalization"):
+                mapped_reaction_smiles = format(reaction_chytorch_rxnmap_rxn, "m")
+
+            if not mapped_reaction_smiles:
+                InstrumentationUtilities.increment(
+                    counter_name="chytorch_rxnmap.empty_outputs"
+                )
 
             return mapped_reaction_smiles, chytorch_rxnmap_atom_mapping_score
 
@@ -57,17 +132,288 @@ class ChytorchRxnMapReactionAtomMappingUtilities:
                 "{0}.ChytorchRxnMapReactionAtomMappingUtilities.run_atom_mapping_on_reaction_smiles".format(__name__)
             ).exception(exception_handle)
 
+            InstrumentationUtilities.increment(
+                counter_name="chytorch_rxnmap.failures"
+            )
+
             return None, None
 
+    @staticmethod
+    def _get_reaction_smiles_batches(
+            reaction_smiles_strings: Iterable[str],
+            chytorch_rxnmap_model_batch_size: int
+    ) -> Iterator[List[str]]:
+        """
+        Get the batches of the chemical reaction SMILES strings.
+
+        :parameter reaction_smiles_strings: The chemical reaction SMILES strings.
+        :parameter chytorch_rxnmap_model_batch_size: The number of chemical reaction SMILES strings per batch.
+
+        :returns: The iterator of the batches of the chemical reaction SMILES strings.
+        """
+
+        reaction_smiles_strings = iter(reaction_smiles_strings)
+
+        while True:
+            reaction_smiles_batch = list(islice(reaction_smiles_strings, max(1, chytorch_rxnmap_model_batch_size)))
+
+            if len(reaction_smiles_batch) == 0:
+                return
+
+            yield reaction_smiles_batch
+
+    @staticmethod
+    def _get_attention_matrices(
+            reactions: List[Any]
+    ) -> List[Any]:
+        """
+        Get the attention matrices of chemical reactions using a single forward pass of the Chytorch RxnMap model.
+
+        The chemical reaction graphs are collated into padded tensors, and the padding is masked out of the attention
+        in the same way as the per-reaction forward pass of the 'chytorch.zoo.rxnmap.Model' model does it for the
+        hidden molecule tokens.
+
+        :parameter reactions: The 'chython.ReactionContainer' chemical reactions.
+
+        :returns: The attention matrices of the chemical reactions.
+        """
+
+        from torch import float as torch_float, no_grad, zeros_like
+        from chytorch.utils.data import ReactionEncoderDataset, collate_encoded_reactions
+
+        chytorch_rxnmap_model = reactions[0]._Attention__attention_model
+
+        reaction_data_points = [
+            reaction_data_point for reaction_data_point in ReactionEncoderDataset(reactions)
+        ]
+
+        with no_grad(), reactions[0]._Attention__autocast:
+            atoms, neighbors, distances, roles = collate_encoded_reactions(
+                reaction_data_points
+            ).to(chytorch_rxnmap_model.role_encoder.weight.device)
+
+            number_of_tokens = atoms.size(1)
+
+            attention_mask = zeros_like(roles, dtype=torch_float).masked_fill_(roles == 0, -inf).view(
+                -1, 1, 1, number_of_tokens
+            ).expand(-1, chytorch_rxnmap_model.nhead, number_of_tokens, -1)
+
+            x = chytorch_rxnmap_model.molecule_encoder((atoms, neighbors, distances)) * (roles > 1).unsqueeze_(-1)
+            x = x + chytorch_rxnmap_model.role_encoder(roles)
+
+            for chytorch_rxnmap_model_layer in chytorch_rxnmap_model.layers[:-1]:
+                x, _ = chytorch_rxnmap_model_layer(x, attention_mask)
+
+            _, attention = chytorch_rxnmap_model.layers[-1](
+                x,
+                attention_mask,
+                need_embedding=False,
+                need_weights=True
+            )
+
+            attention = attention.float().cpu().numpy()
+
+        return [
+            attention[reaction_index, :len(reaction_data_point.roles), :len(reaction_data_point.roles)]
+            for reaction_index, reaction_data_point in enumerate(reaction_data_points)
+        ]
+
+    @staticmethod
+    def _is_batched_atom_mapping_supported() -> bool:
+        """
+        Check whether the installed Chython and Chytorch libraries provide the internals that the batched atom mapping
+        relies on.
+
+        :returns: The indicator whether the batched atom mapping is supported.
+        """
+
+        try:
+            from chython.algorithms.mapping.attention import Attention
+            from chytorch.utils import data
+
+        except ImportError:
+            return False
+
+        if not all(
+            hasattr(Attention, attention_attribute_name)
+            for attention_attribute_name in ChytorchRxnMapReactionAtomMappingUtilities.
+            _batched_atom_mapping_attention_attribute_names
+        ):
+            return False
+
+        return hasattr(data, "ReactionEncoderDataset") and hasattr(data, "collate_encoded_reactions")
+
+    @staticmethod
+    def _set_precomputed_attention_matrix(
+            reaction: Any,
+            attention_matrix: Any
+    ) -> None:
+        """
+        Make the 'chython.algorithms.mapping.attention.Attention.{reset_mapping}' function use the precomputed attention
+        matrix of a chemical reaction instead of running a forward pass of the Chytorch RxnMap model. The attention
+        matrix is only set on the chemical reaction instance, so the other chemical reactions are not affected.
+
+        :parameter reaction: The 'chython.ReactionContainer' chemical reaction.
+        :parameter attention_matrix: The precomputed attention matrix of the chemical reaction.
+        """
+
+        setattr(reaction, "_Attention__get_attention", lambda: attention_matrix)
+
+    @staticmethod
+    def _run_atom_mapping_on_reaction_smiles_batch(
+            reaction_smiles_batch: List[str],
+            **kwargs
+    ) -> List[Tuple[Optional[str], Optional[float]]]:
+        """
+        Run the Chytorch RxnMap library atom mapping on a batch of chemical reaction SMILES strings using a single
+        forward pass of the Chytorch RxnMap model.
+
+        :parameter reaction_smiles_batch: The batch of chemical reaction SMILES strings.
+        :parameter kwargs: The default keyword arguments for the adjustment of underlying functions:
+                           'chython.files.daylight.smiles.{smiles}' and
+                           'chython.algorithms.mapping.attention.Attention.{reset_mapping}'.
+
+        :returns: The mapped chemical reaction SMILES strings, and the Chytorch RxnMap library atom mapping scores.
+        """
+
+        logger = getLogger(
+            "{0}.ChytorchRxnMapReactionAtomMappingUtilities._run_atom_mapping_on_reaction_smiles_batch".format(__name__)
+        )
+
+        from chython.files.daylight.smiles import smiles
+
+        reactions = list()
+
+        for reaction_smiles in reaction_smiles_batch:
+            try:
+                with InstrumentationUtilities.measure("chytorch_rxnmap.parsing"):
+                    reactions.append(smiles(
+                        reaction_smiles,
+                        ignore=kwargs["ignore"] if "ignore" in kwargs.keys() else True,
+                        remap=kwargs["remap"] if "remap" in kwargs.keys() else False,
+                        ignore_stereo=kwargs["ignore_stereo"] if "ignore_stereo" in kwargs.keys() else False,
+                        ignore_bad_isotopes=kwargs["ignore_bad_isotopes"]
+                        if "ignore_bad_isotopes" in kwargs.keys() else False,
+                        keep_implicit=kwargs["keep_implicit"] if "keep_implicit" in kwargs.keys() else False,
+                        ignore_carbon_radicals=kwargs["ignore_carbon_radicals"]
+                        if "ignore_carbon_radicals" in kwargs.keys() else False
+                    ))
+
+            except Exception as exception_handle:
+                logger.exception(exception_handle)
+
+                InstrumentationUtilities.increment(
+                    counter_name="chytorch_rxnmap.failures"
+                )
+
+                reactions.append(None)
+
+        attention_matrices = dict()
+
+        try:
+            parsed_reactions = [reaction for reaction in reactions if reaction is not None]
+
+            if len(parsed_reactions) > 0:
+                with InstrumentationUtilities.measure("chytorch_rxnmap.inference"):
+                    attention_matrices = dict(zip(
+                        map(id, parsed_reactions),
+                        ChytorchRxnMapReactionAtomMappingUtilities._get_attention_matrices(
+                            reactions=parsed_reactions
+                        )
+                    ))
+
+        except Exception as exception_handle:
+            logger.exception(exception_handle)
+
+        atom_mapping_results = list()
+
+        for reaction in reactions:
+            if reaction is None:
+                atom_mapping_results.append((None, None))
+
+                continue
+
+            if id(reaction) in attention_matrices.keys():
+                ChytorchRxnMapReactionAtomMappingUtilities._set_precomputed_attention_matrix(
+                    reaction=reaction,
+                    attention_matrix=attention_matrices[id(reaction)]
+                )
+
+            try:
+                with InstrumentationUtilities.measure("chytorch_rxnmap.atom_mapping"):
+                    chytorch_rxnmap_atom_mapping_score = reaction.reset_mapping(
+                        return_score=True,
+                        multiplier=kwargs["multiplier"] if "multiplier" in kwargs.keys() else 1.75,
+                        keep_reactants_numbering=kwargs["keep_reactants_numbering"]
+                        if "keep_reactants_numbering" in kwargs.keys() else False
+                    )
+
+                with InstrumentationUtilities.measure("chytorch_rxnmap.canonicalization"):
+                    mapped_reaction_smiles = format(reaction, "m")
+
+                if not mapped_reaction_smiles:
+                    InstrumentationUtilities.increment(
+                        counter_name="chytorch_rxnmap.empty_outputs"
+                    )
+
+                atom_mapping_results.append((mapped_reaction_smiles, chytorch_rxnmap_atom_mapping_score))
+
+            except Exception as exception_handle:
+                logger.exception(exception_handle)
+
+                InstrumentationUtilities.increment(
+                    counter_name="chytorch_rxnmap.failures"
+                )
+
+                atom_mapping_results.append((None, None))
+
+        return atom_mapping_results
+
     @staticmethod
     def run_atom_mapping_on_reaction_smiles_strings(
             reaction_smiles_strings: Iterable[str],
+            number_of_cpu_cores: int = 1,
+            task_timeout_period_s: Optional[float] = None,
+            use_shared_memory: bool = False,
+            chytorch_rxnmap_model_batch_size: Optional[int] = None,
+            strip_unchanged_compounds: bool = False,
+            reagent_smiles_strings: Optional[Collection[str]] = None,
+            deduplication_mode: Optional[str] = None,
+            atom_mapping_cache: Optional[AtomMappingResultCache] = None,
             **kwargs
     ) -> List[Tuple[Optional[str], Optional[float]]]:
         """
         Run the Chytorch RxnMap library atom mapping on chemical reaction SMILES strings.
 
         :parameter reaction_smiles_strings: The chemical reaction SMILES strings.
+        :parameter number_of_cpu_cores: The number of CPU cores that should be utilized. Each worker process loads the
+                                        Chytorch RxnMap model once, and utilizes a single PyTorch intra-op thread
+                                        because the process pool starts a worker process per CPU core.
+        :parameter task_timeout_period_s: The maximum amount of time in seconds that may be spent on a chemical
+                                          reaction SMILES string before its worker process is killed and replaced. If
+                                          not specified, the atom mapping procedure is not interrupted. If the
+                                          chemical reaction SMILES strings are batched, the timeout period applies to
+                                          the whole batch.
+        :parameter use_shared_memory: The indicator whether the chemical reaction SMILES strings and the atom mapping
+                                      results should be exchanged with the worker processes through shared memory
+                                      buffers instead of the pipes of the process pool. The indicator is ignored if the
+                                      chemical reaction SMILES strings are batched.
+        :parameter chytorch_rxnmap_model_batch_size: The number of chemical reaction SMILES strings that are passed
+                                                     through the Chytorch RxnMap model in a single forward pass. If not
+                                                     specified, each chemical reaction SMILES string is passed through
+                                                     the Chytorch RxnMap model separately.
+        :parameter strip_unchanged_compounds: The indicator whether the chemical compounds that appear unchanged on both
+                                              sides of the chemical reactions should be stripped before the atom
+                                              mapping and restored without the atom map numbers afterwards.
+        :parameter reagent_smiles_strings: The known reagent chemical compound SMILES strings, such as the solvents and
+                                           the catalysts, that should be stripped from the reactants and the agents
+                                           before the atom mapping and restored without the atom map numbers
+                                           afterwards.
+        :parameter deduplication_mode: The indicator how the duplicate chemical reaction SMILES strings should be
+                                       identified before the atom mapping: 'exact' or 'canonical'. If not specified,
+                                       the chemical reaction SMILES strings are not deduplicated.
+        :parameter atom_mapping_cache: The chemical reaction atom mapping result cache that should be consulted before
+                                       the Chytorch RxnMap library is utilized.
         :parameter kwargs: The default keyword arguments for the adjustment of underlying functions:
                            'chython.files.daylight.smiles.{smiles}' and
                            'chython.algorithms.mapping.attention.Attention.{reset_mapping}'.
@@ -75,15 +421,178 @@ class ChytorchRxnMapReactionAtomMappingUtilities:
         :returns: The mapped chemical reaction SMILES strings, and the Chytorch RxnMap library atom mapping scores.
         """
 
+        if deduplication_mode is not None or atom_mapping_cache is not None:
+            return ChytorchRxnMapReactionAtomMapper(
+                strip_unchanged_compounds=strip_unchanged_compounds,
+                reagent_smiles_strings=reagent_smiles_strings,
+                **kwargs
+            ).map_batch(
+                reaction_smiles_strings=reaction_smiles_strings,
+                number_of_cpu_cores=number_of_cpu_cores,
+                batch_size=chytorch_rxnmap_model_batch_size,
+                task_timeout_period_s=task_timeout_period_s,
+                deduplication_mode=deduplication_mode,
+                atom_mapping_cache=atom_mapping_cache,
+                use_shared_memory=use_shared_memory
+            )
+
+        if strip_unchanged_compounds or reagent_smiles_strings:
+            return SpectatorCompoundUtilities.run_with_spectator_compound_stripping(
+                reaction_smiles_strings=reaction_smiles_strings,
+                atom_mapping_procedure=partial(
+                    ChytorchRxnMapReactionAtomMappingUtilities.run_atom_mapping_on_reaction_smiles_strings,
+                    number_of_cpu_cores=number_of_cpu_cores,
+                    task_timeout_period_s=task_timeout_period_s,
+                    use_shared_memory=use_shared_memory,
+                    chytorch_rxnmap_model_batch_size=chytorch_rxnmap_model_batch_size,
+                    **kwargs
+                ),
+                strip_unchanged_compounds=strip_unchanged_compounds,
+                reagent_smiles_strings=reagent_smiles_strings
+            )
+
         filterwarnings(
             action="ignore"
         )
 
+        if chytorch_rxnmap_model_batch_size is not None and \
+                not ChytorchRxnMapReactionAtomMappingUtilities._is_batched_atom_mapping_supported():
+            getLogger(
+                "{0}.ChytorchRxnMapReactionAtomMappingUtilities.run_atom_mapping_on_reaction_smiles_strings".format(
+                    __name__
+                )
+            ).warning(
+                "The installed Chython and Chytorch libraries do not provide the internals of the batched atom "
+                "mapping, which was verified against the versions {0}. The chemical reaction SMILES strings are mapped "
+                "one by one.".format(ChytorchRxnMapReactionAtomMappingUtilities._batched_atom_mapping_library_versions)
+            )
+
+            chytorch_rxnmap_model_batch_size = None
+
+        if chytorch_rxnmap_model_batch_size is not None:
+            reaction_smiles_batches = list(ChytorchRxnMapReactionAtomMappingUtilities._get_reaction_smiles_batches(
+                reaction_smiles_strings=reaction_smiles_strings,
+                chytorch_rxnmap_model_batch_size=chytorch_rxnmap_model_batch_size
+            ))
+
+            atom_mapping_results = MultiprocessingUtilities.run_with_progress_bar(
+                processing_procedure=partial(
+                    ChytorchRxnMapReactionAtomMappingUtilities._run_atom_mapping_on_reaction_smiles_batch,
+                    **kwargs
+                ),
+                primary_input_argument=reaction_smiles_batches,
+                description_message="Mapping the chemical reaction SMILES string batches using the Chytorch RxnMap "
+                                    "library",
+                number_of_cpu_cores=number_of_cpu_cores,
+                chunk_size=1,
+                task_timeout_period_s=task_timeout_period_s,
+                task_timeout_output=None,
+                process_pool_initializer=ChytorchRxnMapReactionAtomMappingUtilities._initialize_worker_process,
+                process_pool_initializer_arguments=(1, )
+            )
+
+            return list(chain.from_iterable(
+                atom_mapping_result if atom_mapping_result is not None
+                else [(None, None), ] * len(reaction_smiles_batch)
+                for reaction_smiles_batch, atom_mapping_result in zip(reaction_smiles_batches, atom_mapping_results)
+            ))
+
         return MultiprocessingUtilities.run_with_progress_bar(
             processing_procedure=partial(
                 ChytorchRxnMapReactionAtomMappingUtilities.run_atom_mapping_on_reaction_smiles,
                 **kwargs
             ),
             primary_input_argument=reaction_smiles_strings,
-            description_message="Mapping the chemical reaction SMILES strings using the Chytorch RxnMap library"
+            description_message="Mapping the chemical reaction SMILES strings using the Chytorch RxnMap library",
+            number_of_cpu_cores=number_of_cpu_cores,
+            task_timeout_period_s=task_timeout_period_s,
+            task_timeout_output=(None, None),
+            process_pool_initializer=ChytorchRxnMapReactionAtomMappingUtilities._initialize_worker_process,
+            process_pool_initializer_arguments=(1, ),
+            use_shared_memory=use_shared_memory
+        )
+
+
+class ChytorchRxnMapReactionAtomMapper(ReactionAtomMapper):
+    """ The Chytorch RxnMap library chemical reaction atom mapper class. """
+
+    library = "chytorch_rxnmap"
+    library_display_name = "Chytorch RxnMap"
+
+    backend_utilities = ChytorchRxnMapReactionAtomMappingUtilities
+
+    is_batchable = True
+    is_thread_safe = False
+    needs_model = True
+    honours_task_timeout = True
+
+    # ------------------------------------------------------------------------------------------------------------------
+    #  The memory of the Chytorch RxnMap model attention grows quadratically with the number of the atoms.
+    # ------------------------------------------------------------------------------------------------------------------
+
+    pre_validation_limits = {
+        "maximum_number_of_atoms": 500,
+    }
+
+    atom_mapping_option_defaults = {
+        **ReactionAtomMapper.atom_mapping_option_defaults,
+        "ignore": True,
+        "remap": False,
+        "ignore_stereo": False,
+        "ignore_bad_isotopes": False,
+        "keep_implicit": False,
+        "ignore_carbon_radicals": False,
+        "multiplier": 1.75,
+        "keep_reactants_numbering": False,
+    }
+
+    def map_one(
+            self,
+            reaction_smiles: str
+    ) -> Tuple[Optional[str], Optional[float]]:
+        """
+        Map a chemical reaction SMILES string.
+
+        :parameter reaction_smiles: The chemical reaction SMILES string.
+
+        :returns: The mapped chemical reaction SMILES string, and the Chytorch RxnMap library atom mapping score.
+        """
+
+        return ChytorchRxnMapReactionAtomMappingUtilities.run_atom_mapping_on_reaction_smiles(
+            reaction_smiles=reaction_smiles,
+            **self.atom_mapping_options
+        )
+
+    def _map_batch(
+            self,
+            reaction_smiles_strings: List[str],
+            number_of_cpu_cores: int = 1,
+            batch_size: Optional[int] = None,
+            task_timeout_period_s: Optional[float] = None,
+            use_shared_memory: bool = False
+    ) -> List[Tuple[Optional[str], Optional[float]]]:
+        """
+        Map a list of chemical reaction SMILES strings without the deduplication and the caching.
+
+        :parameter reaction_smiles_strings: The chemical reaction SMILES strings.
+        :parameter number_of_cpu_cores: The number of CPU cores that should be utilized.
+        :parameter batch_size: The Chytorch RxnMap model batch size. If not specified, the chemical reaction SMILES
+                               strings are not batched.
+        :parameter task_timeout_period_s: The maximum amount of time in seconds that may be spent on a chemical
+                                          reaction SMILES string or batch before its worker process is killed and
+                                          replaced.
+        :parameter use_shared_memory: The indicator whether the chemical reaction SMILES strings and the atom mapping
+                                      results should be exchanged with the worker processes through shared memory
+                                      buffers instead of the pipes of the process pool if they are not batched.
+
+        :returns: The mapped chemical reaction SMILES strings, and the Chytorch RxnMap library atom mapping scores.
+        """
+
+        return ChytorchRxnMapReactionAtomMappingUtilities.run_atom_mapping_on_reaction_smiles_strings(
+            reaction_smiles_strings=reaction_smiles_strings,
+            number_of_cpu_cores=number_of_cpu_cores,
+            task_timeout_period_s=task_timeout_period_s,
+            use_shared_memory=use_shared_memory,
+            chytorch_rxnmap_model_batch_size=batch_size,
+            **self.atom_mapping_options
         )
@@ -0,0 +1,3 @@
+""" The 'chemical_reaction_atom_mapping.consensus' package initialization module. """
+
+from .consensus import ConsensusReactionAtomMappingUtilities
@@ -0,0 +1,273 @@
+""" The 'chemical_reaction_atom_mapping.consensus' package 'consensus' module. """
+
+from logging import getLogger
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..utilities.atom_mapper import ReactionAtomMapper
+from ..utilities.instrumentation import InstrumentationUtilities
+from ..utilities.reaction_smiles import ReactionSmilesUtilities
+
+
+class ConsensusReactionAtomMappingUtilities:
+    """ The consensus chemical reaction atom mapping utilities class. """
+
+    @staticmethod
+    def _run_atom_mappers(
+            atom_mappers: Sequence[ReactionAtomMapper],
+            reaction_smiles_strings: List[str],
+            batch_sizes: Dict[str, Optional[int]],
+            **kwargs
+    ) -> Dict[str, List[Tuple[Optional[str], Any]]]:
+        """
+        Run the chemical reaction atom mappers one after another, each one utilizing the whole CPU core budget.
+
+        :parameter atom_mappers: The chemical reaction atom mappers.
+        :parameter reaction_smiles_strings: The chemical reaction SMILES strings.
+        :parameter batch_sizes: The batch sizes of the chemical reaction atom mappers keyed by their libraries.
+        :parameter kwargs: The keyword arguments of the 'map_batch' method of the chemical reaction atom mappers.
+
+        :returns: The outputs of the chemical reaction atom mappers keyed by their libraries.
+        """
+
+        if len(atom_mappers) == 0 or len(reaction_smiles_strings) == 0:
+            return {
+                atom_mapper.library: list() for atom_mapper in atom_mappers
+            }
+
+        # --------------------------------------------------------------------------------------------------------------
+        #  The chemical reaction atom mappers are not run from concurrent threads because their process pools are
+        #  started using the 'fork' method, which is unsafe in a multithreaded process, and because each one of them
+        #  already utilizes the whole specified number of CPU cores.
+        # --------------------------------------------------------------------------------------------------------------
+
+        return {
+            atom_mapper.library: atom_mapper.map_batch(
+                reaction_smiles_strings=reaction_smiles_strings,
+                batch_size=batch_sizes.get(atom_mapper.library),
+                **kwargs
+            ) for atom_mapper in atom_mappers
+        }
+
+    @staticmethod
+    def _get_bond_changes(
+            atom_mapping_outputs: List[Tuple[Optional[str], Any]]
+    ) -> List[Optional[Tuple[Tuple[Tuple[str, int], Tuple[str, int], float, float], ...]]]:
+        """
+        Get the bond changes of the outputs of a chemical reaction atom mapper.
+
+        :parameter atom_mapping_outputs: The outputs of the chemical reaction atom mapper.
+
+        :returns: The bond changes of the mapped chemical reaction SMILES strings, or None for the chemical reaction
+                  SMILES strings that were not mapped.
+        """
+
+        with InstrumentationUtilities.measure("consensus.comparison"):
+            return [
+                ReactionSmilesUtilities.get_bond_changes(
+                    mapped_reaction_smiles=mapped_reaction_smiles
+                ) if mapped_reaction_smiles is not None else None
+                for mapped_reaction_smiles, _ in atom_mapping_outputs
+            ]
+
+    @staticmethod
+    def _is_atom_mapping_confident(
+            atom_mapping_output: Tuple[Optional[str], Any],
+            minimum_atom_mapping_score: Optional[float] = None
+    ) -> bool:
+        """
+        Check whether the output of a chemical reaction atom mapper is confident enough for an early exit.
+
+        :parameter atom_mapping_output: The output of the chemical reaction atom mapper.
+        :parameter minimum_atom_mapping_score: The minimum atom mapping score. The indicators of the libraries that do
+                                               not report an atom mapping score must be True instead.
+
+        :returns: The indicator whether the output of the chemical reaction atom mapper is confident enough.
+        """
+
+        mapped_reaction_smiles, atom_mapping_score = atom_mapping_output
+
+        if mapped_reaction_smiles is None:
+            return False
+
+        if isinstance(atom_mapping_score, bool):
+            return atom_mapping_score
+
+        if minimum_atom_mapping_score is None:
+            return True
+
+        return atom_mapping_score is not None and atom_mapping_score >= minimum_atom_mapping_score
+
+    @staticmethod
+    def get_atom_mapping_agreement(
+            bond_changes: Iterable[Optional[Tuple[Tuple[Tuple[str, int], Tuple[str, int], float, float], ...]]]
+    ) -> Optional[bool]:
+        """
+        Get the agreement of the atom mappings of a chemical reaction.
+
+        :parameter bond_changes: The bond changes of the mapped chemical reaction SMILES strings of the chemical
+                                 reaction atom mappers: 'chemical_reaction_atom_mapping.utilities.reaction_smiles.
+                                 ReactionSmilesUtilities.{get_bond_changes}'.
+
+        :returns: The indicator whether all of the atom mappings describe the same bond changes, or None if fewer than
+                  two atom mappings are available.
+        """
+
+        bond_changes = [
+            atom_mapping_bond_changes for atom_mapping_bond_changes in bond_changes
+            if atom_mapping_bond_changes is not None
+        ]
+
+        if len(bond_changes) < 2:
+            return None
+
+        return len(set(bond_changes)) == 1
+
+    @staticmethod
+    def run_consensus_atom_mapping_on_reaction_smiles_strings(
+            reaction_smiles_strings: Iterable[str],
+            atom_mappers: Sequence[ReactionAtomMapper],
+            early_exit_number_of_atom_mappers: Optional[int] = None,
+            early_exit_minimum_atom_mapping_score: Optional[float] = None,
+            batch_sizes: Optional[Dict[str, Optional[int]]] = None,
+            **kwargs
+    ) -> Tuple[Dict[str, List[Tuple[Optional[str], Any]]], List[Optional[bool]]]:
+        """
+        Run multiple chemical reaction atom mappers on chemical reaction SMILES strings in a single pass, and compare
+        their atom mappings based on the bond changes that they describe.
+
+        :parameter reaction_smiles_strings: The chemical reaction SMILES strings.
+        :parameter atom_mappers: The chemical reaction atom mappers ordered from the fastest to the slowest one.
+        :parameter early_exit_number_of_atom_mappers: The number of the first chemical reaction atom mappers that are
+                                                      run on all of the chemical reaction SMILES strings. The remaining
+                                                      chemical reaction atom mappers are only run on the chemical
+                                                      reaction SMILES strings on which the first ones do not agree
+                                                      confidently, and the outputs of the skipped ones are None. If not
+                                                      specified, all of the chemical reaction atom mappers are run on
+                                                      all of the chemical reaction SMILES strings.
+        :parameter early_exit_minimum_atom_mapping_score: The minimum atom mapping score of each of the first chemical
+                                                          reaction atom mappers for an early exit. If not specified, the
+                                                          agreement of the first chemical reaction atom mappers is
+                                                          sufficient.
+        :parameter batch_sizes: The batch sizes of the chemical reaction atom mappers keyed by their libraries.
+        :parameter kwargs: The keyword arguments of the 'map_batch' method of the chemical reaction atom mappers. Each
+                           chemical reaction atom mapper utilizes the specified number of CPU cores, and its
+                           pre-validation rejection reason codes are aligned with all of the chemical reaction SMILES
+                           strings.
+
+        :returns: The outputs of the chemical reaction atom mappers keyed by their libraries, and the indicators whether
+                  all of the available atom mappings of each chemical reaction SMILES string agree.
+        """
+
+        reaction_smiles_strings = list(reaction_smiles_strings)
+
+        batch_sizes = batch_sizes if batch_sizes is not None else dict()
+
+        if early_exit_number_of_atom_mappers is None or \
+                not 2 <= early_exit_number_of_atom_mappers < len(atom_mappers):
+            early_exit_number_of_atom_mappers = len(atom_mappers)
+
+        atom_mapping_outputs = ConsensusReactionAtomMappingUtilities._run_atom_mappers(
+            atom_mappers=atom_mappers[:early_exit_number_of_atom_mappers],
+            reaction_smiles_strings=reaction_smiles_strings,
+            batch_sizes=batch_sizes,
+            **kwargs
+        )
+
+        bond_changes = {
+            library: ConsensusReactionAtomMappingUtilities._get_bond_changes(
+                atom_mapping_outputs=library_atom_mapping_outputs
+            ) for library, library_atom_mapping_outputs in atom_mapping_outputs.items()
+        }
+
+        if early_exit_number_of_atom_mappers < len(atom_mappers):
+            remaining_reaction_smiles_indices = [
+                reaction_smiles_index for reaction_smiles_index in range(len(reaction_smiles_strings))
+                if not (
+                    all(
+                        library_bond_changes[reaction_smiles_index] is not None
+                        for library_bond_changes in bond_changes.values()
+                    ) and ConsensusReactionAtomMappingUtilities.get_atom_mapping_agreement(
+                        bond_changes=(
+                            library_bond_changes[reaction_smiles_index]
+                            for library_bond_changes in bond_changes.values()
+                        )
+                    ) and all(
+                        ConsensusReactionAtomMappingUtilities._is_atom_mapping_confident(
+                            atom_mapping_output=library_atom_mapping_outputs[reaction_smiles_index],
+                            minimum_atom_mapping_score=early_exit_minimum_atom_mapping_score
+                        ) for library_atom_mapping_outputs in atom_mapping_outputs.values()
+                    )
+                )
+            ]
+
+            InstrumentationUtilities.increment(
+                counter_name="consensus.early_exits",
+                value=len(reaction_smiles_strings) - len(remaining_reaction_smiles_indices)
+            )
+
+            getLogger(
+                "{0}.ConsensusReactionAtomMappingUtilities.run_consensus_atom_mapping_on_reaction_smiles_strings".
+                format(__name__)
+            ).info("Early exits after the first {0} libraries: {1} / {2}.".format(
+                early_exit_number_of_atom_mappers,
+                len(reaction_smiles_strings) - len(remaining_reaction_smiles_indices),
+                len(reaction_smiles_strings)
+            ))
+
+            remaining_atom_mapping_outputs = ConsensusReactionAtomMappingUtilities._run_atom_mappers(
+                atom_mappers=atom_mappers[early_exit_number_of_atom_mappers:],
+                reaction_smiles_strings=[
+                    reaction_smiles_strings[reaction_smiles_index]
+                    for reaction_smiles_index in remaining_reaction_smiles_indices
+                ],
+                batch_sizes=batch_sizes,
+                **kwargs
+            )
+
+            for library, library_remaining_atom_mapping_outputs in remaining_atom_mapping_outputs.items():
+                atom_mapping_outputs[library] = [(None, None, ), ] * len(reaction_smiles_strings)
+
+                for reaction_smiles_index, atom_mapping_output in zip(
+                    remaining_reaction_smiles_indices,
+                    library_remaining_atom_mapping_outputs
+                ):
+                    atom_mapping_outputs[library][reaction_smiles_index] = atom_mapping_output
+
+                bond_changes[library] = ConsensusReactionAtomMappingUtilities._get_bond_changes(
+                    atom_mapping_outputs=atom_mapping_outputs[library]
+                )
+
+            # ----------------------------------------------------------------------------------------------------------
+            #  The pre-validation rejection reason codes of the remaining chemical reaction atom mappers are scattered
+            #  back to all of the chemical reaction SMILES strings, where the skipped ones have no rejection reason.
+            # ----------------------------------------------------------------------------------------------------------
+
+            if kwargs.get("use_pre_validation", False):
+                for atom_mapper in atom_mappers[early_exit_number_of_atom_mappers:]:
+                    pre_validation_rejection_reasons = [None, ] * len(reaction_smiles_strings)
+
+                    if len(remaining_reaction_smiles_indices) > 0:
+                        for reaction_smiles_index, pre_validation_rejection_reason in zip(
+                            remaining_reaction_smiles_indices,
+                            atom_mapper.pre_validation_rejection_reasons
+                        ):
+                            pre_validation_rejection_reasons[reaction_smiles_index] = pre_validation_rejection_reason
+
+                    atom_mapper.pre_validation_rejection_reasons = pre_validation_rejection_reasons
+
+        atom_mapping_agreements = [
+            ConsensusReactionAtomMappingUtilities.get_atom_mapping_agreement(
+                bond_changes=(
+                    library_bond_changes[reaction_smiles_index] for library_bond_changes in bond_changes.values()
+                )
+            ) for reaction_smiles_index in range(len(reaction_smiles_strings))
+        ]
+
+        InstrumentationUtilities.increment(
+            counter_name="consensus.disagreements",
+            value=sum(atom_mapping_agreement is False for atom_mapping_agreement in atom_mapping_agreements)
+        )
+
+        return {
+            atom_mapper.library: atom_mapping_outputs[atom_mapper.library] for atom_mapper in atom_mappers
+        }, atom_mapping_agreements
@@ -1,3 +1,3 @@
 """ The 'chemical_reaction_atom_mapping.epam_indigo' package initialization module. """
 
-from .atom_mapping import EpamIndigoReactionAtomMappingUtilities
+from .atom_mapping import EpamIndigoReactionAtomMapper, EpamIndigoReactionAtomMappingUtilities
@@ -2,16 +2,65 @@
 
 from functools import partial
 from logging import getLogger
-from typing import Iterable, List, Optional, Tuple
-
-from indigo.indigo.indigo import Indigo
+from os import getpid
+from threading import local
+from typing import Collection, Iterable, List, Optional, Tuple, TYPE_CHECKING
 
+from ..utilities.atom_mapper import ReactionAtomMapper
+from ..utilities.caching import AtomMappingResultCache
+from ..utilities.instrumentation import InstrumentationUtilities
 from ..utilities.multiprocessing import MultiprocessingUtilities
+from ..utilities.spectator_compounds import SpectatorCompoundUtilities
+
+if TYPE_CHECKING:
+    from indigo.indigo.indigo import Indigo
 
 
 class EpamIndigoReactionAtomMappingUtilities:
     """ The EPAM Indigo library chemical reaction atom mapping utilities class. """
 
+    _epam_indigo_toolkit_cache = local()
+
+    @staticmethod
+    def _get_epam_indigo_toolkit(
+            timeout_period_ms: int,
+            epam_indigo_toolkit_recycling_period: int
+    ) -> "Indigo":
+        """
+        Get the EPAM Indigo toolkit Indigo object of the current worker process and thread, and only construct and
+        configure a new one on the first request, after a fork, or once the recycling period has elapsed.
+
+        :parameter timeout_period_ms: The maximum amount of time in milliseconds that may be spent on the atom mapping
+                                      procedure.
+        :parameter epam_indigo_toolkit_recycling_period: The number of chemical reaction SMILES strings after which the
+                                                         EPAM Indigo toolkit Indigo object is reconstructed to bound the
+                                                         memory growth of the native library. If the value is lower
+                                                         than 1, a new EPAM Indigo toolkit Indigo object is constructed
+                                                         for each chemical reaction SMILES string.
+
+        :returns: The EPAM Indigo toolkit Indigo object.
+        """
+
+        from indigo.indigo.indigo import Indigo
+
+        epam_indigo_toolkit_cache = EpamIndigoReactionAtomMappingUtilities._epam_indigo_toolkit_cache
+
+        if getattr(epam_indigo_toolkit_cache, "process_id", None) != getpid() or \
+                epam_indigo_toolkit_recycling_period < 1 or \
+                epam_indigo_toolkit_cache.number_of_uses >= epam_indigo_toolkit_recycling_period:
+            epam_indigo_toolkit_cache.process_id = getpid()
+            epam_indigo_toolkit_cache.epam_indigo_toolkit = Indigo()
+            epam_indigo_toolkit_cache.timeout_period_ms = None
+            epam_indigo_toolkit_cache.number_of_uses = 0
+
+        if epam_indigo_toolkit_cache.timeout_period_ms != timeout_period_ms:
+            epam_indigo_toolkit_cache.epam_indigo_toolkit.setOption("aam-timeout", timeout_period_ms)
+            epam_indigo_toolkit_cache.timeout_period_ms = timeout_period_ms
+
+        epam_indigo_toolkit_cache.number_of_uses += 1
+
+        return epam_indigo_toolkit_cache.epam_indigo_toolkit
+
     @staticmethod
     def run_atom_mapping_on_reaction_smiles(
             reaction_smiles: str,
@@ -21,7 +70,10 @@ class EpamIndigoReactionAtomMappingUtilities:
             ignore_isotopes: bool = False,
             ignore_valences: bool = False,
             ignore_radicals: bool = False,
-            canonicalize_mapped_reaction_smiles: bool = True
+            canonicalize_mapped_reaction_smiles: bool = True,
+            epam_indigo_toolkit_recycling_period: int = 1000,
+            strip_unchanged_compounds: bool = False,
+            reagent_smiles_strings: Optional[Collection[str]] = None
     ) -> Tuple[Optional[str], Optional[bool]]:
         """
         Run the EPAM Indigo library atom mapping on a chemical reaction SMILES string.
@@ -40,15 +92,47 @@ class EpamIndigoReactionAtomMappingUtilities:
                                     during the atom mapping procedure.
         :parameter canonicalize_mapped_reaction_smiles: The indicator whether the mapped chemical reaction SMILES string
                                                         should be canonicalized.
+        :parameter epam_indigo_toolkit_recycling_period: The number of chemical reaction SMILES strings after which the
+                                                         EPAM Indigo toolkit Indigo object of the worker process is
+                                                         reconstructed. If the value is lower than 1, a new EPAM Indigo
+                                                         toolkit Indigo object is constructed for each chemical
+                                                         reaction SMILES string.
+        :parameter strip_unchanged_compounds: The indicator whether the chemical compounds that appear unchanged on both
+                                              sides of the chemical reaction should be stripped before the atom mapping
+                                              and restored without the atom map numbers afterwards.
+        :parameter reagent_smiles_strings: The known reagent chemical compound SMILES strings, such as the solvents and
+                                           the catalysts, that should be stripped from the reactants and the agents
+                                           before the atom mapping and restored without the atom map numbers
+                                           afterwards.
 
         :returns: The mapped chemical reaction SMILES string, and the indicator whether the atom mapping procedure was
                   completed without errors.
         """
 
-        try:
-            epam_indigo_toolkit = Indigo()
+        if strip_unchanged_compounds or reagent_smiles_strings:
+            return SpectatorCompoundUtilities.run_on_reaction_smiles_with_spectator_compound_stripping(
+                reaction_smiles=reaction_smiles,
+                atom_mapping_procedure=partial(
+                    EpamIndigoReactionAtomMappingUtilities.run_atom_mapping_on_reaction_smiles,
+                    timeout_period_ms=timeout_period_ms,
+                    handle_existing_atom_mapping=handle_existing_atom_mapping,
+                    ignore_charges=ignore_charges,
+                    ignore_isotopes=ignore_isotopes,
+                    ignore_valences=ignore_valences,
+                    ignore_radicals=ignore_radicals,
+                    canonicalize_mapped_reaction_smiles=canonicalize_mapped_reaction_smiles,
+                    epam_indigo_toolkit_recycling_period=epam_indigo_toolkit_recycling_period
+                ),
+                strip_unchanged_compounds=strip_unchanged_compounds,
+                reagent_smiles_strings=reagent_smiles_strings
+            )
 
-            epam_indigo_toolkit.setOption("aam-timeout", timeout_period_ms)
+        try:
+            with InstrumentationUtilities.measure("epam_indigo.toolkit"):
+                epam_indigo_toolkit = EpamIndigoReactionAtomMappingUtilities._get_epam_indigo_toolkit(
+                    timeout_period_ms=timeout_period_ms,
+                    epam_indigo_toolkit_recycling_period=epam_indigo_toolkit_recycling_period
+                )
 
             # ----------------------------------------------------------------------------------------------------------
             #  The 'loadReactionSmarts' method is utilized instead of the 'loadReaction' method to avoid the EPAM Indigo
@@ -56,38 +140,56 @@ class EpamIndigoReactionAtomMappingUtilities:
             #  reaction compound SMILES strings.
             # ----------------------------------------------------------------------------------------------------------
 
-            reaction_epam_indigo_rxn = epam_indigo_toolkit.loadReactionSmarts(
-                string=reaction_smiles
-            )
+            with InstrumentationUtilities.measure("epam_indigo.parsing"):
+                reaction_epam_indigo_rxn = epam_indigo_toolkit.loadReactionSmarts(
+                    string=reaction_smiles
+                )
 
-            epam_indigo_status_code = reaction_epam_indigo_rxn.automap(
-                mode="".join([
-                    handle_existing_atom_mapping
-                    if handle_existing_atom_mapping in ["alter", "clear", "discard", "keep"] else "discard",
-                    " ignore_charges" if ignore_charges else "",
-                    " ignore_isotopes" if ignore_isotopes else "",
-                    " ignore_valence" if ignore_valences else "",
-                    " ignore_radicals" if ignore_radicals else ""
-                ])
-            )
+            with InstrumentationUtilities.measure("epam_indigo.atom_mapping"):
+                epam_indigo_status_code = reaction_epam_indigo_rxn.automap(
+                    mode="".join([
+                        handle_existing_atom_mapping
+                        if handle_existing_atom_mapping in ["alter", "clear", "discard", "keep"] else "discard",
+                        " ignore_charges" if ignore_charges else "",
+                        " ignore_isotopes" if ignore_isotopes else "",
+                        " ignore_valence" if ignore_valences else "",
+                        " ignore_radicals" if ignore_radicals else ""
+                    ])
+                )
+
+            with InstrumentationUtilities.measure("epam_indigo.canonicalization"):
+                if canonicalize_mapped_reaction_smiles:
+                    mapped_reaction_smiles = reaction_epam_indigo_rxn.canonicalSmiles()
+
+                else:
+                    mapped_reaction_smiles = reaction_epam_indigo_rxn.smiles()
 
-            if canonicalize_mapped_reaction_smiles:
-                return reaction_epam_indigo_rxn.canonicalSmiles(), True if epam_indigo_status_code == 1 else False
+            if not mapped_reaction_smiles:
+                InstrumentationUtilities.increment(
+                    counter_name="epam_indigo.empty_outputs"
+                )
 
-            else:
-                return reaction_epam_indigo_rxn.smiles(), True if epam_indigo_status_code == 1 else False
+            return mapped_reaction_smiles, True if epam_indigo_status_code == 1 else False
 
         except Exception as exception_handle:
             getLogger(
                 "{0}.EpamIndigoReactionAtomMappingUtilities.run_atom_mapping_on_reaction_smiles".format(__name__)
             ).debug(exception_handle)
 
+            InstrumentationUtilities.increment(
+                counter_name="epam_indigo.failures"
+            )
+
             return None, None
 
     @staticmethod
     def run_atom_mapping_on_reaction_smiles_strings(
             reaction_smiles_strings: Iterable[str],
             number_of_cpu_cores: int = 1,
+            task_timeout_period_s: Optional[float] = None,
+            use_shared_memory: bool = False,
+            deduplication_mode: Optional[str] = None,
+            atom_mapping_cache: Optional[AtomMappingResultCache] = None,
             **kwargs
     ) -> List[Tuple[Optional[str], Optional[bool]]]:
         """
@@ -95,6 +197,17 @@ class EpamIndigoReactionAtomMappingUtilities:
 
         :parameter reaction_smiles_strings: The chemical reaction SMILES strings.
         :parameter number_of_cpu_cores: The number of CPU cores that should be utilized.
+        :parameter task_timeout_period_s: The maximum amount of time in seconds that may be spent on a chemical
+                                          reaction SMILES string before its worker process is killed and replaced. If
+                                          not specified, the atom mapping procedure is not interrupted.
+        :parameter use_shared_memory: The indicator whether the chemical reaction SMILES strings and the atom mapping
+                                      results should be exchanged with the worker processes through shared memory
+                                      buffers instead of the pipes of the process pool.
+        :parameter deduplication_mode: The indicator how the duplicate chemical reaction SMILES strings should be
+                                       identified before the atom mapping: 'exact' or 'canonical'. If not specified,
+                                       the chemical reaction SMILES strings are not deduplicated.
+        :parameter atom_mapping_cache: The chemical reaction atom mapping result cache that should be consulted before
+                                       the EPAM Indigo library is utilized.
         :parameter kwargs: The default keyword arguments for the adjustment of underlying functions:
                            'chemical_reaction_atom_mapping.indigo.IndigoReactionAtomMappingUtilities.
                            {run_atom_mapping_on_reaction_smiles}'.
@@ -103,6 +216,16 @@ class EpamIndigoReactionAtomMappingUtilities:
                   was completed without errors.
         """
 
+        if deduplication_mode is not None or atom_mapping_cache is not None:
+            return EpamIndigoReactionAtomMapper(**kwargs).map_batch(
+                reaction_smiles_strings=reaction_smiles_strings,
+                number_of_cpu_cores=number_of_cpu_cores,
+                task_timeout_period_s=task_timeout_period_s,
+                deduplication_mode=deduplication_mode,
+                atom_mapping_cache=atom_mapping_cache,
+                use_shared_memory=use_shared_memory
+            )
+
         return MultiprocessingUtilities.run_with_progress_bar(
             processing_procedure=partial(
                 EpamIndigoReactionAtomMappingUtilities.run_atom_mapping_on_reaction_smiles,
@@ -110,5 +233,97 @@ class EpamIndigoReactionAtomMappingUtilities:
             ),
             primary_input_argument=reaction_smiles_strings,
             description_message="Mapping the chemical reaction SMILES strings using the EPAM Indigo library",
-            number_of_cpu_cores=number_of_cpu_cores
+            number_of_cpu_cores=number_of_cpu_cores,
+            task_timeout_period_s=task_timeout_period_s,
+            task_timeout_output=(None, None),
+            use_shared_memory=use_shared_memory
+        )
+
+
+class EpamIndigoReactionAtomMapper(ReactionAtomMapper):
+    """ The EPAM Indigo library chemical reaction atom mapper class. """
+
+    library = "epam_indigo"
+    library_display_name = "EPAM Indigo"
+
+    atom_mapping_score_name = "atom_mapping_status_indicator"
+    atom_mapping_score_display_name = "Atom Mapping Procedure Completed without Errors"
+
+    backend_utilities = EpamIndigoReactionAtomMappingUtilities
+
+    is_batchable = False
+    is_thread_safe = True
+    needs_model = False
+    honours_task_timeout = True
+
+    # ------------------------------------------------------------------------------------------------------------------
+    #  The EPAM Indigo library atom mapping procedure is combinatorial in the numbers of the atoms and the chemical
+    #  compounds, so the chemical reaction SMILES strings beyond these limits usually exhaust the whole timeout period.
+    # ------------------------------------------------------------------------------------------------------------------
+
+    pre_validation_limits = {
+        "maximum_number_of_atoms": 300,
+        "maximum_number_of_compounds": 20,
+    }
+
+    atom_mapping_option_defaults = {
+        **ReactionAtomMapper.atom_mapping_option_defaults,
+        "timeout_period_ms": 10000,
+        "handle_existing_atom_mapping": "discard",
+        "ignore_charges": False,
+        "ignore_isotopes": False,
+        "ignore_valences": False,
+        "ignore_radicals": False,
+        "canonicalize_mapped_reaction_smiles": True,
+    }
+
+    def map_one(
+            self,
+            reaction_smiles: str
+    ) -> Tuple[Optional[str], Optional[bool]]:
+        """
+        Map a chemical reaction SMILES string.
+
+        :parameter reaction_smiles: The chemical reaction SMILES string.
+
+        :returns: The mapped chemical reaction SMILES string, and the indicator whether the atom mapping procedure was
+                  completed without errors.
+        """
+
+        return EpamIndigoReactionAtomMappingUtilities.run_atom_mapping_on_reaction_smiles(
+            reaction_smiles=reaction_smiles,
+            **self.atom_mapping_options
+        )
+
+    def _map_batch(
+            self,
+            reaction_smiles_strings: List[str],
+            number_of_cpu_cores: int = 1,
+            batch_size: Optional[int] = None,
+            task_timeout_period_s: Optional[float] = None,
+            use_shared_memory: bool = False
+    ) -> List[Tuple[Optional[str], Optional[bool]]]:
+        """
+        Map a list of chemical reaction SMILES strings without the deduplication and the caching.
+
+        :parameter reaction_smiles_strings: The chemical reaction SMILES strings.
+        :parameter number_of_cpu_cores: The number of CPU cores that should be utilized.
+        :parameter batch_size: The batch size, which is ignored because the EPAM Indigo library maps the chemical
+                               reaction SMILES strings one at a time.
+        :parameter task_timeout_period_s: The maximum amount of time in seconds that may be spent on a chemical
+                                          reaction SMILES string before its worker process is killed and replaced.
+        :parameter use_shared_memory: The indicator whether the chemical reaction SMILES strings and the atom mapping
+                                      results should be exchanged with the worker processes through shared memory
+                                      buffers instead of the pipes of the process pool.
+
+        :returns: The mapped chemical reaction SMILES strings, and the indicators whether the atom mapping procedure
+                  was completed without errors.
+        """
+
+        return EpamIndigoReactionAtomMappingUtilities.run_atom_mapping_on_reaction_smiles_strings(
+            reaction_smiles_strings=reaction_smiles_strings,
+            number_of_cpu_cores=number_of_cpu_cores,
+            task_timeout_period_s=task_timeout_period_s,
+            use_shared_memory=use_shared_memory,
+            **self.atom_mapping_options
         )
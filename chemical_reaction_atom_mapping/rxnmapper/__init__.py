@@ -1,3 +1,3 @@
 """ The 'chemical_reaction_atom_mapping.rxnmapper' package initialization module. """
 
-from .atom_mapping import RxnMapperReactionAtomMappingUtilities
+from .atom_mapping import RxnMapperReactionAtomMapper, RxnMapperReactionAtomMappingUtilities
@@ -1,19 +1,180 @@
 """ The 'chemical_reaction_atom_mapping.rxnmapper' package 'atom_mapping' module. """
 
+from collections import Counter
+from concurrent.futures import as_completed, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from gc import freeze, unfreeze
 from logging import getLogger
+from multiprocessing import cpu_count, get_all_start_methods, get_context
 from tqdm import tqdm
-from typing import Any, Iterable, Dict, List, Optional, Tuple
+from typing import Any, Collection, Iterable, Iterator, Dict, List, Optional, Tuple, TYPE_CHECKING
 
-from rxnmapper.core import RXNMapper
-from transformers.utils.logging import set_verbosity_error
+from ..utilities.atom_mapper import ReactionAtomMapper
+from ..utilities.caching import AtomMappingResultCache
+from ..utilities.instrumentation import InstrumentationUtilities
+from ..utilities.model_registry import ModelRegistryUtilities
+from ..utilities.multiprocessing import MultiprocessingUtilities
+from ..utilities.reaction_smiles import ReactionSmilesUtilities
+from ..utilities.spectator_compounds import SpectatorCompoundUtilities
+
+if TYPE_CHECKING:
+    from rxnmapper.core import RXNMapper
 
 
 class RxnMapperReactionAtomMappingUtilities:
     """ The RXNMapper library chemical reaction atom mapping utilities class. """
 
+    rxnmapper_model_quantization_modes = ("dynamic_int8", )
+
+    @staticmethod
+    def _get_rxnmapper_model_name(
+            rxnmapper_model_quantization: Optional[str] = None
+    ) -> str:
+        """
+        Get the name of the RXNMapper model in the process-wide model registry, which distinguishes the quantized
+        RXNMapper models from the full-precision one.
+
+        :parameter rxnmapper_model_quantization: The quantization mode of the RXNMapper model.
+
+        :returns: The name of the RXNMapper model.
+        """
+
+        if rxnmapper_model_quantization is None:
+            return "rxnmapper"
+
+        if rxnmapper_model_quantization not in RxnMapperReactionAtomMappingUtilities.rxnmapper_model_quantization_modes:
+            raise ValueError(
+                "The RXNMapper model quantization mode '{0}' is not supported. Please choose one of {1}.".format(
+                    rxnmapper_model_quantization,
+                    list(RxnMapperReactionAtomMappingUtilities.rxnmapper_model_quantization_modes)
+                )
+            )
+
+        return "rxnmapper.{0}".format(rxnmapper_model_quantization)
+
+    @staticmethod
+    def _load_rxnmapper_model(
+            rxnmapper_model_configuration: Optional[Dict[str, Any]] = None,
+            rxnmapper_model_quantization: Optional[str] = None
+    ) -> "RXNMapper":
+        """
+        Load the RXNMapper model, and optionally quantize it for the CPU inference.
+
+        :parameter rxnmapper_model_configuration: The configuration of the RXNMapper model:
+                                                  'rxnmapper.core.RXNMapper.{config}'.
+        :parameter rxnmapper_model_quantization: The quantization mode of the RXNMapper model. The 'dynamic_int8' mode
+                                                 moves the model to the CPU and replaces its linear layers with the
+                                                 dynamically quantized int8 linear layers, whose activations are
+                                                 quantized on the fly.
+
+        :returns: The RXNMapper model RXNMapper object.
+        """
+
+        from rxnmapper.core import RXNMapper
+
+        rxnmapper_model = RXNMapper(
+            config=rxnmapper_model_configuration
+        )
+
+        if rxnmapper_model_quantization == "dynamic_int8":
+            from torch import device, qint8
+            from torch.nn import Linear
+            from torch.quantization import quantize_dynamic
+
+            rxnmapper_model.device = device("cpu")
+
+            rxnmapper_model.model = quantize_dynamic(
+                rxnmapper_model.model.to(rxnmapper_model.device),
+                {Linear, },
+                dtype=qint8
+            )
+
+        return rxnmapper_model
+
+    @staticmethod
+    def get_rxnmapper_model(
+            rxnmapper_model_configuration: Optional[Dict[str, Any]] = None,
+            rxnmapper_model_quantization: Optional[str] = None
+    ) -> "RXNMapper":
+        """
+        Get the RXNMapper model from the process-wide model registry, and load it only on the first request.
+
+        :parameter rxnmapper_model_configuration: The configuration of the RXNMapper model:
+                                                  'rxnmapper.core.RXNMapper.{config}'.
+        :parameter rxnmapper_model_quantization: The quantization mode of the RXNMapper model: 'dynamic_int8'. If not
+                                                 specified, the full-precision RXNMapper model is utilized.
+
+        :returns: The RXNMapper model RXNMapper object.
+        """
+
+        from transformers.utils.logging import set_verbosity_error
+
+        set_verbosity_error()
+
+        return ModelRegistryUtilities.get_model(
+            model_name=RxnMapperReactionAtomMappingUtilities._get_rxnmapper_model_name(
+                rxnmapper_model_quantization=rxnmapper_model_quantization
+            ),
+            model_loading_procedure=lambda model_configuration:
+            RxnMapperReactionAtomMappingUtilities._load_rxnmapper_model(
+                rxnmapper_model_configuration=model_configuration,
+                rxnmapper_model_quantization=rxnmapper_model_quantization
+            ),
+            model_configuration=rxnmapper_model_configuration
+        )
+
+    @staticmethod
+    def release_rxnmapper_model(
+            rxnmapper_model_configuration: Optional[Dict[str, Any]] = None,
+            rxnmapper_model_quantization: Optional[str] = None
+    ) -> bool:
+        """
+        Release the RXNMapper model from the process-wide model registry.
+
+        :parameter rxnmapper_model_configuration: The configuration of the RXNMapper model:
+                                                  'rxnmapper.core.RXNMapper.{config}'.
+        :parameter rxnmapper_model_quantization: The quantization mode of the RXNMapper model.
+
+        :returns: The indicator whether the RXNMapper model was loaded before the release.
+        """
+
+        return ModelRegistryUtilities.release_model(
+            model_name=RxnMapperReactionAtomMappingUtilities._get_rxnmapper_model_name(
+                rxnmapper_model_quantization=rxnmapper_model_quantization
+            ),
+            model_configuration=rxnmapper_model_configuration
+        )
+
+    @staticmethod
+    def get_atom_mapping_options(
+            rxnmapper_model_configuration: Optional[Dict[str, Any]] = None,
+            rxnmapper_model_quantization: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Get the options of the RXNMapper model that affect the chemical reaction atom mapping results.
+        The quantization mode is only included if it is specified, so the full-precision chemical reaction atom mapping
+        results that are already cached remain valid.
+
+        :parameter rxnmapper_model_configuration: The configuration of the RXNMapper model:
+                                                  'rxnmapper.core.RXNMapper.{config}'.
+        :parameter rxnmapper_model_quantization: The quantization mode of the RXNMapper model.
+
+        :returns: The options of the RXNMapper model.
+        """
+
+        atom_mapping_options = {
+            "rxnmapper_model_configuration": rxnmapper_model_configuration,
+        }
+
+        if rxnmapper_model_quantization is not None:
+            atom_mapping_options["rxnmapper_model_quantization"] = rxnmapper_model_quantization
+
+        return atom_mapping_options
+
     @staticmethod
     def _get_attention_guided_atom_maps_wrapper(
-            rxnmapper_model: RXNMapper,
+            rxnmapper_model: "RXNMapper",
             reaction_smiles_strings: List[str],
             **kwargs
     ) -> List[Dict[str, Any]]:
@@ -28,38 +189,68 @@ class RxnMapperReactionAtomMappingUtilities:
         :returns: The mapped chemical reaction SMILES strings, and the RXNMapper library atom mapping confidence scores.
         """
 
-        return rxnmapper_model.get_attention_guided_atom_maps(
-            rxns=reaction_smiles_strings,
-            zero_set_p=kwargs["zero_set_p"] if "zero_set_p" in kwargs.keys() else True,
-            zero_set_r=kwargs["zero_set_r"] if "zero_set_r" in kwargs.keys() else True,
-            canonicalize_rxns=kwargs["canonicalize_rxns"] if "canonicalize_rxns" in kwargs.keys() else True,
-            detailed_output=kwargs["detailed_output"] if "detailed_output" in kwargs.keys() else False,
-            absolute_product_inds=kwargs["absolute_product_inds"]
-            if "absolute_product_inds" in kwargs.keys() else False,
-            force_layer=kwargs["force_layer"] if "force_layer" in kwargs.keys() else None,
-            force_head=kwargs["force_head"] if "force_head" in kwargs.keys() else None
-        )
+        with InstrumentationUtilities.measure("rxnmapper.atom_mapping"):
+            return rxnmapper_model.get_attention_guided_atom_maps(
+                rxns=reaction_smiles_strings,
+                zero_set_p=kwargs["zero_set_p"] if "zero_set_p" in kwargs.keys() else True,
+                zero_set_r=kwargs["zero_set_r"] if "zero_set_r" in kwargs.keys() else True,
+                canonicalize_rxns=kwargs["canonicalize_rxns"] if "canonicalize_rxns" in kwargs.keys() else True,
+                detailed_output=kwargs["detailed_output"] if "detailed_output" in kwargs.keys() else False,
+                absolute_product_inds=kwargs["absolute_product_inds"]
+                if "absolute_product_inds" in kwargs.keys() else False,
+                force_layer=kwargs["force_layer"] if "force_layer" in kwargs.keys() else None,
+                force_head=kwargs["force_head"] if "force_head" in kwargs.keys() else None
+            )
 
     @staticmethod
     def run_atom_mapping_on_reaction_smiles(
             reaction_smiles: str,
+            rxnmapper_model_configuration: Optional[Dict[str, Any]] = None,
+            rxnmapper_model_quantization: Optional[str] = None,
+            strip_unchanged_compounds: bool = False,
+            reagent_smiles_strings: Optional[Collection[str]] = None,
             **kwargs
     ) -> Tuple[Optional[str], Optional[float]]:
         """
         Run the RXNMapper library atom mapping on a chemical reaction SMILES string.
 
         :parameter reaction_smiles: The chemical reaction SMILES string.
+        :parameter rxnmapper_model_configuration: The configuration of the RXNMapper model:
+                                                  'rxnmapper.core.RXNMapper.{config}'.
+        :parameter rxnmapper_model_quantization: The quantization mode of the RXNMapper model: 'dynamic_int8'. If not
+                                                 specified, the full-precision RXNMapper model is utilized.
+        :parameter strip_unchanged_compounds: The indicator whether the chemical compounds that appear unchanged on both
+                                              sides of the chemical reaction should be stripped before the atom mapping
+                                              and restored without the atom map numbers afterwards.
+        :parameter reagent_smiles_strings: The known reagent chemical compound SMILES strings, such as the solvents and
+                                           the catalysts, that should be stripped from the reactants and the agents
+                                           before the atom mapping and restored without the atom map numbers
+                                           afterwards.
         :parameter kwargs: The default keyword arguments for the adjustment of underlying functions:
                            'rxnmapper.core.RXNMapper.{get_attention_guided_atom_maps}'.
 
         :returns: The mapped chemical reaction SMILES string, and the RXNMapper library atom mapping confidence score.
         """
 
-        try:
-            set_verbosity_error()
+        if strip_unchanged_compounds or reagent_smiles_strings:
+            return SpectatorCompoundUtilities.run_on_reaction_smiles_with_spectator_compound_stripping(
+                reaction_smiles=reaction_smiles,
+                atom_mapping_procedure=partial(
+                    RxnMapperReactionAtomMappingUtilities.run_atom_mapping_on_reaction_smiles,
+                    rxnmapper_model_configuration=rxnmapper_model_configuration,
+                    rxnmapper_model_quantization=rxnmapper_model_quantization,
+                    **kwargs
+                ),
+                strip_unchanged_compounds=strip_unchanged_compounds,
+                reagent_smiles_strings=reagent_smiles_strings
+            )
 
+        try:
             rxnmapper_model_output = RxnMapperReactionAtomMappingUtilities._get_attention_guided_atom_maps_wrapper(
-                rxnmapper_model=RXNMapper(),
+                rxnmapper_model=RxnMapperReactionAtomMappingUtilities.get_rxnmapper_model(
+                    rxnmapper_model_configuration=rxnmapper_model_configuration,
+                    rxnmapper_model_quantization=rxnmapper_model_quantization
+                ),
                 reaction_smiles_strings=[reaction_smiles],
                 **kwargs
             )[0]
@@ -74,11 +265,361 @@ class RxnMapperReactionAtomMappingUtilities:
 
             return None, None
 
+    @staticmethod
+    def _get_reaction_smiles_batches_by_size(
+            reaction_smiles_strings: Iterable[str],
+            rxnmapper_model_batch_size: int
+    ) -> Iterator[List[Tuple[int, str]]]:
+        """
+        Get the consecutive batches of a fixed number of chemical reaction SMILES strings.
+
+        :parameter reaction_smiles_strings: The chemical reaction SMILES strings.
+        :parameter rxnmapper_model_batch_size: The RXNMapper model batch size.
+
+        :returns: The batches of the chemical reaction SMILES string indices and chemical reaction SMILES strings.
+        """
+
+        reaction_smiles_batch = list()
+
+        for reaction_smiles_index, reaction_smiles in enumerate(reaction_smiles_strings):
+            reaction_smiles_batch.append((
+                reaction_smiles_index,
+                reaction_smiles
+            ))
+
+            if len(reaction_smiles_batch) == rxnmapper_model_batch_size:
+                yield reaction_smiles_batch
+
+                reaction_smiles_batch = list()
+
+        if len(reaction_smiles_batch) > 0:
+            yield reaction_smiles_batch
+
+    @staticmethod
+    def _get_reaction_smiles_batches_by_token_budget(
+            reaction_smiles_strings: Iterable[str],
+            rxnmapper_model_batch_token_budget: int
+    ) -> Iterator[List[Tuple[int, str]]]:
+        """
+        Get the batches of chemical reaction SMILES strings of similar length that fit into a token budget.
+
+        :parameter reaction_smiles_strings: The chemical reaction SMILES strings.
+        :parameter rxnmapper_model_batch_token_budget: The maximum number of padded tokens per RXNMapper model batch.
+
+        :returns: The batches of the chemical reaction SMILES string indices and chemical reaction SMILES strings.
+        """
+
+        # --------------------------------------------------------------------------------------------------------------
+        #  The chemical reaction SMILES strings are sorted by the number of tokens, including the two special tokens
+        #  of the model input, so the padded size of each batch is determined by its last chemical reaction SMILES
+        #  string. A chemical reaction SMILES string that exceeds the token budget on its own forms a separate batch.
+        # --------------------------------------------------------------------------------------------------------------
+
+        reaction_smiles_lengths_and_indices = sorted(
+            (ReactionSmilesUtilities.get_number_of_reaction_smiles_tokens(
+                reaction_smiles=reaction_smiles
+            ) + 2, reaction_smiles_index, reaction_smiles)
+            for reaction_smiles_index, reaction_smiles in enumerate(reaction_smiles_strings)
+        )
+
+        reaction_smiles_batch = list()
+
+        for reaction_smiles_length, reaction_smiles_index, reaction_smiles in reaction_smiles_lengths_and_indices:
+            if len(reaction_smiles_batch) > 0 and \
+                    reaction_smiles_length * (len(reaction_smiles_batch) + 1) > rxnmapper_model_batch_token_budget:
+                yield reaction_smiles_batch
+
+                reaction_smiles_batch = list()
+
+            reaction_smiles_batch.append((
+                reaction_smiles_index,
+                reaction_smiles
+            ))
+
+        if len(reaction_smiles_batch) > 0:
+            yield reaction_smiles_batch
+
+    @staticmethod
+    def _run_atom_mapping_on_reaction_smiles_batch(
+            rxnmapper_model: "RXNMapper",
+            reaction_smiles_batch: List[str],
+            atom_mapping_statistics: Counter,
+            **kwargs
+    ) -> List[Tuple[Optional[str], Optional[float]]]:
+        """
+        Run the RXNMapper library atom mapping on a batch of chemical reaction SMILES strings, and if the batch fails,
+        recursively split it in halves and retry so that only the offending chemical reaction SMILES strings fail.
+
+        :parameter rxnmapper_model: The RXNMapper model RXNMapper object.
+        :parameter reaction_smiles_batch: The batch of chemical reaction SMILES strings.
+        :parameter atom_mapping_statistics: The counters of the retried and failed chemical reaction SMILES strings.
+        :parameter kwargs: The default keyword arguments for the adjustment of underlying functions:
+                           'rxnmapper.core.RXNMapper.{get_attention_guided_atom_maps}'.
+
+        :returns: The mapped chemical reaction SMILES strings, and the RXNMapper library atom mapping confidence scores.
+        """
+
+        try:
+            rxnmapper_model_outputs = RxnMapperReactionAtomMappingUtilities._get_attention_guided_atom_maps_wrapper(
+                rxnmapper_model=rxnmapper_model,
+                reaction_smiles_strings=reaction_smiles_batch,
+                **kwargs
+            )
+
+        except Exception as exception_handle:
+            if len(reaction_smiles_batch) == 1:
+                getLogger(
+                    "{0}.RxnMapperReactionAtomMappingUtilities._run_atom_mapping_on_reaction_smiles_batch".format(
+                        __name__
+                    )
+                ).debug("'{0}': {1}".format(reaction_smiles_batch[0], exception_handle))
+
+                atom_mapping_statistics["failed"] += 1
+
+                InstrumentationUtilities.increment(
+                    counter_name="rxnmapper.failures"
+                )
+
+                return [(None, None), ]
+
+            atom_mapping_statistics["retried"] += len(reaction_smiles_batch)
+
+            InstrumentationUtilities.increment(
+                counter_name="rxnmapper.retries",
+                value=len(reaction_smiles_batch)
+            )
+
+            mapped_reaction_smiles_strings_and_confidence_scores = list()
+
+            for reaction_smiles_sub_batch in [
+                reaction_smiles_batch[:len(reaction_smiles_batch) // 2],
+                reaction_smiles_batch[len(reaction_smiles_batch) // 2:]
+            ]:
+                mapped_reaction_smiles_strings_and_confidence_scores.extend(
+                    RxnMapperReactionAtomMappingUtilities._run_atom_mapping_on_reaction_smiles_batch(
+                        rxnmapper_model=rxnmapper_model,
+                        reaction_smiles_batch=reaction_smiles_sub_batch,
+                        atom_mapping_statistics=atom_mapping_statistics,
+                        **kwargs
+                    )
+                )
+
+            return mapped_reaction_smiles_strings_and_confidence_scores
+
+        if InstrumentationUtilities.is_enabled():
+            InstrumentationUtilities.increment(
+                counter_name="rxnmapper.empty_outputs",
+                value=sum(
+                    not rxnmapper_model_output.get("mapped_rxn") for rxnmapper_model_output in rxnmapper_model_outputs
+                )
+            )
+
+        return [
+            (
+                rxnmapper_model_output["mapped_rxn"] if "mapped_rxn" in rxnmapper_model_output.keys() else None,
+                rxnmapper_model_output["confidence"] if "confidence" in rxnmapper_model_output.keys() else None
+            ) for rxnmapper_model_output in rxnmapper_model_outputs
+        ]
+
+    @staticmethod
+    def _initialize_worker_process(
+            number_of_threads: int
+    ) -> None:
+        """
+        Initialize a forked worker process by limiting the number of PyTorch intra-op threads, so that the worker
+        processes do not oversubscribe the CPU cores. The RXNMapper model is inherited from the parent process.
+
+        :parameter number_of_threads: The number of PyTorch intra-op threads of the worker process.
+        """
+
+        from torch import set_num_threads
+
+        set_num_threads(number_of_threads)
+
+    @staticmethod
+    def _run_atom_mapping_on_indexed_reaction_smiles_batch(
+            reaction_smiles_batch: List[Tuple[int, str]],
+            rxnmapper_model_configuration: Optional[Dict[str, Any]] = None,
+            rxnmapper_model_quantization: Optional[str] = None,
+            **kwargs
+    ) -> Tuple[List[Tuple[int, Tuple[Optional[str], Optional[float]]]], Counter]:
+        """
+        Run the RXNMapper library atom mapping on a batch of chemical reaction SMILES strings in a forked worker
+        process.
+
+        :parameter reaction_smiles_batch: The batch of the chemical reaction SMILES string indices and chemical reaction
+                                          SMILES strings.
+        :parameter rxnmapper_model_configuration: The configuration of the RXNMapper model:
+                                                  'rxnmapper.core.RXNMapper.{config}'.
+        :parameter rxnmapper_model_quantization: The quantization mode of the RXNMapper model: 'dynamic_int8'. If not
+                                                 specified, the full-precision RXNMapper model is utilized.
+        :parameter kwargs: The default keyword arguments for the adjustment of underlying functions:
+                           'rxnmapper.core.RXNMapper.{get_attention_guided_atom_maps}'.
+
+        :returns: The chemical reaction SMILES string indices with the mapped chemical reaction SMILES strings and the
+                  RXNMapper library atom mapping confidence scores, and the counters of the retried and failed chemical
+                  reaction SMILES strings of the batch.
+        """
+
+        rxnmapper_model = RxnMapperReactionAtomMappingUtilities.get_rxnmapper_model(
+            rxnmapper_model_configuration=rxnmapper_model_configuration,
+            rxnmapper_model_quantization=rxnmapper_model_quantization
+        )
+
+        atom_mapping_statistics = Counter()
+
+        reaction_smiles_indices, reaction_smiles_strings_batch = zip(*reaction_smiles_batch)
+
+        return list(zip(
+            reaction_smiles_indices,
+            RxnMapperReactionAtomMappingUtilities._run_atom_mapping_on_reaction_smiles_batch(
+                rxnmapper_model=rxnmapper_model,
+                reaction_smiles_batch=list(reaction_smiles_strings_batch),
+                atom_mapping_statistics=atom_mapping_statistics,
+                **kwargs
+            )
+        )), atom_mapping_statistics
+
+    @staticmethod
+    def _iterate_data_parallel_atom_mapping_results(
+            reaction_smiles_batches: List[List[Tuple[int, str]]],
+            number_of_cpu_cores: int,
+            rxnmapper_model_configuration: Optional[Dict[str, Any]],
+            rxnmapper_model_quantization: Optional[str],
+            atom_mapping_statistics: Counter,
+            **kwargs
+    ) -> Iterator[List[Tuple[int, Tuple[Optional[str], Optional[float]]]]]:
+        """
+        Iterate over the RXNMapper library atom mapping results of the batches of chemical reaction SMILES strings that
+        are mapped by the forked worker processes. The RXNMapper model must already be loaded in the current process, so
+        that the worker processes share its weights through the copy-on-write memory pages instead of loading their own
+        copies. If a worker process terminates abruptly, the unfinished batches are mapped in the current process.
+
+        :parameter reaction_smiles_batches: The batches of the chemical reaction SMILES string indices and chemical
+                                            reaction SMILES strings.
+        :parameter number_of_cpu_cores: The number of CPU cores that should be utilized.
+        :parameter rxnmapper_model_configuration: The configuration of the RXNMapper model:
+                                                  'rxnmapper.core.RXNMapper.{config}'.
+        :parameter rxnmapper_model_quantization: The quantization mode of the RXNMapper model: 'dynamic_int8'. If not
+                                                 specified, the full-precision RXNMapper model is utilized.
+        :parameter atom_mapping_statistics: The counters that should be updated with the number of chemical reaction
+                                            SMILES strings that were retried after a batch failure or that failed.
+        :parameter kwargs: The default keyword arguments for the adjustment of underlying functions:
+                           'rxnmapper.core.RXNMapper.{get_attention_guided_atom_maps}'.
+
+        :returns: The chemical reaction SMILES string indices with the mapped chemical reaction SMILES strings and the
+                  RXNMapper library atom mapping confidence scores of each batch in the order of completion.
+        """
+
+        if len(reaction_smiles_batches) == 0:
+            return
+
+        number_of_worker_processes = min(number_of_cpu_cores, len(reaction_smiles_batches))
+
+        processing_procedure = partial(
+            RxnMapperReactionAtomMappingUtilities._run_atom_mapping_on_indexed_reaction_smiles_batch,
+            rxnmapper_model_configuration=rxnmapper_model_configuration,
+            rxnmapper_model_quantization=rxnmapper_model_quantization,
+            **kwargs
+        )
+
+        if InstrumentationUtilities.is_enabled():
+            processing_procedure = partial(InstrumentationUtilities.run_with_metrics_collection, processing_procedure)
+
+        # --------------------------------------------------------------------------------------------------------------
+        #  The objects of the current process are moved to the permanent generation of the garbage collector before the
+        #  worker processes are forked, so that the garbage collection in the worker processes does not write to the
+        #  memory pages of the shared objects and copy them.
+        # --------------------------------------------------------------------------------------------------------------
+
+        unfinished_reaction_smiles_batches = {
+            reaction_smiles_batch[0][0]: reaction_smiles_batch for reaction_smiles_batch in reaction_smiles_batches
+        }
+
+        freeze()
+
+        try:
+            with ProcessPoolExecutor(
+                max_workers=number_of_worker_processes,
+                mp_context=get_context("fork"),
+                initializer=RxnMapperReactionAtomMappingUtilities._initialize_worker_process,
+                initargs=(max(1, number_of_cpu_cores // number_of_worker_processes), )
+            ) as process_pool_executor:
+                batch_output_futures = [
+                    process_pool_executor.submit(
+                        processing_procedure,
+                        reaction_smiles_batch
+                    ) for reaction_smiles_batch in reaction_smiles_batches
+                ]
+
+                batch_outputs = (
+                    batch_output_future.result() for batch_output_future in as_completed(batch_output_futures)
+                )
+
+                if InstrumentationUtilities.is_enabled():
+                    batch_outputs = InstrumentationUtilities.iterate_with_metrics_merging(
+                        processing_procedure_outputs=batch_outputs
+                    )
+
+                try:
+                    for indexed_atom_mapping_results, batch_atom_mapping_statistics in batch_outputs:
+                        atom_mapping_statistics.update(batch_atom_mapping_statistics)
+
+                        unfinished_reaction_smiles_batches.pop(indexed_atom_mapping_results[0][0])
+
+                        yield indexed_atom_mapping_results
+
+                # ------------------------------------------------------------------------------------------------------
+                #  A worker process that terminates abruptly, for example after being killed by the out-of-memory
+                #  killer, breaks the whole process pool instead of leaving its batch pending forever. The results of
+                #  the finished batches are kept, and only the unfinished batches are mapped again below.
+                # ------------------------------------------------------------------------------------------------------
+
+                except BrokenProcessPool:
+                    getLogger(
+                        "{0}.RxnMapperReactionAtomMappingUtilities._iterate_data_parallel_atom_mapping_results".format(
+                            __name__
+                        )
+                    ).error(
+                        "A RXNMapper worker process terminated abruptly. The {0} unfinished batches are mapped in the "
+                        "current process.".format(len(unfinished_reaction_smiles_batches))
+                    )
+
+                    for batch_output_future in batch_output_futures:
+                        batch_output_future.cancel()
+
+        finally:
+            unfreeze()
+
+        for reaction_smiles_batch in list(unfinished_reaction_smiles_batches.values()):
+            indexed_atom_mapping_results, batch_atom_mapping_statistics = \
+                RxnMapperReactionAtomMappingUtilities._run_atom_mapping_on_indexed_reaction_smiles_batch(
+                    reaction_smiles_batch=reaction_smiles_batch,
+                    rxnmapper_model_configuration=rxnmapper_model_configuration,
+                    rxnmapper_model_quantization=rxnmapper_model_quantization,
+                    **kwargs
+                )
+
+            atom_mapping_statistics.update(batch_atom_mapping_statistics)
+
+            unfinished_reaction_smiles_batches.pop(reaction_smiles_batch[0][0])
+
+            yield indexed_atom_mapping_results
+
     @staticmethod
     def run_atom_mapping_on_reaction_smiles_strings(
             reaction_smiles_strings: Iterable[str],
             number_of_reaction_smiles_strings: int,
             rxnmapper_model_batch_size: int = 10,
+            rxnmapper_model_batch_token_budget: Optional[int] = None,
+            rxnmapper_model_configuration: Optional[Dict[str, Any]] = None,
+            rxnmapper_model_quantization: Optional[str] = None,
+            atom_mapping_statistics: Optional[Counter] = None,
+            number_of_cpu_cores: int = 1,
+            strip_unchanged_compounds: bool = False,
+            reagent_smiles_strings: Optional[Collection[str]] = None,
+            deduplication_mode: Optional[str] = None,
+            atom_mapping_cache: Optional[AtomMappingResultCache] = None,
             **kwargs
     ) -> Optional[List[Tuple[Optional[str], Optional[float]]]]:
         """
@@ -87,62 +628,162 @@ class RxnMapperReactionAtomMappingUtilities:
         :parameter reaction_smiles_strings: The chemical reaction SMILES strings.
         :parameter number_of_reaction_smiles_strings: The number of chemical reaction SMILES strings.
         :parameter rxnmapper_model_batch_size: The RXNMapper model batch size.
+        :parameter rxnmapper_model_batch_token_budget: The maximum number of padded tokens per RXNMapper model batch. If
+                                                       specified, the chemical reaction SMILES strings are batched by
+                                                       length within the token budget instead of by the batch size, and
+                                                       the outputs are returned in the original order.
+        :parameter rxnmapper_model_configuration: The configuration of the RXNMapper model:
+                                                  'rxnmapper.core.RXNMapper.{config}'.
+        :parameter rxnmapper_model_quantization: The quantization mode of the RXNMapper model: 'dynamic_int8'. If not
+                                                 specified, the full-precision RXNMapper model is utilized.
+        :parameter atom_mapping_statistics: The counters that should be updated with the number of chemical reaction
+                                            SMILES strings that were retried after a batch failure or that failed.
+        :parameter number_of_cpu_cores: The number of CPU cores that should be utilized. If more than one CPU core is
+                                        specified and the 'fork' start method is available, the RXNMapper model is
+                                        loaded once in the current process and shared with the forked worker processes,
+                                        each of which maps the batches with an equal share of the specified CPU cores as
+                                        the PyTorch threads.
+        :parameter strip_unchanged_compounds: The indicator whether the chemical compounds that appear unchanged on both
+                                              sides of the chemical reactions should be stripped before the atom
+                                              mapping and restored without the atom map numbers afterwards.
+        :parameter reagent_smiles_strings: The known reagent chemical compound SMILES strings, such as the solvents and
+                                           the catalysts, that should be stripped from the reactants and the agents
+                                           before the atom mapping and restored without the atom map numbers
+                                           afterwards.
+        :parameter deduplication_mode: The indicator how the duplicate chemical reaction SMILES strings should be
+                                       identified before the atom mapping: 'exact' or 'canonical'. If not specified,
+                                       the chemical reaction SMILES strings are not deduplicated.
+        :parameter atom_mapping_cache: The chemical reaction atom mapping result cache that should be consulted before
+                                       the RXNMapper model is utilized.
         :parameter kwargs: The default keyword arguments for the adjustment of underlying functions:
                            'rxnmapper.core.RXNMapper.{get_attention_guided_atom_maps}'.
 
         :returns: The mapped chemical reaction SMILES strings, and the RXNMapper library atom mapping confidence scores.
         """
 
+        if deduplication_mode is not None or atom_mapping_cache is not None:
+            return RxnMapperReactionAtomMapper(
+                rxnmapper_model_configuration=rxnmapper_model_configuration,
+                rxnmapper_model_quantization=rxnmapper_model_quantization,
+                rxnmapper_model_batch_token_budget=rxnmapper_model_batch_token_budget,
+                atom_mapping_statistics=atom_mapping_statistics,
+                strip_unchanged_compounds=strip_unchanged_compounds,
+                reagent_smiles_strings=reagent_smiles_strings,
+                **kwargs
+            ).map_batch(
+                reaction_smiles_strings=reaction_smiles_strings,
+                number_of_cpu_cores=number_of_cpu_cores,
+                batch_size=rxnmapper_model_batch_size,
+                deduplication_mode=deduplication_mode,
+                atom_mapping_cache=atom_mapping_cache
+            )
+
+        if strip_unchanged_compounds or reagent_smiles_strings:
+            return SpectatorCompoundUtilities.run_with_spectator_compound_stripping(
+                reaction_smiles_strings=reaction_smiles_strings,
+                atom_mapping_procedure=lambda stripped_reaction_smiles_strings:
+                RxnMapperReactionAtomMappingUtilities.run_atom_mapping_on_reaction_smiles_strings(
+                    reaction_smiles_strings=stripped_reaction_smiles_strings,
+                    number_of_reaction_smiles_strings=len(stripped_reaction_smiles_strings),
+                    rxnmapper_model_batch_size=rxnmapper_model_batch_size,
+                    rxnmapper_model_batch_token_budget=rxnmapper_model_batch_token_budget,
+                    rxnmapper_model_configuration=rxnmapper_model_configuration,
+                    rxnmapper_model_quantization=rxnmapper_model_quantization,
+                    atom_mapping_statistics=atom_mapping_statistics,
+                    number_of_cpu_cores=number_of_cpu_cores,
+                    **kwargs
+                ),
+                strip_unchanged_compounds=strip_unchanged_compounds,
+                reagent_smiles_strings=reagent_smiles_strings
+            )
+
+        atom_mapping_statistics = atom_mapping_statistics if atom_mapping_statistics is not None else Counter()
+
         try:
-            set_verbosity_error()
+            rxnmapper_model = RxnMapperReactionAtomMappingUtilities.get_rxnmapper_model(
+                rxnmapper_model_configuration=rxnmapper_model_configuration,
+                rxnmapper_model_quantization=rxnmapper_model_quantization
+            )
 
-            rxnmapper_model = RXNMapper()
+            if rxnmapper_model_batch_token_budget is None:
+                reaction_smiles_batches = RxnMapperReactionAtomMappingUtilities._get_reaction_smiles_batches_by_size(
+                    reaction_smiles_strings=reaction_smiles_strings,
+                    rxnmapper_model_batch_size=rxnmapper_model_batch_size
+                )
+
+            else:
+                reaction_smiles_batches = \
+                    RxnMapperReactionAtomMappingUtilities._get_reaction_smiles_batches_by_token_budget(
+                        reaction_smiles_strings=reaction_smiles_strings,
+                        rxnmapper_model_batch_token_budget=rxnmapper_model_batch_token_budget
+                    )
+
+            mapped_reaction_smiles_strings_and_confidence_scores = dict()
+
+            number_of_cpu_cores = number_of_cpu_cores if 1 <= number_of_cpu_cores <= cpu_count() else 1
 
-            reaction_smiles_batch, mapped_reaction_smiles_strings_and_confidence_scores = list(), list()
+            if number_of_cpu_cores > 1 and "fork" not in get_all_start_methods():
+                getLogger(
+                    "{0}.RxnMapperReactionAtomMappingUtilities.run_atom_mapping_on_reaction_smiles_strings".format(
+                        __name__
+                    )
+                ).warning("The 'fork' start method is not available. The RXNMapper model runs in the current process.")
 
-            for reaction_smiles_index, reaction_smiles in tqdm(
-                iterable=enumerate(reaction_smiles_strings),
+                number_of_cpu_cores = 1
+
+            with tqdm(
                 total=number_of_reaction_smiles_strings,
                 ascii=True,
                 ncols=150,
-                desc="Mapping the chemical reaction SMILES strings using the RXNMapper library"
-            ):
-                reaction_smiles_batch.append(
-                    reaction_smiles
-                )
+                desc="Mapping the chemical reaction SMILES strings using the RXNMapper library (CPU Cores: {0})".format(
+                    number_of_cpu_cores
+                ),
+                disable=not MultiprocessingUtilities.are_progress_bars_enabled()
+            ) as progress_bar:
+                if number_of_cpu_cores > 1:
+                    for indexed_atom_mapping_results in \
+                            RxnMapperReactionAtomMappingUtilities._iterate_data_parallel_atom_mapping_results(
+                                reaction_smiles_batches=list(reaction_smiles_batches),
+                                number_of_cpu_cores=number_of_cpu_cores,
+                                rxnmapper_model_configuration=rxnmapper_model_configuration,
+                                rxnmapper_model_quantization=rxnmapper_model_quantization,
+                                atom_mapping_statistics=atom_mapping_statistics,
+                                **kwargs
+                            ):
+                        mapped_reaction_smiles_strings_and_confidence_scores.update(indexed_atom_mapping_results)
 
-                if (reaction_smiles_index + 1) % rxnmapper_model_batch_size == 0:
-                    rxnmapper_model_outputs = \
-                        RxnMapperReactionAtomMappingUtilities._get_attention_guided_atom_maps_wrapper(
-                            rxnmapper_model=rxnmapper_model,
-                            reaction_smiles_strings=reaction_smiles_batch,
-                            **kwargs
-                        )
+                        progress_bar.update(len(indexed_atom_mapping_results))
 
-                    for rxnmapper_model_output in rxnmapper_model_outputs:
-                        mapped_reaction_smiles_strings_and_confidence_scores.append((
-                            rxnmapper_model_output["mapped_rxn"]
-                            if "mapped_rxn" in rxnmapper_model_output.keys() else None,
-                            rxnmapper_model_output["confidence"]
-                            if "confidence" in rxnmapper_model_output.keys() else None
-                        ))
+                else:
+                    for reaction_smiles_batch in reaction_smiles_batches:
+                        reaction_smiles_indices, reaction_smiles_strings_batch = zip(*reaction_smiles_batch)
 
-                    reaction_smiles_batch.clear()
+                        mapped_reaction_smiles_strings_and_confidence_scores.update(zip(
+                            reaction_smiles_indices,
+                            RxnMapperReactionAtomMappingUtilities._run_atom_mapping_on_reaction_smiles_batch(
+                                rxnmapper_model=rxnmapper_model,
+                                reaction_smiles_batch=list(reaction_smiles_strings_batch),
+                                atom_mapping_statistics=atom_mapping_statistics,
+                                **kwargs
+                            )
+                        ))
 
-            if len(reaction_smiles_batch) > 0:
-                rxnmapper_model_outputs = RxnMapperReactionAtomMappingUtilities._get_attention_guided_atom_maps_wrapper(
-                    rxnmapper_model=rxnmapper_model,
-                    reaction_smiles_strings=reaction_smiles_batch,
-                    **kwargs
-                )
+                        progress_bar.update(len(reaction_smiles_batch))
 
-                for rxnmapper_model_output in rxnmapper_model_outputs:
-                    mapped_reaction_smiles_strings_and_confidence_scores.append((
-                        rxnmapper_model_output["mapped_rxn"] if "mapped_rxn" in rxnmapper_model_output.keys() else None,
-                        rxnmapper_model_output["confidence"] if "confidence" in rxnmapper_model_output.keys() else None
-                    ))
+            if atom_mapping_statistics["retried"] > 0:
+                getLogger(
+                    "{0}.RxnMapperReactionAtomMappingUtilities.run_atom_mapping_on_reaction_smiles_strings".format(
+                        __name__
+                    )
+                ).info("Retried chemical reaction SMILES strings: {0}, failed: {1}.".format(
+                    atom_mapping_statistics["retried"],
+                    atom_mapping_statistics["failed"]
+                ))
 
-            return mapped_reaction_smiles_strings_and_confidence_scores
+            return [
+                mapped_reaction_smiles_strings_and_confidence_scores[reaction_smiles_index]
+                for reaction_smiles_index in range(len(mapped_reaction_smiles_strings_and_confidence_scores))
+            ]
 
         except Exception as exception_handle:
             getLogger(
@@ -150,3 +791,149 @@ class RxnMapperReactionAtomMappingUtilities:
             ).debug(exception_handle)
 
             return None
+
+
+class RxnMapperReactionAtomMapper(ReactionAtomMapper):
+    """ The RXNMapper library chemical reaction atom mapper class. """
+
+    library = "rxnmapper"
+    library_display_name = "RXNMapper"
+
+    atom_mapping_score_name = "atom_mapping_confidence_score"
+    atom_mapping_score_display_name = "Atom Mapping Confidence Score"
+
+    backend_utilities = RxnMapperReactionAtomMappingUtilities
+
+    is_batchable = True
+    is_thread_safe = False
+    needs_model = True
+    honours_task_timeout = False
+
+    # ------------------------------------------------------------------------------------------------------------------
+    #  The RXNMapper model accepts at most 512 tokens, including the two special tokens.
+    # ------------------------------------------------------------------------------------------------------------------
+
+    pre_validation_limits = {
+        "maximum_number_of_tokens": 510,
+    }
+
+    atom_mapping_option_defaults = {
+        **ReactionAtomMapper.atom_mapping_option_defaults,
+        "zero_set_p": True,
+        "zero_set_r": True,
+        "canonicalize_rxns": True,
+        "detailed_output": False,
+        "absolute_product_inds": False,
+        "force_layer": None,
+        "force_head": None,
+    }
+
+    def __init__(
+            self,
+            rxnmapper_model_configuration: Optional[Dict[str, Any]] = None,
+            rxnmapper_model_quantization: Optional[str] = None,
+            rxnmapper_model_batch_token_budget: Optional[int] = None,
+            atom_mapping_statistics: Optional[Counter] = None,
+            **kwargs
+    ) -> None:
+        """
+        The constructor method of the class.
+
+        :parameter rxnmapper_model_configuration: The configuration of the RXNMapper model:
+                                                  'rxnmapper.core.RXNMapper.{config}'.
+        :parameter rxnmapper_model_quantization: The quantization mode of the RXNMapper model: 'dynamic_int8'. If not
+                                                 specified, the full-precision RXNMapper model is utilized.
+        :parameter rxnmapper_model_batch_token_budget: The maximum number of padded tokens per RXNMapper model batch. If
+                                                       specified, the batch size is ignored.
+        :parameter atom_mapping_statistics: The counters of the retried and failed chemical reaction SMILES strings.
+        :parameter kwargs: The default keyword arguments for the adjustment of underlying functions:
+                           'rxnmapper.core.RXNMapper.{get_attention_guided_atom_maps}'.
+        """
+
+        super().__init__(**kwargs)
+
+        self.rxnmapper_model_configuration = rxnmapper_model_configuration
+        self.rxnmapper_model_quantization = rxnmapper_model_quantization
+        self.rxnmapper_model_batch_token_budget = rxnmapper_model_batch_token_budget
+        self.atom_mapping_statistics = atom_mapping_statistics
+
+    def get_atom_mapping_options(
+            self
+    ) -> Dict[str, Any]:
+        """
+        Get the options of the chemical reaction atom mapper that affect the chemical reaction atom mapping results.
+
+        :returns: The options of the chemical reaction atom mapper.
+        """
+
+        return {
+            **super().get_atom_mapping_options(),
+            **RxnMapperReactionAtomMappingUtilities.get_atom_mapping_options(
+                rxnmapper_model_configuration=self.rxnmapper_model_configuration,
+                rxnmapper_model_quantization=self.rxnmapper_model_quantization
+            ),
+        }
+
+    def map_one(
+            self,
+            reaction_smiles: str
+    ) -> Tuple[Optional[str], Optional[float]]:
+        """
+        Map a chemical reaction SMILES string.
+
+        :parameter reaction_smiles: The chemical reaction SMILES string.
+
+        :returns: The mapped chemical reaction SMILES string, and the RXNMapper library atom mapping confidence score.
+        """
+
+        return RxnMapperReactionAtomMappingUtilities.run_atom_mapping_on_reaction_smiles(
+            reaction_smiles=reaction_smiles,
+            rxnmapper_model_configuration=self.rxnmapper_model_configuration,
+            rxnmapper_model_quantization=self.rxnmapper_model_quantization,
+            **self.atom_mapping_options
+        )
+
+    def _map_batch(
+            self,
+            reaction_smiles_strings: List[str],
+            number_of_cpu_cores: int = 1,
+            batch_size: Optional[int] = None,
+            task_timeout_period_s: Optional[float] = None,
+            use_shared_memory: bool = False
+    ) -> Optional[List[Tuple[Optional[str], Optional[float]]]]:
+        """
+        Map a list of chemical reaction SMILES strings without the deduplication and the caching.
+
+        :parameter reaction_smiles_strings: The chemical reaction SMILES strings.
+        :parameter number_of_cpu_cores: The number of CPU cores that should be utilized by the forked worker processes
+                                        that share the RXNMapper model of the current process.
+        :parameter batch_size: The RXNMapper model batch size. If not specified, the default batch size is utilized.
+        :parameter task_timeout_period_s: The task timeout period, which is ignored because the RXNMapper model runs in
+                                          the current process.
+        :parameter use_shared_memory: The shared memory indicator, which is ignored because the forked worker processes
+                                      receive whole RXNMapper model batches.
+
+        :returns: The mapped chemical reaction SMILES strings, and the RXNMapper library atom mapping confidence scores.
+        """
+
+        return RxnMapperReactionAtomMappingUtilities.run_atom_mapping_on_reaction_smiles_strings(
+            reaction_smiles_strings=reaction_smiles_strings,
+            number_of_reaction_smiles_strings=len(reaction_smiles_strings),
+            rxnmapper_model_batch_size=batch_size if batch_size is not None else 10,
+            rxnmapper_model_batch_token_budget=self.rxnmapper_model_batch_token_budget,
+            rxnmapper_model_configuration=self.rxnmapper_model_configuration,
+            rxnmapper_model_quantization=self.rxnmapper_model_quantization,
+            atom_mapping_statistics=self.atom_mapping_statistics,
+            number_of_cpu_cores=number_of_cpu_cores,
+            **self.atom_mapping_options
+        )
+
+    def release(
+            self
+    ) -> None:
+        """ Release the RXNMapper model of the chemical reaction atom mapper from the process-wide model registry. """
+
+        RxnMapperReactionAtomMappingUtilities.release_rxnmapper_model(
+            rxnmapper_model_configuration=self.rxnmapper_model_configuration,
+            rxnmapper_model_quantization=self.rxnmapper_model_quantization
+        )
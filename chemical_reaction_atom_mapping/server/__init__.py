@@ -0,0 +1,3 @@
+""" The 'chemical_reaction_atom_mapping.server' package initialization module. """
+
+from .server import AtomMappingClient, AtomMappingServer
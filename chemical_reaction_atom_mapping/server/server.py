@@ -0,0 +1,490 @@
+""" The 'chemical_reaction_atom_mapping.server' package 'server' module. """
+
+from asyncio import (
+    AbstractEventLoop, Future, Queue, StreamReader, StreamWriter, TimeoutError as AsyncioTimeoutError, gather,
+    get_running_loop, run, start_server, start_unix_server, wait_for
+)
+from concurrent.futures import ThreadPoolExecutor
+from json import dumps, loads
+from logging import getLogger
+from os import remove
+from os.path import exists
+from signal import SIGTERM, signal
+from socket import AF_INET, AF_UNIX, SOCK_STREAM, socket
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..utilities.backend_registry import BackendRegistryUtilities
+from ..utilities.instrumentation import InstrumentationUtilities
+from ..utilities.multiprocessing import MultiprocessingUtilities
+
+
+def _parse_server_address(
+        server_address: str
+) -> Tuple[str, Any]:
+    """
+    Parse a server address of the form 'unix:/path/to/socket' or 'host:port'.
+
+    :parameter server_address: The server address.
+
+    :returns: The socket family name, and the path to the Unix domain socket or the host and the port.
+    """
+
+    if server_address.startswith("unix:"):
+        return "unix", server_address[len("unix:"):]
+
+    host, _, port = server_address.rpartition(":")
+
+    return "tcp", (host if host != "" else "127.0.0.1", int(port))
+
+
+class AtomMappingServer:
+    """
+    The long-running local chemical reaction atom mapping server class. The server keeps the models of the libraries
+    warm, collects the concurrent requests of each library into micro-batches, and speaks a JSON-lines protocol over a
+    Unix domain socket or a TCP socket.
+
+    Each request line is a JSON object with the 'library' and 'reaction_smiles' keys and an optional 'id' key, and each
+    response line is a JSON object with the 'id', 'library', 'reaction_smiles', 'mapped_reaction_smiles' and
+    'atom_mapping_score' keys, or with the 'id' and 'error' keys. For the EPAM Indigo library, the atom mapping score is
+    the indicator whether the atom mapping procedure was completed without errors. The responses of a connection are
+    written in the order of completion, so the requests can be pipelined. The micro-batches are mapped using the
+    'map_batch' method of the chemical reaction atom mappers, so the task timeout period is honoured by the libraries
+    that support it. The worker processes of each library are started once and reused by all of its micro-batches, and
+    the progress bars are not shown.
+    """
+
+    def __init__(
+            self,
+            libraries: Iterable[str],
+            maximum_batch_size: int = 32,
+            maximum_batch_wait_time_ms: float = 5.0,
+            number_of_cpu_cores: int = 1,
+            task_timeout_period_s: Optional[float] = None
+    ) -> None:
+        """
+        The constructor method of the class.
+
+        :parameter libraries: The indicators of the chemical reaction atom mapping libraries that should be served:
+                              'chytorch_rxnmap', 'epam_indigo' and 'rxnmapper'.
+        :parameter maximum_batch_size: The maximum number of chemical reaction SMILES strings per micro-batch.
+        :parameter maximum_batch_wait_time_ms: The maximum amount of time in milliseconds that the first request of a
+                                               micro-batch waits for further requests.
+        :parameter number_of_cpu_cores: The number of worker processes of each library that honours the task timeout
+                                        period. The micro-batches of the other libraries are mapped in the thread of
+                                        the library as a single model batch.
+        :parameter task_timeout_period_s: The maximum amount of time in seconds that may be spent on a chemical
+                                          reaction SMILES string before its worker process is killed and replaced. If
+                                          not specified and only one CPU core is utilized, the micro-batches are mapped
+                                          in the thread of the library.
+        """
+
+        self.libraries = list(libraries)
+        self.maximum_batch_size = max(1, maximum_batch_size)
+        self.maximum_batch_wait_time_ms = max(0.0, maximum_batch_wait_time_ms)
+        self.number_of_cpu_cores = max(1, number_of_cpu_cores)
+        self.task_timeout_period_s = task_timeout_period_s
+
+        self._atom_mapping_procedures = {
+            library: AtomMappingServer._get_atom_mapping_procedure(
+                library=library,
+                number_of_cpu_cores=self.number_of_cpu_cores,
+                task_timeout_period_s=task_timeout_period_s
+            ) for library in self.libraries
+        }
+
+        # --------------------------------------------------------------------------------------------------------------
+        #  Each library runs in its own single thread, so its model is loaded once, stays warm, and is never utilized by
+        #  two micro-batches at the same time. The thread reuses its worker processes across the micro-batches instead
+        #  of starting a process pool per micro-batch.
+        # --------------------------------------------------------------------------------------------------------------
+
+        self._executors = {
+            library: ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix="{0}_atom_mapping".format(library),
+                initializer=AtomMappingServer._initialize_library_thread
+            ) for library in self.libraries
+        }
+
+        self._request_queues = dict()  # type: Dict[str, Queue]
+
+    @staticmethod
+    def _initialize_library_thread() -> None:
+        """ Initialize the thread of a library to reuse its worker processes and to hide the progress bars. """
+
+        MultiprocessingUtilities.enable_persistent_process_pool()
+        MultiprocessingUtilities.disable_progress_bars()
+
+    @staticmethod
+    def _get_atom_mapping_procedure(
+            library: str,
+            number_of_cpu_cores: int = 1,
+            task_timeout_period_s: Optional[float] = None
+    ) -> Callable[[List[str]], List[Tuple[Optional[str], Any]]]:
+        """
+        Get the procedure that maps a micro-batch of chemical reaction SMILES strings using a library.
+
+        :parameter library: The indicator of the chemical reaction atom mapping library.
+        :parameter number_of_cpu_cores: The number of worker processes if the library honours the task timeout period.
+        :parameter task_timeout_period_s: The maximum amount of time in seconds that may be spent on a chemical
+                                          reaction SMILES string before its worker process is killed and replaced.
+
+        :returns: The procedure that maps a micro-batch of chemical reaction SMILES strings as a single model batch.
+        """
+
+        atom_mapper = BackendRegistryUtilities.get_atom_mapper(
+            library=library
+        )
+
+        # --------------------------------------------------------------------------------------------------------------
+        #  The libraries that ignore the task timeout period start their own process pools for more than one CPU core,
+        #  which would be started again for each micro-batch, so they are utilized with a single CPU core.
+        # --------------------------------------------------------------------------------------------------------------
+
+        return lambda reaction_smiles_batch: atom_mapper.map_batch(
+            reaction_smiles_strings=reaction_smiles_batch,
+            number_of_cpu_cores=number_of_cpu_cores if atom_mapper.honours_task_timeout else 1,
+            batch_size=len(reaction_smiles_batch),
+            task_timeout_period_s=task_timeout_period_s
+        )
+
+    async def _run_atom_mapping_on_micro_batch(
+            self,
+            library: str,
+            requests: List[Tuple[str, Future]],
+            event_loop: AbstractEventLoop
+    ) -> None:
+        """
+        Run the atom mapping on a micro-batch of requests in the thread of the library, and resolve their futures.
+
+        :parameter library: The indicator of the chemical reaction atom mapping library.
+        :parameter requests: The chemical reaction SMILES strings and the futures of the requests.
+        :parameter event_loop: The running event loop.
+        """
+
+        try:
+            with InstrumentationUtilities.measure("server.{0}.micro_batch".format(library)):
+                atom_mapping_results = await event_loop.run_in_executor(
+                    self._executors[library],
+                    self._atom_mapping_procedures[library],
+                    [reaction_smiles for reaction_smiles, _ in requests]
+                )
+
+        except Exception as exception_handle:
+            getLogger(
+                "{0}.AtomMappingServer._run_atom_mapping_on_micro_batch".format(__name__)
+            ).exception(exception_handle)
+
+            atom_mapping_results = [(None, None), ] * len(requests)
+
+        for (_, request_future), atom_mapping_result in zip(requests, atom_mapping_results):
+            if not request_future.done():
+                request_future.set_result(atom_mapping_result)
+
+    async def _run_micro_batching_loop(
+            self,
+            library: str
+    ) -> None:
+        """
+        Collect the requests of a library into micro-batches until either the maximum batch size is reached or the
+        first request of the micro-batch has waited for the maximum batch wait time.
+
+        :parameter library: The indicator of the chemical reaction atom mapping library.
+        """
+
+        event_loop = get_running_loop()
+
+        request_queue = self._request_queues[library]
+
+        while True:
+            requests = [await request_queue.get(), ]
+
+            micro_batch_deadline = event_loop.time() + self.maximum_batch_wait_time_ms / 1000
+
+            while len(requests) < self.maximum_batch_size:
+                if not request_queue.empty():
+                    requests.append(request_queue.get_nowait())
+
+                    continue
+
+                remaining_wait_time_s = micro_batch_deadline - event_loop.time()
+
+                if remaining_wait_time_s <= 0:
+                    break
+
+                try:
+                    requests.append(await wait_for(request_queue.get(), timeout=remaining_wait_time_s))
+
+                except AsyncioTimeoutError:
+                    break
+
+            await self._run_atom_mapping_on_micro_batch(
+                library=library,
+                requests=requests,
+                event_loop=event_loop
+            )
+
+    async def _handle_request(
+            self,
+            request_line: bytes,
+            writer: StreamWriter
+    ) -> None:
+        """
+        Handle a request line, and write its response line.
+
+        :parameter request_line: The request line.
+        :parameter writer: The stream writer of the connection.
+        """
+
+        request_identifier = None
+
+        try:
+            request = loads(request_line)
+
+            request_identifier = request.get("id")
+
+            if request.get("library") not in self._request_queues.keys():
+                raise ValueError("The chemical reaction atom mapping library '{0}' is not served.".format(
+                    request.get("library")
+                ))
+
+            if not isinstance(request.get("reaction_smiles"), str):
+                raise ValueError("The 'reaction_smiles' key of the request must be a string.")
+
+            InstrumentationUtilities.increment(
+                counter_name="server.requests"
+            )
+
+            request_future = get_running_loop().create_future()
+
+            await self._request_queues[request["library"]].put((request["reaction_smiles"], request_future))
+
+            mapped_reaction_smiles, atom_mapping_score = await request_future
+
+            response = {
+                "id": request_identifier,
+                "library": request["library"],
+                "reaction_smiles": request["reaction_smiles"],
+                "mapped_reaction_smiles": mapped_reaction_smiles,
+                "atom_mapping_score": atom_mapping_score,
+            }
+
+        except Exception as exception_handle:
+            response = {
+                "id": request_identifier,
+                "error": "{0}: {1}".format(type(exception_handle).__name__, exception_handle),
+            }
+
+        writer.write((dumps(response) + "\n").encode("utf-8"))
+
+        await writer.drain()
+
+    async def _handle_connection(
+            self,
+            reader: StreamReader,
+            writer: StreamWriter
+    ) -> None:
+        """
+        Handle a client connection until the client closes it.
+
+        :parameter reader: The stream reader of the connection.
+        :parameter writer: The stream writer of the connection.
+        """
+
+        request_tasks = list()
+
+        try:
+            while True:
+                request_line = await reader.readline()
+
+                if not request_line:
+                    break
+
+                if request_line.strip():
+                    request_tasks.append(get_running_loop().create_task(self._handle_request(
+                        request_line=request_line,
+                        writer=writer
+                    )))
+
+            await gather(*request_tasks, return_exceptions=True)
+
+        finally:
+            writer.close()
+
+    async def _warm_up(
+            self
+    ) -> None:
+        """ Load the model of each library by mapping a warm-up chemical reaction SMILES string. """
+
+        event_loop = get_running_loop()
+
+        await gather(*[
+            event_loop.run_in_executor(
+                self._executors[library],
+                self._atom_mapping_procedures[library],
+                ["CCO>>CC=O", ]
+            ) for library in self.libraries
+        ])
+
+    async def serve(
+            self,
+            server_address: str
+    ) -> None:
+        """
+        Warm up the libraries, and serve the requests until the server is cancelled.
+
+        :parameter server_address: The server address of the form 'unix:/path/to/socket' or 'host:port'.
+        """
+
+        await self._warm_up()
+
+        self._request_queues = {
+            library: Queue() for library in self.libraries
+        }
+
+        micro_batching_tasks = [
+            get_running_loop().create_task(self._run_micro_batching_loop(
+                library=library
+            )) for library in self.libraries
+        ]
+
+        socket_family_name, socket_address = _parse_server_address(
+            server_address=server_address
+        )
+
+        if socket_family_name == "unix":
+            if exists(socket_address):
+                remove(socket_address)
+
+            server = await start_unix_server(self._handle_connection, path=socket_address)
+
+        else:
+            server = await start_server(self._handle_connection, host=socket_address[0], port=socket_address[1])
+
+        getLogger(
+            "{0}.AtomMappingServer.serve".format(__name__)
+        ).info("Serving the '{0}' libraries at '{1}'.".format("', '".join(self.libraries), server_address))
+
+        try:
+            async with server:
+                await server.serve_forever()
+
+        finally:
+            for micro_batching_task in micro_batching_tasks:
+                micro_batching_task.cancel()
+
+            for executor in self._executors.values():
+                executor.submit(MultiprocessingUtilities.release_persistent_process_pool)
+                executor.shutdown(wait=False)
+
+            if socket_family_name == "unix" and exists(socket_address):
+                remove(socket_address)
+
+    def run(
+            self,
+            server_address: str
+    ) -> None:
+        """
+        Serve the requests in a new event loop until the process is interrupted.
+
+        :parameter server_address: The server address of the form 'unix:/path/to/socket' or 'host:port'.
+        """
+
+        def _raise_keyboard_interrupt(*_) -> None:
+            raise KeyboardInterrupt
+
+        # --------------------------------------------------------------------------------------------------------------
+        #  The termination signal is handled like an interruption, so the Unix domain socket file is removed and the
+        #  threads of the libraries are shut down when the server is stopped by a process manager.
+        # --------------------------------------------------------------------------------------------------------------
+
+        signal(SIGTERM, _raise_keyboard_interrupt)
+
+        try:
+            run(self.serve(
+                server_address=server_address
+            ))
+
+        except KeyboardInterrupt:
+            pass
+
+
+class AtomMappingClient:
+    """ The chemical reaction atom mapping server client class. """
+
+    def __init__(
+            self,
+            server_address: str,
+            timeout_period_s: Optional[float] = None
+    ) -> None:
+        """
+        The constructor method of the class.
+
+        :parameter server_address: The server address of the form 'unix:/path/to/socket' or 'host:port'.
+        :parameter timeout_period_s: The maximum amount of time in seconds that may be spent waiting for the server.
+        """
+
+        self.server_address = server_address
+        self.timeout_period_s = timeout_period_s
+
+    def run_atom_mapping_on_reaction_smiles_strings(
+            self,
+            library: str,
+            reaction_smiles_strings: Iterable[str]
+    ) -> List[Tuple[Optional[str], Any]]:
+        """
+        Run the atom mapping on chemical reaction SMILES strings using the server. The requests are pipelined over a
+        single connection, so the server can map them in micro-batches.
+
+        :parameter library: The indicator of the chemical reaction atom mapping library.
+        :parameter reaction_smiles_strings: The chemical reaction SMILES strings.
+
+        :returns: The mapped chemical reaction SMILES strings, and the atom mapping scores.
+        """
+
+        reaction_smiles_strings = list(reaction_smiles_strings)
+
+        socket_family_name, socket_address = _parse_server_address(
+            server_address=self.server_address
+        )
+
+        with socket(AF_UNIX if socket_family_name == "unix" else AF_INET, SOCK_STREAM) as client_socket:
+            client_socket.settimeout(self.timeout_period_s)
+            client_socket.connect(socket_address)
+
+            client_socket.sendall("".join(
+                dumps({
+                    "id": reaction_smiles_index,
+                    "library": library,
+                    "reaction_smiles": reaction_smiles,
+                }) + "\n" for reaction_smiles_index, reaction_smiles in enumerate(reaction_smiles_strings)
+            ).encode("utf-8"))
+
+            atom_mapping_results = dict()
+
+            with client_socket.makefile(mode="r", encoding="utf-8") as response_file:
+                while len(atom_mapping_results) < len(reaction_smiles_strings):
+                    response_line = response_file.readline()
+
+                    if not response_line:
+                        raise ConnectionError("The server closed the connection before all responses were received.")
+
+                    response = loads(response_line)
+
+                    if "error" in response.keys():
+                        getLogger(
+                            "{0}.AtomMappingClient.run_atom_mapping_on_reaction_smiles_strings".format(__name__)
+                        ).debug(response["error"])
+
+                        atom_mapping_results[response["id"]] = (None, None)
+
+                    else:
+                        atom_mapping_results[response["id"]] = (
+                            response["mapped_reaction_smiles"],
+                            response["atom_mapping_score"],
+                        )
+
+        return [
+            atom_mapping_results[reaction_smiles_index]
+            for reaction_smiles_index in range(len(reaction_smiles_strings))
+        ]
@@ -0,0 +1,3 @@
+""" The 'chemical_reaction_atom_mapping.utilities.atom_mapper' package initialization module. """
+
+from .atom_mapper import ReactionAtomMapper
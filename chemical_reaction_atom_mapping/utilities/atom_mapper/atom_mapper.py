@@ -0,0 +1,364 @@
+""" The 'chemical_reaction_atom_mapping.utilities.atom_mapper' package 'atom_mapper' module. """
+
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..caching import AtomMappingResultCache
+from ..deduplication import DeduplicationUtilities
+from ..multiprocessing import MultiprocessingUtilities
+from ..pre_validation import PreValidationUtilities
+from ..scheduling import SchedulingUtilities
+
+
+class ReactionAtomMapper:
+    """
+    The chemical reaction atom mapper base class. Each chemical reaction atom mapping backend implements the 'map_one'
+    method, declares its capabilities and pre-validation limits, and optionally overrides the '_map_batch' method, while
+    the pre-validation, the deduplication, the caching and the streaming of the chemical reaction SMILES strings are
+    shared by all of the backends.
+    """
+
+    library: str = None
+    library_display_name: str = None
+
+    atom_mapping_score_name: str = "atom_mapping_score"
+    atom_mapping_score_display_name: str = "Atom Mapping Score"
+
+    is_batchable: bool = False
+    is_thread_safe: bool = False
+    needs_model: bool = False
+    honours_task_timeout: bool = False
+
+    pre_validation_limits: Dict[str, Optional[int]] = dict()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    #  Only the options that affect the chemical reaction atom mapping results are declared, together with their
+    #  defaults, so that the result-neutral options and the explicitly specified defaults do not change the cache keys.
+    # ------------------------------------------------------------------------------------------------------------------
+
+    atom_mapping_option_defaults: Dict[str, Any] = {
+        "strip_unchanged_compounds": False,
+        "reagent_smiles_strings": None,
+    }
+
+    def __init__(
+            self,
+            **kwargs
+    ) -> None:
+        """
+        The constructor method of the class.
+
+        :parameter kwargs: The default keyword arguments for the adjustment of the atom mapping procedure of the
+                           backend.
+        """
+
+        self.atom_mapping_options = kwargs
+
+        self.pre_validation_rejection_reasons = None  # type: Optional[List[Optional[str]]]
+
+    @classmethod
+    def get_capabilities(
+            cls
+    ) -> Dict[str, bool]:
+        """
+        Get the declared capabilities of the chemical reaction atom mapper.
+
+        :returns: The indicators whether the backend maps batches of chemical reaction SMILES strings natively, whether
+                  it may be called concurrently from multiple threads, whether it needs a loaded model, and whether it
+                  always runs in the worker processes of the timeout process pool if the task timeout period is
+                  specified.
+        """
+
+        return {
+            "batchable": cls.is_batchable,
+            "thread_safe": cls.is_thread_safe,
+            "needs_model": cls.needs_model,
+            "honours_task_timeout": cls.honours_task_timeout,
+        }
+
+    def get_atom_mapping_options(
+            self
+    ) -> Dict[str, Any]:
+        """
+        Get the options of the chemical reaction atom mapper that affect the chemical reaction atom mapping results.
+
+        :returns: The declared options of the chemical reaction atom mapper, with the unspecified options set to their
+                  defaults.
+        """
+
+        atom_mapping_options = dict()
+
+        for option_name, option_default in self.atom_mapping_option_defaults.items():
+            option_value = self.atom_mapping_options.get(option_name, option_default)
+
+            atom_mapping_options[option_name] = sorted(option_value) \
+                if isinstance(option_value, (frozenset, list, set, tuple)) else option_value
+
+        return atom_mapping_options
+
+    def pre_validate(
+            self,
+            reaction_smiles_strings: Iterable[str],
+            pre_validation_limits: Optional[Dict[str, Optional[int]]] = None
+    ) -> List[Optional[str]]:
+        """
+        Pre-validate chemical reaction SMILES strings against the limits of the backend.
+
+        :parameter reaction_smiles_strings: The chemical reaction SMILES strings.
+        :parameter pre_validation_limits: The limits that override the declared pre-validation limits of the backend:
+                                          'maximum_number_of_tokens', 'maximum_number_of_atoms' and
+                                          'maximum_number_of_compounds'.
+
+        :returns: The rejection reason codes of the chemical reaction SMILES strings, or None for the chemical reaction
+                  SMILES strings that should be mapped.
+        """
+
+        return PreValidationUtilities.get_rejection_reasons(
+            reaction_smiles_strings=reaction_smiles_strings,
+            **self.get_pre_validation_limits(
+                pre_validation_limits=pre_validation_limits
+            )
+        )
+
+    def get_pre_validation_limits(
+            self,
+            pre_validation_limits: Optional[Dict[str, Optional[int]]] = None
+    ) -> Dict[str, Optional[int]]:
+        """
+        Get the pre-validation limits of the chemical reaction atom mapper.
+
+        :parameter pre_validation_limits: The limits that override the declared pre-validation limits of the backend.
+                                          The limits with the value None are not overridden.
+
+        :returns: The pre-validation limits of the chemical reaction atom mapper.
+        """
+
+        return {
+            **self.pre_validation_limits,
+            **{
+                limit_name: limit_value
+                for limit_name, limit_value in (pre_validation_limits or dict()).items()
+                if limit_value is not None
+            },
+        }
+
+    def map_one(
+            self,
+            reaction_smiles: str
+    ) -> Tuple[Optional[str], Any]:
+        """
+        Map a chemical reaction SMILES string.
+
+        :parameter reaction_smiles: The chemical reaction SMILES string.
+
+        :returns: The mapped chemical reaction SMILES string, and the atom mapping score or indicator of the backend.
+        """
+
+        raise NotImplementedError(
+            "The '{0}' chemical reaction atom mapper does not implement the 'map_one' method.".format(self.library)
+        )
+
+    def _map_batch(
+            self,
+            reaction_smiles_strings: List[str],
+            number_of_cpu_cores: int = 1,
+            batch_size: Optional[int] = None,
+            task_timeout_period_s: Optional[float] = None,
+            use_shared_memory: bool = False
+    ) -> Optional[List[Tuple[Optional[str], Any]]]:
+        """
+        Map a list of chemical reaction SMILES strings without the deduplication and the caching. By default, the
+        'map_one' method is run for each chemical reaction SMILES string on the worker processes.
+
+        :parameter reaction_smiles_strings: The chemical reaction SMILES strings.
+        :parameter number_of_cpu_cores: The number of CPU cores that should be utilized.
+        :parameter batch_size: The number of chemical reaction SMILES strings per model batch of the backends that map
+                               batches of chemical reaction SMILES strings natively.
+        :parameter task_timeout_period_s: The maximum amount of time in seconds that may be spent on a chemical
+                                          reaction SMILES string before its worker process is killed and replaced.
+        :parameter use_shared_memory: The indicator whether the chemical reaction SMILES strings and the atom mapping
+                                      results should be exchanged with the worker processes through shared memory
+                                      buffers instead of the pipes of the process pool.
+
+        :returns: The mapped chemical reaction SMILES strings, and the atom mapping scores or indicators of the backend.
+        """
+
+        return MultiprocessingUtilities.run_with_progress_bar(
+            processing_procedure=self.map_one,
+            primary_input_argument=reaction_smiles_strings,
+            description_message="Mapping the chemical reaction SMILES strings using the '{0}' backend".format(
+                self.library
+            ),
+            number_of_cpu_cores=number_of_cpu_cores,
+            task_timeout_period_s=task_timeout_period_s,
+            task_timeout_output=(None, None),
+            use_shared_memory=use_shared_memory
+        )
+
+    def map_batch(
+            self,
+            reaction_smiles_strings: Iterable[str],
+            number_of_cpu_cores: int = 1,
+            batch_size: Optional[int] = None,
+            task_timeout_period_s: Optional[float] = None,
+            deduplication_mode: Optional[str] = None,
+            atom_mapping_cache: Optional[AtomMappingResultCache] = None,
+            use_cost_based_scheduling: bool = False,
+            heavy_reaction_cost_threshold: Optional[float] = None,
+            heavy_reaction_task_timeout_period_s: Optional[float] = None,
+            use_pre_validation: bool = False,
+            pre_validation_limits: Optional[Dict[str, Optional[int]]] = None,
+            use_shared_memory: bool = False
+    ) -> List[Tuple[Optional[str], Any]]:
+        """
+        Map chemical reaction SMILES strings.
+
+        :parameter reaction_smiles_strings: The chemical reaction SMILES strings.
+        :parameter number_of_cpu_cores: The number of CPU cores that should be utilized.
+        :parameter batch_size: The number of chemical reaction SMILES strings per model batch of the backends that map
+                               batches of chemical reaction SMILES strings natively.
+        :parameter task_timeout_period_s: The maximum amount of time in seconds that may be spent on a chemical
+                                          reaction SMILES string before its worker process is killed and replaced.
+        :parameter deduplication_mode: The indicator how the duplicate chemical reaction SMILES strings should be
+                                       identified before the atom mapping: 'exact' or 'canonical'. If not specified,
+                                       the chemical reaction SMILES strings are not deduplicated.
+        :parameter atom_mapping_cache: The chemical reaction atom mapping result cache that should be consulted before
+                                       the backend is utilized.
+        :parameter use_cost_based_scheduling: The indicator whether the chemical reaction SMILES strings that are not
+                                              cached should be dispatched from the most to the least expensive one.
+        :parameter heavy_reaction_cost_threshold: The minimum cost estimate of the chemical reaction SMILES strings that
+                                                  are mapped in a separate heavy lane if the cost-based scheduling is
+                                                  utilized. If not specified, the heavy lane is not utilized.
+        :parameter heavy_reaction_task_timeout_period_s: The maximum amount of time in seconds that may be spent on a
+                                                         chemical reaction SMILES string of the heavy lane.
+        :parameter use_pre_validation: The indicator whether the chemical reaction SMILES strings that fail the
+                                       pre-validation against the limits of the backend should be skipped before the
+                                       deduplication, the caching and the backend. Their outputs are None, and the
+                                       rejection reason codes of all of the chemical reaction SMILES strings of the
+                                       latest call are stored in the 'pre_validation_rejection_reasons' attribute.
+        :parameter pre_validation_limits: The limits that override the declared pre-validation limits of the backend.
+        :parameter use_shared_memory: The indicator whether the chemical reaction SMILES strings and the atom mapping
+                                      results should be exchanged with the worker processes through shared memory
+                                      buffers instead of the pipes of the process pool.
+
+        :returns: The mapped chemical reaction SMILES strings, and the atom mapping scores or indicators of the backend.
+                  If the backend fails on the whole list, the outputs of all chemical reaction SMILES strings are None.
+        """
+
+        reaction_smiles_strings = list(reaction_smiles_strings)
+
+        def _run_atom_mapping_procedure(
+                missed_reaction_smiles_strings: List[str]
+        ) -> Optional[List[Tuple[Optional[str], Any]]]:
+            if not use_cost_based_scheduling:
+                return self._map_batch(
+                    reaction_smiles_strings=missed_reaction_smiles_strings,
+                    number_of_cpu_cores=number_of_cpu_cores,
+                    batch_size=batch_size,
+                    task_timeout_period_s=task_timeout_period_s,
+                    use_shared_memory=use_shared_memory
+                )
+
+            # ----------------------------------------------------------------------------------------------------------
+            #  The lanes may only be run concurrently if both of them run the backend in worker processes. Only the
+            #  backends that honour the task timeout period are guaranteed to do so for a lane with a task timeout
+            #  period or more than one CPU core, so the lanes of the other backends are run one after the other.
+            # ----------------------------------------------------------------------------------------------------------
+
+            return SchedulingUtilities.run_with_cost_based_scheduling(
+                reaction_smiles_strings=missed_reaction_smiles_strings,
+                atom_mapping_procedure=lambda lane_reaction_smiles_strings, **kwargs: self._map_batch(
+                    reaction_smiles_strings=lane_reaction_smiles_strings,
+                    batch_size=batch_size,
+                    use_shared_memory=use_shared_memory,
+                    **kwargs
+                ),
+                number_of_cpu_cores=number_of_cpu_cores,
+                task_timeout_period_s=task_timeout_period_s,
+                heavy_reaction_cost_threshold=heavy_reaction_cost_threshold,
+                heavy_reaction_task_timeout_period_s=heavy_reaction_task_timeout_period_s,
+                run_lanes_concurrently=self.honours_task_timeout
+            )
+
+        def _map_batch(
+                unmapped_reaction_smiles_strings: List[str]
+        ) -> Optional[List[Tuple[Optional[str], Any]]]:
+            if atom_mapping_cache is not None:
+                return atom_mapping_cache.run_with_cache(
+                    library_name=self.library,
+                    atom_mapping_options=self.get_atom_mapping_options(),
+                    reaction_smiles_strings=unmapped_reaction_smiles_strings,
+                    atom_mapping_procedure=_run_atom_mapping_procedure
+                )
+
+            return _run_atom_mapping_procedure(unmapped_reaction_smiles_strings)
+
+        def _map_valid_batch(
+                valid_reaction_smiles_strings: List[str]
+        ) -> Optional[List[Tuple[Optional[str], Any]]]:
+            if deduplication_mode is not None:
+                return DeduplicationUtilities.run_with_deduplication(
+                    reaction_smiles_strings=valid_reaction_smiles_strings,
+                    atom_mapping_procedure=_map_batch,
+                    deduplication_mode=deduplication_mode
+                )
+
+            return _map_batch(valid_reaction_smiles_strings)
+
+        self.pre_validation_rejection_reasons = None
+
+        if use_pre_validation:
+            self.pre_validation_rejection_reasons = list()
+
+            atom_mapping_results = PreValidationUtilities.run_with_pre_validation(
+                reaction_smiles_strings=reaction_smiles_strings,
+                atom_mapping_procedure=_map_valid_batch,
+                rejection_reasons=self.pre_validation_rejection_reasons,
+                **self.get_pre_validation_limits(
+                    pre_validation_limits=pre_validation_limits
+                )
+            )
+
+        else:
+            atom_mapping_results = _map_valid_batch(reaction_smiles_strings)
+
+        if atom_mapping_results is None:
+            return [(None, None, ), ] * len(reaction_smiles_strings)
+
+        return atom_mapping_results
+
+    def map_stream(
+            self,
+            reaction_smiles_strings: Iterable[str],
+            chunk_size: int = 1000,
+            **kwargs
+    ) -> Iterator[Tuple[Optional[str], Any]]:
+        """
+        Map a stream of chemical reaction SMILES strings in chunks, so that only one chunk of the chemical reaction
+        SMILES strings and its chemical reaction atom mapping results is held in memory at a time.
+
+        :parameter reaction_smiles_strings: The stream of chemical reaction SMILES strings.
+        :parameter chunk_size: The number of chemical reaction SMILES strings per chunk.
+        :parameter kwargs: The keyword arguments of the 'map_batch' method.
+
+        :returns: The mapped chemical reaction SMILES strings, and the atom mapping scores or indicators of the backend
+                  in the order of the stream of chemical reaction SMILES strings.
+        """
+
+        reaction_smiles_strings = iter(reaction_smiles_strings)
+
+        while True:
+            reaction_smiles_chunk = list(islice(reaction_smiles_strings, max(chunk_size, 1)))
+
+            if len(reaction_smiles_chunk) == 0:
+                return
+
+            yield from self.map_batch(
+                reaction_smiles_strings=reaction_smiles_chunk,
+                **kwargs
+            )
+
+    def release(
+            self
+    ) -> None:
+        """ Release the resources of the chemical reaction atom mapper, such as its loaded model. """
@@ -0,0 +1,3 @@
+""" The 'chemical_reaction_atom_mapping.utilities.backend_registry' package initialization module. """
+
+from .backend_registry import BackendRegistryUtilities
@@ -0,0 +1,204 @@
+""" The 'chemical_reaction_atom_mapping.utilities.backend_registry' package 'backend_registry' module. """
+
+from importlib import import_module
+from importlib.metadata import entry_points
+from logging import getLogger
+from threading import Lock
+from time import perf_counter
+from typing import Any, Dict, List, Tuple, Type
+
+from ..atom_mapper import ReactionAtomMapper
+from ..instrumentation import InstrumentationUtilities
+
+
+class BackendRegistryUtilities:
+    """
+    The process-wide chemical reaction atom mapping backend registry utilities class. The backends are registered by
+    the names of the modules and the classes of their chemical reaction atom mappers, and each backend module is
+    imported only on the first request, so that the heavy frameworks of the backends that are not utilized are never
+    imported. Additional backends are discovered from the 'chemical_reaction_atom_mapping.backends' entry point group
+    of the installed distributions, with the entry point names as the library indicators and the entry point values in
+    the 'module:class' format.
+    """
+
+    _backend_entry_point_group = "chemical_reaction_atom_mapping.backends"
+
+    _backends: Dict[str, Tuple[str, str]] = {
+        "chytorch_rxnmap": (
+            "chemical_reaction_atom_mapping.chytorch_rxnmap",
+            "ChytorchRxnMapReactionAtomMapper",
+        ),
+        "epam_indigo": (
+            "chemical_reaction_atom_mapping.epam_indigo",
+            "EpamIndigoReactionAtomMapper",
+        ),
+        "rxnmapper": (
+            "chemical_reaction_atom_mapping.rxnmapper",
+            "RxnMapperReactionAtomMapper",
+        ),
+    }
+
+    _are_plugin_backends_discovered = False
+
+    _atom_mapper_classes: Dict[str, Type[ReactionAtomMapper]] = dict()
+    _atom_mapper_classes_lock = Lock()
+
+    @staticmethod
+    def _discover_plugin_backends() -> None:
+        """
+        Register the backends of the 'chemical_reaction_atom_mapping.backends' entry point group without importing
+        them, unless a backend with the same library indicator is registered already.
+        """
+
+        with BackendRegistryUtilities._atom_mapper_classes_lock:
+            if BackendRegistryUtilities._are_plugin_backends_discovered:
+                return
+
+            BackendRegistryUtilities._are_plugin_backends_discovered = True
+
+            backend_entry_points = entry_points()
+
+            backend_entry_points = backend_entry_points.select(
+                group=BackendRegistryUtilities._backend_entry_point_group
+            ) if hasattr(backend_entry_points, "select") else \
+                backend_entry_points.get(BackendRegistryUtilities._backend_entry_point_group, [])
+
+            for backend_entry_point in backend_entry_points:
+                module_name, _, class_name = backend_entry_point.value.partition(":")
+
+                BackendRegistryUtilities._backends.setdefault(
+                    backend_entry_point.name,
+                    (module_name.strip(), class_name.strip(), )
+                )
+
+    @staticmethod
+    def register_backend(
+            library: str,
+            module_name: str,
+            class_name: str
+    ) -> None:
+        """
+        Register a chemical reaction atom mapping backend without importing it.
+
+        :parameter library: The indicator of the chemical reaction atom mapping library.
+        :parameter module_name: The fully qualified name of the module of the chemical reaction atom mapper class.
+        :parameter class_name: The name of the chemical reaction atom mapper class, which extends the
+                               'chemical_reaction_atom_mapping.utilities.atom_mapper.ReactionAtomMapper' class.
+        """
+
+        with BackendRegistryUtilities._atom_mapper_classes_lock:
+            BackendRegistryUtilities._backends[library] = (module_name, class_name, )
+            BackendRegistryUtilities._atom_mapper_classes.pop(library, None)
+
+    @staticmethod
+    def get_backend_names() -> List[str]:
+        """
+        Get the indicators of the registered chemical reaction atom mapping libraries.
+
+        :returns: The indicators of the registered chemical reaction atom mapping libraries.
+        """
+
+        BackendRegistryUtilities._discover_plugin_backends()
+
+        return sorted(BackendRegistryUtilities._backends.keys())
+
+    @staticmethod
+    def is_backend_loaded(
+            library: str
+    ) -> bool:
+        """
+        Check whether a chemical reaction atom mapping backend is imported in the current process.
+
+        :parameter library: The indicator of the chemical reaction atom mapping library.
+
+        :returns: The indicator whether the chemical reaction atom mapping backend is imported.
+        """
+
+        return library in BackendRegistryUtilities._atom_mapper_classes.keys()
+
+    @staticmethod
+    def get_atom_mapper_class(
+            library: str
+    ) -> Type[ReactionAtomMapper]:
+        """
+        Get the chemical reaction atom mapper class of a backend, and import it only on the first request.
+
+        :parameter library: The indicator of the chemical reaction atom mapping library.
+
+        :returns: The chemical reaction atom mapper class of the backend.
+        """
+
+        BackendRegistryUtilities._discover_plugin_backends()
+
+        if library not in BackendRegistryUtilities._backends.keys():
+            raise ValueError(
+                "The chemical reaction atom mapping library '{0}' is not supported.".format(library)
+            )
+
+        with BackendRegistryUtilities._atom_mapper_classes_lock:
+            if library not in BackendRegistryUtilities._atom_mapper_classes.keys():
+                module_name, class_name = BackendRegistryUtilities._backends[library]
+
+                backend_import_start_time = perf_counter()
+
+                atom_mapper_class = getattr(
+                    import_module(module_name),
+                    class_name
+                )
+
+                if not (isinstance(atom_mapper_class, type) and issubclass(atom_mapper_class, ReactionAtomMapper)):
+                    raise TypeError(
+                        "The '{0}:{1}' backend of the chemical reaction atom mapping library '{2}' does not extend the "
+                        "'ReactionAtomMapper' class.".format(module_name, class_name, library)
+                    )
+
+                BackendRegistryUtilities._atom_mapper_classes[library] = atom_mapper_class
+
+                InstrumentationUtilities.record_duration(
+                    stage_name="{0}.backend_import".format(library),
+                    duration_s=perf_counter() - backend_import_start_time
+                )
+
+                getLogger(
+                    "{0}.BackendRegistryUtilities.get_atom_mapper_class".format(__name__)
+                ).debug("The '{0}' backend has been imported in {1:.3f} seconds.".format(
+                    library,
+                    perf_counter() - backend_import_start_time
+                ))
+
+            return BackendRegistryUtilities._atom_mapper_classes[library]
+
+    @staticmethod
+    def get_atom_mapper(
+            library: str,
+            **kwargs
+    ) -> ReactionAtomMapper:
+        """
+        Get a chemical reaction atom mapper of a backend.
+
+        :parameter library: The indicator of the chemical reaction atom mapping library.
+        :parameter kwargs: The keyword arguments of the constructor of the chemical reaction atom mapper class.
+
+        :returns: The chemical reaction atom mapper of the backend.
+        """
+
+        return BackendRegistryUtilities.get_atom_mapper_class(
+            library=library
+        )(**kwargs)
+
+    @staticmethod
+    def get_backend_utilities(
+            library: str
+    ) -> Any:
+        """
+        Get the utilities class of a built-in chemical reaction atom mapping backend, and import it only on the first
+        request.
+
+        :parameter library: The indicator of the chemical reaction atom mapping library.
+
+        :returns: The utilities class of the chemical reaction atom mapping backend.
+        """
+
+        return BackendRegistryUtilities.get_atom_mapper_class(
+            library=library
+        ).backend_utilities
@@ -0,0 +1,3 @@
+""" The 'chemical_reaction_atom_mapping.utilities.caching' package initialization module. """
+
+from .caching import AtomMappingResultCache
@@ -0,0 +1,318 @@
+""" The 'chemical_reaction_atom_mapping.utilities.caching' package 'caching' module. """
+
+from hashlib import sha256
+from importlib.metadata import PackageNotFoundError, version
+from json import dumps, loads
+from logging import getLogger
+from sqlite3 import connect
+from threading import Lock
+from time import time_ns
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+class AtomMappingResultCache:
+    """ The on-disk content-addressed chemical reaction atom mapping result cache class. """
+
+    _library_distribution_names = {
+        "chytorch_rxnmap": "chytorch-rxnmap",
+        "epam_indigo": "epam.indigo",
+        "rxnmapper": "rxnmapper",
+    }
+
+    _maximum_number_of_query_parameters = 500
+
+    def __init__(
+            self,
+            cache_file_path: str,
+            maximum_number_of_entries: Optional[int] = None
+    ) -> None:
+        """
+        The constructor method of the class.
+
+        :parameter cache_file_path: The path to the cache SQLite database file.
+        :parameter maximum_number_of_entries: The maximum number of entries of the cache. If the maximum number of
+                                              entries is exceeded, the least recently used entries are evicted. If not
+                                              specified, the number of entries is not limited.
+        """
+
+        self.cache_file_path = cache_file_path
+        self.maximum_number_of_entries = maximum_number_of_entries
+
+        self.number_of_hits, self.number_of_misses, self.number_of_evictions = 0, 0, 0
+
+        self._connection_lock = Lock()
+        self._connection = connect(cache_file_path, check_same_thread=False)
+
+        with self._connection_lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS atom_mapping_results ("
+                "key TEXT PRIMARY KEY, "
+                "atom_mapping_result TEXT NOT NULL, "
+                "last_access_time INTEGER NOT NULL"
+                ")"
+            )
+
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS atom_mapping_results_last_access_time "
+                "ON atom_mapping_results (last_access_time)"
+            )
+
+    def __enter__(
+            self
+    ) -> "AtomMappingResultCache":
+        """ The context manager entry method of the class. """
+
+        return self
+
+    def __exit__(
+            self,
+            *args
+    ) -> None:
+        """ The context manager exit method of the class. """
+
+        self.close()
+
+    def close(
+            self
+    ) -> None:
+        """ Close the cache SQLite database connection. """
+
+        with self._connection_lock:
+            self._connection.close()
+
+    @staticmethod
+    def get_library_version(
+            library_name: str
+    ) -> str:
+        """
+        Get the installed version of a chemical reaction atom mapping library.
+
+        :parameter library_name: The name of the chemical reaction atom mapping library.
+
+        :returns: The installed version of the chemical reaction atom mapping library.
+        """
+
+        try:
+            return version(AtomMappingResultCache._library_distribution_names.get(library_name, library_name))
+
+        except PackageNotFoundError:
+            return "unknown"
+
+    @staticmethod
+    def get_key(
+            reaction_smiles: str,
+            library_name: str,
+            library_version: str,
+            atom_mapping_options: Dict[str, Any]
+    ) -> str:
+        """
+        Get the cache key of a chemical reaction SMILES string. The key is computed from the exact chemical reaction
+        SMILES string because the atom mapping result is a SMILES string that follows the order of the input compounds.
+
+        :parameter reaction_smiles: The chemical reaction SMILES string.
+        :parameter library_name: The name of the chemical reaction atom mapping library.
+        :parameter library_version: The version of the chemical reaction atom mapping library.
+        :parameter atom_mapping_options: The options of the chemical reaction atom mapping library.
+
+        :returns: The cache key of the chemical reaction SMILES string.
+        """
+
+        return sha256(dumps({
+            "reaction_smiles": reaction_smiles,
+            "library_name": library_name,
+            "library_version": library_version,
+            "atom_mapping_options": atom_mapping_options,
+        }, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    def get_statistics(
+            self
+    ) -> Dict[str, Any]:
+        """
+        Get the statistics of the cache.
+
+        :returns: The numbers of hits, misses, evictions and entries, and the hit ratio of the cache.
+        """
+
+        with self._connection_lock:
+            number_of_entries = self._connection.execute("SELECT COUNT(*) FROM atom_mapping_results").fetchone()[0]
+
+        return {
+            "number_of_hits": self.number_of_hits,
+            "number_of_misses": self.number_of_misses,
+            "number_of_evictions": self.number_of_evictions,
+            "number_of_entries": number_of_entries,
+            "hit_ratio": self.number_of_hits / (self.number_of_hits + self.number_of_misses)
+            if self.number_of_hits + self.number_of_misses > 0 else 0.0,
+        }
+
+    def get(
+            self,
+            keys: Iterable[str]
+    ) -> Dict[str, Tuple[Optional[str], Any]]:
+        """
+        Get the cached chemical reaction atom mapping results, and mark them as recently used.
+
+        :parameter keys: The cache keys.
+
+        :returns: The cached chemical reaction atom mapping results of the cache keys that are found in the cache.
+        """
+
+        keys = list(set(keys))
+
+        atom_mapping_results = dict()
+
+        with self._connection_lock, self._connection:
+            for keys_index in range(0, len(keys), AtomMappingResultCache._maximum_number_of_query_parameters):
+                keys_batch = keys[keys_index:keys_index + AtomMappingResultCache._maximum_number_of_query_parameters]
+
+                for key, atom_mapping_result in self._connection.execute(
+                    "SELECT key, atom_mapping_result FROM atom_mapping_results WHERE key IN ({0})".format(
+                        ", ".join("?" for _ in keys_batch)
+                    ),
+                    keys_batch
+                ):
+                    atom_mapping_results[key] = tuple(loads(atom_mapping_result))
+
+            last_access_time = time_ns()
+
+            self._connection.executemany(
+                "UPDATE atom_mapping_results SET last_access_time = ? WHERE key = ?",
+                [(last_access_time, key) for key in atom_mapping_results.keys()]
+            )
+
+        return atom_mapping_results
+
+    def put(
+            self,
+            keys_and_atom_mapping_results: Iterable[Tuple[str, Tuple[Optional[str], Any]]]
+    ) -> None:
+        """
+        Put the chemical reaction atom mapping results into the cache, and evict the least recently used entries if
+        the maximum number of entries is exceeded.
+
+        :parameter keys_and_atom_mapping_results: The cache keys and the chemical reaction atom mapping results.
+        """
+
+        last_access_time = time_ns()
+
+        with self._connection_lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO atom_mapping_results (key, atom_mapping_result, last_access_time) "
+                "VALUES (?, ?, ?)",
+                [
+                    (key, dumps(list(atom_mapping_result)), last_access_time)
+                    for key, atom_mapping_result in keys_and_atom_mapping_results
+                ]
+            )
+
+            if self.maximum_number_of_entries is not None:
+                number_of_excess_entries = self._connection.execute(
+                    "SELECT COUNT(*) FROM atom_mapping_results"
+                ).fetchone()[0] - self.maximum_number_of_entries
+
+                if number_of_excess_entries > 0:
+                    self._connection.execute(
+                        "DELETE FROM atom_mapping_results WHERE key IN ("
+                        "SELECT key FROM atom_mapping_results ORDER BY last_access_time ASC LIMIT ?"
+                        ")",
+                        (number_of_excess_entries, )
+                    )
+
+                    self.number_of_evictions += number_of_excess_entries
+
+    def run_with_cache(
+            self,
+            library_name: str,
+            atom_mapping_options: Dict[str, Any],
+            reaction_smiles_strings: Iterable[str],
+            atom_mapping_procedure: Callable[[List[str]], Optional[List[Tuple[Optional[str], Any]]]]
+    ) -> Optional[List[Tuple[Optional[str], Any]]]:
+        """
+        Run a chemical reaction atom mapping procedure only on the chemical reaction SMILES strings that are not found
+        in the cache, and cache the successful chemical reaction atom mapping results. The values that are not strings,
+        such as the missing values of a dataset, bypass the cache and are passed to the atom mapping procedure.
+
+        :parameter library_name: The name of the chemical reaction atom mapping library.
+        :parameter atom_mapping_options: The options of the chemical reaction atom mapping library.
+        :parameter reaction_smiles_strings: The chemical reaction SMILES strings.
+        :parameter atom_mapping_procedure: The chemical reaction atom mapping procedure that maps a list of chemical
+                                           reaction SMILES strings.
+
+        :returns: The chemical reaction atom mapping results in the order of the chemical reaction SMILES strings.
+        """
+
+        reaction_smiles_strings = list(reaction_smiles_strings)
+
+        library_version = AtomMappingResultCache.get_library_version(
+            library_name=library_name
+        )
+
+        keys = [
+            AtomMappingResultCache.get_key(
+                reaction_smiles=reaction_smiles,
+                library_name=library_name,
+                library_version=library_version,
+                atom_mapping_options=atom_mapping_options
+            ) if isinstance(reaction_smiles, str) else None for reaction_smiles in reaction_smiles_strings
+        ]
+
+        cached_atom_mapping_results = self.get(
+            keys=[key for key in keys if key is not None]
+        )
+
+        atom_mapping_results = [
+            cached_atom_mapping_results.get(key) if key is not None else None for key in keys
+        ]
+
+        missed_reaction_smiles_indices = [
+            reaction_smiles_index for reaction_smiles_index, key in enumerate(keys)
+            if key is None or key not in cached_atom_mapping_results.keys()
+        ]
+
+        number_of_hits = len(keys) - len(missed_reaction_smiles_indices)
+        number_of_misses = len([
+            reaction_smiles_index for reaction_smiles_index in missed_reaction_smiles_indices
+            if keys[reaction_smiles_index] is not None
+        ])
+
+        self.number_of_hits += number_of_hits
+        self.number_of_misses += number_of_misses
+
+        number_of_evictions = self.number_of_evictions
+
+        if len(missed_reaction_smiles_indices) > 0:
+            missed_atom_mapping_results = atom_mapping_procedure([
+                reaction_smiles_strings[reaction_smiles_index]
+                for reaction_smiles_index in missed_reaction_smiles_indices
+            ])
+
+            if missed_atom_mapping_results is None:
+                return None
+
+            self.put(
+                keys_and_atom_mapping_results=[
+                    (keys[reaction_smiles_index], atom_mapping_result)
+                    for reaction_smiles_index, atom_mapping_result in zip(
+                        missed_reaction_smiles_indices,
+                        missed_atom_mapping_results
+                    ) if keys[reaction_smiles_index] is not None and atom_mapping_result[0] is not None
+                ]
+            )
+
+            for reaction_smiles_index, atom_mapping_result in zip(
+                missed_reaction_smiles_indices,
+                missed_atom_mapping_results
+            ):
+                atom_mapping_results[reaction_smiles_index] = atom_mapping_result
+
+        getLogger(
+            "{0}.AtomMappingResultCache.run_with_cache".format(__name__)
+        ).debug("Atom mapping cache hits: {0}, misses: {1}, evictions: {2}.".format(
+            number_of_hits,
+            number_of_misses,
+            self.number_of_evictions - number_of_evictions
+        ))
+
+        return atom_mapping_results
@@ -0,0 +1,3 @@
+""" The 'chemical_reaction_atom_mapping.utilities.checkpointing' package initialization module. """
+
+from .checkpointing import CheckpointingUtilities
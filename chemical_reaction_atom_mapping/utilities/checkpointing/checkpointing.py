@@ -0,0 +1,76 @@
+""" The 'chemical_reaction_atom_mapping.utilities.checkpointing' package 'checkpointing' module. """
+
+from hashlib import new
+from json import dump, load
+from os import fsync, replace
+from os.path import exists
+from typing import Any, Dict, Optional
+
+
+class CheckpointingUtilities:
+    """ The checkpointing utilities class. """
+
+    @staticmethod
+    def get_file_hash(
+            file_path: str,
+            hash_algorithm_name: str = "sha256",
+            block_size: int = 2 ** 20
+    ) -> str:
+        """
+        Get the hash of a file without loading the whole file into memory.
+
+        :parameter file_path: The path to the file.
+        :parameter hash_algorithm_name: The name of the hash algorithm.
+        :parameter block_size: The number of bytes that should be read from the file at a time.
+
+        :returns: The hexadecimal hash of the file.
+        """
+
+        file_hash = new(hash_algorithm_name)
+
+        with open(file_path, "rb") as file_handle:
+            for file_block in iter(lambda: file_handle.read(block_size), b""):
+                file_hash.update(file_block)
+
+        return "{0}:{1}".format(hash_algorithm_name, file_hash.hexdigest())
+
+    @staticmethod
+    def load_run_manifest(
+            run_manifest_file_path: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Load a run manifest.
+
+        :parameter run_manifest_file_path: The path to the run manifest '*.json' file.
+
+        :returns: The run manifest, or None if the run manifest '*.json' file does not exist.
+        """
+
+        if not exists(run_manifest_file_path):
+            return None
+
+        with open(run_manifest_file_path, "r") as file_handle:
+            return load(file_handle)
+
+    @staticmethod
+    def save_run_manifest(
+            run_manifest_file_path: str,
+            run_manifest: Dict[str, Any]
+    ) -> None:
+        """
+        Save a run manifest atomically, so that an interrupted run always leaves the previous or the current one.
+
+        :parameter run_manifest_file_path: The path to the run manifest '*.json' file.
+        :parameter run_manifest: The run manifest.
+        """
+
+        temporary_run_manifest_file_path = "{0}.tmp".format(run_manifest_file_path)
+
+        with open(temporary_run_manifest_file_path, "w") as file_handle:
+            dump(run_manifest, file_handle, indent=4, sort_keys=True)
+
+            file_handle.flush()
+
+            fsync(file_handle.fileno())
+
+        replace(temporary_run_manifest_file_path, run_manifest_file_path)
@@ -0,0 +1,3 @@
+""" The 'chemical_reaction_atom_mapping.utilities.dataset_io' package initialization module. """
+
+from .dataset_io import DatasetIoUtilities
@@ -0,0 +1,279 @@
+""" The 'chemical_reaction_atom_mapping.utilities.dataset_io' package 'dataset_io' module. """
+
+from csv import reader
+from glob import glob
+from os import fsync, makedirs, remove, replace, truncate
+from os.path import exists, getsize, join
+from typing import Iterator, List, Optional
+
+from pandas import DataFrame, RangeIndex, read_csv
+
+
+class DatasetIoUtilities:
+    """
+    The chemical reaction dataset input and output utilities class. The '*.csv' datasets are read and written using the
+    pandas library, and the '*.parquet' datasets are read and written using the PyArrow library, which is imported only
+    if a '*.parquet' dataset is utilized.
+    """
+
+    _parquet_dataset_file_extensions = (".parquet", ".pq", )
+
+    _parquet_dataset_part_file_name_pattern = "part-{0:06d}.parquet"
+
+    @staticmethod
+    def get_dataset_file_format(
+            dataset_file_path: str,
+            dataset_file_format: Optional[str] = None
+    ) -> str:
+        """
+        Get the format of a dataset file.
+
+        :parameter dataset_file_path: The path to the dataset file.
+        :parameter dataset_file_format: The format of the dataset file: 'csv' or 'parquet'. If not specified, the format
+                                        is inferred from the extension of the dataset file path.
+
+        :returns: The format of the dataset file.
+        """
+
+        if dataset_file_format is not None:
+            return dataset_file_format
+
+        if dataset_file_path.rstrip("/").lower().endswith(DatasetIoUtilities._parquet_dataset_file_extensions):
+            return "parquet"
+
+        return "csv"
+
+    @staticmethod
+    def iterate_dataset_chunks(
+            dataset_file_path: str,
+            dataset_file_format: str,
+            column_names: Optional[List[str]] = None,
+            chunk_size: Optional[int] = None,
+            row_offset: int = 0
+    ) -> Iterator[DataFrame]:
+        """
+        Iterate over the chunks of a dataset file. The '*.parquet' dataset files are streamed by row groups, and the row
+        groups that precede the row offset are skipped without being read.
+
+        :parameter dataset_file_path: The path to the dataset file.
+        :parameter dataset_file_format: The format of the dataset file: 'csv' or 'parquet'.
+        :parameter column_names: The names of the columns that should be read. If not specified, all of the columns are
+                                 read.
+        :parameter chunk_size: The number of rows per chunk. If not specified, the dataset file is read as one chunk.
+        :parameter row_offset: The number of rows at the beginning of the dataset file that should be skipped.
+
+        :returns: The non-empty chunks of the dataset file, indexed by the positions of their rows in the dataset file.
+        """
+
+        if dataset_file_format == "parquet":
+            from pyarrow.parquet import ParquetFile
+
+            parquet_file = ParquetFile(dataset_file_path)
+
+            row_group_indices, row_group_row_offset, skipped_row_group_row_offset = list(), 0, 0
+
+            for row_group_index in range(parquet_file.metadata.num_row_groups):
+                row_group_row_offset += parquet_file.metadata.row_group(row_group_index).num_rows
+
+                if row_group_row_offset <= row_offset:
+                    skipped_row_group_row_offset = row_group_row_offset
+
+                else:
+                    row_group_indices.append(row_group_index)
+
+            record_batches = parquet_file.iter_batches(
+                batch_size=chunk_size if chunk_size is not None else max(parquet_file.metadata.num_rows, 1),
+                row_groups=row_group_indices,
+                columns=column_names
+            )
+
+            number_of_skipped_rows = row_offset - skipped_row_group_row_offset
+
+            for record_batch in record_batches:
+                if number_of_skipped_rows >= record_batch.num_rows:
+                    number_of_skipped_rows -= record_batch.num_rows
+
+                    continue
+
+                dataset_chunk = record_batch.slice(number_of_skipped_rows).to_pandas()
+
+                number_of_skipped_rows = 0
+
+                dataset_chunk.index = RangeIndex(row_offset, row_offset + len(dataset_chunk))
+
+                row_offset += len(dataset_chunk)
+
+                yield dataset_chunk
+
+            return
+
+        # --------------------------------------------------------------------------------------------------------------
+        #  The header and the rows that precede the row offset are consumed from the file handle one at a time, so that
+        #  no collection of the skipped row positions, whose size would grow with the row offset, is built. The empty
+        #  lines are not counted, because they are skipped by the pandas library as well.
+        # --------------------------------------------------------------------------------------------------------------
+
+        with open(dataset_file_path, mode="r", encoding="utf-8", newline="") as file_handle:
+            dataset_file_rows = reader(file_handle)
+
+            dataset_column_names = next(dataset_file_rows)
+            number_of_skipped_rows = 0
+
+            while number_of_skipped_rows < row_offset:
+                dataset_file_row = next(dataset_file_rows, None)
+
+                if dataset_file_row is None:
+                    break
+
+                if len(dataset_file_row) > 0:
+                    number_of_skipped_rows += 1
+
+            read_csv_arguments = {
+                "filepath_or_buffer": file_handle,
+                "usecols": column_names,
+                "header": None,
+                "names": dataset_column_names,
+            }
+
+            dataset_chunks = read_csv(
+                chunksize=chunk_size,
+                **read_csv_arguments
+            ) if chunk_size is not None else [read_csv(**read_csv_arguments), ]
+
+            for dataset_chunk in dataset_chunks:
+                if len(dataset_chunk) == 0:
+                    continue
+
+                dataset_chunk.index = RangeIndex(row_offset, row_offset + len(dataset_chunk))
+
+                row_offset += len(dataset_chunk)
+
+                yield dataset_chunk
+
+    @staticmethod
+    def get_parquet_dataset_part_file_path(
+            dataset_directory_path: str,
+            part_index: int
+    ) -> str:
+        """
+        Get the path to a part file of a '*.parquet' dataset directory.
+
+        :parameter dataset_directory_path: The path to the '*.parquet' dataset directory.
+        :parameter part_index: The index of the part file.
+
+        :returns: The path to the part file.
+        """
+
+        return join(dataset_directory_path, DatasetIoUtilities._parquet_dataset_part_file_name_pattern.format(
+            part_index
+        ))
+
+    @staticmethod
+    def append_dataset_chunk(
+            dataset_chunk: DataFrame,
+            dataset_file_path: str,
+            dataset_file_format: str
+    ) -> None:
+        """
+        Append a chunk to an output dataset file durably. The chunks of the '*.csv' dataset files are appended to a
+        single file, and the chunks of the '*.parquet' datasets are written atomically as separate part files of a
+        dataset directory, so that an interrupted chunk never corrupts the previously appended ones.
+
+        :parameter dataset_chunk: The chunk.
+        :parameter dataset_file_path: The path to the output '*.csv' dataset file or '*.parquet' dataset directory.
+        :parameter dataset_file_format: The format of the output dataset: 'csv' or 'parquet'.
+        """
+
+        dataset_size = DatasetIoUtilities.get_dataset_size(
+            dataset_file_path=dataset_file_path,
+            dataset_file_format=dataset_file_format
+        )
+
+        if dataset_file_format == "parquet":
+            from pyarrow import Table
+            from pyarrow.parquet import write_table
+
+            makedirs(dataset_file_path, exist_ok=True)
+
+            part_file_path = DatasetIoUtilities.get_parquet_dataset_part_file_path(
+                dataset_directory_path=dataset_file_path,
+                part_index=dataset_size
+            )
+
+            temporary_part_file_path = "{0}.tmp".format(part_file_path)
+
+            with open(temporary_part_file_path, mode="wb") as file_handle:
+                write_table(
+                    Table.from_pandas(dataset_chunk, preserve_index=False),
+                    file_handle
+                )
+
+                file_handle.flush()
+
+                fsync(file_handle.fileno())
+
+            replace(temporary_part_file_path, part_file_path)
+
+            return
+
+        with open(dataset_file_path, mode="a", newline="") as file_handle:
+            dataset_chunk.to_csv(
+                path_or_buf=file_handle,
+                header=dataset_size == 0,
+                index=False
+            )
+
+            file_handle.flush()
+
+            fsync(file_handle.fileno())
+
+    @staticmethod
+    def get_dataset_size(
+            dataset_file_path: str,
+            dataset_file_format: str
+    ) -> int:
+        """
+        Get the size of an output dataset file.
+
+        :parameter dataset_file_path: The path to the output '*.csv' dataset file or '*.parquet' dataset directory.
+        :parameter dataset_file_format: The format of the output dataset: 'csv' or 'parquet'.
+
+        :returns: The size of the '*.csv' dataset file in bytes, or the number of part files of the '*.parquet'
+                  dataset directory.
+        """
+
+        if not exists(dataset_file_path):
+            return 0
+
+        if dataset_file_format == "parquet":
+            return len(glob(join(dataset_file_path, "part-*.parquet")))
+
+        return getsize(dataset_file_path)
+
+    @staticmethod
+    def discard_uncommitted_dataset_chunks(
+            dataset_file_path: str,
+            dataset_file_format: str,
+            dataset_size: int
+    ) -> None:
+        """
+        Discard the chunks that were appended to an output dataset file after it had a specific size.
+
+        :parameter dataset_file_path: The path to the output '*.csv' dataset file or '*.parquet' dataset directory.
+        :parameter dataset_file_format: The format of the output dataset: 'csv' or 'parquet'.
+        :parameter dataset_size: The size of the '*.csv' dataset file in bytes, or the number of part files of the
+                                 '*.parquet' dataset directory that should be kept.
+        """
+
+        if not exists(dataset_file_path):
+            return
+
+        if dataset_file_format == "parquet":
+            for part_file_path in glob(join(dataset_file_path, "part-*.parquet*")):
+                if part_file_path.endswith(".tmp") or \
+                        int(part_file_path.rsplit("part-", 1)[1].split(".", 1)[0]) >= dataset_size:
+                    remove(part_file_path)
+
+            return
+
+        truncate(dataset_file_path, dataset_size)
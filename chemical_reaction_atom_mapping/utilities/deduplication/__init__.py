@@ -0,0 +1,3 @@
+""" The 'chemical_reaction_atom_mapping.utilities.deduplication' package initialization module. """
+
+from .deduplication import DeduplicationUtilities
@@ -0,0 +1,107 @@
+""" The 'chemical_reaction_atom_mapping.utilities.deduplication' package 'deduplication' module. """
+
+from logging import getLogger
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from ..reaction_smiles import ReactionSmilesUtilities
+
+
+class DeduplicationUtilities:
+    """ The chemical reaction SMILES string deduplication utilities class. """
+
+    @staticmethod
+    def get_reaction_smiles_key(
+            reaction_smiles: str,
+            deduplication_mode: str = "exact"
+    ) -> str:
+        """
+        Get the deduplication key of a chemical reaction SMILES string.
+
+        :parameter reaction_smiles: The chemical reaction SMILES string.
+        :parameter deduplication_mode: The indicator how the chemical reaction SMILES strings should be compared:
+                                       'exact' or 'canonical'. The 'canonical' mode ignores the order of the compounds
+                                       and canonicalizes the chemical compound SMILES strings using the RDKit library.
+
+        :returns: The deduplication key of the chemical reaction SMILES string.
+        """
+
+        if deduplication_mode == "exact":
+            return reaction_smiles
+
+        elif deduplication_mode == "canonical":
+            return ReactionSmilesUtilities.get_canonical_reaction_smiles(
+                reaction_smiles=reaction_smiles,
+                canonicalize_compound_smiles=True
+            )
+
+        else:
+            raise ValueError(
+                "The deduplication mode '{0}' is not supported. Please choose 'exact' or 'canonical'.".format(
+                    deduplication_mode
+                )
+            )
+
+    @staticmethod
+    def run_with_deduplication(
+            reaction_smiles_strings: Iterable[str],
+            atom_mapping_procedure: Callable[[List[str]], Optional[List[Tuple[Optional[str], Any]]]],
+            deduplication_mode: str = "exact"
+    ) -> Optional[List[Tuple[Optional[str], Any]]]:
+        """
+        Run a chemical reaction atom mapping procedure only once for each unique chemical reaction SMILES string, and
+        scatter the chemical reaction atom mapping results back to all of the duplicate chemical reaction SMILES
+        strings. The values that are not strings, such as the missing values of a dataset, are never deduplicated and
+        are passed to the atom mapping procedure as they are.
+
+        :parameter reaction_smiles_strings: The chemical reaction SMILES strings.
+        :parameter atom_mapping_procedure: The chemical reaction atom mapping procedure that maps a list of chemical
+                                           reaction SMILES strings.
+        :parameter deduplication_mode: The indicator how the chemical reaction SMILES strings should be compared:
+                                       'exact' or 'canonical'.
+
+        :returns: The chemical reaction atom mapping results in the order of the chemical reaction SMILES strings.
+        """
+
+        reaction_smiles_keys = list()  # type: List[Hashable]
+        unique_reaction_smiles_strings = dict()  # type: Dict[Hashable, Any]
+
+        for reaction_smiles_index, reaction_smiles in enumerate(reaction_smiles_strings):
+            if isinstance(reaction_smiles, str):
+                reaction_smiles_key = DeduplicationUtilities.get_reaction_smiles_key(
+                    reaction_smiles=reaction_smiles,
+                    deduplication_mode=deduplication_mode
+                )
+
+            else:
+                reaction_smiles_key = (reaction_smiles_index, )
+
+            reaction_smiles_keys.append(
+                reaction_smiles_key
+            )
+
+            unique_reaction_smiles_strings.setdefault(reaction_smiles_key, reaction_smiles)
+
+        getLogger(
+            "{0}.DeduplicationUtilities.run_with_deduplication".format(__name__)
+        ).info("Unique chemical reaction SMILES strings: {0} / {1} (Deduplication Ratio: {2:.2%}).".format(
+            len(unique_reaction_smiles_strings),
+            len(reaction_smiles_keys),
+            1.0 - len(unique_reaction_smiles_strings) / len(reaction_smiles_keys)
+            if len(reaction_smiles_keys) > 0 else 0.0
+        ))
+
+        unique_atom_mapping_results = atom_mapping_procedure(
+            list(unique_reaction_smiles_strings.values())
+        )
+
+        if unique_atom_mapping_results is None:
+            return None
+
+        unique_atom_mapping_results = dict(zip(
+            unique_reaction_smiles_strings.keys(),
+            unique_atom_mapping_results
+        ))
+
+        return [
+            unique_atom_mapping_results[reaction_smiles_key] for reaction_smiles_key in reaction_smiles_keys
+        ]
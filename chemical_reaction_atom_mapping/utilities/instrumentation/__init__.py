@@ -0,0 +1,3 @@
+""" The 'chemical_reaction_atom_mapping.utilities.instrumentation' package initialization module. """
+
+from .instrumentation import InstrumentationUtilities, JsonLinesMetricsSink, PrometheusTextMetricsSink
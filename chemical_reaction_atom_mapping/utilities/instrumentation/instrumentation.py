@@ -0,0 +1,427 @@
+""" The 'chemical_reaction_atom_mapping.utilities.instrumentation' package 'instrumentation' module. """
+
+from json import dumps
+from os import fsync, getpid, replace
+from threading import Lock
+from time import perf_counter, time
+from typing import Any, Callable, Dict, Generator, Iterator, List, Optional, Tuple
+
+
+class _DisabledStageTimer:
+    """ The stage timer class that is utilized while the instrumentation is disabled. """
+
+    __slots__ = ()
+
+    def __enter__(
+            self
+    ) -> "_DisabledStageTimer":
+        """ The context manager entry method of the class. """
+
+        return self
+
+    def __exit__(
+            self,
+            *args
+    ) -> bool:
+        """ The context manager exit method of the class. """
+
+        return False
+
+
+class _StageTimer:
+    """ The stage timer class that is utilized while the instrumentation is enabled. """
+
+    __slots__ = ("stage_name", "stage_start_time", )
+
+    def __init__(
+            self,
+            stage_name: str
+    ) -> None:
+        """
+        The constructor method of the class.
+
+        :parameter stage_name: The name of the stage.
+        """
+
+        self.stage_name = stage_name
+        self.stage_start_time = 0.0
+
+    def __enter__(
+            self
+    ) -> "_StageTimer":
+        """ The context manager entry method of the class. """
+
+        self.stage_start_time = perf_counter()
+
+        return self
+
+    def __exit__(
+            self,
+            exception_type: Optional[type],
+            *args
+    ) -> bool:
+        """ The context manager exit method of the class. """
+
+        InstrumentationUtilities.record_duration(
+            stage_name=self.stage_name,
+            duration_s=perf_counter() - self.stage_start_time
+        )
+
+        if exception_type is not None:
+            InstrumentationUtilities.increment(
+                counter_name="{0}.failures".format(self.stage_name)
+            )
+
+        return False
+
+
+class InstrumentationUtilities:
+    """ The process-wide per-stage timer and counter instrumentation utilities class. """
+
+    _is_enabled = False
+
+    _disabled_stage_timer = _DisabledStageTimer()
+
+    _metrics_lock = Lock()
+    _metrics_process_id = getpid()
+    _timers: Dict[str, List[float]] = dict()
+    _counters: Dict[str, int] = dict()
+
+    @staticmethod
+    def enable() -> None:
+        """ Enable the instrumentation in the current process and in the worker processes that it starts. """
+
+        InstrumentationUtilities._is_enabled = True
+
+    @staticmethod
+    def disable() -> None:
+        """ Disable the instrumentation. """
+
+        InstrumentationUtilities._is_enabled = False
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """
+        Check whether the instrumentation is enabled.
+
+        :returns: The indicator whether the instrumentation is enabled.
+        """
+
+        return InstrumentationUtilities._is_enabled
+
+    @staticmethod
+    def _reset_metrics_after_fork() -> None:
+        """
+        Reset the metrics if the current process is a forked child process that inherited the metrics of its parent
+        process, so that the metrics of the parent process are not counted twice once they are merged back.
+        """
+
+        if InstrumentationUtilities._metrics_process_id != getpid():
+            InstrumentationUtilities._metrics_process_id = getpid()
+            InstrumentationUtilities._timers = dict()
+            InstrumentationUtilities._counters = dict()
+
+    @staticmethod
+    def measure(
+            stage_name: str
+    ) -> Any:
+        """
+        Measure the duration of a stage as a context manager. If the stage raises an exception, the failure counter of
+        the stage is incremented as well.
+
+        :parameter stage_name: The name of the stage.
+
+        :returns: The stage timer context manager.
+        """
+
+        if not InstrumentationUtilities._is_enabled:
+            return InstrumentationUtilities._disabled_stage_timer
+
+        return _StageTimer(stage_name)
+
+    @staticmethod
+    def record_duration(
+            stage_name: str,
+            duration_s: float
+    ) -> None:
+        """
+        Record the duration of a stage.
+
+        :parameter stage_name: The name of the stage.
+        :parameter duration_s: The duration of the stage in seconds.
+        """
+
+        if not InstrumentationUtilities._is_enabled:
+            return
+
+        with InstrumentationUtilities._metrics_lock:
+            InstrumentationUtilities._reset_metrics_after_fork()
+
+            timer = InstrumentationUtilities._timers.setdefault(stage_name, [0, 0.0, 0.0])
+
+            timer[0] += 1
+            timer[1] += duration_s
+            timer[2] = max(timer[2], duration_s)
+
+    @staticmethod
+    def increment(
+            counter_name: str,
+            value: int = 1
+    ) -> None:
+        """
+        Increment a counter.
+
+        :parameter counter_name: The name of the counter.
+        :parameter value: The value by which the counter is incremented.
+        """
+
+        if not InstrumentationUtilities._is_enabled:
+            return
+
+        with InstrumentationUtilities._metrics_lock:
+            InstrumentationUtilities._reset_metrics_after_fork()
+
+            InstrumentationUtilities._counters[counter_name] = \
+                InstrumentationUtilities._counters.get(counter_name, 0) + value
+
+    @staticmethod
+    def get_metrics(
+            reset: bool = False
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the metrics of the current process.
+
+        :parameter reset: The indicator whether the metrics should be reset after they are retrieved.
+
+        :returns: The number of calls, the total duration and the maximum duration of each stage, and the value of each
+                  counter.
+        """
+
+        with InstrumentationUtilities._metrics_lock:
+            InstrumentationUtilities._reset_metrics_after_fork()
+
+            metrics = {
+                "timers": {
+                    stage_name: {
+                        "count": timer[0],
+                        "total_s": timer[1],
+                        "max_s": timer[2],
+                    } for stage_name, timer in sorted(InstrumentationUtilities._timers.items())
+                },
+                "counters": dict(sorted(InstrumentationUtilities._counters.items())),
+            }
+
+            if reset:
+                InstrumentationUtilities._timers = dict()
+                InstrumentationUtilities._counters = dict()
+
+        return metrics
+
+    @staticmethod
+    def merge_metrics(
+            metrics: Dict[str, Dict[str, Any]]
+    ) -> None:
+        """
+        Merge the metrics of another process into the metrics of the current process.
+
+        :parameter metrics: The metrics of another process.
+        """
+
+        with InstrumentationUtilities._metrics_lock:
+            InstrumentationUtilities._reset_metrics_after_fork()
+
+            for stage_name, stage_metrics in metrics["timers"].items():
+                timer = InstrumentationUtilities._timers.setdefault(stage_name, [0, 0.0, 0.0])
+
+                timer[0] += stage_metrics["count"]
+                timer[1] += stage_metrics["total_s"]
+                timer[2] = max(timer[2], stage_metrics["max_s"])
+
+            for counter_name, counter_value in metrics["counters"].items():
+                InstrumentationUtilities._counters[counter_name] = \
+                    InstrumentationUtilities._counters.get(counter_name, 0) + counter_value
+
+    @staticmethod
+    def reset_metrics() -> None:
+        """ Reset the metrics of the current process. """
+
+        with InstrumentationUtilities._metrics_lock:
+            InstrumentationUtilities._timers = dict()
+            InstrumentationUtilities._counters = dict()
+
+    @staticmethod
+    def run_with_metrics_collection(
+            processing_procedure: Callable[..., Any],
+            primary_input_argument: Any
+    ) -> Tuple[Any, Dict[str, Dict[str, Any]]]:
+        """
+        Run a processing procedure in a worker process with the instrumentation enabled, and collect the metrics that
+        it records so that they can be merged into the metrics of the parent process.
+
+        :parameter processing_procedure: The processing procedure.
+        :parameter primary_input_argument: The primary input argument of the processing procedure.
+
+        :returns: The output of the processing procedure, and the metrics that were recorded in the worker process since
+                  the previous collection.
+        """
+
+        InstrumentationUtilities.enable()
+
+        with InstrumentationUtilities.measure("multiprocessing.task"):
+            processing_procedure_output = processing_procedure(primary_input_argument)
+
+        return processing_procedure_output, InstrumentationUtilities.get_metrics(
+            reset=True
+        )
+
+    @staticmethod
+    def iterate_with_metrics_merging(
+            processing_procedure_outputs: Generator[Tuple[Any, Optional[Dict[str, Dict[str, Any]]]], None, None]
+    ) -> Iterator[Any]:
+        """
+        Iterate over the outputs of the 'run_with_metrics_collection' function, merge the collected metrics into the
+        metrics of the current process, and measure how long the current process waits for each output.
+
+        :parameter processing_procedure_outputs: The outputs of the 'run_with_metrics_collection' function.
+
+        :returns: The outputs of the processing procedure.
+        """
+
+        try:
+            while True:
+                output_wait_start_time = perf_counter()
+
+                try:
+                    processing_procedure_output, metrics = next(processing_procedure_outputs)
+
+                except StopIteration:
+                    return
+
+                InstrumentationUtilities.record_duration(
+                    stage_name="multiprocessing.output_wait",
+                    duration_s=perf_counter() - output_wait_start_time
+                )
+
+                if metrics is not None:
+                    InstrumentationUtilities.merge_metrics(
+                        metrics=metrics
+                    )
+
+                yield processing_procedure_output
+
+        finally:
+            processing_procedure_outputs.close()
+
+    @staticmethod
+    def export(
+            metrics_sink: Any
+    ) -> None:
+        """
+        Export the metrics of the current process through a metrics sink.
+
+        :parameter metrics_sink: The metrics sink object that implements the 'write' method.
+        """
+
+        metrics_sink.write(InstrumentationUtilities.get_metrics())
+
+
+class JsonLinesMetricsSink:
+    """ The JSON-lines metrics sink class that appends a timestamped snapshot of the metrics per export. """
+
+    def __init__(
+            self,
+            file_path: str
+    ) -> None:
+        """
+        The constructor method of the class.
+
+        :parameter file_path: The path to the '*.jsonl' metrics file.
+        """
+
+        self.file_path = file_path
+
+    def write(
+            self,
+            metrics: Dict[str, Dict[str, Any]]
+    ) -> None:
+        """
+        Append a snapshot of the metrics to the metrics file.
+
+        :parameter metrics: The metrics.
+        """
+
+        with open(self.file_path, mode="a") as file_handle:
+            file_handle.write(dumps({
+                "timestamp": time(),
+                **metrics,
+            }, sort_keys=True) + "\n")
+
+
+class PrometheusTextMetricsSink:
+    """ The Prometheus text exposition format metrics sink class that overwrites the metrics file per export. """
+
+    def __init__(
+            self,
+            file_path: str,
+            metric_name_prefix: str = "chemical_reaction_atom_mapping"
+    ) -> None:
+        """
+        The constructor method of the class.
+
+        :parameter file_path: The path to the '*.prom' metrics file, for example in the directory of the node exporter
+                              textfile collector.
+        :parameter metric_name_prefix: The prefix of the metric names.
+        """
+
+        self.file_path = file_path
+        self.metric_name_prefix = metric_name_prefix
+
+    def write(
+            self,
+            metrics: Dict[str, Dict[str, Any]]
+    ) -> None:
+        """
+        Write the metrics to the metrics file atomically, so that a scraper never reads a partially written file.
+
+        :parameter metrics: The metrics.
+        """
+
+        metric_lines = list()
+
+        for metric_name_suffix, metric_type, metric_key, metric_label in [
+            ("stage_calls_total", "counter", "count", "stage"),
+            ("stage_duration_seconds_total", "counter", "total_s", "stage"),
+            ("stage_duration_seconds_max", "gauge", "max_s", "stage"),
+        ]:
+            metric_lines.append("# TYPE {0}_{1} {2}".format(self.metric_name_prefix, metric_name_suffix, metric_type))
+
+            metric_lines.extend(
+                "{0}_{1}{{{2}=\"{3}\"}} {4}".format(
+                    self.metric_name_prefix,
+                    metric_name_suffix,
+                    metric_label,
+                    stage_name,
+                    stage_metrics[metric_key]
+                ) for stage_name, stage_metrics in metrics["timers"].items()
+            )
+
+        metric_lines.append("# TYPE {0}_events_total counter".format(self.metric_name_prefix))
+
+        metric_lines.extend(
+            "{0}_events_total{{counter=\"{1}\"}} {2}".format(
+                self.metric_name_prefix,
+                counter_name,
+                counter_value
+            ) for counter_name, counter_value in metrics["counters"].items()
+        )
+
+        temporary_file_path = "{0}.tmp".format(self.file_path)
+
+        with open(temporary_file_path, mode="w") as file_handle:
+            file_handle.write("\n".join(metric_lines) + "\n")
+
+            file_handle.flush()
+
+            fsync(file_handle.fileno())
+
+        replace(temporary_file_path, self.file_path)
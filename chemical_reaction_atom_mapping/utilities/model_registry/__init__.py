@@ -0,0 +1,3 @@
+""" The 'chemical_reaction_atom_mapping.utilities.model_registry' package initialization module. """
+
+from .model_registry import ModelRegistryUtilities
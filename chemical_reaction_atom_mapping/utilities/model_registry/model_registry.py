@@ -0,0 +1,159 @@
+""" The 'chemical_reaction_atom_mapping.utilities.model_registry' package 'model_registry' module. """
+
+from gc import collect
+from json import dumps
+from logging import getLogger
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from ..instrumentation import InstrumentationUtilities
+
+
+class ModelRegistryUtilities:
+    """ The process-wide model registry utilities class. """
+
+    _models: Dict[Tuple[str, str], Any] = dict()
+    _models_lock = Lock()
+    _model_loading_locks: Dict[Tuple[str, str], Lock] = dict()
+
+    @staticmethod
+    def get_model_key(
+            model_name: str,
+            model_configuration: Optional[Dict[str, Any]] = None
+    ) -> Tuple[str, str]:
+        """
+        Get the key of a model in the registry.
+
+        :parameter model_name: The name of the model.
+        :parameter model_configuration: The configuration of the model.
+
+        :returns: The key of the model in the registry.
+        """
+
+        return model_name, dumps(
+            model_configuration if model_configuration is not None else dict(),
+            sort_keys=True,
+            default=str
+        )
+
+    @staticmethod
+    def get_model(
+            model_name: str,
+            model_loading_procedure: Callable[..., Any],
+            model_configuration: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """
+        Get a model from the registry, and load it only if it has not been loaded in the current process yet.
+
+        :parameter model_name: The name of the model.
+        :parameter model_loading_procedure: The procedure that loads the model from the model configuration.
+        :parameter model_configuration: The configuration of the model.
+
+        :returns: The loaded model.
+        """
+
+        model_key = ModelRegistryUtilities.get_model_key(
+            model_name=model_name,
+            model_configuration=model_configuration
+        )
+
+        with ModelRegistryUtilities._models_lock:
+            if model_key in ModelRegistryUtilities._models.keys():
+                return ModelRegistryUtilities._models[model_key]
+
+            model_loading_lock = ModelRegistryUtilities._model_loading_locks.setdefault(model_key, Lock())
+
+        # --------------------------------------------------------------------------------------------------------------
+        #  The model is loaded while holding only its own loading lock, so the concurrent requests for the same model
+        #  wait for a single load, while the requests for the other models are not blocked by it.
+        # --------------------------------------------------------------------------------------------------------------
+
+        with model_loading_lock:
+            with ModelRegistryUtilities._models_lock:
+                if model_key in ModelRegistryUtilities._models.keys():
+                    return ModelRegistryUtilities._models[model_key]
+
+            model_loading_start_time = perf_counter()
+
+            model = model_loading_procedure(
+                model_configuration if model_configuration is not None else dict()
+            )
+
+            InstrumentationUtilities.record_duration(
+                stage_name="{0}.model_loading".format(model_name),
+                duration_s=perf_counter() - model_loading_start_time
+            )
+
+            getLogger(
+                "{0}.ModelRegistryUtilities.get_model".format(__name__)
+            ).debug("The '{0}' model has been loaded in {1:.3f} seconds.".format(
+                model_name,
+                perf_counter() - model_loading_start_time
+            ))
+
+            with ModelRegistryUtilities._models_lock:
+                ModelRegistryUtilities._models[model_key] = model
+
+            return model
+
+    @staticmethod
+    def is_model_loaded(
+            model_name: str,
+            model_configuration: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """
+        Check whether a model is loaded in the registry.
+
+        :parameter model_name: The name of the model.
+        :parameter model_configuration: The configuration of the model.
+
+        :returns: The indicator whether the model is loaded in the registry.
+        """
+
+        with ModelRegistryUtilities._models_lock:
+            return ModelRegistryUtilities.get_model_key(
+                model_name=model_name,
+                model_configuration=model_configuration
+            ) in ModelRegistryUtilities._models.keys()
+
+    @staticmethod
+    def release_model(
+            model_name: str,
+            model_configuration: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """
+        Release a model from the registry.
+
+        :parameter model_name: The name of the model.
+        :parameter model_configuration: The configuration of the model.
+
+        :returns: The indicator whether the model was loaded in the registry before the release.
+        """
+
+        with ModelRegistryUtilities._models_lock:
+            model = ModelRegistryUtilities._models.pop(
+                ModelRegistryUtilities.get_model_key(
+                    model_name=model_name,
+                    model_configuration=model_configuration
+                ),
+                None
+            )
+
+        if model is None:
+            return False
+
+        del model
+
+        collect()
+
+        return True
+
+    @staticmethod
+    def release_all_models() -> None:
+        """ Release all models from the registry. """
+
+        with ModelRegistryUtilities._models_lock:
+            ModelRegistryUtilities._models.clear()
+
+        collect()
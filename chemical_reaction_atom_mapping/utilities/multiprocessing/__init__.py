@@ -1,3 +1,3 @@
 """ The 'chemical_reaction_atom_mapping.utilities.multiprocessing' package initialization module. """
 
-from .multiprocessing import MultiprocessingUtilities
+from .multiprocessing import MultiprocessingUtilities, PersistentProcessPool
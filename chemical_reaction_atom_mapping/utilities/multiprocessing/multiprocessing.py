@@ -1,20 +1,1162 @@
 """ The 'chemical_reaction_atom_mapping.utilities.multiprocessing' package 'multiprocessing' module. """
 
+from array import array
+from functools import partial
 from logging import getLogger
-from multiprocessing import cpu_count, Pool
+from multiprocessing import cpu_count, Pipe, Pool, Process
+from multiprocessing.connection import Connection, wait
+from multiprocessing.shared_memory import SharedMemory
+from pickle import dumps
+from struct import calcsize, pack_into, unpack_from
+from threading import BoundedSemaphore, Event, local
+from time import monotonic
 from tqdm import tqdm
-from typing import Any, Callable, Iterable, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Sized, Tuple
+
+from ..instrumentation import InstrumentationUtilities
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  The shared memory input buffer consists of the byte offsets of the primary input arguments followed by their
+#  concatenated UTF-8 bytes. The shared memory output buffer consists of a fixed-size record per output followed by a
+#  slot per output for the bytes of its string, whose capacity is derived from the byte length of the primary input
+#  argument, so that no offsets need to be exchanged between the processes.
+# ----------------------------------------------------------------------------------------------------------------------
+
+_shared_memory_offset_size = calcsize("<q")
+_shared_memory_output_record_format = "<BBid"
+_shared_memory_output_record_size = calcsize(_shared_memory_output_record_format)
+_shared_memory_output_slot_capacity_factor = 8
+_shared_memory_output_slot_capacity_padding = 64
+
+
+_attached_shared_memory_blocks = dict()  # type: Dict[str, SharedMemory]
+
+
+def _get_attached_shared_memory(
+        shared_memory_name: str
+) -> SharedMemory:
+    """
+    Get a shared memory block that is attached to the current worker process only once, so that the index ranges of the
+    same shared memory block do not attach it again.
+
+    :parameter shared_memory_name: The name of the shared memory block.
+
+    :returns: The shared memory block.
+    """
+
+    if shared_memory_name not in _attached_shared_memory_blocks.keys():
+        _attached_shared_memory_blocks[shared_memory_name] = SharedMemory(
+            name=shared_memory_name
+        )
+
+    return _attached_shared_memory_blocks[shared_memory_name]
+
+
+def _get_shared_memory_output_slot(
+        input_argument_byte_offsets: Tuple[int, int],
+        primary_input_argument_index: int,
+        number_of_primary_input_arguments: int
+) -> Tuple[int, int]:
+    """
+    Get the position of the slot of an output in the shared memory output buffer.
+
+    :parameter input_argument_byte_offsets: The start and end byte offsets of the primary input argument in the shared
+                                            memory input buffer.
+    :parameter primary_input_argument_index: The index of the primary input argument.
+    :parameter number_of_primary_input_arguments: The number of primary input arguments.
+
+    :returns: The byte offset and the byte capacity of the slot of the output.
+    """
+
+    return (
+        number_of_primary_input_arguments * _shared_memory_output_record_size +
+        _shared_memory_output_slot_capacity_factor * input_argument_byte_offsets[0] +
+        _shared_memory_output_slot_capacity_padding * primary_input_argument_index,
+        _shared_memory_output_slot_capacity_factor * (input_argument_byte_offsets[1] - input_argument_byte_offsets[0]) +
+        _shared_memory_output_slot_capacity_padding
+    )
+
+
+def _write_shared_memory_output(
+        output_buffer: memoryview,
+        primary_input_argument_index: int,
+        output_slot: Tuple[int, int],
+        processing_procedure_output: Any
+) -> bool:
+    """
+    Write an output that is a pair of a string or None and a float, a boolean or None to the shared memory output
+    buffer.
+
+    :parameter output_buffer: The shared memory output buffer.
+    :parameter primary_input_argument_index: The index of the primary input argument.
+    :parameter output_slot: The byte offset and the byte capacity of the slot of the output.
+    :parameter processing_procedure_output: The output of the processing procedure.
+
+    :returns: The indicator whether the output was written. The outputs of any other form and the strings that exceed
+              the capacity of the slot are not written.
+    """
+
+    if not isinstance(processing_procedure_output, tuple) or len(processing_procedure_output) != 2:
+        return False
+
+    output_string, output_score = processing_procedure_output
+
+    if output_score is None:
+        output_score_kind, output_score = 0, 0.0
+
+    elif isinstance(output_score, bool):
+        output_score_kind, output_score = 2, float(output_score)
+
+    elif isinstance(output_score, float):
+        output_score_kind = 1
+
+    else:
+        return False
+
+    if output_string is None:
+        output_string_length = -1
+
+    elif isinstance(output_string, str):
+        output_string = output_string.encode("utf-8")
+        output_string_length = len(output_string)
+
+        if output_string_length > output_slot[1]:
+            return False
+
+        output_buffer[output_slot[0]:output_slot[0] + output_string_length] = output_string
+
+    else:
+        return False
+
+    pack_into(
+        _shared_memory_output_record_format,
+        output_buffer,
+        primary_input_argument_index * _shared_memory_output_record_size,
+        1,
+        output_score_kind,
+        output_string_length,
+        output_score
+    )
+
+    return True
+
+
+def _read_shared_memory_output(
+        output_buffer: memoryview,
+        primary_input_argument_index: int,
+        output_slot: Tuple[int, int]
+) -> Optional[Tuple[Optional[str], Any]]:
+    """
+    Read an output from the shared memory output buffer.
+
+    :parameter output_buffer: The shared memory output buffer.
+    :parameter primary_input_argument_index: The index of the primary input argument.
+    :parameter output_slot: The byte offset and the byte capacity of the slot of the output.
+
+    :returns: The output of the processing procedure, or None if the output was not written.
+    """
+
+    is_written, output_score_kind, output_string_length, output_score = unpack_from(
+        _shared_memory_output_record_format,
+        output_buffer,
+        primary_input_argument_index * _shared_memory_output_record_size
+    )
+
+    if not is_written:
+        return None
+
+    return (
+        bytes(output_buffer[output_slot[0]:output_slot[0] + output_string_length]).decode("utf-8")
+        if output_string_length >= 0 else None,
+        None if output_score_kind == 0 else output_score if output_score_kind == 1 else bool(output_score)
+    )
+
+
+def _run_processing_procedure_on_shared_memory_input_argument_range(
+        processing_procedure: Callable[..., Any],
+        shared_memory_layout: Tuple[str, str, int],
+        input_argument_range: Tuple[int, int, Dict[int, Any]]
+) -> Dict[int, Any]:
+    """
+    Run a processing procedure on a range of the primary input arguments that are read from the shared memory input
+    buffer, and write the outputs to the shared memory output buffer.
+
+    :parameter processing_procedure: The processing procedure.
+    :parameter shared_memory_layout: The names of the shared memory input and output buffers, and the number of primary
+                                     input arguments.
+    :parameter input_argument_range: The start and end indices of the range, and the primary input arguments of the
+                                     range that are not strings and are therefore not stored in the shared memory input
+                                     buffer.
+
+    :returns: The outputs of the range that were not written to the shared memory output buffer by their indices.
+    """
+
+    input_shared_memory_name, output_shared_memory_name, number_of_primary_input_arguments = shared_memory_layout
+    range_start_index, range_end_index, non_string_input_arguments = input_argument_range
+
+    input_buffer = _get_attached_shared_memory(
+        shared_memory_name=input_shared_memory_name
+    ).buf
+
+    output_buffer = _get_attached_shared_memory(
+        shared_memory_name=output_shared_memory_name
+    ).buf
+
+    input_data_offset = _shared_memory_offset_size * (number_of_primary_input_arguments + 1)
+
+    input_argument_byte_offsets = unpack_from(
+        "<{0}q".format(range_end_index - range_start_index + 1),
+        input_buffer,
+        _shared_memory_offset_size * range_start_index
+    )
+
+    unwritten_processing_procedure_outputs = dict()
+
+    for primary_input_argument_index in range(range_start_index, range_end_index):
+        input_argument_start_byte_offset, input_argument_end_byte_offset = input_argument_byte_offsets[
+            primary_input_argument_index - range_start_index:primary_input_argument_index - range_start_index + 2
+        ]
+
+        if primary_input_argument_index in non_string_input_arguments.keys():
+            primary_input_argument = non_string_input_arguments[primary_input_argument_index]
+
+        else:
+            primary_input_argument = bytes(input_buffer[
+                input_data_offset + input_argument_start_byte_offset:input_data_offset + input_argument_end_byte_offset
+            ]).decode("utf-8")
+
+        processing_procedure_output = processing_procedure(primary_input_argument)
+
+        if not _write_shared_memory_output(
+            output_buffer=output_buffer,
+            primary_input_argument_index=primary_input_argument_index,
+            output_slot=_get_shared_memory_output_slot(
+                input_argument_byte_offsets=(input_argument_start_byte_offset, input_argument_end_byte_offset),
+                primary_input_argument_index=primary_input_argument_index,
+                number_of_primary_input_arguments=number_of_primary_input_arguments
+            ),
+            processing_procedure_output=processing_procedure_output
+        ):
+            unwritten_processing_procedure_outputs[primary_input_argument_index] = processing_procedure_output
+
+            InstrumentationUtilities.increment(
+                counter_name="multiprocessing.shared_memory_overflows"
+            )
+
+    return unwritten_processing_procedure_outputs
+
+
+def _run_processing_procedure_on_indexed_input_argument(
+        processing_procedure: Callable[..., Any],
+        indexed_input_argument: Tuple[int, Any]
+) -> Tuple[int, Any]:
+    """
+    Run a processing procedure on an indexed input argument, and keep the index with the output.
+
+    :parameter processing_procedure: The processing procedure.
+    :parameter indexed_input_argument: The index of the input argument and the input argument.
+
+    :returns: The index of the input argument and the output of the processing procedure.
+    """
+
+    return indexed_input_argument[0], processing_procedure(indexed_input_argument[1])
+
+
+def _run_timeout_process_pool_worker(
+        processing_procedure: Callable[..., Any],
+        task_connection: Connection,
+        process_pool_initializer: Optional[Callable[..., Any]] = None,
+        process_pool_initializer_arguments: Tuple[Any, ...] = ()
+) -> None:
+    """
+    Run the tasks that are received from the parent process until the parent process stops the worker process.
+
+    :parameter processing_procedure: The processing procedure.
+    :parameter task_connection: The connection to the parent process.
+    :parameter process_pool_initializer: The procedure that initializes the worker process.
+    :parameter process_pool_initializer_arguments: The arguments of the procedure that initializes the worker process.
+    """
+
+    if process_pool_initializer is not None:
+        process_pool_initializer(*process_pool_initializer_arguments)
+
+    while True:
+        try:
+            task = task_connection.recv()
+
+        except EOFError:
+            return
+
+        if task is None:
+            return
+
+        try:
+            task_connection.send((task[0], True, processing_procedure(task[1])))
+
+        except Exception as exception_handle:
+            task_connection.send((task[0], False, exception_handle))
+
+
+class PersistentProcessPool:
+    """
+    The persistent process pool class. The worker processes are started once and reused across the calls, and a worker
+    process that exceeds the deadline of its primary input argument or crashes is killed and replaced, so that the
+    worker processes and their loaded models stay warm for a long-running caller such as the atom mapping server.
+    """
+
+    def __init__(
+            self,
+            processing_procedure: Callable[..., Any],
+            number_of_cpu_cores: int,
+            process_pool_initializer: Optional[Callable[..., Any]] = None,
+            process_pool_initializer_arguments: Tuple[Any, ...] = ()
+    ) -> None:
+        """
+        The constructor method of the class.
+
+        :parameter processing_procedure: The processing procedure.
+        :parameter number_of_cpu_cores: The number of CPU cores that should be utilized.
+        :parameter process_pool_initializer: The procedure that initializes each worker process.
+        :parameter process_pool_initializer_arguments: The arguments of the procedure that initializes each worker
+                                                       process.
+        """
+
+        self.processing_procedure = processing_procedure
+        self.process_pool_initializer = process_pool_initializer
+        self.process_pool_initializer_arguments = process_pool_initializer_arguments
+
+        self._workers = [
+            self._start_worker() for _ in range(max(1, number_of_cpu_cores))
+        ]  # type: List[Tuple[Process, Connection]]
+
+    def _start_worker(
+            self
+    ) -> Tuple[Process, Connection]:
+        """
+        Start a worker process of the process pool.
+
+        :returns: The worker process, and the connection to the worker process.
+        """
+
+        parent_connection, child_connection = Pipe(duplex=True)
+
+        worker_process = Process(
+            target=_run_timeout_process_pool_worker,
+            args=(
+                self.processing_procedure,
+                child_connection,
+                self.process_pool_initializer,
+                self.process_pool_initializer_arguments,
+            ),
+            daemon=True
+        )
+
+        worker_process.start()
+
+        child_connection.close()
+
+        return worker_process, parent_connection
+
+    def _replace_worker(
+            self,
+            worker_index: int
+    ) -> None:
+        """
+        Kill a worker process of the process pool, and start a new one in its place.
+
+        :parameter worker_index: The index of the worker process.
+        """
+
+        worker_process, worker_connection = self._workers[worker_index]
+
+        worker_process.kill()
+        worker_process.join()
+        worker_connection.close()
+
+        self._workers[worker_index] = self._start_worker()
+
+    def iterate_outputs(
+            self,
+            primary_input_arguments: Iterable[Any],
+            task_timeout_period_s: Optional[float] = None,
+            task_timeout_output: Any = None
+    ) -> Iterator[Any]:
+        """
+        Iterate over the outputs of the processing procedure in the order of the primary input arguments.
+
+        :parameter primary_input_arguments: The primary input arguments of the processing procedure.
+        :parameter task_timeout_period_s: The maximum amount of time in seconds that may be spent on a primary input
+                                          argument. If not specified, only the worker processes that crash are replaced.
+        :parameter task_timeout_output: The output that is recorded for a primary input argument that times out or
+                                        whose worker process crashes.
+
+        :returns: The output of the processing procedure for each primary input argument.
+        """
+
+        logger = getLogger("{0}.PersistentProcessPool.iterate_outputs".format(__name__))
+
+        worker_tasks = dict()  # type: Dict[int, Tuple[int, Optional[float]]]
+
+        primary_input_arguments = iter(enumerate(primary_input_arguments))
+        processing_procedure_outputs, next_primary_input_argument_index = dict(), 0
+        primary_input_arguments_exhausted = False
+
+        try:
+            while True:
+                # ------------------------------------------------------------------------------------------------------
+                #  Each idle worker process receives the next primary input argument. Only one task per worker process
+                #  is pending at a time, so a hung worker process never holds back any other primary input argument.
+                # ------------------------------------------------------------------------------------------------------
+
+                for worker_index, (_, worker_connection) in enumerate(self._workers):
+                    if worker_index in worker_tasks.keys() or primary_input_arguments_exhausted:
+                        continue
+
+                    try:
+                        primary_input_argument_index, primary_input_argument = next(primary_input_arguments)
+
+                    except StopIteration:
+                        primary_input_arguments_exhausted = True
+
+                        break
+
+                    worker_connection.send((primary_input_argument_index, primary_input_argument))
+
+                    worker_tasks[worker_index] = (
+                        primary_input_argument_index,
+                        monotonic() + task_timeout_period_s if task_timeout_period_s is not None else None,
+                    )
+
+                if len(worker_tasks) == 0:
+                    break
+
+                task_deadlines = [
+                    task_deadline for _, task_deadline in worker_tasks.values() if task_deadline is not None
+                ]
+
+                ready_worker_connections = wait(
+                    [self._workers[worker_index][1] for worker_index in worker_tasks.keys()],
+                    timeout=max(0.0, min(task_deadlines) - monotonic()) if len(task_deadlines) > 0 else None
+                )
+
+                for worker_index in list(worker_tasks.keys()):
+                    worker_connection = self._workers[worker_index][1]
+                    primary_input_argument_index, task_deadline = worker_tasks[worker_index]
+
+                    if worker_connection in ready_worker_connections:
+                        try:
+                            _, is_successful, processing_procedure_output = worker_connection.recv()
+
+                        except EOFError:
+                            logger.debug("The worker process of the primary input argument {0} crashed.".format(
+                                primary_input_argument_index
+                            ))
+
+                            InstrumentationUtilities.increment(
+                                counter_name="multiprocessing.worker_crashes"
+                            )
+
+                        else:
+                            del worker_tasks[worker_index]
+
+                            if not is_successful:
+                                raise processing_procedure_output
+
+                            processing_procedure_outputs[primary_input_argument_index] = processing_procedure_output
+
+                            continue
+
+                    elif task_deadline is None or monotonic() < task_deadline:
+                        continue
+
+                    else:
+                        logger.debug("The primary input argument {0} timed out after {1} seconds.".format(
+                            primary_input_argument_index,
+                            task_timeout_period_s
+                        ))
+
+                        InstrumentationUtilities.increment(
+                            counter_name="multiprocessing.task_timeouts"
+                        )
+
+                    self._replace_worker(
+                        worker_index=worker_index
+                    )
+
+                    processing_procedure_outputs[primary_input_argument_index] = task_timeout_output
+
+                    del worker_tasks[worker_index]
+
+                while next_primary_input_argument_index in processing_procedure_outputs.keys():
+                    yield processing_procedure_outputs.pop(next_primary_input_argument_index)
+
+                    next_primary_input_argument_index += 1
+
+        # --------------------------------------------------------------------------------------------------------------
+        #  If the iteration is interrupted, for example by an exception of the processing procedure, the worker
+        #  processes that are still busy are replaced, so that their outputs are never received by the next call.
+        # --------------------------------------------------------------------------------------------------------------
+
+        finally:
+            for worker_index in worker_tasks.keys():
+                self._replace_worker(
+                    worker_index=worker_index
+                )
+
+    def close(
+            self
+    ) -> None:
+        """ Stop the worker processes of the process pool. """
+
+        for worker_process, worker_connection in self._workers:
+            if worker_process.is_alive():
+                try:
+                    worker_connection.send(None)
+
+                except (BrokenPipeError, OSError):
+                    pass
+
+            worker_process.join(timeout=1.0)
+
+            if worker_process.is_alive():
+                worker_process.kill()
+                worker_process.join()
+
+            worker_connection.close()
+
+        self._workers = list()
 
 
 class MultiprocessingUtilities:
     """ The multiprocessing utilities class. """
 
+    # ------------------------------------------------------------------------------------------------------------------
+    #  The persistent process pool and the progress bar indicator are kept per thread, so that a long-running caller,
+    #  such as a thread of the atom mapping server, can opt in without affecting the other threads.
+    # ------------------------------------------------------------------------------------------------------------------
+
+    _thread_state = local()
+
+    @staticmethod
+    def enable_persistent_process_pool() -> None:
+        """
+        Reuse the worker processes across the calls in the current thread instead of starting a process pool per call.
+        The worker processes are replaced only if the processing procedure, the number of CPU cores or the worker
+        process initializer changes, or if a worker process exceeds the task timeout period or crashes.
+        """
+
+        MultiprocessingUtilities._thread_state.use_persistent_process_pool = True
+
+    @staticmethod
+    def release_persistent_process_pool() -> None:
+        """ Stop the worker processes of the persistent process pool of the current thread, and stop reusing them. """
+
+        MultiprocessingUtilities._thread_state.use_persistent_process_pool = False
+
+        persistent_process_pool = getattr(MultiprocessingUtilities._thread_state, "persistent_process_pool", None)
+
+        if persistent_process_pool is not None:
+            persistent_process_pool[1].close()
+
+            MultiprocessingUtilities._thread_state.persistent_process_pool = None
+
+    @staticmethod
+    def enable_progress_bars() -> None:
+        """ Show the progress bars in the current thread. """
+
+        MultiprocessingUtilities._thread_state.show_progress_bars = True
+
+    @staticmethod
+    def disable_progress_bars() -> None:
+        """ Hide the progress bars in the current thread. """
+
+        MultiprocessingUtilities._thread_state.show_progress_bars = False
+
+    @staticmethod
+    def are_progress_bars_enabled() -> bool:
+        """
+        Check whether the progress bars are shown in the current thread.
+
+        :returns: The indicator whether the progress bars are shown.
+        """
+
+        return getattr(MultiprocessingUtilities._thread_state, "show_progress_bars", True)
+
+    @staticmethod
+    def _get_persistent_process_pool(
+            processing_procedure: Callable[..., Any],
+            number_of_cpu_cores: int,
+            process_pool_initializer: Optional[Callable[..., Any]] = None,
+            process_pool_initializer_arguments: Tuple[Any, ...] = ()
+    ) -> PersistentProcessPool:
+        """
+        Get the persistent process pool of the current thread, and replace it if it was started for another processing
+        procedure, number of CPU cores or worker process initializer. The processing procedures are compared by their
+        serialized form, because a new partial object of the same procedure is created for each call.
+
+        :parameter processing_procedure: The processing procedure.
+        :parameter number_of_cpu_cores: The number of CPU cores that should be utilized.
+        :parameter process_pool_initializer: The procedure that initializes each worker process.
+        :parameter process_pool_initializer_arguments: The arguments of the procedure that initializes each worker
+                                                       process.
+
+        :returns: The persistent process pool of the current thread.
+        """
+
+        try:
+            persistent_process_pool_key = dumps((
+                processing_procedure,
+                number_of_cpu_cores,
+                process_pool_initializer,
+                process_pool_initializer_arguments,
+            ))
+
+        except Exception:
+            persistent_process_pool_key = None
+
+        persistent_process_pool = getattr(MultiprocessingUtilities._thread_state, "persistent_process_pool", None)
+
+        if persistent_process_pool is not None and persistent_process_pool_key is not None and \
+                persistent_process_pool[0] == persistent_process_pool_key:
+            return persistent_process_pool[1]
+
+        if persistent_process_pool is not None:
+            persistent_process_pool[1].close()
+
+        MultiprocessingUtilities._thread_state.persistent_process_pool = (
+            persistent_process_pool_key,
+            PersistentProcessPool(
+                processing_procedure=processing_procedure,
+                number_of_cpu_cores=number_of_cpu_cores,
+                process_pool_initializer=process_pool_initializer,
+                process_pool_initializer_arguments=process_pool_initializer_arguments
+            ),
+        )
+
+        return MultiprocessingUtilities._thread_state.persistent_process_pool[1]
+
+    @staticmethod
+    def _iterate_timeout_process_pool_outputs(
+            processing_procedure: Callable[..., Any],
+            primary_input_arguments: Iterable[Any],
+            number_of_cpu_cores: int,
+            task_timeout_period_s: float,
+            task_timeout_output: Any = None,
+            process_pool_initializer: Optional[Callable[..., Any]] = None,
+            process_pool_initializer_arguments: Tuple[Any, ...] = ()
+    ) -> Iterator[Any]:
+        """
+        Iterate over the outputs of a processing procedure that is run in worker processes with a hard deadline for each
+        primary input argument. A worker process that exceeds the deadline or crashes is killed and replaced, and the
+        task timeout output is recorded for its primary input argument.
+
+        :parameter processing_procedure: The processing procedure.
+        :parameter primary_input_arguments: The primary input arguments of the processing procedure.
+        :parameter number_of_cpu_cores: The number of CPU cores that should be utilized.
+        :parameter task_timeout_period_s: The maximum amount of time in seconds that may be spent on a primary input
+                                          argument.
+        :parameter task_timeout_output: The output that is recorded for a primary input argument that times out.
+        :parameter process_pool_initializer: The procedure that initializes each worker process.
+        :parameter process_pool_initializer_arguments: The arguments of the procedure that initializes each worker
+                                                       process.
+
+        :returns: The output of the processing procedure for each primary input argument.
+        """
+
+        timeout_process_pool = PersistentProcessPool(
+            processing_procedure=processing_procedure,
+            number_of_cpu_cores=number_of_cpu_cores,
+            process_pool_initializer=process_pool_initializer,
+            process_pool_initializer_arguments=process_pool_initializer_arguments
+        )
+
+        try:
+            yield from timeout_process_pool.iterate_outputs(
+                primary_input_arguments=primary_input_arguments,
+                task_timeout_period_s=task_timeout_period_s,
+                task_timeout_output=task_timeout_output
+            )
+
+        finally:
+            timeout_process_pool.close()
+
+    @staticmethod
+    def _get_chunk_size(
+            number_of_primary_input_arguments: Optional[int],
+            number_of_cpu_cores: int,
+            maximum_chunk_size: int = 64
+    ) -> int:
+        """
+        Get the number of primary input arguments that are sent to a worker process at a time.
+
+        :parameter number_of_primary_input_arguments: The number of primary input arguments of the processing procedure.
+        :parameter number_of_cpu_cores: The number of CPU cores that should be utilized.
+        :parameter maximum_chunk_size: The maximum number of primary input arguments that are sent to a worker process
+                                       at a time, which keeps the progress bar and the load balancing responsive.
+
+        :returns: The chunk size.
+        """
+
+        if number_of_primary_input_arguments is None:
+            return maximum_chunk_size // 4
+
+        return max(1, min(maximum_chunk_size, number_of_primary_input_arguments // (4 * number_of_cpu_cores)))
+
+    @staticmethod
+    def _iterate_with_backpressure(
+            primary_input_arguments: Iterable[Any],
+            pending_input_arguments_semaphore: BoundedSemaphore,
+            stop_event: Event
+    ) -> Iterator[Any]:
+        """
+        Iterate over the primary input arguments, but only as fast as the outputs are consumed.
+
+        :parameter primary_input_arguments: The primary input arguments of the processing procedure.
+        :parameter pending_input_arguments_semaphore: The semaphore of the pending primary input arguments.
+        :parameter stop_event: The event that stops the iteration.
+
+        :returns: The primary input arguments of the processing procedure.
+        """
+
+        for primary_input_argument in primary_input_arguments:
+            while not pending_input_arguments_semaphore.acquire(timeout=0.1):
+                if stop_event.is_set():
+                    return
+
+            yield primary_input_argument
+
+    @staticmethod
+    def _iterate_process_pool_outputs(
+            processing_procedure: Callable[..., Any],
+            primary_input_arguments: Iterable[Any],
+            number_of_primary_input_arguments: Optional[int],
+            number_of_cpu_cores: int,
+            chunk_size: Optional[int] = None,
+            use_unordered_completion: bool = False,
+            maximum_number_of_pending_input_arguments: Optional[int] = None,
+            process_pool_initializer: Optional[Callable[..., Any]] = None,
+            process_pool_initializer_arguments: Tuple[Any, ...] = ()
+    ) -> Iterator[Any]:
+        """
+        Iterate over the outputs of a processing procedure that is run in a process pool in the order of the primary
+        input arguments.
+
+        :parameter processing_procedure: The processing procedure.
+        :parameter primary_input_arguments: The primary input arguments of the processing procedure.
+        :parameter number_of_primary_input_arguments: The number of primary input arguments of the processing procedure.
+        :parameter number_of_cpu_cores: The number of CPU cores that should be utilized.
+        :parameter chunk_size: The number of primary input arguments that are sent to a worker process at a time. If
+                               not specified, the chunk size is chosen based on the number of primary input arguments.
+        :parameter use_unordered_completion: The indicator whether the outputs should be collected in the order of
+                                             completion, and then restored to the order of the primary input arguments.
+        :parameter maximum_number_of_pending_input_arguments: The maximum number of primary input arguments that are
+                                                              consumed ahead of the outputs. If not specified, eight
+                                                              chunks per CPU core are allowed to be pending.
+        :parameter process_pool_initializer: The procedure that initializes each worker process.
+        :parameter process_pool_initializer_arguments: The arguments of the procedure that initializes each worker
+                                                       process.
+
+        :returns: The output of the processing procedure for each primary input argument.
+        """
+
+        chunk_size = chunk_size if chunk_size is not None and chunk_size >= 1 else \
+            MultiprocessingUtilities._get_chunk_size(
+                number_of_primary_input_arguments=number_of_primary_input_arguments,
+                number_of_cpu_cores=number_of_cpu_cores
+            )
+
+        # --------------------------------------------------------------------------------------------------------------
+        #  The pending primary input arguments are released only once their outputs are yielded, so a huge generator of
+        #  primary input arguments is never consumed far ahead of the worker processes. At least one full chunk per CPU
+        #  core must be allowed to be pending, otherwise the earliest chunk could never be completed.
+        # --------------------------------------------------------------------------------------------------------------
+
+        pending_input_arguments_semaphore = BoundedSemaphore(max(
+            maximum_number_of_pending_input_arguments
+            if maximum_number_of_pending_input_arguments is not None else 8 * chunk_size * number_of_cpu_cores,
+            chunk_size * number_of_cpu_cores
+        ))
+
+        stop_event = Event()
+
+        bounded_primary_input_arguments = MultiprocessingUtilities._iterate_with_backpressure(
+            primary_input_arguments=primary_input_arguments,
+            pending_input_arguments_semaphore=pending_input_arguments_semaphore,
+            stop_event=stop_event
+        )
+
+        # --------------------------------------------------------------------------------------------------------------
+        #  The iteration over the primary input arguments is stopped before the process pool is terminated, otherwise
+        #  the task handler thread of the process pool could wait for the semaphore indefinitely.
+        # --------------------------------------------------------------------------------------------------------------
+
+        with Pool(
+            processes=number_of_cpu_cores,
+            initializer=process_pool_initializer,
+            initargs=process_pool_initializer_arguments
+        ) as process_pool:
+            try:
+                if use_unordered_completion:
+                    processing_procedure_outputs, next_primary_input_argument_index = dict(), 0
+
+                    for primary_input_argument_index, processing_procedure_output in process_pool.imap_unordered(
+                        partial(_run_processing_procedure_on_indexed_input_argument, processing_procedure),
+                        enumerate(bounded_primary_input_arguments),
+                        chunksize=chunk_size
+                    ):
+                        processing_procedure_outputs[primary_input_argument_index] = processing_procedure_output
+
+                        while next_primary_input_argument_index in processing_procedure_outputs.keys():
+                            yield processing_procedure_outputs.pop(next_primary_input_argument_index)
+
+                            pending_input_arguments_semaphore.release()
+
+                            next_primary_input_argument_index += 1
+
+                else:
+                    for processing_procedure_output in process_pool.imap(
+                        processing_procedure,
+                        bounded_primary_input_arguments,
+                        chunksize=chunk_size
+                    ):
+                        yield processing_procedure_output
+
+                        pending_input_arguments_semaphore.release()
+
+            finally:
+                stop_event.set()
+
+            process_pool.close()
+            process_pool.join()
+
+    @staticmethod
+    def _iterate_shared_memory_process_pool_outputs(
+            processing_procedure: Callable[..., Any],
+            primary_input_arguments: Sequence[Any],
+            number_of_cpu_cores: int,
+            chunk_size: Optional[int] = None,
+            use_unordered_completion: bool = False,
+            collect_worker_metrics: bool = False,
+            process_pool_initializer: Optional[Callable[..., Any]] = None,
+            process_pool_initializer_arguments: Tuple[Any, ...] = ()
+    ) -> Iterator[Any]:
+        """
+        Iterate over the outputs of a processing procedure that is run in a process pool in the order of the primary
+        input arguments. The primary input arguments are placed once in a shared memory input buffer, the worker
+        processes receive only the index ranges of the primary input arguments, and the outputs that are pairs of a
+        string or None and a float, a boolean or None are written to a shared memory output buffer instead of being
+        sent back through the pipes of the process pool.
+
+        :parameter processing_procedure: The processing procedure.
+        :parameter primary_input_arguments: The primary input arguments of the processing procedure. The primary input
+                                            arguments that are not strings are sent with their index ranges.
+        :parameter number_of_cpu_cores: The number of CPU cores that should be utilized.
+        :parameter chunk_size: The number of primary input arguments per index range. If not specified, the chunk size
+                               is chosen based on the number of primary input arguments.
+        :parameter use_unordered_completion: The indicator whether the index ranges should be collected in the order of
+                                             completion, and then restored to the order of the primary input arguments.
+        :parameter collect_worker_metrics: The indicator whether the metrics that are recorded in the worker processes
+                                           should be collected for each index range. If so, each output is yielded with
+                                           the metrics of its index range, or None after the first output of the range.
+        :parameter process_pool_initializer: The procedure that initializes each worker process.
+        :parameter process_pool_initializer_arguments: The arguments of the procedure that initializes each worker
+                                                       process.
+
+        :returns: The output of the processing procedure for each primary input argument.
+        """
+
+        number_of_primary_input_arguments = len(primary_input_arguments)
+
+        if number_of_primary_input_arguments == 0:
+            return
+
+        chunk_size = chunk_size if chunk_size is not None and chunk_size >= 1 else \
+            MultiprocessingUtilities._get_chunk_size(
+                number_of_primary_input_arguments=number_of_primary_input_arguments,
+                number_of_cpu_cores=number_of_cpu_cores
+            )
+
+        # --------------------------------------------------------------------------------------------------------------
+        #  The byte offsets are computed from the encoded lengths first, and each encoded primary input argument is then
+        #  written straight into the shared memory input buffer, so no list or concatenation of the encoded primary
+        #  input arguments is held next to the buffer. The length of an ASCII string is its encoded length.
+        # --------------------------------------------------------------------------------------------------------------
+
+        input_argument_byte_offsets = array("q", [0, ])
+
+        for primary_input_argument in primary_input_arguments:
+            input_argument_byte_offsets.append(input_argument_byte_offsets[-1] + (
+                0 if not isinstance(primary_input_argument, str) else
+                len(primary_input_argument) if primary_input_argument.isascii() else
+                len(primary_input_argument.encode("utf-8"))
+            ))
+
+        input_data_offset = _shared_memory_offset_size * (number_of_primary_input_arguments + 1)
+
+        input_shared_memory = SharedMemory(
+            create=True,
+            size=input_data_offset + max(1, input_argument_byte_offsets[-1])
+        )
+
+        output_shared_memory = None
+
+        try:
+            input_shared_memory.buf[:input_data_offset] = memoryview(input_argument_byte_offsets).cast("B")
+
+            for primary_input_argument_index, primary_input_argument in enumerate(primary_input_arguments):
+                if isinstance(primary_input_argument, str) and primary_input_argument != "":
+                    input_shared_memory.buf[
+                        input_data_offset + input_argument_byte_offsets[primary_input_argument_index]:
+                        input_data_offset + input_argument_byte_offsets[primary_input_argument_index + 1]
+                    ] = primary_input_argument.encode("utf-8")
+
+            output_shared_memory = SharedMemory(
+                create=True,
+                size=number_of_primary_input_arguments * (
+                    _shared_memory_output_record_size + _shared_memory_output_slot_capacity_padding
+                ) + _shared_memory_output_slot_capacity_factor * input_argument_byte_offsets[-1]
+            )
+
+            input_argument_ranges = [
+                (
+                    range_start_index,
+                    min(range_start_index + chunk_size, number_of_primary_input_arguments),
+                    {
+                        primary_input_argument_index: primary_input_arguments[primary_input_argument_index]
+                        for primary_input_argument_index in range(
+                            range_start_index,
+                            min(range_start_index + chunk_size, number_of_primary_input_arguments)
+                        ) if not isinstance(primary_input_arguments[primary_input_argument_index], str)
+                    },
+                ) for range_start_index in range(0, number_of_primary_input_arguments, chunk_size)
+            ]
+
+            range_processing_procedure = partial(
+                _run_processing_procedure_on_shared_memory_input_argument_range,
+                processing_procedure,
+                (input_shared_memory.name, output_shared_memory.name, number_of_primary_input_arguments)
+            )
+
+            if collect_worker_metrics:
+                range_processing_procedure = partial(
+                    InstrumentationUtilities.run_with_metrics_collection,
+                    range_processing_procedure
+                )
+
+            with Pool(
+                processes=number_of_cpu_cores,
+                initializer=process_pool_initializer,
+                initargs=process_pool_initializer_arguments
+            ) as process_pool:
+                if use_unordered_completion:
+                    range_outputs = process_pool.imap_unordered(
+                        partial(_run_processing_procedure_on_indexed_input_argument, range_processing_procedure),
+                        enumerate(input_argument_ranges),
+                        chunksize=1
+                    )
+
+                else:
+                    range_outputs = enumerate(process_pool.imap(
+                        range_processing_procedure,
+                        input_argument_ranges,
+                        chunksize=1
+                    ))
+
+                output_buffer = output_shared_memory.buf
+                completed_range_outputs, next_range_index = dict(), 0
+
+                for range_index, range_output in range_outputs:
+                    completed_range_outputs[range_index] = range_output
+
+                    while next_range_index in completed_range_outputs.keys():
+                        range_start_index, range_end_index, _ = input_argument_ranges[next_range_index]
+                        range_output = completed_range_outputs.pop(next_range_index)
+
+                        range_metrics = None
+
+                        if collect_worker_metrics:
+                            range_output, range_metrics = range_output
+
+                        for primary_input_argument_index in range(range_start_index, range_end_index):
+                            if primary_input_argument_index in range_output.keys():
+                                processing_procedure_output = range_output[primary_input_argument_index]
+
+                            else:
+                                processing_procedure_output = _read_shared_memory_output(
+                                    output_buffer=output_buffer,
+                                    primary_input_argument_index=primary_input_argument_index,
+                                    output_slot=_get_shared_memory_output_slot(
+                                        input_argument_byte_offsets=(
+                                            input_argument_byte_offsets[primary_input_argument_index],
+                                            input_argument_byte_offsets[primary_input_argument_index + 1]
+                                        ),
+                                        primary_input_argument_index=primary_input_argument_index,
+                                        number_of_primary_input_arguments=number_of_primary_input_arguments
+                                    )
+                                )
+
+                            if collect_worker_metrics:
+                                yield processing_procedure_output, range_metrics
+
+                                range_metrics = None
+
+                            else:
+                                yield processing_procedure_output
+
+                        next_range_index += 1
+
+                process_pool.close()
+                process_pool.join()
+
+        finally:
+            for shared_memory in [input_shared_memory, output_shared_memory, ]:
+                if shared_memory is not None:
+                    shared_memory.close()
+                    shared_memory.unlink()
+
+    @staticmethod
+    def _iterate_processing_procedure_outputs(
+            processing_procedure: Callable[..., Any],
+            primary_input_arguments: Iterable[Any],
+            number_of_primary_input_arguments: Optional[int],
+            number_of_cpu_cores: int,
+            chunk_size: Optional[int] = None,
+            use_unordered_completion: bool = False,
+            maximum_number_of_pending_input_arguments: Optional[int] = None,
+            task_timeout_period_s: Optional[float] = None,
+            task_timeout_output: Any = None,
+            process_pool_initializer: Optional[Callable[..., Any]] = None,
+            process_pool_initializer_arguments: Tuple[Any, ...] = (),
+            use_shared_memory: bool = False
+    ) -> Iterator[Any]:
+        """
+        Iterate over the outputs of a processing procedure in the order of the primary input arguments using the
+        current process, a process pool, or the timeout process pool if the task timeout period is specified. If the
+        persistent process pool is enabled in the current thread, it is utilized instead of the process pools.
+
+        :parameter processing_procedure: The processing procedure.
+        :parameter primary_input_arguments: The primary input arguments of the processing procedure.
+        :parameter number_of_primary_input_arguments: The number of primary input arguments of the processing procedure.
+        :parameter number_of_cpu_cores: The number of CPU cores that should be utilized.
+        :parameter chunk_size: The number of primary input arguments that are sent to a worker process at a time.
+        :parameter use_unordered_completion: The indicator whether the outputs should be collected in the order of
+                                             completion, and then restored to the order of the primary input arguments.
+        :parameter maximum_number_of_pending_input_arguments: The maximum number of primary input arguments that are
+                                                              consumed ahead of the outputs.
+        :parameter task_timeout_period_s: The maximum amount of time in seconds that may be spent on a primary input
+                                          argument. If specified, the primary input arguments are always processed in
+                                          worker processes that are killed and replaced if they exceed the deadline.
+        :parameter task_timeout_output: The output that is recorded for a primary input argument that times out.
+        :parameter process_pool_initializer: The procedure that initializes each worker process. If the processing
+                                             procedure is run in the current process, the procedure is not utilized.
+        :parameter process_pool_initializer_arguments: The arguments of the procedure that initializes each worker
+                                                       process.
+        :parameter use_shared_memory: The indicator whether the primary input arguments and the outputs should be
+                                      exchanged with the process pool through shared memory buffers instead of the
+                                      pipes of the process pool. The indicator is ignored if the primary input arguments
+                                      are processed in the current process or in the timeout process pool.
+
+        :returns: The output of the processing procedure for each primary input argument.
+        """
+
+        # --------------------------------------------------------------------------------------------------------------
+        #  If the instrumentation is enabled, the metrics that are recorded in the worker processes are sent back with
+        #  each output, or with each index range of the shared memory process pool, and merged into the metrics of the
+        #  current process.
+        # --------------------------------------------------------------------------------------------------------------
+
+        collect_worker_metrics = InstrumentationUtilities.is_enabled() and \
+            (task_timeout_period_s is not None or number_of_cpu_cores > 1)
+
+        use_persistent_process_pool = getattr(
+            MultiprocessingUtilities._thread_state,
+            "use_persistent_process_pool",
+            False
+        ) and (task_timeout_period_s is not None or number_of_cpu_cores > 1)
+
+        use_shared_memory = use_shared_memory and not use_persistent_process_pool and \
+            task_timeout_period_s is None and number_of_cpu_cores > 1
+
+        if collect_worker_metrics and not use_shared_memory:
+            processing_procedure = partial(InstrumentationUtilities.run_with_metrics_collection, processing_procedure)
+            task_timeout_output = (task_timeout_output, None)
+
+        if use_persistent_process_pool:
+            processing_procedure_outputs = MultiprocessingUtilities._get_persistent_process_pool(
+                processing_procedure=processing_procedure,
+                number_of_cpu_cores=number_of_cpu_cores,
+                process_pool_initializer=process_pool_initializer,
+                process_pool_initializer_arguments=process_pool_initializer_arguments
+            ).iterate_outputs(
+                primary_input_arguments=primary_input_arguments,
+                task_timeout_period_s=task_timeout_period_s,
+                task_timeout_output=task_timeout_output
+            )
+
+        elif use_shared_memory:
+            processing_procedure_outputs = MultiprocessingUtilities._iterate_shared_memory_process_pool_outputs(
+                processing_procedure=processing_procedure,
+                primary_input_arguments=primary_input_arguments if isinstance(primary_input_arguments, Sequence)
+                else list(primary_input_arguments),
+                number_of_cpu_cores=number_of_cpu_cores,
+                chunk_size=chunk_size,
+                use_unordered_completion=use_unordered_completion,
+                collect_worker_metrics=collect_worker_metrics,
+                process_pool_initializer=process_pool_initializer,
+                process_pool_initializer_arguments=process_pool_initializer_arguments
+            )
+
+        elif task_timeout_period_s is not None:
+            processing_procedure_outputs = MultiprocessingUtilities._iterate_timeout_process_pool_outputs(
+                processing_procedure=processing_procedure,
+                primary_input_arguments=primary_input_arguments,
+                number_of_cpu_cores=number_of_cpu_cores,
+                task_timeout_period_s=task_timeout_period_s,
+                task_timeout_output=task_timeout_output,
+                process_pool_initializer=process_pool_initializer,
+                process_pool_initializer_arguments=process_pool_initializer_arguments
+            )
+
+        elif number_of_cpu_cores == 1:
+            processing_procedure_outputs = (
+                processing_procedure(primary_input_argument) for primary_input_argument in primary_input_arguments
+            )
+
+        else:
+            processing_procedure_outputs = MultiprocessingUtilities._iterate_process_pool_outputs(
+                processing_procedure=processing_procedure,
+                primary_input_arguments=primary_input_arguments,
+                number_of_primary_input_arguments=number_of_primary_input_arguments,
+                number_of_cpu_cores=number_of_cpu_cores,
+                chunk_size=chunk_size,
+                use_unordered_completion=use_unordered_completion,
+                maximum_number_of_pending_input_arguments=maximum_number_of_pending_input_arguments,
+                process_pool_initializer=process_pool_initializer,
+                process_pool_initializer_arguments=process_pool_initializer_arguments
+            )
+
+        if collect_worker_metrics:
+            return InstrumentationUtilities.iterate_with_metrics_merging(
+                processing_procedure_outputs=processing_procedure_outputs
+            )
+
+        return processing_procedure_outputs
+
     @staticmethod
     def run(
             processing_procedure: Callable[..., Any],
             primary_input_arguments: Iterable[Any],
             number_of_cpu_cores: int = 1,
-            enable_logger: bool = False
+            enable_logger: bool = False,
+            chunk_size: Optional[int] = None,
+            use_unordered_completion: bool = False,
+            maximum_number_of_pending_input_arguments: Optional[int] = None,
+            task_timeout_period_s: Optional[float] = None,
+            task_timeout_output: Any = None,
+            process_pool_initializer: Optional[Callable[..., Any]] = None,
+            process_pool_initializer_arguments: Tuple[Any, ...] = (),
+            use_shared_memory: bool = False
     ) -> Optional[List[Any]]:
         """
         Run a processing procedure for each primary input argument.
@@ -23,6 +1165,22 @@ class MultiprocessingUtilities:
         :parameter primary_input_arguments: The primary input arguments of the processing procedure.
         :parameter number_of_cpu_cores: The number of CPU cores that should be utilized.
         :parameter enable_logger: The indicator whether the logger should be enabled.
+        :parameter chunk_size: The number of primary input arguments that are sent to a worker process at a time. If
+                               not specified, the chunk size is chosen based on the number of primary input arguments.
+        :parameter use_unordered_completion: The indicator whether the outputs should be collected in the order of
+                                             completion, and then restored to the order of the primary input arguments.
+        :parameter maximum_number_of_pending_input_arguments: The maximum number of primary input arguments that are
+                                                              consumed ahead of the outputs.
+        :parameter task_timeout_period_s: The maximum amount of time in seconds that may be spent on a primary input
+                                          argument before its worker process is killed and replaced.
+        :parameter task_timeout_output: The output that is recorded for a primary input argument that times out.
+        :parameter process_pool_initializer: The procedure that initializes each worker process.
+        :parameter process_pool_initializer_arguments: The arguments of the procedure that initializes each worker
+                                                       process.
+        :parameter use_shared_memory: The indicator whether the primary input arguments should be placed once in a
+                                      shared memory buffer from which the worker processes read their index ranges, and
+                                      the outputs should be written to a shared memory buffer instead of being sent back
+                                      through the pipes of the process pool.
 
         :returns: The output of the processing procedure for each primary input argument.
         """
@@ -32,21 +1190,30 @@ class MultiprocessingUtilities:
 
             processing_procedure_outputs = list()
 
-            if number_of_cpu_cores == 1:
-                for primary_input_argument in primary_input_arguments:
+            processing_procedure_outputs_iterator = MultiprocessingUtilities._iterate_processing_procedure_outputs(
+                processing_procedure=processing_procedure,
+                primary_input_arguments=primary_input_arguments,
+                number_of_primary_input_arguments=len(primary_input_arguments)
+                if isinstance(primary_input_arguments, Sized) else None,
+                number_of_cpu_cores=number_of_cpu_cores,
+                chunk_size=chunk_size,
+                use_unordered_completion=use_unordered_completion,
+                maximum_number_of_pending_input_arguments=maximum_number_of_pending_input_arguments,
+                task_timeout_period_s=task_timeout_period_s,
+                task_timeout_output=task_timeout_output,
+                process_pool_initializer=process_pool_initializer,
+                process_pool_initializer_arguments=process_pool_initializer_arguments,
+                use_shared_memory=use_shared_memory
+            )
+
+            try:
+                for processing_procedure_output in processing_procedure_outputs_iterator:
                     processing_procedure_outputs.append(
-                        processing_procedure(primary_input_argument)
+                        processing_procedure_output
                     )
 
-            else:
-                with Pool(number_of_cpu_cores) as process_pool:
-                    for processing_procedure_output in process_pool.map(processing_procedure, primary_input_arguments):
-                        processing_procedure_outputs.append(
-                            processing_procedure_output
-                        )
-
-                    process_pool.close()
-                    process_pool.join()
+            finally:
+                processing_procedure_outputs_iterator.close()
 
             return processing_procedure_outputs
 
@@ -66,6 +1233,14 @@ class MultiprocessingUtilities:
             description_message: str = None,
             number_of_cpu_cores: int = 1,
             enable_logger: bool = False,
+            chunk_size: Optional[int] = None,
+            use_unordered_completion: bool = False,
+            maximum_number_of_pending_input_arguments: Optional[int] = None,
+            task_timeout_period_s: Optional[float] = None,
+            task_timeout_output: Any = None,
+            process_pool_initializer: Optional[Callable[..., Any]] = None,
+            process_pool_initializer_arguments: Tuple[Any, ...] = (),
+            use_shared_memory: bool = False
     ) -> Optional[List[Any]]:
         """
         Run a processing procedure for each primary input argument, and visualize the progress with a progress bar.
@@ -76,6 +1251,22 @@ class MultiprocessingUtilities:
         :parameter description_message: The progress bar description message.
         :parameter number_of_cpu_cores: The number of CPU cores that should be utilized.
         :parameter enable_logger: The indicator whether the logger should be enabled.
+        :parameter chunk_size: The number of primary input arguments that are sent to a worker process at a time. If
+                               not specified, the chunk size is chosen based on the number of primary input arguments.
+        :parameter use_unordered_completion: The indicator whether the outputs should be collected in the order of
+                                             completion, and then restored to the order of the primary input arguments.
+        :parameter maximum_number_of_pending_input_arguments: The maximum number of primary input arguments that are
+                                                              consumed ahead of the outputs.
+        :parameter task_timeout_period_s: The maximum amount of time in seconds that may be spent on a primary input
+                                          argument before its worker process is killed and replaced.
+        :parameter task_timeout_output: The output that is recorded for a primary input argument that times out.
+        :parameter process_pool_initializer: The procedure that initializes each worker process.
+        :parameter process_pool_initializer_arguments: The arguments of the procedure that initializes each worker
+                                                       process.
+        :parameter use_shared_memory: The indicator whether the primary input arguments should be placed once in a
+                                      shared memory buffer from which the worker processes read their index ranges, and
+                                      the outputs should be written to a shared memory buffer instead of being sent back
+                                      through the pipes of the process pool.
 
         :returns: The output of the processing procedure for each primary input argument.
         """
@@ -83,40 +1274,44 @@ class MultiprocessingUtilities:
         try:
             number_of_cpu_cores = number_of_cpu_cores if 1 <= number_of_cpu_cores <= cpu_count() else 1
 
+            if number_of_primary_input_arguments is None and isinstance(primary_input_argument, Sized):
+                number_of_primary_input_arguments = len(primary_input_argument)
+
             processing_procedure_outputs = list()
 
-            if number_of_cpu_cores == 1:
-                for input_argument in tqdm(
-                    iterable=primary_input_argument,
+            processing_procedure_outputs_iterator = MultiprocessingUtilities._iterate_processing_procedure_outputs(
+                processing_procedure=processing_procedure,
+                primary_input_arguments=primary_input_argument,
+                number_of_primary_input_arguments=number_of_primary_input_arguments,
+                number_of_cpu_cores=number_of_cpu_cores,
+                chunk_size=chunk_size,
+                use_unordered_completion=use_unordered_completion,
+                maximum_number_of_pending_input_arguments=maximum_number_of_pending_input_arguments,
+                task_timeout_period_s=task_timeout_period_s,
+                task_timeout_output=task_timeout_output,
+                process_pool_initializer=process_pool_initializer,
+                process_pool_initializer_arguments=process_pool_initializer_arguments,
+                use_shared_memory=use_shared_memory
+            )
+
+            try:
+                for processing_procedure_output in tqdm(
+                    iterable=processing_procedure_outputs_iterator,
                     total=number_of_primary_input_arguments,
                     ascii=True,
                     ncols=150,
-                    desc="{0} (CPU Cores: 1)".format(
-                        description_message if description_message is not None else "Running"
-                    )
+                    desc="{0} (CPU Cores: {1})".format(
+                        description_message if description_message is not None else "Running",
+                        number_of_cpu_cores
+                    ),
+                    disable=not MultiprocessingUtilities.are_progress_bars_enabled()
                 ):
                     processing_procedure_outputs.append(
-                        processing_procedure(input_argument)
+                        processing_procedure_output
                     )
 
-            else:
-                with Pool(number_of_cpu_cores) as process_pool:
-                    for processing_procedure_output in tqdm(
-                        iterable=process_pool.imap(processing_procedure, primary_input_argument),
-                        total=number_of_primary_input_arguments,
-                        ascii=True,
-                        ncols=150,
-                        desc="{0} (CPU Cores: {1})".format(
-                            description_message if description_message is not None else "Running",
-                            number_of_cpu_cores
-                        )
-                    ):
-                        processing_procedure_outputs.append(
-                            processing_procedure_output
-                        )
-
-                    process_pool.close()
-                    process_pool.join()
+            finally:
+                processing_procedure_outputs_iterator.close()
 
             return processing_procedure_outputs
 
@@ -0,0 +1,3 @@
+""" The 'chemical_reaction_atom_mapping.utilities.pre_validation' package initialization module. """
+
+from .pre_validation import PreValidationUtilities
@@ -0,0 +1,231 @@
+""" The 'chemical_reaction_atom_mapping.utilities.pre_validation' package 'pre_validation' module. """
+
+from collections import Counter
+from logging import getLogger
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+from ..instrumentation import InstrumentationUtilities
+from ..reaction_smiles import ReactionSmilesUtilities
+
+
+class PreValidationUtilities:
+    """
+    The chemical reaction SMILES string pre-validation utilities class. The chemical reaction SMILES strings are only
+    tokenized, which is cheap compared to any of the chemical reaction atom mapping libraries, so that the invalid and
+    the oversized chemical reaction SMILES strings are rejected with a reason code before they reach a library.
+    """
+
+    rejection_reason_codes = (
+        "empty_reaction_smiles",
+        "invalid_reaction_smiles_format",
+        "invalid_smiles_syntax",
+        "too_many_tokens",
+        "too_many_atoms",
+        "too_many_compounds",
+    )
+
+    @staticmethod
+    def _is_reaction_role_smiles_syntax_valid(
+            reaction_role_smiles_tokens: List[str]
+    ) -> bool:
+        """
+        Check whether the branches and the ring closures of a chemical reaction role SMILES string are balanced. The
+        ring closures are balanced across the whole chemical reaction role, because a ring closure may also bond two
+        dot-separated chemical compound SMILES strings, such as in 'C1.C1'.
+
+        :parameter reaction_role_smiles_tokens: The tokens of the chemical reaction role SMILES string.
+
+        :returns: The indicator whether the branches and the ring closures of the chemical reaction role SMILES string
+                  are balanced.
+        """
+
+        branch_depth, open_ring_closures = 0, set()
+
+        for reaction_role_smiles_token in reaction_role_smiles_tokens:
+            if reaction_role_smiles_token == "(":
+                branch_depth += 1
+
+            elif reaction_role_smiles_token == ")":
+                branch_depth -= 1
+
+                if branch_depth < 0:
+                    return False
+
+            elif reaction_role_smiles_token[0] == "%" or reaction_role_smiles_token.isdigit():
+                open_ring_closures.symmetric_difference_update((reaction_role_smiles_token.lstrip("%").strip("()"), ))
+
+        return branch_depth == 0 and len(open_ring_closures) == 0
+
+    @staticmethod
+    def get_rejection_reason(
+            reaction_smiles: Any,
+            maximum_number_of_tokens: Optional[int] = None,
+            maximum_number_of_atoms: Optional[int] = None,
+            maximum_number_of_compounds: Optional[int] = None
+    ) -> Optional[str]:
+        """
+        Get the reason why a chemical reaction SMILES string should not be passed to a chemical reaction atom mapping
+        library.
+
+        :parameter reaction_smiles: The chemical reaction SMILES string.
+        :parameter maximum_number_of_tokens: The maximum number of tokens of the chemical reaction SMILES string without
+                                             the special tokens of the language models. If not specified, the number of
+                                             tokens is not limited.
+        :parameter maximum_number_of_atoms: The maximum number of atoms of all of the chemical compounds. If not
+                                            specified, the number of atoms is not limited.
+        :parameter maximum_number_of_compounds: The maximum number of the chemical compounds. If not specified, the
+                                                number of the chemical compounds is not limited.
+
+        :returns: The rejection reason code of the chemical reaction SMILES string, or None if the chemical reaction
+                  SMILES string should be mapped.
+        """
+
+        if not isinstance(reaction_smiles, str) or reaction_smiles.strip() == "":
+            return "empty_reaction_smiles"
+
+        # --------------------------------------------------------------------------------------------------------------
+        #  The extensions of the CXSMILES strings are not validated, and they do not count towards the limits.
+        # --------------------------------------------------------------------------------------------------------------
+
+        reaction_roles_smiles = reaction_smiles.strip().split(" ")[0].split(">")
+
+        if len(reaction_roles_smiles) != 3 or reaction_roles_smiles[0] == "" or reaction_roles_smiles[2] == "":
+            return "invalid_reaction_smiles_format"
+
+        number_of_atoms, number_of_compounds = 0, 0
+
+        for reaction_role_smiles in reaction_roles_smiles:
+            reaction_role_smiles_tokens = ReactionSmilesUtilities.tokenize_reaction_smiles(
+                reaction_smiles=reaction_role_smiles
+            )
+
+            if sum(map(len, reaction_role_smiles_tokens)) != len(reaction_role_smiles) or \
+                    not PreValidationUtilities._is_reaction_role_smiles_syntax_valid(
+                        reaction_role_smiles_tokens=reaction_role_smiles_tokens
+                    ):
+                return "invalid_smiles_syntax"
+
+            number_of_atoms += sum(
+                reaction_role_smiles_token[0] == "[" or reaction_role_smiles_token[0].isalpha()
+                for reaction_role_smiles_token in reaction_role_smiles_tokens
+            )
+            number_of_compounds += sum(
+                compound_smiles != "" for compound_smiles in reaction_role_smiles.split(".")
+            )
+
+        if maximum_number_of_tokens is not None and ReactionSmilesUtilities.get_number_of_reaction_smiles_tokens(
+            reaction_smiles=">".join(reaction_roles_smiles)
+        ) > maximum_number_of_tokens:
+            return "too_many_tokens"
+
+        if maximum_number_of_atoms is not None and number_of_atoms > maximum_number_of_atoms:
+            return "too_many_atoms"
+
+        if maximum_number_of_compounds is not None and number_of_compounds > maximum_number_of_compounds:
+            return "too_many_compounds"
+
+        return None
+
+    @staticmethod
+    def get_rejection_reasons(
+            reaction_smiles_strings: Iterable[Any],
+            **kwargs
+    ) -> List[Optional[str]]:
+        """
+        Get the reasons why the chemical reaction SMILES strings should not be passed to a chemical reaction atom
+        mapping library.
+
+        :parameter reaction_smiles_strings: The chemical reaction SMILES strings.
+        :parameter kwargs: The limits of the 'get_rejection_reason' method.
+
+        :returns: The rejection reason codes of the chemical reaction SMILES strings, or None for the chemical reaction
+                  SMILES strings that should be mapped.
+        """
+
+        with InstrumentationUtilities.measure("pre_validation"):
+            return [
+                PreValidationUtilities.get_rejection_reason(
+                    reaction_smiles=reaction_smiles,
+                    **kwargs
+                ) for reaction_smiles in reaction_smiles_strings
+            ]
+
+    @staticmethod
+    def run_with_pre_validation(
+            reaction_smiles_strings: Iterable[Any],
+            atom_mapping_procedure: Callable[[List[str]], Optional[List[Tuple[Optional[str], Any]]]],
+            rejection_reasons: Optional[List[Optional[str]]] = None,
+            **kwargs
+    ) -> Optional[List[Tuple[Optional[str], Any]]]:
+        """
+        Run a chemical reaction atom mapping procedure only on the chemical reaction SMILES strings that pass the
+        pre-validation. The outputs of the rejected chemical reaction SMILES strings are None.
+
+        :parameter reaction_smiles_strings: The chemical reaction SMILES strings.
+        :parameter atom_mapping_procedure: The chemical reaction atom mapping procedure that maps a list of chemical
+                                           reaction SMILES strings.
+        :parameter rejection_reasons: The list that should be extended with the rejection reason codes of the chemical
+                                      reaction SMILES strings, so that they do not have to be computed again.
+        :parameter kwargs: The limits of the 'get_rejection_reason' method.
+
+        :returns: The chemical reaction atom mapping results in the order of the chemical reaction SMILES strings.
+        """
+
+        reaction_smiles_strings = list(reaction_smiles_strings)
+
+        reaction_smiles_rejection_reasons = PreValidationUtilities.get_rejection_reasons(
+            reaction_smiles_strings=reaction_smiles_strings,
+            **kwargs
+        )
+
+        if rejection_reasons is not None:
+            rejection_reasons.extend(reaction_smiles_rejection_reasons)
+
+        accepted_reaction_smiles_indices = [
+            reaction_smiles_index for reaction_smiles_index, rejection_reason in enumerate(
+                reaction_smiles_rejection_reasons
+            ) if rejection_reason is None
+        ]
+
+        rejection_reason_counts = Counter(filter(None, reaction_smiles_rejection_reasons))
+
+        InstrumentationUtilities.increment(
+            counter_name="pre_validation.rejected_reactions",
+            value=sum(rejection_reason_counts.values())
+        )
+
+        getLogger(
+            "{0}.PreValidationUtilities.run_with_pre_validation".format(__name__)
+        ).info("Rejected chemical reaction SMILES strings: {0} / {1} ({2}).".format(
+            sum(rejection_reason_counts.values()),
+            len(reaction_smiles_strings),
+            ", ".join(
+                "{0}: {1}".format(rejection_reason, rejection_reason_count)
+                for rejection_reason, rejection_reason_count in sorted(rejection_reason_counts.items())
+            ) if len(rejection_reason_counts) > 0 else "None"
+        ))
+
+        if len(accepted_reaction_smiles_indices) == len(reaction_smiles_strings):
+            return atom_mapping_procedure(reaction_smiles_strings)
+
+        atom_mapping_results = [
+            (None, None, ),
+        ] * len(reaction_smiles_strings)  # type: List[Tuple[Optional[str], Any]]
+
+        if len(accepted_reaction_smiles_indices) == 0:
+            return atom_mapping_results
+
+        accepted_atom_mapping_results = atom_mapping_procedure([
+            reaction_smiles_strings[reaction_smiles_index] for reaction_smiles_index in accepted_reaction_smiles_indices
+        ])
+
+        if accepted_atom_mapping_results is None:
+            return None
+
+        for reaction_smiles_index, atom_mapping_result in zip(
+            accepted_reaction_smiles_indices,
+            accepted_atom_mapping_results
+        ):
+            atom_mapping_results[reaction_smiles_index] = atom_mapping_result
+
+        return atom_mapping_results
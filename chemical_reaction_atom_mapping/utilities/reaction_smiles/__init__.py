@@ -0,0 +1,3 @@
+""" The 'chemical_reaction_atom_mapping.utilities.reaction_smiles' package initialization module. """
+
+from .reaction_smiles import ReactionSmilesUtilities
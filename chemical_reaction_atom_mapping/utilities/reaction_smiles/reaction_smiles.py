@@ -0,0 +1,259 @@
+""" The 'chemical_reaction_atom_mapping.utilities.reaction_smiles' package 'reaction_smiles' module. """
+
+from re import compile
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+
+class ReactionSmilesUtilities:
+    """ The chemical reaction SMILES string utilities class. """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    #  The regular expression is the exact 'SMILES_TOKENIZER_PATTERN' of the RXNMapper library tokenizer, which allows
+    #  for the estimation of the model input length without loading the tokenizer.
+    # ------------------------------------------------------------------------------------------------------------------
+
+    _smiles_tokenization_pattern = compile(
+        r"(\%\([0-9]{3}\)|\[[^\]]+]|Br?|Cl?|N|O|S|P|F|I|b|c|n|o|s|p|\||\(|\)|\.|=|#|-|\+|\\|\/|:|~|@|\?|>>?|\*|\$|"
+        r"\%[0-9]{2}|[0-9])"
+    )
+
+    @staticmethod
+    def tokenize_reaction_smiles(
+            reaction_smiles: str
+    ) -> List[str]:
+        """
+        Tokenize a chemical reaction SMILES string.
+
+        :parameter reaction_smiles: The chemical reaction SMILES string.
+
+        :returns: The tokens of the chemical reaction SMILES string.
+        """
+
+        return ReactionSmilesUtilities._smiles_tokenization_pattern.findall(reaction_smiles)
+
+    @staticmethod
+    def get_number_of_reaction_smiles_tokens(
+            reaction_smiles: str
+    ) -> int:
+        """
+        Get the number of tokens of a chemical reaction SMILES string.
+
+        :parameter reaction_smiles: The chemical reaction SMILES string.
+
+        :returns: The number of tokens of the chemical reaction SMILES string.
+        """
+
+        return len(ReactionSmilesUtilities.tokenize_reaction_smiles(
+            reaction_smiles=reaction_smiles
+        ))
+
+    @staticmethod
+    def get_reaction_cost_estimate(
+            reaction_smiles: str
+    ) -> float:
+        """
+        Estimate the relative cost of the atom mapping of a chemical reaction SMILES string from its cheap SMILES
+        features, without parsing it. The cost grows with the product of the numbers of the reactant and product atoms,
+        which bounds the number of candidate atom correspondences, and with the number of the reactant and agent
+        compounds, which multiplies the number of the compared compound combinations.
+
+        :parameter reaction_smiles: The chemical reaction SMILES string.
+
+        :returns: The relative cost estimate of the chemical reaction SMILES string.
+        """
+
+        reaction_roles_smiles = reaction_smiles.strip().split(" ")[0].split(">")
+
+        if len(reaction_roles_smiles) != 3:
+            return 0.0
+
+        reactant_and_agent_smiles = ".".join(filter(None, reaction_roles_smiles[:2]))
+
+        number_of_reactant_and_agent_atoms, number_of_product_atoms = (
+            sum(
+                reaction_smiles_token[0] == "[" or reaction_smiles_token[0].isalpha()
+                for reaction_smiles_token in ReactionSmilesUtilities.tokenize_reaction_smiles(
+                    reaction_smiles=reaction_role_smiles
+                )
+            ) for reaction_role_smiles in (reactant_and_agent_smiles, reaction_roles_smiles[2], )
+        )
+
+        number_of_reactant_and_agent_compounds = sum(
+            compound_smiles != "" for compound_smiles in reactant_and_agent_smiles.split(".")
+        )
+
+        return float(
+            max(number_of_reactant_and_agent_atoms, 1) * max(number_of_product_atoms, 1) *
+            max(number_of_reactant_and_agent_compounds, 1)
+        )
+
+    @staticmethod
+    def get_canonical_compound_smiles(
+            compound_smiles: str
+    ) -> str:
+        """
+        Get the RDKit canonical form of a chemical compound SMILES string.
+
+        :parameter compound_smiles: The chemical compound SMILES string.
+
+        :returns: The canonical chemical compound SMILES string, or the original chemical compound SMILES string if it
+                  cannot be parsed.
+        """
+
+        from rdkit.Chem import MolFromSmiles, MolToSmiles
+        from rdkit.RDLogger import DisableLog
+
+        DisableLog("rdApp.*")
+
+        compound_rdkit_mol = MolFromSmiles(compound_smiles)
+
+        return MolToSmiles(compound_rdkit_mol) if compound_rdkit_mol is not None else compound_smiles
+
+    @staticmethod
+    def get_canonical_reaction_smiles(
+            reaction_smiles: str,
+            canonicalize_compound_smiles: bool = False
+    ) -> str:
+        """
+        Get the canonical form of a chemical reaction SMILES string, which is identical for chemical reaction SMILES
+        strings that differ only in the order of the compounds within the reactants, agents and products.
+
+        :parameter reaction_smiles: The chemical reaction SMILES string.
+        :parameter canonicalize_compound_smiles: The indicator whether the chemical compound SMILES strings should also
+                                                 be canonicalized using the RDKit library, which makes the canonical
+                                                 form identical for differently written chemical compounds.
+
+        :returns: The canonical chemical reaction SMILES string.
+        """
+
+        reaction_smiles = reaction_smiles.strip()
+
+        # --------------------------------------------------------------------------------------------------------------
+        #  The extensions of the CXSMILES strings refer to the compounds by their position, so the compounds of such
+        #  chemical reaction SMILES strings are not reordered.
+        # --------------------------------------------------------------------------------------------------------------
+
+        if " " in reaction_smiles:
+            return reaction_smiles
+
+        return ">".join(
+            ".".join(sorted(
+                ReactionSmilesUtilities.get_canonical_compound_smiles(
+                    compound_smiles=compound_smiles
+                ) if canonicalize_compound_smiles else compound_smiles
+                for compound_smiles in reaction_role_smiles.split(".")
+                if compound_smiles != ""
+            ))
+            for reaction_role_smiles in reaction_smiles.split(">")
+        )
+
+    @staticmethod
+    def get_bond_changes(
+            mapped_reaction_smiles: str
+    ) -> Optional[Tuple[Tuple[Tuple[str, int], Tuple[str, int], float, float], ...]]:
+        """
+        Get the bond changes of a mapped chemical reaction SMILES string in a form that does not depend on the atom map
+        numbers, so that the atom mappings of different chemical reaction atom mapping libraries can be compared. Each
+        bond change is described by the symmetry classes of its two atoms, and by the bond order before and after the
+        chemical reaction, where the order of a missing bond is zero. The symmetry class of an atom is the RDKit
+        canonical SMILES string of its reactant compound and the RDKit canonical symmetry class of the atom within that
+        compound. The bonds of the reactant atoms that are not mapped to any product atom are only considered if they
+        are connected to a mapped reactant atom.
+
+        :parameter mapped_reaction_smiles: The mapped chemical reaction SMILES string.
+
+        :returns: The sorted bond changes of the mapped chemical reaction SMILES string, or None if the mapped chemical
+                  reaction SMILES string cannot be parsed.
+        """
+
+        from rdkit.Chem import CanonicalRankAtoms, GetMolFrags, MolFromSmiles, MolToSmiles
+        from rdkit.RDLogger import DisableLog
+
+        DisableLog("rdApp.*")
+
+        reaction_roles_smiles = mapped_reaction_smiles.strip().split(" ")[0].split(">")
+
+        if len(reaction_roles_smiles) != 3:
+            return None
+
+        reactants_rdkit_mol = MolFromSmiles(reaction_roles_smiles[0])
+        products_rdkit_mol = MolFromSmiles(reaction_roles_smiles[2])
+
+        if reactants_rdkit_mol is None or products_rdkit_mol is None:
+            return None
+
+        reactant_atom_indices = {
+            reactant_rdkit_atom.GetAtomMapNum(): reactant_rdkit_atom.GetIdx()
+            for reactant_rdkit_atom in reactants_rdkit_mol.GetAtoms() if reactant_rdkit_atom.GetAtomMapNum() > 0
+        }  # type: Dict[int, int]
+
+        product_atom_reactant_atom_indices = {
+            product_rdkit_atom.GetIdx(): reactant_atom_indices[product_rdkit_atom.GetAtomMapNum()]
+            for product_rdkit_atom in products_rdkit_mol.GetAtoms()
+            if product_rdkit_atom.GetAtomMapNum() in reactant_atom_indices.keys()
+        }  # type: Dict[int, int]
+
+        mapped_reactant_atom_indices = set(product_atom_reactant_atom_indices.values())
+
+        reactant_bond_orders = {
+            frozenset((reactant_rdkit_bond.GetBeginAtomIdx(), reactant_rdkit_bond.GetEndAtomIdx(), )):
+                reactant_rdkit_bond.GetBondTypeAsDouble()
+            for reactant_rdkit_bond in reactants_rdkit_mol.GetBonds()
+            if reactant_rdkit_bond.GetBeginAtomIdx() in mapped_reactant_atom_indices or
+            reactant_rdkit_bond.GetEndAtomIdx() in mapped_reactant_atom_indices
+        }  # type: Dict[FrozenSet[int], float]
+
+        product_bond_orders = {
+            frozenset((
+                product_atom_reactant_atom_indices[product_rdkit_bond.GetBeginAtomIdx()],
+                product_atom_reactant_atom_indices[product_rdkit_bond.GetEndAtomIdx()],
+            )): product_rdkit_bond.GetBondTypeAsDouble()
+            for product_rdkit_bond in products_rdkit_mol.GetBonds()
+            if product_rdkit_bond.GetBeginAtomIdx() in product_atom_reactant_atom_indices.keys() and
+            product_rdkit_bond.GetEndAtomIdx() in product_atom_reactant_atom_indices.keys()
+        }  # type: Dict[FrozenSet[int], float]
+
+        # --------------------------------------------------------------------------------------------------------------
+        #  The symmetry classes are computed without the atom map numbers and only within the reactant compounds that
+        #  contain mapped atoms, so that they are identical for the same reactants regardless of the chemical reaction
+        #  atom mapping library, even if the library moves the unmapped agents into the reactants, and so that the atom
+        #  mappings that differ only in the choice between symmetry-equivalent atoms are considered identical.
+        # --------------------------------------------------------------------------------------------------------------
+
+        reactant_atom_symmetry_classes = dict()  # type: Dict[int, Tuple[str, int]]
+
+        reactant_compound_atom_indices = list()  # type: List[Tuple[int, ...]]
+
+        reactant_compound_rdkit_mols = GetMolFrags(
+            reactants_rdkit_mol,
+            asMols=True,
+            sanitizeFrags=False,
+            fragsMolAtomMapping=reactant_compound_atom_indices
+        )
+
+        for reactant_compound_index, reactant_compound_rdkit_mol in enumerate(reactant_compound_rdkit_mols):
+            if mapped_reactant_atom_indices.isdisjoint(reactant_compound_atom_indices[reactant_compound_index]):
+                continue
+
+            for reactant_compound_rdkit_atom in reactant_compound_rdkit_mol.GetAtoms():
+                reactant_compound_rdkit_atom.SetAtomMapNum(0)
+
+            reactant_compound_smiles = MolToSmiles(reactant_compound_rdkit_mol)
+
+            for reactant_atom_index, reactant_atom_symmetry_class in zip(
+                reactant_compound_atom_indices[reactant_compound_index],
+                CanonicalRankAtoms(reactant_compound_rdkit_mol, breakTies=False)
+            ):
+                reactant_atom_symmetry_classes[reactant_atom_index] = (
+                    reactant_compound_smiles,
+                    reactant_atom_symmetry_class,
+                )
+
+        return tuple(sorted(
+            (
+                *sorted(reactant_atom_symmetry_classes[reactant_atom_index] for reactant_atom_index in bond),
+                reactant_bond_orders.get(bond, 0.0),
+                product_bond_orders.get(bond, 0.0),
+            ) for bond in set(reactant_bond_orders.keys()).union(product_bond_orders.keys())
+            if reactant_bond_orders.get(bond, 0.0) != product_bond_orders.get(bond, 0.0)
+        ))
@@ -0,0 +1,3 @@
+""" The 'chemical_reaction_atom_mapping.utilities.scheduling' package initialization module. """
+
+from .scheduling import SchedulingUtilities
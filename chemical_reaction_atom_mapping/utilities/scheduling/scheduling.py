@@ -0,0 +1,198 @@
+""" The 'chemical_reaction_atom_mapping.utilities.scheduling' package 'scheduling' module. """
+
+from concurrent.futures import ThreadPoolExecutor
+from logging import getLogger
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+from ..instrumentation import InstrumentationUtilities
+from ..reaction_smiles import ReactionSmilesUtilities
+
+
+class SchedulingUtilities:
+    """ The cost-based chemical reaction SMILES string scheduling utilities class. """
+
+    @staticmethod
+    def _run_lane(
+            reaction_smiles_strings: List[str],
+            reaction_smiles_indices: List[int],
+            atom_mapping_procedure: Callable[..., Optional[List[Tuple[Optional[str], Any]]]],
+            number_of_cpu_cores: int,
+            task_timeout_period_s: Optional[float]
+    ) -> Optional[List[Tuple[Optional[str], Any]]]:
+        """
+        Run a chemical reaction atom mapping procedure on a lane of chemical reaction SMILES strings.
+
+        :parameter reaction_smiles_strings: The chemical reaction SMILES strings.
+        :parameter reaction_smiles_indices: The indices of the chemical reaction SMILES strings of the lane in the order
+                                            in which they should be dispatched.
+        :parameter atom_mapping_procedure: The chemical reaction atom mapping procedure.
+        :parameter number_of_cpu_cores: The number of CPU cores of the lane.
+        :parameter task_timeout_period_s: The task timeout period of the lane.
+
+        :returns: The chemical reaction atom mapping results of the lane in the dispatch order.
+        """
+
+        if len(reaction_smiles_indices) == 0:
+            return list()
+
+        return atom_mapping_procedure(
+            [reaction_smiles_strings[reaction_smiles_index] for reaction_smiles_index in reaction_smiles_indices],
+            number_of_cpu_cores=number_of_cpu_cores,
+            task_timeout_period_s=task_timeout_period_s
+        )
+
+    @staticmethod
+    def run_with_cost_based_scheduling(
+            reaction_smiles_strings: Iterable[str],
+            atom_mapping_procedure: Callable[..., Optional[List[Tuple[Optional[str], Any]]]],
+            number_of_cpu_cores: int = 1,
+            task_timeout_period_s: Optional[float] = None,
+            heavy_reaction_cost_threshold: Optional[float] = None,
+            heavy_reaction_task_timeout_period_s: Optional[float] = None,
+            number_of_heavy_reaction_cpu_cores: int = 1,
+            run_lanes_concurrently: bool = False
+    ) -> Optional[List[Tuple[Optional[str], Any]]]:
+        """
+        Run a chemical reaction atom mapping procedure with the chemical reaction SMILES strings dispatched from the
+        most to the least expensive one, so that the expensive chemical reaction SMILES strings do not leave most of
+        the worker processes idle at the end of the run. Optionally, the chemical reaction SMILES strings whose cost
+        estimate reaches a threshold are mapped in a separate heavy lane with its own CPU cores and task timeout period.
+
+        :parameter reaction_smiles_strings: The chemical reaction SMILES strings.
+        :parameter atom_mapping_procedure: The chemical reaction atom mapping procedure that maps a list of chemical
+                                           reaction SMILES strings, and accepts the 'number_of_cpu_cores' and the
+                                           'task_timeout_period_s' keyword arguments.
+        :parameter number_of_cpu_cores: The number of CPU cores that should be utilized.
+        :parameter task_timeout_period_s: The maximum amount of time in seconds that may be spent on a chemical
+                                          reaction SMILES string of the regular lane.
+        :parameter heavy_reaction_cost_threshold: The minimum cost estimate of the chemical reaction SMILES strings of
+                                                  the heavy lane: 'chemical_reaction_atom_mapping.utilities.
+                                                  reaction_smiles.ReactionSmilesUtilities.{get_reaction_cost_estimate}'.
+                                                  If not specified, all of the chemical reaction SMILES strings are
+                                                  mapped in the regular lane.
+        :parameter heavy_reaction_task_timeout_period_s: The maximum amount of time in seconds that may be spent on a
+                                                         chemical reaction SMILES string of the heavy lane. If not
+                                                         specified, the task timeout period of the regular lane is
+                                                         utilized.
+        :parameter number_of_heavy_reaction_cpu_cores: The number of CPU cores of the heavy lane if the lanes are run
+                                                       concurrently.
+        :parameter run_lanes_concurrently: The indicator whether the heavy lane may be run concurrently with the regular
+                                           lane, which requires the chemical reaction atom mapping procedure to run in
+                                           worker processes whenever a lane has a task timeout period or more than one
+                                           CPU core. The lanes are only run concurrently if both of them run in worker
+                                           processes. Otherwise, the heavy lane is run first with all of the CPU cores.
+
+        :returns: The chemical reaction atom mapping results in the order of the chemical reaction SMILES strings.
+        """
+
+        reaction_smiles_strings = list(reaction_smiles_strings)
+
+        with InstrumentationUtilities.measure("scheduling.cost_estimation"):
+            reaction_cost_estimates = [
+                ReactionSmilesUtilities.get_reaction_cost_estimate(
+                    reaction_smiles=reaction_smiles
+                ) for reaction_smiles in reaction_smiles_strings
+            ]
+
+        reaction_smiles_indices = sorted(
+            range(len(reaction_smiles_strings)),
+            key=lambda reaction_smiles_index: -reaction_cost_estimates[reaction_smiles_index]
+        )
+
+        heavy_reaction_smiles_indices = [
+            reaction_smiles_index for reaction_smiles_index in reaction_smiles_indices
+            if heavy_reaction_cost_threshold is not None and
+            reaction_cost_estimates[reaction_smiles_index] >= heavy_reaction_cost_threshold
+        ]
+
+        regular_reaction_smiles_indices = reaction_smiles_indices[len(heavy_reaction_smiles_indices):]
+
+        InstrumentationUtilities.increment(
+            counter_name="scheduling.heavy_reactions",
+            value=len(heavy_reaction_smiles_indices)
+        )
+
+        getLogger(
+            "{0}.SchedulingUtilities.run_with_cost_based_scheduling".format(__name__)
+        ).info("Heavy lane chemical reaction SMILES strings: {0} / {1}.".format(
+            len(heavy_reaction_smiles_indices),
+            len(reaction_smiles_strings)
+        ))
+
+        heavy_lane_arguments = {
+            "reaction_smiles_strings": reaction_smiles_strings,
+            "reaction_smiles_indices": heavy_reaction_smiles_indices,
+            "atom_mapping_procedure": atom_mapping_procedure,
+            "task_timeout_period_s": heavy_reaction_task_timeout_period_s
+            if heavy_reaction_task_timeout_period_s is not None else task_timeout_period_s,
+        }
+
+        regular_lane_arguments = {
+            "reaction_smiles_strings": reaction_smiles_strings,
+            "reaction_smiles_indices": regular_reaction_smiles_indices,
+            "atom_mapping_procedure": atom_mapping_procedure,
+            "task_timeout_period_s": task_timeout_period_s,
+        }
+
+        # --------------------------------------------------------------------------------------------------------------
+        #  The concurrent heavy lane keeps at least one CPU core for the regular lane, so the cheap chemical reaction
+        #  SMILES strings are never queued behind the expensive ones. A lane without a task timeout period and with a
+        #  single CPU core would run in the current process on the thread of the heavy lane while the other lane forks
+        #  its worker processes, so the lanes are then run one after the other.
+        # --------------------------------------------------------------------------------------------------------------
+
+        number_of_heavy_reaction_cpu_cores = min(
+            max(number_of_heavy_reaction_cpu_cores, 1),
+            number_of_cpu_cores - 1
+        )
+
+        lanes_run_in_worker_processes = all(
+            lane_arguments["task_timeout_period_s"] is not None or lane_number_of_cpu_cores > 1
+            for lane_arguments, lane_number_of_cpu_cores in [
+                (heavy_lane_arguments, number_of_heavy_reaction_cpu_cores),
+                (regular_lane_arguments, number_of_cpu_cores - number_of_heavy_reaction_cpu_cores),
+            ]
+        )
+
+        if run_lanes_concurrently and lanes_run_in_worker_processes and number_of_cpu_cores > 1 and \
+                len(heavy_reaction_smiles_indices) > 0 and len(regular_reaction_smiles_indices) > 0:
+            with ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix="heavy_reaction_lane"
+            ) as thread_pool_executor:
+                heavy_atom_mapping_results_future = thread_pool_executor.submit(
+                    SchedulingUtilities._run_lane,
+                    number_of_cpu_cores=number_of_heavy_reaction_cpu_cores,
+                    **heavy_lane_arguments
+                )
+
+                regular_atom_mapping_results = SchedulingUtilities._run_lane(
+                    number_of_cpu_cores=number_of_cpu_cores - number_of_heavy_reaction_cpu_cores,
+                    **regular_lane_arguments
+                )
+
+                heavy_atom_mapping_results = heavy_atom_mapping_results_future.result()
+
+        else:
+            heavy_atom_mapping_results = SchedulingUtilities._run_lane(
+                number_of_cpu_cores=number_of_cpu_cores,
+                **heavy_lane_arguments
+            )
+
+            regular_atom_mapping_results = SchedulingUtilities._run_lane(
+                number_of_cpu_cores=number_of_cpu_cores,
+                **regular_lane_arguments
+            )
+
+        if heavy_atom_mapping_results is None or regular_atom_mapping_results is None:
+            return None
+
+        atom_mapping_results = [None, ] * len(reaction_smiles_strings)  # type: List[Tuple[Optional[str], Any]]
+
+        for reaction_smiles_index, atom_mapping_result in zip(
+            heavy_reaction_smiles_indices + regular_reaction_smiles_indices,
+            heavy_atom_mapping_results + regular_atom_mapping_results
+        ):
+            atom_mapping_results[reaction_smiles_index] = atom_mapping_result
+
+        return atom_mapping_results
@@ -0,0 +1,3 @@
+""" The 'chemical_reaction_atom_mapping.utilities.spectator_compounds' package initialization module. """
+
+from .spectator_compounds import SpectatorCompoundUtilities
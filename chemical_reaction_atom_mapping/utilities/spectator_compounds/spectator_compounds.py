@@ -0,0 +1,312 @@
+""" The 'chemical_reaction_atom_mapping.utilities.spectator_compounds' package 'spectator_compounds' module. """
+
+from logging import getLogger
+from re import compile
+from typing import Any, Callable, Collection, FrozenSet, Iterable, List, Optional, Tuple
+
+from ..instrumentation import InstrumentationUtilities
+from ..reaction_smiles import ReactionSmilesUtilities
+
+
+class SpectatorCompoundUtilities:
+    """
+    The chemical reaction spectator compound utilities class. The chemical compounds that appear unchanged on both sides
+    of a chemical reaction and the known reagents are stripped before the atom mapping, which shrinks the problem that
+    the chemical reaction atom mapping libraries have to solve, and they are restored without the atom map numbers
+    afterwards.
+    """
+
+    _atom_map_number_pattern = compile(r"(\[[^\]:]+):[0-9]+]")
+
+    @staticmethod
+    def _get_canonical_reagent_smiles_strings(
+            reagent_smiles_strings: Optional[Collection[str]]
+    ) -> FrozenSet[str]:
+        """
+        Get the RDKit canonical forms of the known reagent chemical compound SMILES strings.
+
+        :parameter reagent_smiles_strings: The known reagent chemical compound SMILES strings.
+
+        :returns: The canonical known reagent chemical compound SMILES strings.
+        """
+
+        return frozenset(
+            ReactionSmilesUtilities.get_canonical_compound_smiles(
+                compound_smiles=reagent_smiles
+            ) for reagent_smiles in (reagent_smiles_strings or list())
+        )
+
+    @staticmethod
+    def strip_spectator_compounds(
+            reaction_smiles: str,
+            strip_unchanged_compounds: bool = True,
+            reagent_smiles_strings: Optional[Collection[str]] = None
+    ) -> Tuple[str, Optional[Tuple[List[str], List[str], List[str]]]]:
+        """
+        Strip the spectator chemical compounds from a chemical reaction SMILES string. The chemical compounds are
+        compared by their RDKit canonical forms, and at least one reactant and one product are always kept.
+
+        :parameter reaction_smiles: The chemical reaction SMILES string.
+        :parameter strip_unchanged_compounds: The indicator whether the reactant and agent chemical compounds that
+                                              appear unchanged among the products should be stripped together with the
+                                              matching product chemical compounds.
+        :parameter reagent_smiles_strings: The known reagent chemical compound SMILES strings, such as the solvents and
+                                           the catalysts, that should be stripped from the reactants and the agents.
+
+        :returns: The stripped chemical reaction SMILES string, and the stripped reactant, agent and product chemical
+                  compound SMILES strings, or the original chemical reaction SMILES string and None if no chemical
+                  compound is stripped.
+        """
+
+        reaction_smiles = reaction_smiles.strip()
+
+        # --------------------------------------------------------------------------------------------------------------
+        #  The extensions of the CXSMILES strings refer to the compounds by their position, so the compounds of such
+        #  chemical reaction SMILES strings are not stripped.
+        # --------------------------------------------------------------------------------------------------------------
+
+        reaction_roles_smiles = reaction_smiles.split(">")
+
+        if " " in reaction_smiles or len(reaction_roles_smiles) != 3:
+            return reaction_smiles, None
+
+        reaction_roles_compound_smiles = [
+            [compound_smiles for compound_smiles in reaction_role_smiles.split(".") if compound_smiles != ""]
+            for reaction_role_smiles in reaction_roles_smiles
+        ]
+
+        reaction_roles_canonical_compound_smiles = [
+            [
+                ReactionSmilesUtilities.get_canonical_compound_smiles(
+                    compound_smiles=compound_smiles
+                ) for compound_smiles in reaction_role_compound_smiles
+            ] for reaction_role_compound_smiles in reaction_roles_compound_smiles
+        ]
+
+        stripped_compound_indices = (set(), set(), set(), )
+
+        if strip_unchanged_compounds:
+            for product_index, canonical_product_smiles in enumerate(reaction_roles_canonical_compound_smiles[2]):
+                if len(reaction_roles_compound_smiles[2]) - len(stripped_compound_indices[2]) < 2:
+                    break
+
+                for reaction_role_index in (1, 0, ):
+                    if reaction_role_index == 0 and \
+                            len(reaction_roles_compound_smiles[0]) - len(stripped_compound_indices[0]) < 2:
+                        continue
+
+                    compound_index = next((
+                        compound_index for compound_index, canonical_compound_smiles in enumerate(
+                            reaction_roles_canonical_compound_smiles[reaction_role_index]
+                        ) if canonical_compound_smiles == canonical_product_smiles and
+                        compound_index not in stripped_compound_indices[reaction_role_index]
+                    ), None)
+
+                    if compound_index is not None:
+                        stripped_compound_indices[reaction_role_index].add(compound_index)
+                        stripped_compound_indices[2].add(product_index)
+
+                        break
+
+        canonical_reagent_smiles_strings = SpectatorCompoundUtilities._get_canonical_reagent_smiles_strings(
+            reagent_smiles_strings=reagent_smiles_strings
+        )
+
+        for reaction_role_index in (1, 0, ):
+            for compound_index, canonical_compound_smiles in enumerate(
+                reaction_roles_canonical_compound_smiles[reaction_role_index]
+            ):
+                if reaction_role_index == 0 and \
+                        len(reaction_roles_compound_smiles[0]) - len(stripped_compound_indices[0]) < 2:
+                    break
+
+                if canonical_compound_smiles in canonical_reagent_smiles_strings:
+                    stripped_compound_indices[reaction_role_index].add(compound_index)
+
+        if not any(stripped_compound_indices):
+            return reaction_smiles, None
+
+        InstrumentationUtilities.increment(
+            counter_name="spectator_compounds.stripped_compounds",
+            value=sum(map(len, stripped_compound_indices))
+        )
+
+        return ">".join(
+            ".".join(
+                compound_smiles for compound_index, compound_smiles in enumerate(reaction_role_compound_smiles)
+                if compound_index not in reaction_role_stripped_compound_indices
+            ) for reaction_role_compound_smiles, reaction_role_stripped_compound_indices in zip(
+                reaction_roles_compound_smiles,
+                stripped_compound_indices
+            )
+        ), tuple(
+            [
+                reaction_role_compound_smiles[compound_index]
+                for compound_index in sorted(reaction_role_stripped_compound_indices)
+            ] for reaction_role_compound_smiles, reaction_role_stripped_compound_indices in zip(
+                reaction_roles_compound_smiles,
+                stripped_compound_indices
+            )
+        )
+
+    @staticmethod
+    def restore_spectator_compounds(
+            mapped_reaction_smiles: str,
+            stripped_compound_smiles: Tuple[List[str], List[str], List[str]]
+    ) -> str:
+        """
+        Restore the stripped spectator chemical compounds of a mapped chemical reaction SMILES string without the atom
+        map numbers.
+
+        :parameter mapped_reaction_smiles: The mapped stripped chemical reaction SMILES string.
+        :parameter stripped_compound_smiles: The stripped reactant, agent and product chemical compound SMILES strings.
+
+        :returns: The mapped chemical reaction SMILES string with the restored spectator chemical compounds.
+        """
+
+        # --------------------------------------------------------------------------------------------------------------
+        #  The extensions of the CXSMILES strings refer to the atoms and the compounds by their position, which is
+        #  shifted by the restored chemical compounds, so they are discarded.
+        # --------------------------------------------------------------------------------------------------------------
+
+        mapped_reaction_roles_smiles = mapped_reaction_smiles.strip().split(" ")[0].split(">")
+
+        if len(mapped_reaction_roles_smiles) != 3:
+            return mapped_reaction_smiles
+
+        return ">".join(
+            ".".join(filter(None, [
+                mapped_reaction_role_smiles,
+                *(
+                    SpectatorCompoundUtilities._atom_map_number_pattern.sub(r"\1]", compound_smiles)
+                    for compound_smiles in reaction_role_stripped_compound_smiles
+                ),
+            ])) for mapped_reaction_role_smiles, reaction_role_stripped_compound_smiles in zip(
+                mapped_reaction_roles_smiles,
+                stripped_compound_smiles
+            )
+        )
+
+    @staticmethod
+    def _restore_atom_mapping_result(
+            atom_mapping_result: Tuple[Optional[str], Any],
+            stripped_compound_smiles: Optional[Tuple[List[str], List[str], List[str]]]
+    ) -> Tuple[Optional[str], Any]:
+        """
+        Restore the stripped spectator chemical compounds of a chemical reaction atom mapping result.
+
+        :parameter atom_mapping_result: The mapped stripped chemical reaction SMILES string, and the atom mapping score.
+        :parameter stripped_compound_smiles: The stripped reactant, agent and product chemical compound SMILES strings.
+
+        :returns: The mapped chemical reaction SMILES string with the restored spectator chemical compounds, and the
+                  atom mapping score.
+        """
+
+        mapped_reaction_smiles, atom_mapping_score = atom_mapping_result
+
+        if not mapped_reaction_smiles or stripped_compound_smiles is None:
+            return mapped_reaction_smiles, atom_mapping_score
+
+        return SpectatorCompoundUtilities.restore_spectator_compounds(
+            mapped_reaction_smiles=mapped_reaction_smiles,
+            stripped_compound_smiles=stripped_compound_smiles
+        ), atom_mapping_score
+
+    @staticmethod
+    def run_on_reaction_smiles_with_spectator_compound_stripping(
+            reaction_smiles: str,
+            atom_mapping_procedure: Callable[[str], Tuple[Optional[str], Any]],
+            strip_unchanged_compounds: bool = False,
+            reagent_smiles_strings: Optional[Collection[str]] = None
+    ) -> Tuple[Optional[str], Any]:
+        """
+        Run a chemical reaction atom mapping procedure on a chemical reaction SMILES string without its spectator
+        chemical compounds, and restore the spectator chemical compounds in the mapped chemical reaction SMILES string.
+
+        :parameter reaction_smiles: The chemical reaction SMILES string.
+        :parameter atom_mapping_procedure: The chemical reaction atom mapping procedure that maps a chemical reaction
+                                           SMILES string.
+        :parameter strip_unchanged_compounds: The indicator whether the chemical compounds that appear unchanged on both
+                                              sides of the chemical reaction should be stripped.
+        :parameter reagent_smiles_strings: The known reagent chemical compound SMILES strings that should be stripped
+                                           from the reactants and the agents.
+
+        :returns: The mapped chemical reaction SMILES string, and the atom mapping score.
+        """
+
+        if not isinstance(reaction_smiles, str):
+            return atom_mapping_procedure(reaction_smiles)
+
+        stripped_reaction_smiles, stripped_compound_smiles = SpectatorCompoundUtilities.strip_spectator_compounds(
+            reaction_smiles=reaction_smiles,
+            strip_unchanged_compounds=strip_unchanged_compounds,
+            reagent_smiles_strings=reagent_smiles_strings
+        )
+
+        return SpectatorCompoundUtilities._restore_atom_mapping_result(
+            atom_mapping_result=atom_mapping_procedure(stripped_reaction_smiles),
+            stripped_compound_smiles=stripped_compound_smiles
+        )
+
+    @staticmethod
+    def run_with_spectator_compound_stripping(
+            reaction_smiles_strings: Iterable[str],
+            atom_mapping_procedure: Callable[[List[str]], Optional[List[Tuple[Optional[str], Any]]]],
+            strip_unchanged_compounds: bool = False,
+            reagent_smiles_strings: Optional[Collection[str]] = None
+    ) -> Optional[List[Tuple[Optional[str], Any]]]:
+        """
+        Run a chemical reaction atom mapping procedure on the chemical reaction SMILES strings without their spectator
+        chemical compounds, and restore the spectator chemical compounds in the mapped chemical reaction SMILES strings.
+
+        :parameter reaction_smiles_strings: The chemical reaction SMILES strings.
+        :parameter atom_mapping_procedure: The chemical reaction atom mapping procedure that maps a list of chemical
+                                           reaction SMILES strings.
+        :parameter strip_unchanged_compounds: The indicator whether the chemical compounds that appear unchanged on both
+                                              sides of the chemical reactions should be stripped.
+        :parameter reagent_smiles_strings: The known reagent chemical compound SMILES strings that should be stripped
+                                           from the reactants and the agents.
+
+        :returns: The chemical reaction atom mapping results in the order of the chemical reaction SMILES strings.
+        """
+
+        with InstrumentationUtilities.measure("spectator_compound_stripping"):
+            stripped_reaction_smiles_strings_and_compound_smiles = [
+                SpectatorCompoundUtilities.strip_spectator_compounds(
+                    reaction_smiles=reaction_smiles,
+                    strip_unchanged_compounds=strip_unchanged_compounds,
+                    reagent_smiles_strings=reagent_smiles_strings
+                ) if isinstance(reaction_smiles, str) else (reaction_smiles, None, )
+                for reaction_smiles in reaction_smiles_strings
+            ]
+
+        stripped_compound_smiles = [
+            reaction_stripped_compound_smiles
+            for _, reaction_stripped_compound_smiles in stripped_reaction_smiles_strings_and_compound_smiles
+        ]
+
+        getLogger(
+            "{0}.SpectatorCompoundUtilities.run_with_spectator_compound_stripping".format(__name__)
+        ).info("Chemical reaction SMILES strings with stripped spectator compounds: {0} / {1}.".format(
+            sum(reaction_stripped_compound_smiles is not None for reaction_stripped_compound_smiles in
+                stripped_compound_smiles),
+            len(stripped_compound_smiles)
+        ))
+
+        atom_mapping_results = atom_mapping_procedure([
+            stripped_reaction_smiles
+            for stripped_reaction_smiles, _ in stripped_reaction_smiles_strings_and_compound_smiles
+        ])
+
+        if atom_mapping_results is None:
+            return None
+
+        return [
+            SpectatorCompoundUtilities._restore_atom_mapping_result(
+                atom_mapping_result=atom_mapping_result,
+                stripped_compound_smiles=reaction_stripped_compound_smiles
+            ) for atom_mapping_result, reaction_stripped_compound_smiles in zip(
+                atom_mapping_results,
+                stripped_compound_smiles
+            )
+        ]
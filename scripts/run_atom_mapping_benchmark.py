@@ -0,0 +1,445 @@
+""" The 'scripts' directory 'run_atom_mapping_benchmark' script. """
+
+from argparse import ArgumentParser, Namespace
+from itertools import cycle, islice
+from json import dump, dumps
+from multiprocessing import cpu_count, get_context
+from multiprocessing.connection import Connection
+from platform import platform, python_version
+from resource import RUSAGE_CHILDREN, RUSAGE_SELF, getrusage
+from sys import stderr
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from numpy import mean, percentile
+from pandas import read_csv
+
+from chemical_reaction_atom_mapping.utilities.backend_registry import BackendRegistryUtilities
+from chemical_reaction_atom_mapping.utilities.caching import AtomMappingResultCache
+
+
+BENCHMARK_REACTION_SMILES_STRINGS = [
+    "CCO.CC(=O)O>>CCOC(C)=O",
+    "CC(=O)Cl.NCc1ccccc1>>CC(=O)NCc1ccccc1",
+    "Brc1ccccc1.OB(O)c1ccccc1>>c1ccc(-c2ccccc2)cc1",
+    "BrCCBr.COC(=O)c1cc(n[nH]1)C(F)(F)F>>COC(=O)c1cc(nn1CCBr)C(F)(F)F",
+    "O=C(O)c1ccccc1.OCC>>CCOC(=O)c1ccccc1",
+    "N#Cc1ccccc1>>NCc1ccccc1",
+    "O=C1CCCCC1>>OC1CCCCC1",
+    "C=CC=C.C=CC(=O)OC>>COC(=O)C1CCC=CC1",
+    "CC(C)(C)OC(=O)NCCc1ccccc1>>NCCc1ccccc1",
+    "Cc1ccc(S(=O)(=O)Cl)cc1.OCc1ccccc1>>Cc1ccc(S(=O)(=O)OCc2ccccc2)cc1",
+    "O=Cc1ccccc1.NC1CCCCC1>>c1ccc(CNC2CCCCC2)cc1",
+    "CN.O=C(Cl)c1ccc([N+](=O)[O-])cc1>>CNC(=O)c1ccc([N+](=O)[O-])cc1",
+    "Clc1ccc(I)cc1.C#CCO>>OCC#Cc1ccc(Cl)cc1",
+    "COc1ccc(CCO)cc1.CS(=O)(=O)Cl>>COc1ccc(CCOS(C)(=O)=O)cc1",
+    "O=[N+]([O-])c1ccc(F)cc1.C1CNCCN1>>O=[N+]([O-])c1ccc(N2CCNCC2)cc1",
+    "CC(=O)c1ccc(O)cc1.BrCc1ccccc1>>CC(=O)c1ccc(OCc2ccccc2)cc1",
+]
+
+
+def parse_arguments() -> Namespace:
+    """ Parse the 'run_atom_mapping_benchmark' script arguments. """
+
+    argument_parser = ArgumentParser()
+
+    argument_parser.add_argument(
+        "-l",
+        "--libraries",
+        type=str,
+        nargs="+",
+        choices=BackendRegistryUtilities.get_backend_names(),
+        default=[
+            "chytorch_rxnmap",
+            "epam_indigo",
+            "rxnmapper"
+        ],
+        help="The indicators of the chemical reaction atom mapping libraries that should be benchmarked."
+    )
+
+    argument_parser.add_argument(
+        "-i",
+        "--input_csv_dataset_file_path",
+        type=str,
+        default=None,
+        help="The path to the input '*.csv' dataset file from which the benchmark chemical reaction SMILES strings are "
+             "sampled. If not specified, the chemical reaction SMILES strings bundled with the script are utilized."
+    )
+
+    argument_parser.add_argument(
+        "-s",
+        "--reaction_smiles_column_name",
+        type=str,
+        default="reaction_smiles",
+        help="The name of the chemical reaction SMILES column of the input '*.csv' dataset file."
+    )
+
+    argument_parser.add_argument(
+        "-n",
+        "--numbers_of_reactions",
+        type=int,
+        nargs="+",
+        default=[100, ],
+        help="The numbers of chemical reaction SMILES strings of the benchmark reaction sets. The source chemical "
+             "reaction SMILES strings are repeated if there are fewer of them."
+    )
+
+    argument_parser.add_argument(
+        "-c",
+        "--numbers_of_cpu_cores",
+        type=int,
+        nargs="+",
+        default=[1, ],
+        help="The numbers of CPU cores that should be swept. The 'rxnmapper' library utilizes a single CPU core as "
+             "one PyTorch intra-op thread, and multiple CPU cores as forked worker processes that share the model, "
+             "and the other libraries utilize them as worker processes."
+    )
+
+    argument_parser.add_argument(
+        "-b",
+        "--batch_sizes",
+        type=int,
+        nargs="+",
+        default=[10, ],
+        help="The model batch sizes of the 'chytorch_rxnmap' and 'rxnmapper' libraries that should be swept. The "
+             "'epam_indigo' library does not batch the chemical reaction SMILES strings."
+    )
+
+    argument_parser.add_argument(
+        "-p",
+        "--number_of_latency_samples",
+        type=int,
+        default=100,
+        help="The number of chemical reaction SMILES strings that are mapped one by one to measure the per-reaction "
+             "latency of each library."
+    )
+
+    argument_parser.add_argument(
+        "-o",
+        "--output_json_file_path",
+        type=str,
+        default=None,
+        help="The path to the output '*.json' benchmark report file. If not specified, the report is printed."
+    )
+
+    return argument_parser.parse_args()
+
+
+def get_benchmark_reaction_smiles_strings(
+        script_arguments: Namespace,
+        number_of_reactions: int
+) -> List[str]:
+    """
+    Get a benchmark reaction set of a controlled size.
+
+    :parameter script_arguments: The 'run_atom_mapping_benchmark' script arguments.
+    :parameter number_of_reactions: The number of chemical reaction SMILES strings of the benchmark reaction set.
+
+    :returns: The chemical reaction SMILES strings of the benchmark reaction set.
+    """
+
+    if script_arguments.input_csv_dataset_file_path is not None:
+        source_reaction_smiles_strings = read_csv(
+            filepath_or_buffer=script_arguments.input_csv_dataset_file_path,
+            usecols=[script_arguments.reaction_smiles_column_name, ],
+            nrows=number_of_reactions
+        )[script_arguments.reaction_smiles_column_name].dropna().tolist()
+
+    else:
+        source_reaction_smiles_strings = BENCHMARK_REACTION_SMILES_STRINGS
+
+    return list(islice(cycle(source_reaction_smiles_strings), number_of_reactions))
+
+
+def get_peak_resident_set_sizes_mb() -> Dict[str, float]:
+    """
+    Get the peak resident set sizes of the current process and of its largest terminated child process.
+
+    :returns: The peak resident set sizes in megabytes.
+    """
+
+    return {
+        "peak_rss_mb": getrusage(RUSAGE_SELF).ru_maxrss / 1024,
+        "peak_children_rss_mb": getrusage(RUSAGE_CHILDREN).ru_maxrss / 1024,
+    }
+
+
+def get_atom_mapping_procedures(
+        library: str
+) -> Tuple[Callable[[str], Tuple[Optional[str], Any]], Callable[..., List[Tuple[Optional[str], Any]]]]:
+    """
+    Get the single and the batch atom mapping procedures of a chemical reaction atom mapping library.
+
+    :parameter library: The indicator of the chemical reaction atom mapping library.
+
+    :returns: The procedure that maps a chemical reaction SMILES string, and the procedure that maps a list of chemical
+              reaction SMILES strings for a number of CPU cores and a batch size.
+    """
+
+    atom_mapper = BackendRegistryUtilities.get_atom_mapper(
+        library=library
+    )
+
+    def _run_atom_mapping_on_reaction_smiles_strings(
+            reaction_smiles_strings: List[str],
+            number_of_cpu_cores: int,
+            batch_size: Optional[int]
+    ) -> List[Tuple[Optional[str], Any]]:
+        if library == "rxnmapper":
+            from torch import set_num_threads
+
+            set_num_threads(number_of_cpu_cores)
+
+        return atom_mapper.map_batch(
+            reaction_smiles_strings=reaction_smiles_strings,
+            number_of_cpu_cores=number_of_cpu_cores,
+            batch_size=batch_size
+        )
+
+    return atom_mapper.map_one, _run_atom_mapping_on_reaction_smiles_strings
+
+
+def run_latency_benchmark(
+        library: str,
+        reaction_smiles_strings: List[str]
+) -> Dict[str, Any]:
+    """
+    Measure the model loading time and the per-reaction latency of a chemical reaction atom mapping library.
+
+    :parameter library: The indicator of the chemical reaction atom mapping library.
+    :parameter reaction_smiles_strings: The chemical reaction SMILES strings that are mapped one by one.
+
+    :returns: The latency benchmark record.
+    """
+
+    run_atom_mapping_on_reaction_smiles, _ = get_atom_mapping_procedures(
+        library=library
+    )
+
+    # ------------------------------------------------------------------------------------------------------------------
+    #  The benchmark runs in a fresh process, so the first atom mapping includes the loading of the model and the
+    #  initialization of the library, and it is excluded from the latency measurements.
+    # ------------------------------------------------------------------------------------------------------------------
+
+    model_loading_start_time = perf_counter()
+
+    run_atom_mapping_on_reaction_smiles(reaction_smiles_strings[0])
+
+    model_loading_time_s = perf_counter() - model_loading_start_time
+
+    latencies_s, number_of_failed_reactions = list(), 0
+
+    for reaction_smiles in reaction_smiles_strings:
+        atom_mapping_start_time = perf_counter()
+
+        mapped_reaction_smiles, _ = run_atom_mapping_on_reaction_smiles(reaction_smiles)
+
+        latencies_s.append(perf_counter() - atom_mapping_start_time)
+
+        number_of_failed_reactions += mapped_reaction_smiles is None
+
+    return {
+        "benchmark": "latency",
+        "library": library,
+        "number_of_reactions": len(reaction_smiles_strings),
+        "number_of_failed_reactions": number_of_failed_reactions,
+        "model_loading_time_s": model_loading_time_s,
+        "latency_s": {
+            "mean": float(mean(latencies_s)),
+            "p50": float(percentile(latencies_s, 50)),
+            "p95": float(percentile(latencies_s, 95)),
+            "p99": float(percentile(latencies_s, 99)),
+        },
+        **get_peak_resident_set_sizes_mb(),
+    }
+
+
+def run_throughput_benchmark(
+        library: str,
+        reaction_smiles_strings: List[str],
+        number_of_cpu_cores: int,
+        batch_size: Optional[int]
+) -> Dict[str, Any]:
+    """
+    Measure the throughput of a chemical reaction atom mapping library for a number of CPU cores and a batch size.
+
+    :parameter library: The indicator of the chemical reaction atom mapping library.
+    :parameter reaction_smiles_strings: The chemical reaction SMILES strings of the benchmark reaction set.
+    :parameter number_of_cpu_cores: The number of CPU cores that should be utilized.
+    :parameter batch_size: The model batch size of the chemical reaction atom mapping library.
+
+    :returns: The throughput benchmark record.
+    """
+
+    run_atom_mapping_on_reaction_smiles, run_atom_mapping_on_reaction_smiles_strings = get_atom_mapping_procedures(
+        library=library
+    )
+
+    model_loading_start_time = perf_counter()
+
+    run_atom_mapping_on_reaction_smiles(reaction_smiles_strings[0])
+
+    model_loading_time_s = perf_counter() - model_loading_start_time
+
+    atom_mapping_start_time = perf_counter()
+
+    atom_mapping_results = run_atom_mapping_on_reaction_smiles_strings(
+        reaction_smiles_strings,
+        number_of_cpu_cores,
+        batch_size
+    )
+
+    atom_mapping_time_s = perf_counter() - atom_mapping_start_time
+
+    return {
+        "benchmark": "throughput",
+        "library": library,
+        "number_of_reactions": len(reaction_smiles_strings),
+        "number_of_cpu_cores": number_of_cpu_cores,
+        "batch_size": batch_size,
+        "number_of_failed_reactions": sum(
+            atom_mapping_result[0] is None for atom_mapping_result in atom_mapping_results
+        ) if atom_mapping_results is not None else len(reaction_smiles_strings),
+        "model_loading_time_s": model_loading_time_s,
+        "atom_mapping_time_s": atom_mapping_time_s,
+        "reactions_per_second": len(reaction_smiles_strings) / atom_mapping_time_s,
+        **get_peak_resident_set_sizes_mb(),
+    }
+
+
+def _run_benchmark_procedure_in_process(
+        benchmark_procedure: Callable[..., Dict[str, Any]],
+        benchmark_procedure_arguments: Dict[str, Any],
+        result_connection: Connection
+) -> None:
+    """
+    Run a benchmark procedure, and send its record or its exception message through a connection.
+
+    :parameter benchmark_procedure: The benchmark procedure.
+    :parameter benchmark_procedure_arguments: The keyword arguments of the benchmark procedure.
+    :parameter result_connection: The connection through which the benchmark record is sent.
+    """
+
+    try:
+        result_connection.send(benchmark_procedure(**benchmark_procedure_arguments))
+
+    except Exception as exception_handle:
+        result_connection.send({
+            "error": "{0}: {1}".format(type(exception_handle).__name__, exception_handle),
+        })
+
+    finally:
+        result_connection.close()
+
+
+def run_benchmark_procedure_in_fresh_process(
+        benchmark_procedure: Callable[..., Dict[str, Any]],
+        **kwargs
+) -> Dict[str, Any]:
+    """
+    Run a benchmark procedure in a fresh process, so that the model loading time and the peak resident set size are
+    not affected by the previous benchmark procedures.
+
+    :parameter benchmark_procedure: The benchmark procedure.
+    :parameter kwargs: The keyword arguments of the benchmark procedure.
+
+    :returns: The benchmark record.
+    """
+
+    spawn_context = get_context("spawn")
+
+    result_receiving_connection, result_sending_connection = spawn_context.Pipe(duplex=False)
+
+    benchmark_process = spawn_context.Process(
+        target=_run_benchmark_procedure_in_process,
+        args=(benchmark_procedure, kwargs, result_sending_connection, )
+    )
+
+    benchmark_process.start()
+
+    result_sending_connection.close()
+
+    try:
+        benchmark_record = result_receiving_connection.recv()
+
+    except EOFError:
+        benchmark_record = {
+            "error": "The benchmark process terminated unexpectedly.",
+        }
+
+    benchmark_process.join()
+
+    if "error" in benchmark_record.keys():
+        benchmark_record.update({
+            key: value for key, value in kwargs.items() if key != "reaction_smiles_strings"
+        })
+
+    return benchmark_record
+
+
+def get_benchmark_environment() -> Dict[str, Any]:
+    """
+    Get the description of the benchmark environment.
+
+    :returns: The Python version, the platform, the number of CPU cores and the versions of the libraries.
+    """
+
+    return {
+        "python_version": python_version(),
+        "platform": platform(),
+        "number_of_cpu_cores": cpu_count(),
+        "library_versions": {
+            library: AtomMappingResultCache.get_library_version(
+                library_name=library
+            ) for library in ["chytorch_rxnmap", "epam_indigo", "rxnmapper", "torch", ]
+        },
+    }
+
+
+if __name__ == "__main__":
+    script_arguments = parse_arguments()
+
+    benchmark_records = list()
+
+    for library in script_arguments.libraries:
+        benchmark_records.append(run_benchmark_procedure_in_fresh_process(
+            benchmark_procedure=run_latency_benchmark,
+            library=library,
+            reaction_smiles_strings=get_benchmark_reaction_smiles_strings(
+                script_arguments=script_arguments,
+                number_of_reactions=script_arguments.number_of_latency_samples
+            )
+        ))
+
+        print(dumps(benchmark_records[-1]), file=stderr)
+
+        for number_of_reactions in script_arguments.numbers_of_reactions:
+            reaction_smiles_strings = get_benchmark_reaction_smiles_strings(
+                script_arguments=script_arguments,
+                number_of_reactions=number_of_reactions
+            )
+
+            for number_of_cpu_cores in script_arguments.numbers_of_cpu_cores:
+                for batch_size in script_arguments.batch_sizes \
+                        if BackendRegistryUtilities.get_atom_mapper_class(library=library).is_batchable else [None, ]:
+                    benchmark_records.append(run_benchmark_procedure_in_fresh_process(
+                        benchmark_procedure=run_throughput_benchmark,
+                        library=library,
+                        reaction_smiles_strings=reaction_smiles_strings,
+                        number_of_cpu_cores=number_of_cpu_cores,
+                        batch_size=batch_size
+                    ))
+
+                    print(dumps(benchmark_records[-1]), file=stderr)
+
+    benchmark_report = {
+        "environment": get_benchmark_environment(),
+        "benchmarks": benchmark_records,
+    }
+
+    if script_arguments.output_json_file_path is not None:
+        with open(script_arguments.output_json_file_path, mode="w") as output_json_file_handle:
+            dump(benchmark_report, output_json_file_handle, indent=4)
+
+    else:
+        print(dumps(benchmark_report, indent=4))
@@ -0,0 +1,17 @@
+#!/bin/bash
+
+export PYTHONPATH=$PYTHONPATH:"/path/to/project/root/directory"
+
+export LIBRARIES="chytorch_rxnmap epam_indigo rxnmapper"
+export NUMBERS_OF_REACTIONS="100 1000"
+export NUMBERS_OF_CPU_CORES="1 2 4"
+export BATCH_SIZES="1 10 50"
+export OUTPUT_JSON_FILE_PATH="/path/to/output/json/benchmark/report/file.json"
+
+
+python "$(cd -P "$(dirname "${BASH_SOURCE[0]}")" && pwd)"/run_atom_mapping_benchmark.py \
+        --libraries $LIBRARIES \
+        --numbers_of_reactions $NUMBERS_OF_REACTIONS \
+        --numbers_of_cpu_cores $NUMBERS_OF_CPU_CORES \
+        --batch_sizes $BATCH_SIZES \
+        --output_json_file_path $OUTPUT_JSON_FILE_PATH
@@ -1,8 +1,19 @@
 """ The 'scripts' directory 'run_atom_mapping_on_csv_dataset' script. """
 
 from argparse import ArgumentParser, Namespace
+from os.path import abspath, exists
+from typing import Any, Dict, List, Optional
 
-from pandas import read_csv
+from pandas import DataFrame
+
+from chemical_reaction_atom_mapping.consensus import ConsensusReactionAtomMappingUtilities
+from chemical_reaction_atom_mapping.utilities.atom_mapper import ReactionAtomMapper
+from chemical_reaction_atom_mapping.utilities.backend_registry import BackendRegistryUtilities
+from chemical_reaction_atom_mapping.utilities.caching import AtomMappingResultCache
+from chemical_reaction_atom_mapping.utilities.checkpointing import CheckpointingUtilities
+from chemical_reaction_atom_mapping.utilities.dataset_io import DatasetIoUtilities
+from chemical_reaction_atom_mapping.utilities.instrumentation import InstrumentationUtilities, JsonLinesMetricsSink, \
+    PrometheusTextMetricsSink
 
 
 def parse_arguments() -> Namespace:
@@ -14,13 +25,41 @@ def parse_arguments() -> Namespace:
         "-l",
         "--library",
         type=str,
-        choices=[
-            "chytorch_rxnmap",
-            "epam_indigo",
-            "rxnmapper"
-        ],
-        required=True,
-        help="The indicator of the chemical reaction atom mapping library that should be utilized."
+        choices=BackendRegistryUtilities.get_backend_names(),
+        default=None,
+        help="The indicator of the chemical reaction atom mapping library that should be utilized. Either this "
+             "argument or the '--consensus_libraries' argument should be specified."
+    )
+
+    argument_parser.add_argument(
+        "-g",
+        "--consensus_libraries",
+        type=str,
+        nargs="+",
+        choices=BackendRegistryUtilities.get_backend_names(),
+        default=None,
+        help="The indicators of the chemical reaction atom mapping libraries that should be run on each chemical "
+             "reaction SMILES string in a single pass, one after another, ordered from the fastest to the slowest one. "
+             "The output '*.csv' dataset file contains the columns of each library and a consensus indicator column."
+    )
+
+    argument_parser.add_argument(
+        "-y",
+        "--consensus_early_exit_number_of_libraries",
+        type=int,
+        default=None,
+        help="The number of the first consensus libraries after which the remaining ones are skipped for the chemical "
+             "reaction SMILES strings on which the first ones agree confidently. If not specified, all of the "
+             "consensus libraries are run on all of the chemical reaction SMILES strings."
+    )
+
+    argument_parser.add_argument(
+        "-z",
+        "--consensus_early_exit_minimum_atom_mapping_score",
+        type=float,
+        default=None,
+        help="The minimum atom mapping score of each of the first consensus libraries for an early exit. If not "
+             "specified, the agreement of the first consensus libraries is sufficient."
     )
 
     argument_parser.add_argument(
@@ -28,7 +67,20 @@ def parse_arguments() -> Namespace:
         "--input_csv_dataset_file_path",
         type=str,
         required=True,
-        help="The path to the input '*.csv' dataset file."
+        help="The path to the input '*.csv' or '*.parquet' dataset file."
+    )
+
+    argument_parser.add_argument(
+        "-n",
+        "--input_dataset_file_format",
+        type=str,
+        choices=[
+            "csv",
+            "parquet"
+        ],
+        default=None,
+        help="The format of the input dataset file. If not specified, the format is inferred from the extension of the "
+             "input dataset file path."
     )
 
     argument_parser.add_argument(
@@ -36,7 +88,7 @@ def parse_arguments() -> Namespace:
         "--reaction_smiles_column_name",
         type=str,
         required=True,
-        help="The name of the chemical reaction SMILES string column in the input dataset '*.csv' file."
+        help="The name of the chemical reaction SMILES string column in the input dataset file."
     )
 
     argument_parser.add_argument(
@@ -44,7 +96,35 @@ def parse_arguments() -> Namespace:
         "--output_csv_dataset_file_path",
         type=str,
         required=True,
-        help="The path to the output '*.csv' dataset file."
+        help="The path to the output '*.csv' dataset file or '*.parquet' dataset directory. The '*.parquet' dataset "
+             "directory contains a part file per chunk."
+    )
+
+    argument_parser.add_argument(
+        "-u",
+        "--output_dataset_file_format",
+        type=str,
+        choices=[
+            "csv",
+            "parquet"
+        ],
+        default=None,
+        help="The format of the output dataset. If not specified, the format is inferred from the extension of the "
+             "output dataset path."
+    )
+
+    argument_parser.add_argument(
+        "-p",
+        "--output_mode",
+        type=str,
+        choices=[
+            "columns",
+            "sidecar"
+        ],
+        default="columns",
+        help="The indicator whether the chemical reaction atom mapping columns should be appended to all of the "
+             "columns of the input dataset file, or written to a sidecar dataset keyed by the 'row_index' column. In "
+             "the sidecar mode, only the chemical reaction SMILES string column of the input dataset file is read."
     )
 
     argument_parser.add_argument(
@@ -55,62 +135,542 @@ def parse_arguments() -> Namespace:
         help="The number of CPU cores that should be utilized."
     )
 
-    return argument_parser.parse_args()
+    argument_parser.add_argument(
+        "-w",
+        "--task_timeout_period_s",
+        type=float,
+        default=None,
+        help="The maximum amount of time in seconds that may be spent on a chemical reaction SMILES string by the "
+             "'chytorch_rxnmap' and 'epam_indigo' libraries before its worker process is killed and replaced."
+    )
+
+    argument_parser.add_argument(
+        "-v",
+        "--use_cost_based_scheduling",
+        action="store_true",
+        help="The indicator whether the chemical reaction SMILES strings should be dispatched to the worker processes "
+             "from the most to the least expensive one, based on a cost estimate from their SMILES features."
+    )
+
+    argument_parser.add_argument(
+        "-j",
+        "--heavy_reaction_cost_threshold",
+        type=float,
+        default=None,
+        help="The minimum cost estimate of the chemical reaction SMILES strings that are mapped in a separate heavy "
+             "lane if the cost-based scheduling is utilized. If not specified, the heavy lane is not utilized."
+    )
+
+    argument_parser.add_argument(
+        "-q",
+        "--heavy_reaction_task_timeout_period_s",
+        type=float,
+        default=None,
+        help="The maximum amount of time in seconds that may be spent on a chemical reaction SMILES string of the "
+             "heavy lane. If not specified, the '--task_timeout_period_s' argument is utilized."
+    )
+
+    argument_parser.add_argument(
+        "--use_shared_memory",
+        action="store_true",
+        help="The indicator whether the chemical reaction SMILES strings should be placed once in a shared memory "
+             "buffer from which the worker processes of the 'chytorch_rxnmap' and 'epam_indigo' libraries read their "
+             "index ranges, and the atom mapping results should be written to a shared memory buffer instead of being "
+             "sent back through pipes. It is ignored if the '--task_timeout_period_s' argument is specified."
+    )
+
+    argument_parser.add_argument(
+        "--strip_unchanged_compounds",
+        action="store_true",
+        help="The indicator whether the chemical compounds that appear unchanged on both sides of the chemical "
+             "reactions should be stripped before the atom mapping and restored without the atom map numbers "
+             "afterwards."
+    )
+
+    argument_parser.add_argument(
+        "--reagent_smiles_strings",
+        type=str,
+        nargs="+",
+        default=None,
+        help="The known reagent chemical compound SMILES strings, such as the solvents and the catalysts, that should "
+             "be stripped from the reactants and the agents before the atom mapping and restored without the atom map "
+             "numbers afterwards."
+    )
+
+    argument_parser.add_argument(
+        "--use_pre_validation",
+        action="store_true",
+        help="The indicator whether the chemical reaction SMILES strings should be pre-validated against the limits "
+             "of each library before the atom mapping. The rejected chemical reaction SMILES strings are not mapped, "
+             "and their rejection reason codes are written to the '{library}_pre_validation_rejection_reason' column."
+    )
+
+    argument_parser.add_argument(
+        "--pre_validation_maximum_number_of_tokens",
+        type=int,
+        default=None,
+        help="The maximum number of tokens of the chemical reaction SMILES strings. If not specified, the limit of "
+             "each library is utilized."
+    )
+
+    argument_parser.add_argument(
+        "--pre_validation_maximum_number_of_atoms",
+        type=int,
+        default=None,
+        help="The maximum number of atoms of the chemical reaction SMILES strings. If not specified, the limit of each "
+             "library is utilized."
+    )
+
+    argument_parser.add_argument(
+        "--pre_validation_maximum_number_of_compounds",
+        type=int,
+        default=None,
+        help="The maximum number of the chemical compounds of the chemical reaction SMILES strings. If not specified, "
+             "the limit of each library is utilized."
+    )
+
+    argument_parser.add_argument(
+        "-b",
+        "--chytorch_rxnmap_model_batch_size",
+        type=int,
+        default=None,
+        help="The number of chemical reaction SMILES strings that are passed through the Chytorch RxnMap model in a "
+             "single forward pass. If not specified, each chemical reaction SMILES string is passed separately."
+    )
+
+    argument_parser.add_argument(
+        "-t",
+        "--rxnmapper_model_batch_token_budget",
+        type=int,
+        default=None,
+        help="The maximum number of padded tokens per RXNMapper model batch. If specified, the chemical reaction "
+             "SMILES strings are batched by length within the token budget instead of by a fixed batch size."
+    )
+
+    argument_parser.add_argument(
+        "--rxnmapper_model_quantization",
+        type=str,
+        choices=[
+            "dynamic_int8",
+        ],
+        default=None,
+        help="The quantization mode of the RXNMapper model for the CPU inference. If not specified, the full-precision "
+             "RXNMapper model is utilized."
+    )
+
+    argument_parser.add_argument(
+        "-k",
+        "--chunk_size",
+        type=int,
+        default=None,
+        help="The number of rows of the input dataset file that should be read, mapped and appended to the output "
+             "dataset at a time. If not specified, the whole dataset is processed at once."
+    )
+
+    argument_parser.add_argument(
+        "-m",
+        "--run_manifest_file_path",
+        type=str,
+        default=None,
+        help="The path to the run manifest '*.json' file that records the last committed chunk. If not specified, the "
+             "path to the output dataset with the '.manifest.json' suffix is utilized."
+    )
+
+    argument_parser.add_argument(
+        "-r",
+        "--resume",
+        action="store_true",
+        help="The indicator whether the run should be resumed from the last committed chunk of the run manifest."
+    )
+
+    argument_parser.add_argument(
+        "-d",
+        "--deduplication_mode",
+        type=str,
+        choices=[
+            "exact",
+            "canonical"
+        ],
+        default=None,
+        help="The indicator how the duplicate chemical reaction SMILES strings should be identified and mapped only "
+             "once. If not specified, the chemical reaction SMILES strings are not deduplicated."
+    )
+
+    argument_parser.add_argument(
+        "-a",
+        "--atom_mapping_cache_file_path",
+        type=str,
+        default=None,
+        help="The path to the chemical reaction atom mapping result cache SQLite database file that should be "
+             "consulted before the library is utilized. If not specified, the cache is not utilized."
+    )
+
+    argument_parser.add_argument(
+        "-e",
+        "--atom_mapping_cache_maximum_number_of_entries",
+        type=int,
+        default=None,
+        help="The maximum number of entries of the chemical reaction atom mapping result cache."
+    )
+
+    argument_parser.add_argument(
+        "-x",
+        "--metrics_file_path",
+        type=str,
+        default=None,
+        help="The path to the file to which the per-stage timers and counters are exported after each chunk. If not "
+             "specified, the instrumentation is disabled."
+    )
+
+    argument_parser.add_argument(
+        "-f",
+        "--metrics_file_format",
+        type=str,
+        choices=[
+            "json_lines",
+            "prometheus_text"
+        ],
+        default="json_lines",
+        help="The format of the metrics file: a JSON-lines snapshot per export, or a Prometheus text exposition format "
+             "file that is overwritten per export."
+    )
+
+    script_arguments = argument_parser.parse_args()
+
+    if (script_arguments.library is None) == (script_arguments.consensus_libraries is None):
+        argument_parser.error("Exactly one of the '--library' and '--consensus_libraries' arguments is required.")
+
+    return script_arguments
+
+
+def get_run_manifest_options(
+        script_arguments: Namespace
+) -> Dict[str, Any]:
+    """
+    Get the 'run_atom_mapping_on_csv_dataset' script arguments that affect the content of the output dataset, and that
+    must therefore be identical for a run to be resumed. The arguments that only affect the performance of the run,
+    such as the number of CPU cores, the batch sizes, the scheduling, the deduplication and the caching, are not
+    included.
+
+    :parameter script_arguments: The 'run_atom_mapping_on_csv_dataset' script arguments.
+
+    :returns: The run manifest options.
+    """
+
+    return {
+        script_argument_name: vars(script_arguments)[script_argument_name]
+        for script_argument_name in [
+            "consensus_early_exit_minimum_atom_mapping_score",
+            "consensus_early_exit_number_of_libraries",
+            "consensus_libraries",
+            "heavy_reaction_cost_threshold",
+            "heavy_reaction_task_timeout_period_s",
+            "output_mode",
+            "pre_validation_maximum_number_of_atoms",
+            "pre_validation_maximum_number_of_compounds",
+            "pre_validation_maximum_number_of_tokens",
+            "reaction_smiles_column_name",
+            "reagent_smiles_strings",
+            "rxnmapper_model_quantization",
+            "strip_unchanged_compounds",
+            "task_timeout_period_s",
+            "use_pre_validation",
+        ]
+    }
+
+
+def get_atom_mapper(
+        script_arguments: Namespace,
+        library: str
+) -> ReactionAtomMapper:
+    """
+    Get the chemical reaction atom mapper of a library from the backend registry.
+
+    :parameter script_arguments: The 'run_atom_mapping_on_csv_dataset' script arguments.
+    :parameter library: The indicator of the chemical reaction atom mapping library.
+
+    :returns: The chemical reaction atom mapper of the library.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    #  The spectator compound stripping options are only passed if they are specified, so the chemical reaction atom
+    #  mapping results that are already cached without them remain valid.
+    # ------------------------------------------------------------------------------------------------------------------
+
+    atom_mapping_options = dict()
+
+    if script_arguments.strip_unchanged_compounds:
+        atom_mapping_options["strip_unchanged_compounds"] = True
+
+    if script_arguments.reagent_smiles_strings is not None:
+        atom_mapping_options["reagent_smiles_strings"] = script_arguments.reagent_smiles_strings
+
+    if library == "rxnmapper":
+        return BackendRegistryUtilities.get_atom_mapper(
+            library=library,
+            rxnmapper_model_batch_token_budget=script_arguments.rxnmapper_model_batch_token_budget,
+            rxnmapper_model_quantization=script_arguments.rxnmapper_model_quantization,
+            **atom_mapping_options
+        )
+
+    return BackendRegistryUtilities.get_atom_mapper(
+        library=library,
+        **atom_mapping_options
+    )
+
+
+def run_atom_mapping_on_csv_dataset_chunk(
+        csv_dataset_chunk: DataFrame,
+        script_arguments: Namespace,
+        atom_mappers: List[ReactionAtomMapper],
+        atom_mapping_cache: Optional[AtomMappingResultCache] = None
+) -> DataFrame:
+    """
+    Run the chemical reaction atom mapping on a chunk of the input dataset file.
+
+    :parameter csv_dataset_chunk: The chunk of the input dataset file.
+    :parameter script_arguments: The 'run_atom_mapping_on_csv_dataset' script arguments.
+    :parameter atom_mappers: The chemical reaction atom mappers of the library or of the consensus libraries.
+    :parameter atom_mapping_cache: The chemical reaction atom mapping result cache.
+
+    :returns: The chunk of the input dataset file extended with the chemical reaction atom mapping columns, or the
+              sidecar chunk of the chemical reaction atom mapping columns keyed by the 'row_index' column.
+    """
+
+    map_batch_arguments = {
+        "number_of_cpu_cores": script_arguments.number_of_cpu_cores,
+        "task_timeout_period_s": script_arguments.task_timeout_period_s,
+        "deduplication_mode": script_arguments.deduplication_mode,
+        "atom_mapping_cache": atom_mapping_cache,
+        "use_cost_based_scheduling": script_arguments.use_cost_based_scheduling,
+        "heavy_reaction_cost_threshold": script_arguments.heavy_reaction_cost_threshold,
+        "heavy_reaction_task_timeout_period_s": script_arguments.heavy_reaction_task_timeout_period_s,
+        "use_pre_validation": script_arguments.use_pre_validation,
+        "pre_validation_limits": {
+            "maximum_number_of_tokens": script_arguments.pre_validation_maximum_number_of_tokens,
+            "maximum_number_of_atoms": script_arguments.pre_validation_maximum_number_of_atoms,
+            "maximum_number_of_compounds": script_arguments.pre_validation_maximum_number_of_compounds,
+        },
+        "use_shared_memory": script_arguments.use_shared_memory,
+    }
+
+    batch_sizes = {
+        "chytorch_rxnmap": script_arguments.chytorch_rxnmap_model_batch_size,
+    }
+
+    if script_arguments.consensus_libraries is not None:
+        atom_mapping_outputs, atom_mapping_agreements = \
+            ConsensusReactionAtomMappingUtilities.run_consensus_atom_mapping_on_reaction_smiles_strings(
+                reaction_smiles_strings=csv_dataset_chunk[script_arguments.reaction_smiles_column_name],
+                atom_mappers=atom_mappers,
+                early_exit_number_of_atom_mappers=script_arguments.consensus_early_exit_number_of_libraries,
+                early_exit_minimum_atom_mapping_score=script_arguments.consensus_early_exit_minimum_atom_mapping_score,
+                batch_sizes=batch_sizes,
+                **map_batch_arguments
+            )
+
+    else:
+        atom_mapping_outputs, atom_mapping_agreements = {
+            atom_mapper.library: atom_mapper.map_batch(
+                reaction_smiles_strings=csv_dataset_chunk[script_arguments.reaction_smiles_column_name],
+                batch_size=batch_sizes.get(atom_mapper.library),
+                **map_batch_arguments
+            ) for atom_mapper in atom_mappers
+        }, None
+
+    for atom_mapper in atom_mappers:
+        csv_dataset_chunk["{0}_mapped_reaction_smiles".format(atom_mapper.library)], \
+            csv_dataset_chunk["{0}_{1}".format(atom_mapper.library, atom_mapper.atom_mapping_score_name)] = \
+            list(zip(*atom_mapping_outputs[atom_mapper.library]))
+
+        if script_arguments.use_pre_validation:
+            csv_dataset_chunk["{0}_pre_validation_rejection_reason".format(atom_mapper.library)] = \
+                atom_mapper.pre_validation_rejection_reasons
+
+    if atom_mapping_agreements is not None:
+        csv_dataset_chunk["consensus_atom_mapping_indicator"] = atom_mapping_agreements
+
+    if script_arguments.output_mode == "sidecar":
+        csv_dataset_chunk = csv_dataset_chunk.drop(columns=[script_arguments.reaction_smiles_column_name, ])
+
+        csv_dataset_chunk.insert(0, "row_index", csv_dataset_chunk.index)
+
+    return csv_dataset_chunk
 
 
 if __name__ == "__main__":
     script_arguments = parse_arguments()
 
-    csv_dataset = read_csv(
-        filepath_or_buffer=script_arguments.input_csv_dataset_file_path
+    input_dataset_file_format = DatasetIoUtilities.get_dataset_file_format(
+        dataset_file_path=script_arguments.input_csv_dataset_file_path,
+        dataset_file_format=script_arguments.input_dataset_file_format
     )
 
-    if script_arguments.library == "chytorch_rxnmap":
-        from chemical_reaction_atom_mapping.chytorch_rxnmap import ChytorchRxnMapReactionAtomMappingUtilities
+    output_dataset_file_format = DatasetIoUtilities.get_dataset_file_format(
+        dataset_file_path=script_arguments.output_csv_dataset_file_path,
+        dataset_file_format=script_arguments.output_dataset_file_format
+    )
 
-        chytorch_rxnmap_atom_mapping_outputs = \
-            ChytorchRxnMapReactionAtomMappingUtilities.run_atom_mapping_on_reaction_smiles_strings(
-                reaction_smiles_strings=csv_dataset[script_arguments.reaction_smiles_column_name].values
-            )
+    run_manifest_file_path = script_arguments.run_manifest_file_path \
+        if script_arguments.run_manifest_file_path is not None \
+        else "{0}.manifest.json".format(script_arguments.output_csv_dataset_file_path)
 
-        csv_dataset["chytorch_rxnmap_mapped_reaction_smiles"], csv_dataset["chytorch_rxnmap_atom_mapping_score"] = \
-            list(zip(*chytorch_rxnmap_atom_mapping_outputs))
+    run_manifest = {
+        "input_csv_dataset_file_path": abspath(script_arguments.input_csv_dataset_file_path),
+        "input_csv_dataset_file_hash": CheckpointingUtilities.get_file_hash(
+            file_path=script_arguments.input_csv_dataset_file_path
+        ),
+        "library": script_arguments.library,
+        "options": get_run_manifest_options(
+            script_arguments=script_arguments
+        ),
+        "output_dataset_file_format": output_dataset_file_format,
+        "last_committed_row_offset": 0,
+        "last_committed_output_file_size": 0,
+        "completed": False,
+    }
 
-        csv_dataset.to_csv(
-            path_or_buf=script_arguments.output_csv_dataset_file_path,
-            index=False
+    if script_arguments.resume:
+        previous_run_manifest = CheckpointingUtilities.load_run_manifest(
+            run_manifest_file_path=run_manifest_file_path
         )
 
-    elif script_arguments.library == "epam_indigo":
-        from chemical_reaction_atom_mapping.epam_indigo import EpamIndigoReactionAtomMappingUtilities
+        if previous_run_manifest is None or not exists(script_arguments.output_csv_dataset_file_path):
+            print("The run manifest or the output dataset does not exist. Starting a new run.")
+
+        # --------------------------------------------------------------------------------------------------------------
+        #  Only the current run manifest options are compared, so the run manifests that also recorded the options that
+        #  do not affect the content of the output dataset can still be resumed.
+        # --------------------------------------------------------------------------------------------------------------
 
-        epam_indigo_atom_mapping_outputs = \
-            EpamIndigoReactionAtomMappingUtilities.run_atom_mapping_on_reaction_smiles_strings(
-                reaction_smiles_strings=csv_dataset[script_arguments.reaction_smiles_column_name],
-                number_of_cpu_cores=script_arguments.number_of_cpu_cores
+        elif any(previous_run_manifest[run_manifest_key] != run_manifest[run_manifest_key] for run_manifest_key in [
+            "input_csv_dataset_file_hash",
+            "library",
+        ]) or any(
+            previous_run_manifest["options"].get(run_manifest_option_name) != run_manifest_option_value
+            for run_manifest_option_name, run_manifest_option_value in run_manifest["options"].items()
+        ) or previous_run_manifest.get("output_dataset_file_format", "csv") != output_dataset_file_format:
+            raise ValueError(
+                "The input dataset file, the output dataset format, the library or the options of the run differ from "
+                "the run manifest '{0}'. Please start a new run instead.".format(run_manifest_file_path)
             )
 
-        csv_dataset["epam_indigo_mapped_reaction_smiles"], csv_dataset["epam_indigo_atom_mapping_status_indicator"] = \
-            list(zip(*epam_indigo_atom_mapping_outputs))
+        elif previous_run_manifest["completed"]:
+            print("The run recorded in the run manifest '{0}' is already completed.".format(
+                run_manifest_file_path
+            ))
 
-        csv_dataset.to_csv(
-            path_or_buf=script_arguments.output_csv_dataset_file_path,
-            index=False
-        )
+            exit(0)
+
+        else:
+            run_manifest = previous_run_manifest
 
-    elif script_arguments.library == "rxnmapper":
-        from chemical_reaction_atom_mapping.rxnmapper import RxnMapperReactionAtomMappingUtilities
+            # ----------------------------------------------------------------------------------------------------------
+            #  Any rows that were appended to the output dataset after the last committed chunk belong to an interrupted
+            #  chunk, and they are discarded before the run is resumed. The size of the output dataset is the size of
+            #  the '*.csv' dataset file in bytes, or the number of part files of the '*.parquet' dataset directory.
+            # ----------------------------------------------------------------------------------------------------------
 
-        rxnmapper_atom_mapping_outputs = \
-            RxnMapperReactionAtomMappingUtilities.run_atom_mapping_on_reaction_smiles_strings(
-                reaction_smiles_strings=csv_dataset[script_arguments.reaction_smiles_column_name],
-                number_of_reaction_smiles_strings=len(csv_dataset[script_arguments.reaction_smiles_column_name])
+            DatasetIoUtilities.discard_uncommitted_dataset_chunks(
+                dataset_file_path=script_arguments.output_csv_dataset_file_path,
+                dataset_file_format=output_dataset_file_format,
+                dataset_size=run_manifest["last_committed_output_file_size"]
             )
 
-        csv_dataset["rxnmapper_mapped_reaction_smiles"], csv_dataset["rxnmapper_atom_mapping_confidence_score"] = \
-            list(zip(*rxnmapper_atom_mapping_outputs))
+            print("Resuming the run from the row offset {0}.".format(run_manifest["last_committed_row_offset"]))
+
+    if run_manifest["last_committed_row_offset"] == 0:
+        DatasetIoUtilities.discard_uncommitted_dataset_chunks(
+            dataset_file_path=script_arguments.output_csv_dataset_file_path,
+            dataset_file_format=output_dataset_file_format,
+            dataset_size=0
+        )
+
+    CheckpointingUtilities.save_run_manifest(
+        run_manifest_file_path=run_manifest_file_path,
+        run_manifest=run_manifest
+    )
+
+    # ------------------------------------------------------------------------------------------------------------------
+    #  If the chunk size is specified, the input dataset file is streamed in chunks and each mapped chunk is appended to
+    #  the output dataset, which keeps the memory usage independent of the dataset size. Each appended chunk is
+    #  committed to the run manifest, which allows the run to be resumed if it is interrupted.
+    # ------------------------------------------------------------------------------------------------------------------
+
+    csv_dataset_chunks = DatasetIoUtilities.iterate_dataset_chunks(
+        dataset_file_path=script_arguments.input_csv_dataset_file_path,
+        dataset_file_format=input_dataset_file_format,
+        column_names=[
+            script_arguments.reaction_smiles_column_name,
+        ] if script_arguments.output_mode == "sidecar" else None,
+        chunk_size=script_arguments.chunk_size,
+        row_offset=run_manifest["last_committed_row_offset"]
+    )
+
+    atom_mappers = [
+        get_atom_mapper(
+            script_arguments=script_arguments,
+            library=library
+        ) for library in (
+            script_arguments.consensus_libraries if script_arguments.consensus_libraries is not None
+            else [script_arguments.library, ]
+        )
+    ]
 
-        csv_dataset.to_csv(
-            path_or_buf=script_arguments.output_csv_dataset_file_path,
-            index=False
+    atom_mapping_cache = AtomMappingResultCache(
+        cache_file_path=script_arguments.atom_mapping_cache_file_path,
+        maximum_number_of_entries=script_arguments.atom_mapping_cache_maximum_number_of_entries
+    ) if script_arguments.atom_mapping_cache_file_path is not None else None
+
+    if script_arguments.metrics_file_path is not None:
+        InstrumentationUtilities.enable()
+
+        metrics_sink = JsonLinesMetricsSink(
+            file_path=script_arguments.metrics_file_path
+        ) if script_arguments.metrics_file_format == "json_lines" else PrometheusTextMetricsSink(
+            file_path=script_arguments.metrics_file_path
+        )
+
+    else:
+        metrics_sink = None
+
+    for csv_dataset_chunk in csv_dataset_chunks:
+        DatasetIoUtilities.append_dataset_chunk(
+            dataset_chunk=run_atom_mapping_on_csv_dataset_chunk(
+                csv_dataset_chunk=csv_dataset_chunk,
+                script_arguments=script_arguments,
+                atom_mappers=atom_mappers,
+                atom_mapping_cache=atom_mapping_cache
+            ),
+            dataset_file_path=script_arguments.output_csv_dataset_file_path,
+            dataset_file_format=output_dataset_file_format
         )
+
+        run_manifest["last_committed_output_file_size"] = DatasetIoUtilities.get_dataset_size(
+            dataset_file_path=script_arguments.output_csv_dataset_file_path,
+            dataset_file_format=output_dataset_file_format
+        )
+
+        run_manifest["last_committed_row_offset"] += len(csv_dataset_chunk)
+
+        CheckpointingUtilities.save_run_manifest(
+            run_manifest_file_path=run_manifest_file_path,
+            run_manifest=run_manifest
+        )
+
+        if metrics_sink is not None:
+            InstrumentationUtilities.export(
+                metrics_sink=metrics_sink
+            )
+
+    if atom_mapping_cache is not None:
+        print("Atom Mapping Cache Statistics: {0}".format(atom_mapping_cache.get_statistics()))
+
+        atom_mapping_cache.close()
+
+    run_manifest["completed"] = True
+
+    CheckpointingUtilities.save_run_manifest(
+        run_manifest_file_path=run_manifest_file_path,
+        run_manifest=run_manifest
+    )
@@ -2,6 +2,8 @@
 
 from argparse import ArgumentParser, Namespace
 
+from chemical_reaction_atom_mapping.utilities.backend_registry import BackendRegistryUtilities
+
 
 def parse_arguments() -> Namespace:
     """ Parse the 'run_atom_mapping_on_reaction_smiles' script arguments. """
@@ -12,11 +14,7 @@ def parse_arguments() -> Namespace:
         "-l",
         "--library",
         type=str,
-        choices=[
-            "chytorch_rxnmap",
-            "epam_indigo",
-            "rxnmapper"
-        ],
+        choices=BackendRegistryUtilities.get_backend_names(),
         required=True,
         help="The indicator of the chemical reaction atom mapping library that should be utilized."
     )
@@ -25,8 +23,39 @@ def parse_arguments() -> Namespace:
         "-s",
         "--reaction_smiles",
         type=str,
+        nargs="+",
         required=True,
-        help="The chemical reaction SMILES string."
+        help="The chemical reaction SMILES string(s). The model of the library is loaded only once for all of them."
+    )
+
+    argument_parser.add_argument(
+        "-u",
+        "--strip_unchanged_compounds",
+        action="store_true",
+        help="The indicator whether the chemical compounds that appear unchanged on both sides of the chemical "
+             "reaction should be stripped before the atom mapping and restored without the atom map numbers "
+             "afterwards."
+    )
+
+    argument_parser.add_argument(
+        "-g",
+        "--reagent_smiles_strings",
+        type=str,
+        nargs="+",
+        default=None,
+        help="The known reagent chemical compound SMILES strings, such as the solvents and the catalysts, that should "
+             "be stripped from the reactants and the agents before the atom mapping and restored without the atom map "
+             "numbers afterwards."
+    )
+
+    argument_parser.add_argument(
+        "-a",
+        "--server_address",
+        type=str,
+        default=None,
+        help="The address of a running 'run_atom_mapping_server' script of the form 'unix:/path/to/socket' or "
+             "'host:port'. If specified, the warm library of the server is utilized instead of loading it locally, "
+             "and the spectator compounds are not stripped."
     )
 
     return argument_parser.parse_args()
@@ -35,40 +64,55 @@ def parse_arguments() -> Namespace:
 if __name__ == "__main__":
     script_arguments = parse_arguments()
 
-    if script_arguments.library == "chytorch_rxnmap":
-        from chemical_reaction_atom_mapping.chytorch_rxnmap import ChytorchRxnMapReactionAtomMappingUtilities
+    atom_mapper_class = BackendRegistryUtilities.get_atom_mapper_class(
+        library=script_arguments.library
+    )
 
-        chytorch_rxnmap_mapped_reaction_smiles, chytorch_rxnmap_atom_mapping_score = \
-            ChytorchRxnMapReactionAtomMappingUtilities.run_atom_mapping_on_reaction_smiles(
-                reaction_smiles=script_arguments.reaction_smiles
-            )
+    if script_arguments.server_address is not None:
+        from chemical_reaction_atom_mapping.server import AtomMappingClient
 
-        print("Reaction SMILES: '{0}'".format(script_arguments.reaction_smiles))
-        print("Mapped Reaction SMILES (Chytorch RxnMap): '{0}'".format(chytorch_rxnmap_mapped_reaction_smiles))
-        print("Atom Mapping Score (Chytorch RxnMap): {0}".format(chytorch_rxnmap_atom_mapping_score))
+        atom_mapping_outputs = AtomMappingClient(
+            server_address=script_arguments.server_address
+        ).run_atom_mapping_on_reaction_smiles_strings(
+            library=script_arguments.library,
+            reaction_smiles_strings=script_arguments.reaction_smiles
+        )
 
-    elif script_arguments.library == "epam_indigo":
-        from chemical_reaction_atom_mapping.epam_indigo import EpamIndigoReactionAtomMappingUtilities
+    else:
+        # --------------------------------------------------------------------------------------------------------------
+        #  The models of the backends that need one are loaded only once through the process-wide model registry, and
+        #  they are shared by all of the chemical reaction SMILES strings until they are explicitly released.
+        # --------------------------------------------------------------------------------------------------------------
 
-        epam_indigo_mapped_reaction_smiles, epam_indigo_atom_mapping_status_indicator = \
-            EpamIndigoReactionAtomMappingUtilities.run_atom_mapping_on_reaction_smiles(
-                reaction_smiles=script_arguments.reaction_smiles
-            )
+        atom_mapping_options = dict()
 
-        print("Reaction SMILES: '{0}'".format(script_arguments.reaction_smiles))
-        print("Mapped Reaction SMILES (EPAM Indigo): '{0}'".format(epam_indigo_mapped_reaction_smiles))
-        print("Atom Mapping Procedure Completed without Errors (EPAM Indigo): {0}".format(
-            epam_indigo_atom_mapping_status_indicator
-        ))
+        if script_arguments.strip_unchanged_compounds:
+            atom_mapping_options["strip_unchanged_compounds"] = True
 
-    elif script_arguments.library == "rxnmapper":
-        from chemical_reaction_atom_mapping.rxnmapper import RxnMapperReactionAtomMappingUtilities
+        if script_arguments.reagent_smiles_strings is not None:
+            atom_mapping_options["reagent_smiles_strings"] = script_arguments.reagent_smiles_strings
 
-        rxnmapper_mapped_reaction_smiles, rxnmapper_atom_mapping_confidence_score = \
-            RxnMapperReactionAtomMappingUtilities.run_atom_mapping_on_reaction_smiles(
-                reaction_smiles=script_arguments.reaction_smiles
-            )
+        atom_mapper = atom_mapper_class(**atom_mapping_options)
 
-        print("Reaction SMILES: '{0}'".format(script_arguments.reaction_smiles))
-        print("Mapped Reaction SMILES (RXNMapper): '{0}'".format(rxnmapper_mapped_reaction_smiles))
-        print("Atom Mapping Confidence Score (RXNMapper): {0}".format(rxnmapper_atom_mapping_confidence_score))
+        atom_mapping_outputs = [
+            atom_mapper.map_one(
+                reaction_smiles=reaction_smiles
+            ) for reaction_smiles in script_arguments.reaction_smiles
+        ]
+
+        atom_mapper.release()
+
+    for reaction_smiles, (mapped_reaction_smiles, atom_mapping_score) in zip(
+        script_arguments.reaction_smiles,
+        atom_mapping_outputs
+    ):
+        print("Reaction SMILES: '{0}'".format(reaction_smiles))
+        print("Mapped Reaction SMILES ({0}): '{1}'".format(
+            atom_mapper_class.library_display_name,
+            mapped_reaction_smiles
+        ))
+        print("{0} ({1}): {2}".format(
+            atom_mapper_class.atom_mapping_score_display_name,
+            atom_mapper_class.library_display_name,
+            atom_mapping_score
+        ))
@@ -0,0 +1,82 @@
+""" The 'scripts' directory 'run_atom_mapping_server' script. """
+
+from argparse import ArgumentParser, Namespace
+
+from chemical_reaction_atom_mapping.server import AtomMappingServer
+from chemical_reaction_atom_mapping.utilities.backend_registry import BackendRegistryUtilities
+
+
+def parse_arguments() -> Namespace:
+    """ Parse the 'run_atom_mapping_server' script arguments. """
+
+    argument_parser = ArgumentParser()
+
+    argument_parser.add_argument(
+        "-l",
+        "--libraries",
+        type=str,
+        nargs="+",
+        choices=BackendRegistryUtilities.get_backend_names(),
+        required=True,
+        help="The indicators of the chemical reaction atom mapping libraries that should be kept warm and served."
+    )
+
+    argument_parser.add_argument(
+        "-a",
+        "--server_address",
+        type=str,
+        default="unix:/tmp/chemical_reaction_atom_mapping.sock",
+        help="The server address of the form 'unix:/path/to/socket' or 'host:port'."
+    )
+
+    argument_parser.add_argument(
+        "-b",
+        "--maximum_batch_size",
+        type=int,
+        default=32,
+        help="The maximum number of chemical reaction SMILES strings per micro-batch."
+    )
+
+    argument_parser.add_argument(
+        "-w",
+        "--maximum_batch_wait_time_ms",
+        type=float,
+        default=5.0,
+        help="The maximum amount of time in milliseconds that the first request of a micro-batch waits for further "
+             "requests."
+    )
+
+    argument_parser.add_argument(
+        "-c",
+        "--number_of_cpu_cores",
+        type=int,
+        default=1,
+        help="The number of worker processes of each of the 'chytorch_rxnmap' and 'epam_indigo' libraries, which are "
+             "started once and reused by all of the micro-batches."
+    )
+
+    argument_parser.add_argument(
+        "-t",
+        "--task_timeout_period_s",
+        type=float,
+        default=None,
+        help="The maximum amount of time in seconds that may be spent on a chemical reaction SMILES string by the "
+             "'chytorch_rxnmap' and 'epam_indigo' libraries before its worker process is killed and replaced. If not "
+             "specified and only one CPU core is utilized, the micro-batches are mapped in the thread of each library."
+    )
+
+    return argument_parser.parse_args()
+
+
+if __name__ == "__main__":
+    script_arguments = parse_arguments()
+
+    AtomMappingServer(
+        libraries=script_arguments.libraries,
+        maximum_batch_size=script_arguments.maximum_batch_size,
+        maximum_batch_wait_time_ms=script_arguments.maximum_batch_wait_time_ms,
+        number_of_cpu_cores=script_arguments.number_of_cpu_cores,
+        task_timeout_period_s=script_arguments.task_timeout_period_s
+    ).run(
+        server_address=script_arguments.server_address
+    )
@@ -0,0 +1,15 @@
+#!/bin/bash
+
+export PYTHONPATH=$PYTHONPATH:"/path/to/project/root/directory"
+
+export LIBRARIES="chytorch_rxnmap epam_indigo rxnmapper"
+export SERVER_ADDRESS="unix:/tmp/chemical_reaction_atom_mapping.sock"
+export MAXIMUM_BATCH_SIZE=32
+export MAXIMUM_BATCH_WAIT_TIME_MS=5
+
+
+python "$(cd -P "$(dirname "${BASH_SOURCE[0]}")" && pwd)"/run_atom_mapping_server.py \
+        --libraries $LIBRARIES \
+        --server_address $SERVER_ADDRESS \
+        --maximum_batch_size $MAXIMUM_BATCH_SIZE \
+        --maximum_batch_wait_time_ms $MAXIMUM_BATCH_WAIT_TIME_MS
@@ -0,0 +1,211 @@
+""" The 'run_import_time_benchmark' script. """
+
+from argparse import ArgumentParser, Namespace
+from json import dump, dumps, loads
+from os import environ, pathsep
+from os.path import abspath, dirname
+from statistics import median
+from subprocess import run
+from sys import executable, exit, stderr
+from typing import Any, Dict, List
+
+
+def parse_arguments() -> Namespace:
+    """ Parse the 'run_import_time_benchmark' script arguments. """
+
+    argument_parser = ArgumentParser()
+
+    argument_parser.add_argument(
+        "-m",
+        "--module_names",
+        type=str,
+        nargs="+",
+        default=[
+            "chemical_reaction_atom_mapping",
+            "chemical_reaction_atom_mapping.chytorch_rxnmap",
+            "chemical_reaction_atom_mapping.epam_indigo",
+            "chemical_reaction_atom_mapping.rxnmapper",
+            "chemical_reaction_atom_mapping.server",
+            "chemical_reaction_atom_mapping.utilities.backend_registry",
+        ],
+        help="The names of the modules whose import time should be benchmarked."
+    )
+
+    argument_parser.add_argument(
+        "-f",
+        "--heavy_module_names",
+        type=str,
+        nargs="+",
+        default=[
+            "chython",
+            "chytorch",
+            "indigo",
+            "rdkit",
+            "rxnmapper",
+            "torch",
+            "transformers",
+        ],
+        help="The names of the heavy framework modules that the benchmarked modules must not import at load time."
+    )
+
+    argument_parser.add_argument(
+        "-r",
+        "--number_of_repetitions",
+        type=int,
+        default=5,
+        help="The number of fresh Python interpreter processes in which each module is imported."
+    )
+
+    argument_parser.add_argument(
+        "-t",
+        "--maximum_import_time_s",
+        type=float,
+        default=None,
+        help="The maximum median import time in seconds of each module. If specified, the script exits with a non-zero "
+             "status code once it is exceeded."
+    )
+
+    argument_parser.add_argument(
+        "-o",
+        "--output_json_file_path",
+        type=str,
+        default=None,
+        help="The path to the output '*.json' import time benchmark report file. If not specified, the report is "
+             "printed to the standard output."
+    )
+
+    return argument_parser.parse_args()
+
+
+def get_module_import_time_sample(
+        module_name: str,
+        heavy_module_names: List[str]
+) -> Dict[str, Any]:
+    """
+    Import a module in a fresh Python interpreter process with the '-X importtime' option.
+
+    :parameter module_name: The name of the module.
+    :parameter heavy_module_names: The names of the heavy framework modules.
+
+    :returns: The cumulative import time of the module in seconds, and the names of the heavy framework modules that
+              were imported along with it.
+    """
+
+    project_root_directory_path = dirname(dirname(abspath(__file__)))
+
+    completed_process = run(
+        [
+            executable,
+            "-X",
+            "importtime",
+            "-c",
+            "import json, sys; import {0}; print(json.dumps(sorted(set({1}).intersection(sys.modules.keys()))))".format(
+                module_name,
+                repr(heavy_module_names)
+            ),
+        ],
+        capture_output=True,
+        text=True,
+        env={
+            **environ,
+            "PYTHONPATH": pathsep.join(filter(None, [project_root_directory_path, environ.get("PYTHONPATH"), ])),
+        },
+        check=True
+    )
+
+    cumulative_import_time_us = None
+
+    for import_time_line in completed_process.stderr.splitlines():
+        if not import_time_line.startswith("import time:"):
+            continue
+
+        import_time_line_fields = import_time_line[len("import time:"):].split("|")
+
+        if import_time_line_fields[2].strip() == module_name:
+            cumulative_import_time_us = int(import_time_line_fields[1])
+
+    return {
+        "import_time_s": cumulative_import_time_us / 1e6 if cumulative_import_time_us is not None else 0.0,
+        "heavy_modules_imported": loads(completed_process.stdout.strip().splitlines()[-1]),
+    }
+
+
+def run_import_time_benchmark(
+        module_name: str,
+        heavy_module_names: List[str],
+        number_of_repetitions: int
+) -> Dict[str, Any]:
+    """
+    Run the import time benchmark of a module.
+
+    :parameter module_name: The name of the module.
+    :parameter heavy_module_names: The names of the heavy framework modules.
+    :parameter number_of_repetitions: The number of fresh Python interpreter processes in which the module is imported.
+
+    :returns: The import time benchmark record of the module.
+    """
+
+    import_time_samples = [
+        get_module_import_time_sample(
+            module_name=module_name,
+            heavy_module_names=heavy_module_names
+        ) for _ in range(max(number_of_repetitions, 1))
+    ]
+
+    import_times_s = [import_time_sample["import_time_s"] for import_time_sample in import_time_samples]
+
+    return {
+        "module_name": module_name,
+        "number_of_repetitions": len(import_time_samples),
+        "median_import_time_s": median(import_times_s),
+        "minimum_import_time_s": min(import_times_s),
+        "maximum_import_time_s": max(import_times_s),
+        "heavy_modules_imported": sorted(set().union(*(
+            import_time_sample["heavy_modules_imported"] for import_time_sample in import_time_samples
+        ))),
+    }
+
+
+if __name__ == "__main__":
+    script_arguments = parse_arguments()
+
+    benchmark_records = list()
+    regressions = list()
+
+    for module_name in script_arguments.module_names:
+        benchmark_records.append(run_import_time_benchmark(
+            module_name=module_name,
+            heavy_module_names=script_arguments.heavy_module_names,
+            number_of_repetitions=script_arguments.number_of_repetitions
+        ))
+
+        print(dumps(benchmark_records[-1]), file=stderr)
+
+        if len(benchmark_records[-1]["heavy_modules_imported"]) > 0:
+            regressions.append("The '{0}' module imports the heavy framework modules {1} at load time.".format(
+                module_name,
+                benchmark_records[-1]["heavy_modules_imported"]
+            ))
+
+        if script_arguments.maximum_import_time_s is not None and \
+                benchmark_records[-1]["median_import_time_s"] > script_arguments.maximum_import_time_s:
+            regressions.append("The median import time of the '{0}' module is {1:.3f} seconds.".format(
+                module_name,
+                benchmark_records[-1]["median_import_time_s"]
+            ))
+
+    benchmark_report = {
+        "python_executable": executable,
+        "benchmarks": benchmark_records,
+        "regressions": regressions,
+    }
+
+    if script_arguments.output_json_file_path is not None:
+        with open(script_arguments.output_json_file_path, mode="w") as output_json_file_handle:
+            dump(benchmark_report, output_json_file_handle, indent=4)
+
+    else:
+        print(dumps(benchmark_report, indent=4))
+
+    if len(regressions) > 0:
+        exit(1)
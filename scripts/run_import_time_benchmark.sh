@@ -0,0 +1,13 @@
+#!/bin/bash
+
+export PYTHONPATH=$PYTHONPATH:"/path/to/project/root/directory"
+
+export NUMBER_OF_REPETITIONS=5
+export MAXIMUM_IMPORT_TIME_S=0.5
+export OUTPUT_JSON_FILE_PATH="/path/to/output/json/import/time/benchmark/report/file.json"
+
+
+python "$(cd -P "$(dirname "${BASH_SOURCE[0]}")" && pwd)"/run_import_time_benchmark.py \
+        --number_of_repetitions $NUMBER_OF_REPETITIONS \
+        --maximum_import_time_s $MAXIMUM_IMPORT_TIME_S \
+        --output_json_file_path $OUTPUT_JSON_FILE_PATH
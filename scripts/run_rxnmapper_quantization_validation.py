@@ -0,0 +1,267 @@
+""" The 'scripts' directory 'run_rxnmapper_quantization_validation' script. """
+
+from argparse import ArgumentParser, Namespace
+from json import dump, dumps
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from numpy import mean
+from pandas import DataFrame, read_csv
+
+from chemical_reaction_atom_mapping.consensus import ConsensusReactionAtomMappingUtilities
+from chemical_reaction_atom_mapping.rxnmapper import RxnMapperReactionAtomMappingUtilities
+from chemical_reaction_atom_mapping.utilities.reaction_smiles import ReactionSmilesUtilities
+
+
+def parse_arguments() -> Namespace:
+    """ Parse the 'run_rxnmapper_quantization_validation' script arguments. """
+
+    argument_parser = ArgumentParser()
+
+    argument_parser.add_argument(
+        "-i",
+        "--input_csv_dataset_file_path",
+        type=str,
+        required=True,
+        help="The path to the input '*.csv' dataset file of the reference chemical reaction SMILES strings."
+    )
+
+    argument_parser.add_argument(
+        "-s",
+        "--reaction_smiles_column_name",
+        type=str,
+        required=True,
+        help="The name of the chemical reaction SMILES string column in the input '*.csv' dataset file."
+    )
+
+    argument_parser.add_argument(
+        "-n",
+        "--number_of_reactions",
+        type=int,
+        default=None,
+        help="The number of the first chemical reaction SMILES strings of the input '*.csv' dataset file that should "
+             "be utilized. If not specified, all of the chemical reaction SMILES strings are utilized."
+    )
+
+    argument_parser.add_argument(
+        "-q",
+        "--rxnmapper_model_quantization",
+        type=str,
+        choices=RxnMapperReactionAtomMappingUtilities.rxnmapper_model_quantization_modes,
+        default="dynamic_int8",
+        help="The quantization mode of the RXNMapper model that should be validated against the full-precision one."
+    )
+
+    argument_parser.add_argument(
+        "-b",
+        "--rxnmapper_model_batch_size",
+        type=int,
+        default=10,
+        help="The RXNMapper model batch size."
+    )
+
+    argument_parser.add_argument(
+        "-c",
+        "--number_of_cpu_cores",
+        type=int,
+        default=1,
+        help="The number of CPU cores that should be utilized."
+    )
+
+    argument_parser.add_argument(
+        "-d",
+        "--output_csv_file_path",
+        type=str,
+        default=None,
+        help="The path to the output '*.csv' file of the per-reaction comparison. If not specified, only the report is "
+             "written."
+    )
+
+    argument_parser.add_argument(
+        "-o",
+        "--output_json_file_path",
+        type=str,
+        default=None,
+        help="The path to the output '*.json' validation report file. If not specified, the report is printed."
+    )
+
+    return argument_parser.parse_args()
+
+
+def run_rxnmapper_atom_mapping(
+        reaction_smiles_strings: List[str],
+        rxnmapper_model_quantization: Optional[str],
+        rxnmapper_model_batch_size: int,
+        number_of_cpu_cores: int
+) -> Tuple[List[Tuple[Optional[str], Optional[float]]], Dict[str, Any]]:
+    """
+    Run the RXNMapper library atom mapping on the reference chemical reaction SMILES strings, and measure its
+    throughput after the RXNMapper model is loaded.
+
+    :parameter reaction_smiles_strings: The reference chemical reaction SMILES strings.
+    :parameter rxnmapper_model_quantization: The quantization mode of the RXNMapper model.
+    :parameter rxnmapper_model_batch_size: The RXNMapper model batch size.
+    :parameter number_of_cpu_cores: The number of CPU cores that should be utilized.
+
+    :returns: The mapped chemical reaction SMILES strings and the RXNMapper library atom mapping confidence scores, and
+              the throughput record.
+    """
+
+    model_loading_start_time = perf_counter()
+
+    RxnMapperReactionAtomMappingUtilities.get_rxnmapper_model(
+        rxnmapper_model_quantization=rxnmapper_model_quantization
+    )
+
+    model_loading_time_s = perf_counter() - model_loading_start_time
+
+    atom_mapping_start_time = perf_counter()
+
+    atom_mapping_results = RxnMapperReactionAtomMappingUtilities.run_atom_mapping_on_reaction_smiles_strings(
+        reaction_smiles_strings=reaction_smiles_strings,
+        number_of_reaction_smiles_strings=len(reaction_smiles_strings),
+        rxnmapper_model_batch_size=rxnmapper_model_batch_size,
+        rxnmapper_model_quantization=rxnmapper_model_quantization,
+        number_of_cpu_cores=number_of_cpu_cores
+    )
+
+    atom_mapping_time_s = perf_counter() - atom_mapping_start_time
+
+    if atom_mapping_results is None:
+        atom_mapping_results = [(None, None), ] * len(reaction_smiles_strings)
+
+    return atom_mapping_results, {
+        "model_loading_time_s": model_loading_time_s,
+        "atom_mapping_time_s": atom_mapping_time_s,
+        "reactions_per_s": len(reaction_smiles_strings) / atom_mapping_time_s if atom_mapping_time_s > 0 else None,
+        "number_of_mapped_reactions": sum(
+            mapped_reaction_smiles is not None for mapped_reaction_smiles, _ in atom_mapping_results
+        ),
+    }
+
+
+def get_agreement_record(
+        full_precision_atom_mapping_results: List[Tuple[Optional[str], Optional[float]]],
+        quantized_atom_mapping_results: List[Tuple[Optional[str], Optional[float]]]
+) -> Tuple[Dict[str, Any], DataFrame]:
+    """
+    Compare the atom mappings of the quantized RXNMapper model to the ones of the full-precision RXNMapper model.
+
+    :parameter full_precision_atom_mapping_results: The atom mapping results of the full-precision RXNMapper model.
+    :parameter quantized_atom_mapping_results: The atom mapping results of the quantized RXNMapper model.
+
+    :returns: The agreement record, and the per-reaction comparison.
+    """
+
+    comparison_rows = list()
+
+    for (full_precision_mapped_reaction_smiles, full_precision_confidence_score), \
+            (quantized_mapped_reaction_smiles, quantized_confidence_score) in zip(
+                full_precision_atom_mapping_results,
+                quantized_atom_mapping_results
+            ):
+        are_both_mapped = full_precision_mapped_reaction_smiles is not None and \
+            quantized_mapped_reaction_smiles is not None
+
+        comparison_rows.append({
+            "full_precision_mapped_reaction_smiles": full_precision_mapped_reaction_smiles,
+            "quantized_mapped_reaction_smiles": quantized_mapped_reaction_smiles,
+            "full_precision_atom_mapping_confidence_score": full_precision_confidence_score,
+            "quantized_atom_mapping_confidence_score": quantized_confidence_score,
+            "identical_atom_mapping_indicator":
+                full_precision_mapped_reaction_smiles == quantized_mapped_reaction_smiles if are_both_mapped else None,
+            "equivalent_bond_changes_indicator": ConsensusReactionAtomMappingUtilities.get_atom_mapping_agreement(
+                bond_changes=[
+                    ReactionSmilesUtilities.get_bond_changes(
+                        mapped_reaction_smiles=mapped_reaction_smiles
+                    ) for mapped_reaction_smiles in [
+                        full_precision_mapped_reaction_smiles,
+                        quantized_mapped_reaction_smiles,
+                    ]
+                ]
+            ) if are_both_mapped else None,
+        })
+
+    comparison = DataFrame(comparison_rows)
+
+    compared_comparison = comparison[comparison["identical_atom_mapping_indicator"].notna()]
+
+    return {
+        "number_of_compared_reactions": len(compared_comparison),
+        "number_of_reactions_mapped_only_by_full_precision_model": int((
+            comparison["full_precision_mapped_reaction_smiles"].notna() &
+            comparison["quantized_mapped_reaction_smiles"].isna()
+        ).sum()),
+        "number_of_reactions_mapped_only_by_quantized_model": int((
+            comparison["full_precision_mapped_reaction_smiles"].isna() &
+            comparison["quantized_mapped_reaction_smiles"].notna()
+        ).sum()),
+        "identical_atom_mapping_rate": float(
+            compared_comparison["identical_atom_mapping_indicator"].astype(bool).mean()
+        ) if len(compared_comparison) > 0 else None,
+        "equivalent_bond_changes_rate": float(
+            compared_comparison["equivalent_bond_changes_indicator"].dropna().astype(bool).mean()
+        ) if compared_comparison["equivalent_bond_changes_indicator"].notna().any() else None,
+        "mean_absolute_confidence_score_difference": float(mean(abs(
+            compared_comparison["full_precision_atom_mapping_confidence_score"].astype(float) -
+            compared_comparison["quantized_atom_mapping_confidence_score"].astype(float)
+        ))) if len(compared_comparison) > 0 else None,
+    }, comparison
+
+
+if __name__ == "__main__":
+    script_arguments = parse_arguments()
+
+    reaction_smiles_strings = read_csv(
+        filepath_or_buffer=script_arguments.input_csv_dataset_file_path,
+        usecols=[script_arguments.reaction_smiles_column_name, ],
+        nrows=script_arguments.number_of_reactions
+    )[script_arguments.reaction_smiles_column_name].dropna().tolist()
+
+    full_precision_atom_mapping_results, full_precision_throughput_record = run_rxnmapper_atom_mapping(
+        reaction_smiles_strings=reaction_smiles_strings,
+        rxnmapper_model_quantization=None,
+        rxnmapper_model_batch_size=script_arguments.rxnmapper_model_batch_size,
+        number_of_cpu_cores=script_arguments.number_of_cpu_cores
+    )
+
+    quantized_atom_mapping_results, quantized_throughput_record = run_rxnmapper_atom_mapping(
+        reaction_smiles_strings=reaction_smiles_strings,
+        rxnmapper_model_quantization=script_arguments.rxnmapper_model_quantization,
+        rxnmapper_model_batch_size=script_arguments.rxnmapper_model_batch_size,
+        number_of_cpu_cores=script_arguments.number_of_cpu_cores
+    )
+
+    agreement_record, per_reaction_comparison = get_agreement_record(
+        full_precision_atom_mapping_results=full_precision_atom_mapping_results,
+        quantized_atom_mapping_results=quantized_atom_mapping_results
+    )
+
+    validation_report = {
+        "input_csv_dataset_file_path": script_arguments.input_csv_dataset_file_path,
+        "number_of_reactions": len(reaction_smiles_strings),
+        "rxnmapper_model_quantization": script_arguments.rxnmapper_model_quantization,
+        "rxnmapper_model_batch_size": script_arguments.rxnmapper_model_batch_size,
+        "number_of_cpu_cores": script_arguments.number_of_cpu_cores,
+        "full_precision": full_precision_throughput_record,
+        "quantized": quantized_throughput_record,
+        "speedup": full_precision_throughput_record["atom_mapping_time_s"] /
+        quantized_throughput_record["atom_mapping_time_s"]
+        if quantized_throughput_record["atom_mapping_time_s"] > 0 else None,
+        "agreement": agreement_record,
+    }
+
+    if script_arguments.output_csv_file_path is not None:
+        per_reaction_comparison.insert(0, script_arguments.reaction_smiles_column_name, reaction_smiles_strings)
+
+        per_reaction_comparison.to_csv(
+            path_or_buf=script_arguments.output_csv_file_path,
+            index=False
+        )
+
+    if script_arguments.output_json_file_path is not None:
+        with open(script_arguments.output_json_file_path, mode="w") as output_json_file_handle:
+            dump(validation_report, output_json_file_handle, indent=4)
+
+    else:
+        print(dumps(validation_report, indent=4))
@@ -0,0 +1,23 @@
+#!/bin/bash
+
+export PYTHONPATH=$PYTHONPATH:"/path/to/project/root/directory"
+
+export INPUT_CSV_DATASET_FILE_PATH="/path/to/input/csv/reference/dataset/file.csv"
+export REACTION_SMILES_COLUMN_NAME="reaction_smiles"
+export NUMBER_OF_REACTIONS=1000
+export RXNMAPPER_MODEL_QUANTIZATION="dynamic_int8"
+export RXNMAPPER_MODEL_BATCH_SIZE=10
+export NUMBER_OF_CPU_CORES=1
+export OUTPUT_CSV_FILE_PATH="/path/to/output/csv/comparison/file.csv"
+export OUTPUT_JSON_FILE_PATH="/path/to/output/json/validation/report/file.json"
+
+
+python "$(cd -P "$(dirname "${BASH_SOURCE[0]}")" && pwd)"/run_rxnmapper_quantization_validation.py \
+        --input_csv_dataset_file_path $INPUT_CSV_DATASET_FILE_PATH \
+        --reaction_smiles_column_name $REACTION_SMILES_COLUMN_NAME \
+        --number_of_reactions $NUMBER_OF_REACTIONS \
+        --rxnmapper_model_quantization $RXNMAPPER_MODEL_QUANTIZATION \
+        --rxnmapper_model_batch_size $RXNMAPPER_MODEL_BATCH_SIZE \
+        --number_of_cpu_cores $NUMBER_OF_CPU_CORES \
+        --output_csv_file_path $OUTPUT_CSV_FILE_PATH \
+        --output_json_file_path $OUTPUT_JSON_FILE_PATH
@@ -0,0 +1 @@
+""" The 'tests' package initialization module. """
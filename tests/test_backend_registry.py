@@ -0,0 +1,205 @@
+""" The 'tests' package 'test_backend_registry' module. """
+
+from importlib.metadata import EntryPoint
+from pathlib import Path
+from subprocess import run
+from sys import executable
+from typing import Any, List, Optional, Tuple
+
+from pytest import raises
+
+from chemical_reaction_atom_mapping.utilities.atom_mapper import ReactionAtomMapper
+from chemical_reaction_atom_mapping.utilities.backend_registry import BackendRegistryUtilities
+from chemical_reaction_atom_mapping.utilities.backend_registry import backend_registry
+
+
+class _PluginReactionAtomMapper(ReactionAtomMapper):
+    """ The plugin chemical reaction atom mapper test double class, which reverses the chemical reaction SMILES. """
+
+    library = "plugin"
+    library_display_name = "Plugin"
+
+    def map_one(
+            self,
+            reaction_smiles: str
+    ) -> Tuple[Optional[str], Any]:
+        """
+        Map a chemical reaction SMILES string.
+
+        :parameter reaction_smiles: The chemical reaction SMILES string.
+
+        :returns: The reversed chemical reaction SMILES string, and the atom mapping indicator.
+        """
+
+        return reaction_smiles[::-1], True
+
+
+class _NotAReactionAtomMapper:
+    """ The plugin test double class, which does not extend the 'ReactionAtomMapper' class. """
+
+
+class _BackendEntryPoints:
+    """ The installed distribution entry points test double class. """
+
+    def __init__(
+            self,
+            backend_entry_points: List[EntryPoint]
+    ) -> None:
+        """
+        The constructor method of the class.
+
+        :parameter backend_entry_points: The entry points of the backends.
+        """
+
+        self.backend_entry_points = backend_entry_points
+
+    def select(
+            self,
+            group: str
+    ) -> List[EntryPoint]:
+        """
+        Select the entry points of a group.
+
+        :parameter group: The name of the entry point group.
+
+        :returns: The entry points of the group.
+        """
+
+        return [
+            backend_entry_point for backend_entry_point in self.backend_entry_points
+            if backend_entry_point.group == group
+        ]
+
+
+class TestBackendRegistryUtilities:
+    """ The chemical reaction atom mapping backend registry utilities test class. """
+
+    def test_backends_are_imported_lazily(
+            self
+    ) -> None:
+        """
+        Test whether the import of the backend registry and the listing of the backends import none of the backend
+        modules and none of the frameworks of the backends.
+        """
+
+        completed_process = run(
+            [
+                executable,
+                "-c",
+                "from sys import modules\n"
+                "from chemical_reaction_atom_mapping.utilities.backend_registry import BackendRegistryUtilities\n"
+                "print(BackendRegistryUtilities.get_backend_names())\n"
+                "print(sorted(module_name for module_name in modules if module_name.split('.')[0] in {\n"
+                "    'chython', 'chytorch', 'indigo', 'pandas', 'rdkit', 'rxnmapper', 'torch', 'transformers',\n"
+                "} or module_name.split('.')[-1] in {'chytorch_rxnmap', 'epam_indigo', 'rxnmapper', }))\n",
+            ],
+            cwd=str(Path(__file__).resolve().parents[1]),
+            capture_output=True,
+            text=True,
+            check=True
+        )
+
+        assert completed_process.stdout.splitlines() == [
+            "['chytorch_rxnmap', 'epam_indigo', 'rxnmapper']",
+            "[]",
+        ]
+
+    def test_plugin_backends_are_discovered(
+            self,
+            monkeypatch
+    ) -> None:
+        """
+        Test whether the backends of the entry point group are registered without being imported, whether they do not
+        replace the built-in backends, and whether they are imported on the first request.
+        """
+
+        monkeypatch.setattr(BackendRegistryUtilities, "_backends", dict(BackendRegistryUtilities._backends))
+        monkeypatch.setattr(BackendRegistryUtilities, "_atom_mapper_classes", dict())
+        monkeypatch.setattr(BackendRegistryUtilities, "_are_plugin_backends_discovered", False)
+
+        monkeypatch.setattr(backend_registry, "entry_points", lambda: _BackendEntryPoints(
+            backend_entry_points=[
+                EntryPoint(
+                    name="plugin",
+                    value="{0}:_PluginReactionAtomMapper".format(__name__),
+                    group="chemical_reaction_atom_mapping.backends"
+                ),
+                EntryPoint(
+                    name="rxnmapper",
+                    value="{0}:_PluginReactionAtomMapper".format(__name__),
+                    group="chemical_reaction_atom_mapping.backends"
+                ),
+                EntryPoint(
+                    name="other_plugin",
+                    value="{0}:_PluginReactionAtomMapper".format(__name__),
+                    group="other_group"
+                ),
+            ]
+        ))
+
+        assert BackendRegistryUtilities.get_backend_names() == [
+            "chytorch_rxnmap", "epam_indigo", "plugin", "rxnmapper",
+        ]
+
+        assert BackendRegistryUtilities._backends["rxnmapper"][0] == "chemical_reaction_atom_mapping.rxnmapper"
+
+        assert not BackendRegistryUtilities.is_backend_loaded(
+            library="plugin"
+        )
+
+        assert BackendRegistryUtilities.get_atom_mapper(
+            library="plugin"
+        ).map_batch(
+            reaction_smiles_strings=["CCO>>CC=O", ]
+        ) == [("O=CC>>OCC", True), ]
+
+        assert BackendRegistryUtilities.is_backend_loaded(
+            library="plugin"
+        )
+
+        assert BackendRegistryUtilities.get_atom_mapper_class(
+            library="plugin"
+        ) is _PluginReactionAtomMapper
+
+    def test_invalid_backends_are_rejected(
+            self,
+            monkeypatch
+    ) -> None:
+        """
+        Test whether the unknown backends and the backends that do not extend the 'ReactionAtomMapper' class are
+        rejected, and whether a registered backend replaces the imported one.
+        """
+
+        monkeypatch.setattr(BackendRegistryUtilities, "_backends", dict(BackendRegistryUtilities._backends))
+        monkeypatch.setattr(BackendRegistryUtilities, "_atom_mapper_classes", dict())
+        monkeypatch.setattr(BackendRegistryUtilities, "_are_plugin_backends_discovered", True)
+
+        with raises(ValueError):
+            BackendRegistryUtilities.get_atom_mapper_class(
+                library="unknown"
+            )
+
+        BackendRegistryUtilities.register_backend(
+            library="plugin",
+            module_name=__name__,
+            class_name="_NotAReactionAtomMapper"
+        )
+
+        with raises(TypeError):
+            BackendRegistryUtilities.get_atom_mapper_class(
+                library="plugin"
+            )
+
+        assert not BackendRegistryUtilities.is_backend_loaded(
+            library="plugin"
+        )
+
+        BackendRegistryUtilities.register_backend(
+            library="plugin",
+            module_name=__name__,
+            class_name="_PluginReactionAtomMapper"
+        )
+
+        assert BackendRegistryUtilities.get_atom_mapper_class(
+            library="plugin"
+        ) is _PluginReactionAtomMapper
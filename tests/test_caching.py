@@ -0,0 +1,116 @@
+""" The 'tests' package 'test_caching' module. """
+
+from typing import List, Optional, Tuple
+
+from chemical_reaction_atom_mapping.utilities.caching import AtomMappingResultCache
+
+
+class TestAtomMappingResultCache:
+    """ The on-disk content-addressed chemical reaction atom mapping result cache test class. """
+
+    def test_least_recently_used_entries_are_evicted(
+            self,
+            tmp_path
+    ) -> None:
+        """ Test whether the least recently used entries are evicted if the maximum number of entries is exceeded. """
+
+        with AtomMappingResultCache(
+            cache_file_path=str(tmp_path / "cache.sqlite"),
+            maximum_number_of_entries=2
+        ) as atom_mapping_result_cache:
+            atom_mapping_result_cache.put(
+                keys_and_atom_mapping_results=[("a", ("A", 0.1)), ]
+            )
+
+            atom_mapping_result_cache.put(
+                keys_and_atom_mapping_results=[("b", ("B", 0.2)), ]
+            )
+
+            assert atom_mapping_result_cache.get(
+                keys=["a", ]
+            ) == {"a": ("A", 0.1)}
+
+            atom_mapping_result_cache.put(
+                keys_and_atom_mapping_results=[("c", ("C", 0.3)), ]
+            )
+
+            assert atom_mapping_result_cache.get(
+                keys=["a", "b", "c", ]
+            ) == {"a": ("A", 0.1), "c": ("C", 0.3)}
+
+            assert atom_mapping_result_cache.get_statistics()["number_of_evictions"] == 1
+            assert atom_mapping_result_cache.get_statistics()["number_of_entries"] == 2
+
+    def test_run_with_cache(
+            self,
+            tmp_path
+    ) -> None:
+        """
+        Test whether only the chemical reaction SMILES strings that are not found in the cache are mapped, whether the
+        failed chemical reaction atom mapping results are not cached, and whether the values that are not strings
+        bypass the cache.
+        """
+
+        mapped_reaction_smiles_batches = list()  # type: List[List[Optional[str]]]
+
+        def atom_mapping_procedure(
+                reaction_smiles_strings: List[Optional[str]]
+        ) -> List[Tuple[Optional[str], Optional[float]]]:
+            """
+            Map the chemical reaction SMILES strings, and fail for the values that are not strings or contain the 'X'
+            character.
+
+            :parameter reaction_smiles_strings: The chemical reaction SMILES strings.
+
+            :returns: The chemical reaction atom mapping results.
+            """
+
+            mapped_reaction_smiles_batches.append(reaction_smiles_strings)
+
+            return [
+                ("mapped:{0}".format(reaction_smiles), 1.0)
+                if isinstance(reaction_smiles, str) and "X" not in reaction_smiles else (None, None)
+                for reaction_smiles in reaction_smiles_strings
+            ]
+
+        with AtomMappingResultCache(
+            cache_file_path=str(tmp_path / "cache.sqlite")
+        ) as atom_mapping_result_cache:
+            for _ in range(2):
+                atom_mapping_results = atom_mapping_result_cache.run_with_cache(
+                    library_name="epam_indigo",
+                    atom_mapping_options={"strip_unchanged_compounds": False},
+                    reaction_smiles_strings=["CCO>>CC=O", None, "CX>>C", "CCO>>CC=O", ],
+                    atom_mapping_procedure=atom_mapping_procedure
+                )
+
+                assert atom_mapping_results == [
+                    ("mapped:CCO>>CC=O", 1.0),
+                    (None, None),
+                    (None, None),
+                    ("mapped:CCO>>CC=O", 1.0),
+                ]
+
+            assert mapped_reaction_smiles_batches == [
+                ["CCO>>CC=O", None, "CX>>C", "CCO>>CC=O", ],
+                [None, "CX>>C", ],
+            ]
+
+    def test_keys_depend_on_atom_mapping_options(
+            self
+    ) -> None:
+        """ Test whether the cache keys depend on the chemical reaction SMILES string and the atom mapping options. """
+
+        keys = {
+            AtomMappingResultCache.get_key(
+                reaction_smiles=reaction_smiles,
+                library_name="epam_indigo",
+                library_version="1.0",
+                atom_mapping_options=atom_mapping_options
+            ) for reaction_smiles in ["CCO>>CC=O", "OCC>>CC=O", ] for atom_mapping_options in [
+                {"strip_unchanged_compounds": False},
+                {"strip_unchanged_compounds": True},
+            ]
+        }
+
+        assert len(keys) == 4
@@ -0,0 +1,56 @@
+""" The 'tests' package 'test_checkpointing' module. """
+
+from hashlib import sha256
+from os.path import exists
+
+from chemical_reaction_atom_mapping.utilities.checkpointing import CheckpointingUtilities
+
+
+class TestCheckpointingUtilities:
+    """ The checkpointing utilities test class. """
+
+    def test_get_file_hash(
+            self,
+            tmp_path
+    ) -> None:
+        """ Test whether the hash of a file that is read in blocks is the hash of the whole file. """
+
+        file_path = tmp_path / "dataset.csv"
+        file_path.write_bytes(b"id,rxn\n" * 1000)
+
+        assert CheckpointingUtilities.get_file_hash(
+            file_path=str(file_path),
+            block_size=100
+        ) == "sha256:{0}".format(sha256(b"id,rxn\n" * 1000).hexdigest())
+
+    def test_save_and_load_run_manifest(
+            self,
+            tmp_path
+    ) -> None:
+        """ Test whether a saved run manifest is loaded back, and whether no temporary file is left behind. """
+
+        run_manifest_file_path = str(tmp_path / "output.csv.manifest.json")
+
+        assert CheckpointingUtilities.load_run_manifest(
+            run_manifest_file_path=run_manifest_file_path
+        ) is None
+
+        for last_committed_row_offset in [100, 200, ]:
+            CheckpointingUtilities.save_run_manifest(
+                run_manifest_file_path=run_manifest_file_path,
+                run_manifest={
+                    "completed": False,
+                    "last_committed_row_offset": last_committed_row_offset,
+                    "options": {"output_mode": "columns"},
+                }
+            )
+
+        assert CheckpointingUtilities.load_run_manifest(
+            run_manifest_file_path=run_manifest_file_path
+        ) == {
+            "completed": False,
+            "last_committed_row_offset": 200,
+            "options": {"output_mode": "columns"},
+        }
+
+        assert not exists("{0}.tmp".format(run_manifest_file_path))
@@ -0,0 +1,53 @@
+""" The 'tests' package 'test_chytorch_rxnmap' module. """
+
+from pytest import approx, importorskip, skip
+
+from chemical_reaction_atom_mapping.chytorch_rxnmap import ChytorchRxnMapReactionAtomMappingUtilities
+
+
+class TestChytorchRxnMapReactionAtomMappingUtilities:
+    """ The Chytorch RxnMap library chemical reaction atom mapping utilities test class. """
+
+    reaction_smiles_strings = [
+        "CC(=O)O.CO>>COC(C)=O.O",
+        "CCO>>CC=O",
+        "c1ccccc1Br.OB(O)c1ccccc1>>c1ccc(cc1)-c1ccccc1",
+        "not a reaction SMILES string",
+    ]
+
+    def test_batched_atom_mapping(
+            self
+    ) -> None:
+        """
+        Test whether the batched atom mapping produces the same outputs as the atom mapping of each chemical reaction
+        SMILES string separately.
+        """
+
+        importorskip("chython")
+        importorskip("chytorch")
+
+        if not ChytorchRxnMapReactionAtomMappingUtilities._is_batched_atom_mapping_supported():
+            skip("The installed Chython and Chytorch libraries do not support the batched atom mapping.")
+
+        batched_atom_mapping_results = ChytorchRxnMapReactionAtomMappingUtilities.\
+            _run_atom_mapping_on_reaction_smiles_batch(
+                reaction_smiles_batch=self.reaction_smiles_strings
+            )
+
+        atom_mapping_results = [
+            ChytorchRxnMapReactionAtomMappingUtilities.run_atom_mapping_on_reaction_smiles(
+                reaction_smiles=reaction_smiles
+            ) for reaction_smiles in self.reaction_smiles_strings
+        ]
+
+        assert [
+            mapped_reaction_smiles for mapped_reaction_smiles, _ in batched_atom_mapping_results
+        ] == [
+            mapped_reaction_smiles for mapped_reaction_smiles, _ in atom_mapping_results
+        ]
+
+        assert [
+            atom_mapping_score for _, atom_mapping_score in batched_atom_mapping_results
+        ] == approx([
+            atom_mapping_score for _, atom_mapping_score in atom_mapping_results
+        ], abs=1e-4)
@@ -0,0 +1,180 @@
+""" The 'tests' package 'test_dataset_io' module. """
+
+from pandas import DataFrame, concat, read_csv
+from pytest import importorskip
+
+from chemical_reaction_atom_mapping.utilities.dataset_io import DatasetIoUtilities
+
+
+class TestDatasetIoUtilities:
+    """ The chemical reaction dataset input and output utilities test class. """
+
+    dataset = DataFrame({
+        "id": list(range(10)),
+        "rxn": ["C{0}O>>C{0}=O".format("C" * row_index) for row_index in range(10)],
+    })
+
+    def test_csv_dataset_chunks_row_offset(
+            self,
+            tmp_path
+    ) -> None:
+        """ Test whether the chunks of a '*.csv' dataset file start at the row offset and keep the row positions. """
+
+        dataset_file_path = str(tmp_path / "dataset.csv")
+
+        self.dataset.to_csv(dataset_file_path, index=False)
+
+        dataset_chunks = list(DatasetIoUtilities.iterate_dataset_chunks(
+            dataset_file_path=dataset_file_path,
+            dataset_file_format="csv",
+            chunk_size=3,
+            row_offset=4
+        ))
+
+        assert [len(dataset_chunk) for dataset_chunk in dataset_chunks] == [3, 3, ]
+
+        assert concat(dataset_chunks).equals(self.dataset.iloc[4:])
+
+    def test_csv_dataset_chunks_row_offset_with_multiline_values(
+            self,
+            tmp_path
+    ) -> None:
+        """
+        Test whether the rows of a '*.csv' dataset file with quoted multiline values and empty lines are skipped in the
+        same way as the pandas library reads them.
+        """
+
+        dataset_file_path = tmp_path / "dataset.csv"
+        dataset_file_path.write_text("id,rxn,note\n0,CCO>>CC=O,\"a\nb\"\n\n1,CO>>C=O,c\n2,C>>C,\"d,e\"\n")
+
+        dataset = read_csv(str(dataset_file_path))
+
+        for row_offset in range(len(dataset) + 2):
+            dataset_chunks = list(DatasetIoUtilities.iterate_dataset_chunks(
+                dataset_file_path=str(dataset_file_path),
+                dataset_file_format="csv",
+                chunk_size=2,
+                row_offset=row_offset
+            ))
+
+            if row_offset >= len(dataset):
+                assert len(dataset_chunks) == 0
+
+            else:
+                assert concat(dataset_chunks).equals(dataset.iloc[row_offset:]), row_offset
+
+    def test_parquet_dataset_chunks_row_offset(
+            self,
+            tmp_path
+    ) -> None:
+        """
+        Test whether the chunks of a '*.parquet' dataset file start at the row offset within and across row groups, and
+        keep the row positions.
+        """
+
+        importorskip("pyarrow")
+
+        from pyarrow import Table
+        from pyarrow.parquet import write_table
+
+        dataset_file_path = str(tmp_path / "dataset.parquet")
+
+        write_table(Table.from_pandas(self.dataset, preserve_index=False), dataset_file_path, row_group_size=4)
+
+        for row_offset in [0, 3, 4, 5, 9, 10, ]:
+            dataset_chunks = list(DatasetIoUtilities.iterate_dataset_chunks(
+                dataset_file_path=dataset_file_path,
+                dataset_file_format="parquet",
+                chunk_size=3,
+                row_offset=row_offset
+            ))
+
+            assert sum(len(dataset_chunk) for dataset_chunk in dataset_chunks) == len(self.dataset) - row_offset
+
+            if len(dataset_chunks) > 0:
+                assert concat(dataset_chunks).equals(self.dataset.iloc[row_offset:]), row_offset
+
+    def test_discard_uncommitted_csv_dataset_chunks(
+            self,
+            tmp_path
+    ) -> None:
+        """ Test whether the '*.csv' dataset file is truncated to the committed size, and then appended to again. """
+
+        dataset_file_path = str(tmp_path / "output.csv")
+
+        DatasetIoUtilities.append_dataset_chunk(
+            dataset_chunk=self.dataset.iloc[:5],
+            dataset_file_path=dataset_file_path,
+            dataset_file_format="csv"
+        )
+
+        dataset_size = DatasetIoUtilities.get_dataset_size(
+            dataset_file_path=dataset_file_path,
+            dataset_file_format="csv"
+        )
+
+        DatasetIoUtilities.append_dataset_chunk(
+            dataset_chunk=self.dataset.iloc[5:7],
+            dataset_file_path=dataset_file_path,
+            dataset_file_format="csv"
+        )
+
+        DatasetIoUtilities.discard_uncommitted_dataset_chunks(
+            dataset_file_path=dataset_file_path,
+            dataset_file_format="csv",
+            dataset_size=dataset_size
+        )
+
+        DatasetIoUtilities.append_dataset_chunk(
+            dataset_chunk=self.dataset.iloc[5:],
+            dataset_file_path=dataset_file_path,
+            dataset_file_format="csv"
+        )
+
+        assert read_csv(dataset_file_path).equals(self.dataset)
+
+    def test_discard_uncommitted_parquet_dataset_chunks(
+            self,
+            tmp_path
+    ) -> None:
+        """
+        Test whether the part files of the '*.parquet' dataset directory that were written after the committed size,
+        including the temporary ones, are removed, and whether the dataset is then appended to again.
+        """
+
+        importorskip("pyarrow")
+
+        from pandas import read_parquet
+
+        dataset_file_path = str(tmp_path / "output.parquet")
+
+        for dataset_chunk in [self.dataset.iloc[:5], self.dataset.iloc[5:7], ]:
+            DatasetIoUtilities.append_dataset_chunk(
+                dataset_chunk=dataset_chunk,
+                dataset_file_path=dataset_file_path,
+                dataset_file_format="parquet"
+            )
+
+        open("{0}.tmp".format(DatasetIoUtilities.get_parquet_dataset_part_file_path(
+            dataset_directory_path=dataset_file_path,
+            part_index=2
+        )), "wb").close()
+
+        DatasetIoUtilities.discard_uncommitted_dataset_chunks(
+            dataset_file_path=dataset_file_path,
+            dataset_file_format="parquet",
+            dataset_size=1
+        )
+
+        assert DatasetIoUtilities.get_dataset_size(
+            dataset_file_path=dataset_file_path,
+            dataset_file_format="parquet"
+        ) == 1
+
+        DatasetIoUtilities.append_dataset_chunk(
+            dataset_chunk=self.dataset.iloc[5:],
+            dataset_file_path=dataset_file_path,
+            dataset_file_format="parquet"
+        )
+
+        assert read_parquet(dataset_file_path).equals(self.dataset)
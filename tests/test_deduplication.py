@@ -0,0 +1,93 @@
+""" The 'tests' package 'test_deduplication' module. """
+
+from typing import Any, List, Tuple
+
+from pytest import importorskip
+
+from chemical_reaction_atom_mapping.utilities.deduplication import DeduplicationUtilities
+
+
+class TestDeduplicationUtilities:
+    """ The chemical reaction SMILES string deduplication utilities test class. """
+
+    @staticmethod
+    def _run_deduplication(
+            reaction_smiles_strings: List[Any],
+            deduplication_mode: str
+    ) -> Tuple[List[Any], List[List[Any]]]:
+        """
+        Run an atom mapping procedure that tags each chemical reaction SMILES string with its position in the batch
+        with the deduplication.
+
+        :parameter reaction_smiles_strings: The chemical reaction SMILES strings.
+        :parameter deduplication_mode: The indicator how the chemical reaction SMILES strings should be compared.
+
+        :returns: The chemical reaction atom mapping results, and the batches that were passed to the atom mapping
+                  procedure.
+        """
+
+        reaction_smiles_batches = list()
+
+        def atom_mapping_procedure(
+                reaction_smiles_batch: List[Any]
+        ) -> List[Tuple[Any, int]]:
+            """
+            Tag each chemical reaction SMILES string with its position in the batch.
+
+            :parameter reaction_smiles_batch: The batch of chemical reaction SMILES strings.
+
+            :returns: The chemical reaction SMILES strings and their positions in the batch.
+            """
+
+            reaction_smiles_batches.append(reaction_smiles_batch)
+
+            return [
+                (reaction_smiles, reaction_smiles_index)
+                for reaction_smiles_index, reaction_smiles in enumerate(reaction_smiles_batch)
+            ]
+
+        return DeduplicationUtilities.run_with_deduplication(
+            reaction_smiles_strings=reaction_smiles_strings,
+            atom_mapping_procedure=atom_mapping_procedure,
+            deduplication_mode=deduplication_mode
+        ), reaction_smiles_batches
+
+    def test_exact_deduplication_scatters_results(
+            self
+    ) -> None:
+        """
+        Test whether each unique chemical reaction SMILES string is mapped once, and whether the chemical reaction
+        atom mapping results are scattered back to the duplicates, while the values that are not strings are never
+        deduplicated.
+        """
+
+        atom_mapping_results, reaction_smiles_batches = TestDeduplicationUtilities._run_deduplication(
+            reaction_smiles_strings=["CCO>>CC=O", None, "CO>>C=O", "CCO>>CC=O", None, ],
+            deduplication_mode="exact"
+        )
+
+        assert reaction_smiles_batches == [["CCO>>CC=O", None, "CO>>C=O", None, ], ]
+
+        assert atom_mapping_results == [
+            ("CCO>>CC=O", 0),
+            (None, 1),
+            ("CO>>C=O", 2),
+            ("CCO>>CC=O", 0),
+            (None, 3),
+        ]
+
+    def test_canonical_deduplication_scatters_results(
+            self
+    ) -> None:
+        """ Test whether the chemical reaction SMILES strings that differ only in the order of compounds are merged. """
+
+        importorskip("rdkit")
+
+        atom_mapping_results, reaction_smiles_batches = TestDeduplicationUtilities._run_deduplication(
+            reaction_smiles_strings=["CO.CC(=O)O>>COC(C)=O.O", "CC(=O)O.CO>>O.COC(C)=O", ],
+            deduplication_mode="canonical"
+        )
+
+        assert reaction_smiles_batches == [["CO.CC(=O)O>>COC(C)=O.O", ], ]
+
+        assert atom_mapping_results == [("CO.CC(=O)O>>COC(C)=O.O", 0), ] * 2
@@ -0,0 +1,97 @@
+""" The 'tests' package 'test_epam_indigo' module. """
+
+from threading import Thread
+
+from pytest import importorskip
+
+from chemical_reaction_atom_mapping.epam_indigo import EpamIndigoReactionAtomMappingUtilities
+
+
+class TestEpamIndigoReactionAtomMappingUtilities:
+    """ The EPAM Indigo library chemical reaction atom mapping utilities test class. """
+
+    def test_epam_indigo_toolkit_is_reused_and_recycled(
+            self
+    ) -> None:
+        """
+        Test whether the EPAM Indigo toolkit Indigo object is reused until the recycling period has elapsed, and whether
+        a new one is constructed for each chemical reaction SMILES string if the recycling period is lower than 1.
+        """
+
+        importorskip("indigo")
+
+        EpamIndigoReactionAtomMappingUtilities._epam_indigo_toolkit_cache.__dict__.clear()
+
+        epam_indigo_toolkits = [
+            EpamIndigoReactionAtomMappingUtilities._get_epam_indigo_toolkit(
+                timeout_period_ms=10000,
+                epam_indigo_toolkit_recycling_period=3
+            ) for _ in range(7)
+        ]
+
+        assert [
+            len({id(epam_indigo_toolkit) for epam_indigo_toolkit in epam_indigo_toolkits[index:index + 3]})
+            for index in range(0, 7, 3)
+        ] == [1, 1, 1, ]
+
+        assert len({id(epam_indigo_toolkit) for epam_indigo_toolkit in epam_indigo_toolkits}) == 3
+
+        epam_indigo_toolkits = [
+            EpamIndigoReactionAtomMappingUtilities._get_epam_indigo_toolkit(
+                timeout_period_ms=10000,
+                epam_indigo_toolkit_recycling_period=0
+            ) for _ in range(3)
+        ]
+
+        assert len({id(epam_indigo_toolkit) for epam_indigo_toolkit in epam_indigo_toolkits}) == 3
+
+    def test_epam_indigo_toolkit_is_not_shared_between_threads(
+            self
+    ) -> None:
+        """ Test whether each thread constructs its own EPAM Indigo toolkit Indigo object. """
+
+        importorskip("indigo")
+
+        epam_indigo_toolkits = list()
+
+        def get_epam_indigo_toolkit() -> None:
+            """ Get the EPAM Indigo toolkit Indigo object of the current thread. """
+
+            epam_indigo_toolkits.append(EpamIndigoReactionAtomMappingUtilities._get_epam_indigo_toolkit(
+                timeout_period_ms=10000,
+                epam_indigo_toolkit_recycling_period=1000
+            ))
+
+        threads = [Thread(target=get_epam_indigo_toolkit) for _ in range(2)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        assert epam_indigo_toolkits[0] is not epam_indigo_toolkits[1]
+
+    def test_run_atom_mapping_on_reaction_smiles_strings_with_reused_toolkit(
+            self
+    ) -> None:
+        """
+        Test whether the chemical reaction SMILES strings are mapped in the same way with a reused and a recycled EPAM
+        Indigo toolkit Indigo object.
+        """
+
+        importorskip("indigo")
+
+        reaction_smiles_strings = ["CC(=O)O.CO>>COC(C)=O.O", "CCO>>CC=O", "not a reaction SMILES string", ] * 2
+
+        assert [
+            EpamIndigoReactionAtomMappingUtilities.run_atom_mapping_on_reaction_smiles(
+                reaction_smiles=reaction_smiles,
+                epam_indigo_toolkit_recycling_period=1000
+            ) for reaction_smiles in reaction_smiles_strings
+        ] == [
+            EpamIndigoReactionAtomMappingUtilities.run_atom_mapping_on_reaction_smiles(
+                reaction_smiles=reaction_smiles,
+                epam_indigo_toolkit_recycling_period=0
+            ) for reaction_smiles in reaction_smiles_strings
+        ]
@@ -0,0 +1,247 @@
+""" The 'tests' package 'test_instrumentation' module. """
+
+from json import loads
+
+from pytest import raises
+
+from chemical_reaction_atom_mapping.utilities.instrumentation import (
+    InstrumentationUtilities,
+    JsonLinesMetricsSink,
+    PrometheusTextMetricsSink,
+)
+from chemical_reaction_atom_mapping.utilities.multiprocessing import MultiprocessingUtilities
+
+
+def _get_instrumented_output(
+        primary_input_argument: str
+) -> str:
+    """
+    Get the output of a processing procedure that records a stage duration and a counter.
+
+    :parameter primary_input_argument: The primary input argument.
+
+    :returns: The reversed primary input argument.
+    """
+
+    with InstrumentationUtilities.measure("test.stage"):
+        InstrumentationUtilities.increment(
+            counter_name="test.calls"
+        )
+
+        return primary_input_argument[::-1]
+
+
+class TestInstrumentationUtilities:
+    """ The per-stage timer and counter instrumentation utilities test class. """
+
+    def test_disabled_instrumentation_records_nothing(
+            self
+    ) -> None:
+        """ Test whether no metrics are recorded while the instrumentation is disabled. """
+
+        InstrumentationUtilities.disable()
+        InstrumentationUtilities.reset_metrics()
+
+        with InstrumentationUtilities.measure("test.stage"):
+            InstrumentationUtilities.increment(
+                counter_name="test.calls"
+            )
+
+        InstrumentationUtilities.record_duration(
+            stage_name="test.stage",
+            duration_s=1.0
+        )
+
+        assert not InstrumentationUtilities.is_enabled()
+
+        assert InstrumentationUtilities.get_metrics() == {"timers": dict(), "counters": dict(), }
+
+    def test_enabled_instrumentation_records_the_metrics(
+            self
+    ) -> None:
+        """
+        Test whether the durations, the counters and the failures of the stages are recorded while the instrumentation
+        is enabled, and whether the metrics are reset after they are retrieved.
+        """
+
+        InstrumentationUtilities.enable()
+        InstrumentationUtilities.reset_metrics()
+
+        try:
+            for _ in range(2):
+                with InstrumentationUtilities.measure("test.stage"):
+                    InstrumentationUtilities.increment(
+                        counter_name="test.calls",
+                        value=3
+                    )
+
+            with raises(ValueError):
+                with InstrumentationUtilities.measure("test.failing_stage"):
+                    raise ValueError("The stage has failed.")
+
+            InstrumentationUtilities.record_duration(
+                stage_name="test.recorded_stage",
+                duration_s=2.0
+            )
+
+            metrics = InstrumentationUtilities.get_metrics(
+                reset=True
+            )
+
+        finally:
+            InstrumentationUtilities.disable()
+
+        assert {
+            stage_name: stage_metrics["count"] for stage_name, stage_metrics in metrics["timers"].items()
+        } == {"test.failing_stage": 1, "test.recorded_stage": 1, "test.stage": 2, }
+
+        assert metrics["timers"]["test.recorded_stage"] == {"count": 1, "total_s": 2.0, "max_s": 2.0, }
+
+        assert metrics["counters"] == {"test.calls": 6, "test.failing_stage.failures": 1, }
+
+        assert InstrumentationUtilities.get_metrics() == {"timers": dict(), "counters": dict(), }
+
+    def test_worker_metrics_are_merged(
+            self
+    ) -> None:
+        """
+        Test whether the metrics that are recorded in the worker processes are merged into the metrics of the current
+        process, and whether the outputs are kept in the order of the primary input arguments.
+        """
+
+        primary_input_arguments = ["C" * index + "O" for index in range(10)]
+
+        InstrumentationUtilities.enable()
+        InstrumentationUtilities.reset_metrics()
+
+        try:
+            for processing_procedure_outputs in [
+                MultiprocessingUtilities.run(
+                    processing_procedure=_get_instrumented_output,
+                    primary_input_arguments=primary_input_arguments,
+                    task_timeout_period_s=10.0
+                ),
+                list(MultiprocessingUtilities._iterate_processing_procedure_outputs(
+                    processing_procedure=_get_instrumented_output,
+                    primary_input_arguments=primary_input_arguments,
+                    number_of_primary_input_arguments=len(primary_input_arguments),
+                    number_of_cpu_cores=2,
+                    chunk_size=3
+                )),
+            ]:
+                assert processing_procedure_outputs == [
+                    primary_input_argument[::-1] for primary_input_argument in primary_input_arguments
+                ]
+
+            metrics = InstrumentationUtilities.get_metrics(
+                reset=True
+            )
+
+        finally:
+            InstrumentationUtilities.disable()
+
+        assert metrics["counters"]["test.calls"] == 2 * len(primary_input_arguments)
+
+        assert metrics["timers"]["test.stage"]["count"] == 2 * len(primary_input_arguments)
+        assert metrics["timers"]["multiprocessing.task"]["count"] == 2 * len(primary_input_arguments)
+        assert metrics["timers"]["multiprocessing.output_wait"]["count"] == 2 * len(primary_input_arguments)
+
+    def test_merge_metrics(
+            self
+    ) -> None:
+        """ Test whether the merged metrics add up the counts and the totals, and keep the maximum durations. """
+
+        InstrumentationUtilities.enable()
+        InstrumentationUtilities.reset_metrics()
+
+        try:
+            InstrumentationUtilities.record_duration(
+                stage_name="test.stage",
+                duration_s=1.0
+            )
+
+            InstrumentationUtilities.merge_metrics(
+                metrics={
+                    "timers": {"test.stage": {"count": 2, "total_s": 5.0, "max_s": 4.0, }, },
+                    "counters": {"test.calls": 3, },
+                }
+            )
+
+            metrics = InstrumentationUtilities.get_metrics(
+                reset=True
+            )
+
+        finally:
+            InstrumentationUtilities.disable()
+
+        assert metrics == {
+            "timers": {"test.stage": {"count": 3, "total_s": 6.0, "max_s": 4.0, }, },
+            "counters": {"test.calls": 3, },
+        }
+
+
+class TestMetricsSinks:
+    """ The metrics sinks test class. """
+
+    metrics = {
+        "timers": {"atom_mapping": {"count": 2, "total_s": 1.5, "max_s": 1.0, }, },
+        "counters": {"cache.hits": 4, },
+    }
+
+    def test_json_lines_metrics_sink(
+            self,
+            tmp_path
+    ) -> None:
+        """ Test whether the JSON-lines metrics sink appends one timestamped snapshot of the metrics per export. """
+
+        metrics_file_path = str(tmp_path / "metrics.jsonl")
+
+        metrics_sink = JsonLinesMetricsSink(
+            file_path=metrics_file_path
+        )
+
+        for _ in range(2):
+            metrics_sink.write(
+                metrics=self.metrics
+            )
+
+        with open(metrics_file_path, mode="r") as file_handle:
+            metrics_snapshots = [loads(line) for line in file_handle]
+
+        assert len(metrics_snapshots) == 2
+
+        for metrics_snapshot in metrics_snapshots:
+            assert isinstance(metrics_snapshot.pop("timestamp"), float)
+
+            assert metrics_snapshot == self.metrics
+
+    def test_prometheus_text_metrics_sink(
+            self,
+            tmp_path
+    ) -> None:
+        """ Test whether the Prometheus text metrics sink overwrites the metrics file with the metrics per export. """
+
+        metrics_file_path = tmp_path / "metrics.prom"
+
+        metrics_sink = PrometheusTextMetricsSink(
+            file_path=str(metrics_file_path),
+            metric_name_prefix="test"
+        )
+
+        for _ in range(2):
+            metrics_sink.write(
+                metrics=self.metrics
+            )
+
+        assert metrics_file_path.read_text().splitlines() == [
+            "# TYPE test_stage_calls_total counter",
+            "test_stage_calls_total{stage=\"atom_mapping\"} 2",
+            "# TYPE test_stage_duration_seconds_total counter",
+            "test_stage_duration_seconds_total{stage=\"atom_mapping\"} 1.5",
+            "# TYPE test_stage_duration_seconds_max gauge",
+            "test_stage_duration_seconds_max{stage=\"atom_mapping\"} 1.0",
+            "# TYPE test_events_total counter",
+            "test_events_total{counter=\"cache.hits\"} 4",
+        ]
+
+        assert [file_path.name for file_path in tmp_path.iterdir()] == ["metrics.prom", ]
@@ -0,0 +1,373 @@
+""" The 'tests' package 'test_multiprocessing' module. """
+
+from os import _exit, getpid
+from threading import BoundedSemaphore, Event
+from time import sleep
+from typing import Any, Iterator, List, Optional, Tuple
+
+from pytest import raises
+
+from chemical_reaction_atom_mapping.utilities.multiprocessing import MultiprocessingUtilities
+from chemical_reaction_atom_mapping.utilities.multiprocessing.multiprocessing import (
+    _get_shared_memory_output_slot,
+    _read_shared_memory_output,
+    _shared_memory_output_record_size,
+    _write_shared_memory_output,
+)
+
+
+def _get_reversed_string_and_length(
+        primary_input_argument: Any
+) -> Tuple[Optional[str], Any]:
+    """
+    Get the reversed string and the length of a primary input argument, or a pair of None values for the primary input
+    arguments that are not strings.
+
+    :parameter primary_input_argument: The primary input argument.
+
+    :returns: The reversed string and the length of the primary input argument.
+    """
+
+    if not isinstance(primary_input_argument, str):
+        return None, None
+
+    # The varying delays make the primary input arguments complete out of their order.
+    sleep(0.001 * (len(primary_input_argument) % 3))
+
+    return primary_input_argument[::-1], float(len(primary_input_argument))
+
+
+def _get_output_of_misbehaving_procedure(
+        primary_input_argument: str
+) -> Tuple[str, int]:
+    """
+    Get the output of a processing procedure that hangs, crashes or raises an exception depending on the primary input
+    argument.
+
+    :parameter primary_input_argument: The primary input argument.
+
+    :returns: The primary input argument, and the identifier of the worker process.
+    """
+
+    if primary_input_argument == "hang":
+        sleep(60)
+
+    elif primary_input_argument == "crash":
+        _exit(1)
+
+    elif primary_input_argument == "raise":
+        raise ValueError(primary_input_argument)
+
+    return primary_input_argument, getpid()
+
+
+class TestMultiprocessingUtilities:
+    """ The multiprocessing utilities test class. """
+
+    def test_chunk_size(
+            self
+    ) -> None:
+        """ Test whether the chunk size stays between 1 and the maximum chunk size. """
+
+        assert MultiprocessingUtilities._get_chunk_size(
+            number_of_primary_input_arguments=3,
+            number_of_cpu_cores=4
+        ) == 1
+
+        assert MultiprocessingUtilities._get_chunk_size(
+            number_of_primary_input_arguments=800,
+            number_of_cpu_cores=4
+        ) == 50
+
+        assert MultiprocessingUtilities._get_chunk_size(
+            number_of_primary_input_arguments=10 ** 6,
+            number_of_cpu_cores=4
+        ) == 64
+
+        assert MultiprocessingUtilities._get_chunk_size(
+            number_of_primary_input_arguments=None,
+            number_of_cpu_cores=4
+        ) == 16
+
+    def test_process_pool_outputs_keep_the_order(
+            self
+    ) -> None:
+        """
+        Test whether the process pool returns the outputs in the order of the primary input arguments for both the
+        ordered and the unordered completion and any chunk size, including a generator of primary input arguments.
+        """
+
+        primary_input_arguments = ["C" * index for index in range(50)] + [None, "CCO>>CC=O", ]
+
+        expected_processing_procedure_outputs = [
+            _get_reversed_string_and_length(
+                primary_input_argument=primary_input_argument
+            ) for primary_input_argument in primary_input_arguments
+        ]
+
+        for use_unordered_completion in [False, True, ]:
+            for chunk_size in [None, 1, 7, ]:
+                assert list(MultiprocessingUtilities._iterate_process_pool_outputs(
+                    processing_procedure=_get_reversed_string_and_length,
+                    primary_input_arguments=(
+                        primary_input_argument for primary_input_argument in primary_input_arguments
+                    ),
+                    number_of_primary_input_arguments=None,
+                    number_of_cpu_cores=2,
+                    chunk_size=chunk_size,
+                    use_unordered_completion=use_unordered_completion,
+                    maximum_number_of_pending_input_arguments=4
+                )) == expected_processing_procedure_outputs
+
+    def test_backpressure(
+            self
+    ) -> None:
+        """
+        Test whether the primary input arguments are consumed only while the semaphore of the pending primary input
+        arguments allows it, and whether the iteration is stopped by the stop event.
+        """
+
+        consumed_primary_input_arguments = list()  # type: List[int]
+
+        def iterate_primary_input_arguments() -> Iterator[int]:
+            """ Iterate over the primary input arguments, and record which of them are consumed. """
+
+            for primary_input_argument in range(100):
+                consumed_primary_input_arguments.append(primary_input_argument)
+
+                yield primary_input_argument
+
+        pending_input_arguments_semaphore, stop_event = BoundedSemaphore(3), Event()
+
+        bounded_primary_input_arguments = MultiprocessingUtilities._iterate_with_backpressure(
+            primary_input_arguments=iterate_primary_input_arguments(),
+            pending_input_arguments_semaphore=pending_input_arguments_semaphore,
+            stop_event=stop_event
+        )
+
+        assert [next(bounded_primary_input_arguments) for _ in range(3)] == [0, 1, 2, ]
+
+        pending_input_arguments_semaphore.release()
+
+        assert next(bounded_primary_input_arguments) == 3
+
+        stop_event.set()
+
+        assert list(bounded_primary_input_arguments) == list()
+
+        assert consumed_primary_input_arguments == [0, 1, 2, 3, 4, ]
+
+    def test_timeout_process_pool_kills_and_replaces_worker_processes(
+            self
+    ) -> None:
+        """
+        Test whether the timeout process pool records the task timeout output for the primary input arguments whose
+        worker processes hang or crash, and whether the following primary input arguments are processed by the
+        replacement worker processes.
+        """
+
+        processing_procedure_outputs = MultiprocessingUtilities.run(
+            processing_procedure=_get_output_of_misbehaving_procedure,
+            primary_input_arguments=["a", "hang", "b", "crash", "c", ],
+            task_timeout_period_s=1.0,
+            task_timeout_output="timeout"
+        )
+
+        assert [
+            processing_procedure_output if isinstance(processing_procedure_output, str)
+            else processing_procedure_output[0] for processing_procedure_output in processing_procedure_outputs
+        ] == ["a", "timeout", "b", "timeout", "c", ]
+
+        assert len({
+            processing_procedure_outputs[primary_input_argument_index][1]
+            for primary_input_argument_index in [0, 2, 4, ]
+        }) == 3
+
+    def test_timeout_process_pool_propagates_exceptions(
+            self
+    ) -> None:
+        """ Test whether the exceptions of the processing procedure are raised in the parent process. """
+
+        with raises(ValueError):
+            MultiprocessingUtilities.run(
+                processing_procedure=_get_output_of_misbehaving_procedure,
+                primary_input_arguments=["a", "raise", "b", ],
+                task_timeout_period_s=10.0
+            )
+
+    def test_persistent_process_pool_reuses_worker_processes(
+            self
+    ) -> None:
+        """
+        Test whether the persistent process pool reuses its worker processes across the calls, whether it replaces only
+        the worker processes that hang, and whether the outputs of an interrupted call do not leak into the next call.
+        """
+
+        def run_processing_procedure(
+                primary_input_arguments: List[str],
+                task_timeout_period_s: Optional[float] = 10.0
+        ) -> List[Any]:
+            """
+            Run the misbehaving processing procedure with two CPU cores.
+
+            :parameter primary_input_arguments: The primary input arguments of the processing procedure.
+            :parameter task_timeout_period_s: The task timeout period.
+
+            :returns: The outputs of the processing procedure.
+            """
+
+            return list(MultiprocessingUtilities._iterate_processing_procedure_outputs(
+                processing_procedure=_get_output_of_misbehaving_procedure,
+                primary_input_arguments=primary_input_arguments,
+                number_of_primary_input_arguments=len(primary_input_arguments),
+                number_of_cpu_cores=2,
+                task_timeout_period_s=task_timeout_period_s,
+                task_timeout_output="timeout"
+            ))
+
+        MultiprocessingUtilities.enable_persistent_process_pool()
+
+        try:
+            worker_process_identifiers = list()
+
+            for primary_input_arguments in [["a", "b", "c", "d", ], ["e", "f", "g", "h", ], ]:
+                processing_procedure_outputs = run_processing_procedure(
+                    primary_input_arguments=primary_input_arguments
+                )
+
+                assert [
+                    processing_procedure_output[0] for processing_procedure_output in processing_procedure_outputs
+                ] == primary_input_arguments
+
+                worker_process_identifiers.append({
+                    processing_procedure_output[1] for processing_procedure_output in processing_procedure_outputs
+                })
+
+            assert len(worker_process_identifiers[0]) == 2
+            assert worker_process_identifiers[0] == worker_process_identifiers[1]
+
+            processing_procedure_outputs = run_processing_procedure(
+                primary_input_arguments=["hang", "i", "j", ],
+                task_timeout_period_s=1.0
+            )
+
+            assert processing_procedure_outputs[0] == "timeout"
+
+            assert len({
+                processing_procedure_output[1] for processing_procedure_output in processing_procedure_outputs[1:]
+            } & worker_process_identifiers[0]) == 1
+
+            with raises(ValueError):
+                run_processing_procedure(
+                    primary_input_arguments=["hang", "raise", ]
+                )
+
+            assert [
+                processing_procedure_output[0] for processing_procedure_output in run_processing_procedure(
+                    primary_input_arguments=["k", "l", ],
+                    task_timeout_period_s=None
+                )
+            ] == ["k", "l", ]
+
+        finally:
+            MultiprocessingUtilities.release_persistent_process_pool()
+
+    def test_shared_memory_output_slot_layout(
+            self
+    ) -> None:
+        """
+        Test whether the slots of the outputs follow the output records without overlapping each other, and whether
+        the outputs are read back as they were written.
+        """
+
+        input_argument_byte_offsets = [0, 3, 3, 10, ]
+        number_of_primary_input_arguments = len(input_argument_byte_offsets) - 1
+
+        output_slots = [
+            _get_shared_memory_output_slot(
+                input_argument_byte_offsets=(
+                    input_argument_byte_offsets[primary_input_argument_index],
+                    input_argument_byte_offsets[primary_input_argument_index + 1]
+                ),
+                primary_input_argument_index=primary_input_argument_index,
+                number_of_primary_input_arguments=number_of_primary_input_arguments
+            ) for primary_input_argument_index in range(number_of_primary_input_arguments)
+        ]
+
+        assert output_slots[0][0] == number_of_primary_input_arguments * _shared_memory_output_record_size
+
+        for output_slot, next_output_slot in zip(output_slots, output_slots[1:]):
+            assert output_slot[0] + output_slot[1] == next_output_slot[0]
+
+        output_buffer = memoryview(bytearray(output_slots[-1][0] + output_slots[-1][1]))
+
+        processing_procedure_outputs = [("[CH3:1][OH:2]", 0.5), (None, None), ("C", True), ]
+
+        for primary_input_argument_index, (output_slot, processing_procedure_output) in enumerate(zip(
+            output_slots,
+            processing_procedure_outputs
+        )):
+            assert _write_shared_memory_output(
+                output_buffer=output_buffer,
+                primary_input_argument_index=primary_input_argument_index,
+                output_slot=output_slot,
+                processing_procedure_output=processing_procedure_output
+            )
+
+        assert [
+            _read_shared_memory_output(
+                output_buffer=output_buffer,
+                primary_input_argument_index=primary_input_argument_index,
+                output_slot=output_slot
+            ) for primary_input_argument_index, output_slot in enumerate(output_slots)
+        ] == processing_procedure_outputs
+
+    def test_shared_memory_output_slot_overflow(
+            self
+    ) -> None:
+        """ Test whether the outputs that do not fit into their slots or have another form are not written. """
+
+        output_slot = _get_shared_memory_output_slot(
+            input_argument_byte_offsets=(0, 1),
+            primary_input_argument_index=0,
+            number_of_primary_input_arguments=1
+        )
+
+        output_buffer = memoryview(bytearray(output_slot[0] + output_slot[1]))
+
+        for processing_procedure_output in [("C" * (output_slot[1] + 1), 0.5), ("C", 1), "C", ]:
+            assert not _write_shared_memory_output(
+                output_buffer=output_buffer,
+                primary_input_argument_index=0,
+                output_slot=output_slot,
+                processing_procedure_output=processing_procedure_output
+            )
+
+        assert _read_shared_memory_output(
+            output_buffer=output_buffer,
+            primary_input_argument_index=0,
+            output_slot=output_slot
+        ) is None
+
+    def test_shared_memory_process_pool_outputs(
+            self
+    ) -> None:
+        """
+        Test whether the shared memory process pool returns the outputs in the order of the primary input arguments,
+        including the primary input arguments that are not strings and the empty and non-ASCII strings.
+        """
+
+        primary_input_arguments = ["CCO>>CC=O", "", None, "[2H]C>>C", "Ω" * 10, float("nan"), "C" * 1000, ]
+
+        for use_unordered_completion in [False, True, ]:
+            assert list(MultiprocessingUtilities._iterate_shared_memory_process_pool_outputs(
+                processing_procedure=_get_reversed_string_and_length,
+                primary_input_arguments=primary_input_arguments,
+                number_of_cpu_cores=2,
+                chunk_size=2,
+                use_unordered_completion=use_unordered_completion
+            )) == [
+                _get_reversed_string_and_length(
+                    primary_input_argument=primary_input_argument
+                ) for primary_input_argument in primary_input_arguments
+            ]
@@ -0,0 +1,91 @@
+""" The 'tests' package 'test_pre_validation' module. """
+
+from typing import List, Optional, Tuple
+
+from chemical_reaction_atom_mapping.utilities.pre_validation import PreValidationUtilities
+
+
+class TestPreValidationUtilities:
+    """ The chemical reaction SMILES string pre-validation utilities test class. """
+
+    def test_get_rejection_reason(
+            self
+    ) -> None:
+        """ Test whether the rejection reason codes of the chemical reaction SMILES strings are correct. """
+
+        for reaction_smiles, rejection_reason in [
+            ("CC(=O)O.CO>>COC(C)=O.O", None),
+            ("C1.C1>>CC", None),
+            ("C%(123)CC%(123)>>C%12CC%12", None),
+            ("c1ccccc1Br>[Pd]>c1ccccc1 |f:0|", None),
+            (None, "empty_reaction_smiles"),
+            (float("nan"), "empty_reaction_smiles"),
+            ("  ", "empty_reaction_smiles"),
+            ("CCO>CC=O", "invalid_reaction_smiles_format"),
+            (">>CC=O", "invalid_reaction_smiles_format"),
+            ("CC(O>>CC=O", "invalid_smiles_syntax"),
+            ("C1CC>>CC", "invalid_smiles_syntax"),
+            ("C1>>C1", "invalid_smiles_syntax"),
+            ("C%(123)CC>>C1CC1", "invalid_smiles_syntax"),
+            ("CC&O>>CC=O", "invalid_smiles_syntax"),
+        ]:
+            assert PreValidationUtilities.get_rejection_reason(
+                reaction_smiles=reaction_smiles
+            ) == rejection_reason, reaction_smiles
+
+    def test_get_rejection_reason_limits(
+            self
+    ) -> None:
+        """ Test whether the limits of the numbers of tokens, atoms and compounds are applied. """
+
+        reaction_smiles = "CC(=O)O.CO>>COC(C)=O.O"
+
+        for limits, rejection_reason in [
+            ({"maximum_number_of_tokens": 21}, None),
+            ({"maximum_number_of_tokens": 20}, "too_many_tokens"),
+            ({"maximum_number_of_atoms": 12}, None),
+            ({"maximum_number_of_atoms": 11}, "too_many_atoms"),
+            ({"maximum_number_of_compounds": 4}, None),
+            ({"maximum_number_of_compounds": 3}, "too_many_compounds"),
+        ]:
+            assert PreValidationUtilities.get_rejection_reason(
+                reaction_smiles=reaction_smiles,
+                **limits
+            ) == rejection_reason, limits
+
+    def test_run_with_pre_validation(
+            self
+    ) -> None:
+        """
+        Test whether only the accepted chemical reaction SMILES strings are mapped, and whether the rejection reason
+        codes are exposed.
+        """
+
+        mapped_reaction_smiles_batches = list()  # type: List[List[str]]
+
+        def atom_mapping_procedure(
+                reaction_smiles_strings: List[str]
+        ) -> List[Tuple[Optional[str], Optional[float]]]:
+            """
+            Map the chemical reaction SMILES strings.
+
+            :parameter reaction_smiles_strings: The chemical reaction SMILES strings.
+
+            :returns: The chemical reaction atom mapping results.
+            """
+
+            mapped_reaction_smiles_batches.append(reaction_smiles_strings)
+
+            return [("mapped:{0}".format(reaction_smiles), 1.0) for reaction_smiles in reaction_smiles_strings]
+
+        rejection_reasons = list()  # type: List[Optional[str]]
+
+        assert PreValidationUtilities.run_with_pre_validation(
+            reaction_smiles_strings=["CCO>>CC=O", None, "C1>>C", "CO>>C=O", ],
+            atom_mapping_procedure=atom_mapping_procedure,
+            rejection_reasons=rejection_reasons
+        ) == [("mapped:CCO>>CC=O", 1.0), (None, None), (None, None), ("mapped:CO>>C=O", 1.0), ]
+
+        assert mapped_reaction_smiles_batches == [["CCO>>CC=O", "CO>>C=O", ], ]
+
+        assert rejection_reasons == [None, "empty_reaction_smiles", "invalid_smiles_syntax", None, ]
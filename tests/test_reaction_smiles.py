@@ -0,0 +1,85 @@
+""" The 'tests' package 'test_reaction_smiles' module. """
+
+from pytest import importorskip
+
+from chemical_reaction_atom_mapping.utilities.reaction_smiles import ReactionSmilesUtilities
+
+
+class TestReactionSmilesUtilities:
+    """ The chemical reaction SMILES string utilities test class. """
+
+    def test_tokenize_reaction_smiles(
+            self
+    ) -> None:
+        """
+        Test whether the tokenization covers each character of the chemical reaction SMILES strings, including the
+        three-digit ring closures and the fragment grouping characters that are also tokenized by the RXNMapper library.
+        """
+
+        for reaction_smiles, reaction_smiles_tokens in [
+            ("CC(=O)O.CO>>COC(C)=O.O", [
+                "C", "C", "(", "=", "O", ")", "O", ".", "C", "O", ">>",
+                "C", "O", "C", "(", "C", ")", "=", "O", ".", "O",
+            ]),
+            ("[NH4+].Cl[Pd]Cl>>C%10CC%10", [
+                "[NH4+]", ".", "Cl", "[Pd]", "Cl", ">>", "C", "%10", "C", "C", "%10",
+            ]),
+            ("C%(123)CC%(123)|Br>>C", [
+                "C", "%(123)", "C", "C", "%(123)", "|", "Br", ">>", "C",
+            ]),
+        ]:
+            assert ReactionSmilesUtilities.tokenize_reaction_smiles(
+                reaction_smiles=reaction_smiles
+            ) == reaction_smiles_tokens
+
+            assert ReactionSmilesUtilities.get_number_of_reaction_smiles_tokens(
+                reaction_smiles=reaction_smiles
+            ) == len(reaction_smiles_tokens)
+
+    def test_get_canonical_reaction_smiles(
+            self
+    ) -> None:
+        """ Test whether the order of the compounds within the reaction roles does not change the canonical form. """
+
+        assert ReactionSmilesUtilities.get_canonical_reaction_smiles(
+            reaction_smiles="CO.CC(=O)O>>COC(C)=O.O"
+        ) == ReactionSmilesUtilities.get_canonical_reaction_smiles(
+            reaction_smiles="CC(=O)O.CO>>O.COC(C)=O"
+        )
+
+    def test_get_bond_changes_of_different_library_outputs(
+            self
+    ) -> None:
+        """
+        Test whether the RXNMapper library style output, which moves the unmapped agents into the reactants, and the
+        EPAM Indigo library style output of the same chemical reaction describe the same bond changes.
+        """
+
+        importorskip("rdkit")
+
+        rxnmapper_bond_changes = ReactionSmilesUtilities.get_bond_changes(
+            mapped_reaction_smiles="O=S(=O)(O)O.[CH3:1][C:2](=[O:3])[OH:4].[CH3:5][OH:6]>>"
+                                   "[CH3:1][C:2](=[O:3])[O:6][CH3:5].[OH2:4]"
+        )
+
+        epam_indigo_bond_changes = ReactionSmilesUtilities.get_bond_changes(
+            mapped_reaction_smiles="[CH3:6][OH:5].[CH3:1][C:2]([OH:3])=[O:4]>OS(=O)(=O)O>"
+                                   "[CH3:1][C:2](=[O:4])[O:5][CH3:6].[OH2:3]"
+        )
+
+        assert rxnmapper_bond_changes is not None
+        assert len(rxnmapper_bond_changes) == 2
+        assert rxnmapper_bond_changes == epam_indigo_bond_changes
+
+    def test_get_bond_changes_of_different_atom_mappings(
+            self
+    ) -> None:
+        """ Test whether the atom mappings of the same chemical reaction with different bond changes disagree. """
+
+        importorskip("rdkit")
+
+        assert ReactionSmilesUtilities.get_bond_changes(
+            mapped_reaction_smiles="[CH3:1][C:2](=[O:3])[OH:4].[CH3:5][OH:6]>>[CH3:1][C:2](=[O:3])[O:6][CH3:5].[OH2:4]"
+        ) != ReactionSmilesUtilities.get_bond_changes(
+            mapped_reaction_smiles="[CH3:1][C:2](=[O:3])[OH:4].[CH3:5][OH:6]>>[CH3:1][C:2](=[O:3])[O:4][CH3:5].[OH2:6]"
+        )
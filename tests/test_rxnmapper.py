@@ -0,0 +1,201 @@
+""" The 'tests' package 'test_rxnmapper' module. """
+
+from collections import Counter
+from os import getpid, kill
+from signal import SIGKILL
+from typing import Any, Dict, List
+
+from pytest import importorskip
+
+from chemical_reaction_atom_mapping.rxnmapper import RxnMapperReactionAtomMappingUtilities
+from chemical_reaction_atom_mapping.utilities.reaction_smiles import ReactionSmilesUtilities
+
+
+class _FailingRxnMapperModel:
+    """ The RXNMapper model test double class, which fails for any batch that contains an 'X' character. """
+
+    def __init__(
+            self
+    ) -> None:
+        """ The constructor method of the class. """
+
+        self.batch_sizes = list()  # type: List[int]
+
+    def get_attention_guided_atom_maps(
+            self,
+            rxns: List[str],
+            **kwargs
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the atom mapping outputs of a batch of chemical reaction SMILES strings.
+
+        :parameter rxns: The batch of chemical reaction SMILES strings.
+        :parameter kwargs: The keyword arguments of the RXNMapper model, which are ignored.
+
+        :returns: The atom mapping outputs of the batch of chemical reaction SMILES strings.
+        """
+
+        self.batch_sizes.append(len(rxns))
+
+        if any("X" in reaction_smiles for reaction_smiles in rxns):
+            raise RuntimeError("The batch contains an offending chemical reaction SMILES string.")
+
+        return [{"mapped_rxn": "mapped:{0}".format(reaction_smiles), "confidence": 0.5} for reaction_smiles in rxns]
+
+
+class _CrashingRxnMapperModel:
+    """
+    The RXNMapper model test double class, which kills its worker process for any batch that contains an 'X' character,
+    but maps it in the process that constructed it.
+    """
+
+    def __init__(
+            self
+    ) -> None:
+        """ The constructor method of the class. """
+
+        self.process_id = getpid()
+
+    def get_attention_guided_atom_maps(
+            self,
+            rxns: List[str],
+            **kwargs
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the atom mapping outputs of a batch of chemical reaction SMILES strings.
+
+        :parameter rxns: The batch of chemical reaction SMILES strings.
+        :parameter kwargs: The keyword arguments of the RXNMapper model, which are ignored.
+
+        :returns: The atom mapping outputs of the batch of chemical reaction SMILES strings.
+        """
+
+        if getpid() != self.process_id and any("X" in reaction_smiles for reaction_smiles in rxns):
+            kill(getpid(), SIGKILL)
+
+        return [{"mapped_rxn": "mapped:{0}".format(reaction_smiles), "confidence": 0.5} for reaction_smiles in rxns]
+
+
+class TestRxnMapperReactionAtomMappingUtilities:
+    """ The RXNMapper library chemical reaction atom mapping utilities test class. """
+
+    def test_failed_batches_are_bisected(
+            self
+    ) -> None:
+        """
+        Test whether a failed batch is split in halves until only the offending chemical reaction SMILES strings fail,
+        and whether the order of the outputs is kept.
+        """
+
+        reaction_smiles_batch = ["C{0}O>>C{0}=O".format("C" * index) for index in range(8)]
+        reaction_smiles_batch[5] = "CX>>C"
+
+        rxnmapper_model = _FailingRxnMapperModel()
+        atom_mapping_statistics = Counter()
+
+        assert RxnMapperReactionAtomMappingUtilities._run_atom_mapping_on_reaction_smiles_batch(
+            rxnmapper_model=rxnmapper_model,
+            reaction_smiles_batch=reaction_smiles_batch,
+            atom_mapping_statistics=atom_mapping_statistics
+        ) == [
+            ("mapped:{0}".format(reaction_smiles), 0.5) if "X" not in reaction_smiles else (None, None)
+            for reaction_smiles in reaction_smiles_batch
+        ]
+
+        assert rxnmapper_model.batch_sizes == [8, 4, 4, 2, 1, 1, 2, ]
+
+        assert atom_mapping_statistics == Counter({"retried": 8 + 4 + 2, "failed": 1})
+
+    def test_token_budget_batches(
+            self
+    ) -> None:
+        """
+        Test whether the token budget batches cover each chemical reaction SMILES string once in the order of the
+        number of tokens, and whether each batch fits into the token budget unless it is a single chemical reaction
+        SMILES string that exceeds the token budget on its own.
+        """
+
+        reaction_smiles_strings = ["C{0}O>>C{0}=O".format("C" * (index * 7 % 11)) for index in range(20)]
+        reaction_smiles_strings.append("C" * 100 + ">>C")
+
+        rxnmapper_model_batch_token_budget = 60
+
+        reaction_smiles_batches = list(
+            RxnMapperReactionAtomMappingUtilities._get_reaction_smiles_batches_by_token_budget(
+                reaction_smiles_strings=reaction_smiles_strings,
+                rxnmapper_model_batch_token_budget=rxnmapper_model_batch_token_budget
+            )
+        )
+
+        reaction_smiles_indices = [
+            reaction_smiles_index for reaction_smiles_batch in reaction_smiles_batches
+            for reaction_smiles_index, _ in reaction_smiles_batch
+        ]
+
+        assert sorted(reaction_smiles_indices) == list(range(len(reaction_smiles_strings)))
+
+        reaction_smiles_lengths = [
+            ReactionSmilesUtilities.get_number_of_reaction_smiles_tokens(
+                reaction_smiles=reaction_smiles_strings[reaction_smiles_index]
+            ) + 2 for reaction_smiles_index in reaction_smiles_indices
+        ]
+
+        assert reaction_smiles_lengths == sorted(reaction_smiles_lengths)
+
+        for reaction_smiles_batch in reaction_smiles_batches:
+            assert all(
+                reaction_smiles == reaction_smiles_strings[reaction_smiles_index]
+                for reaction_smiles_index, reaction_smiles in reaction_smiles_batch
+            )
+
+            assert len(reaction_smiles_batch) == 1 or len(reaction_smiles_batch) * max(
+                ReactionSmilesUtilities.get_number_of_reaction_smiles_tokens(
+                    reaction_smiles=reaction_smiles
+                ) + 2 for _, reaction_smiles in reaction_smiles_batch
+            ) <= rxnmapper_model_batch_token_budget
+
+        assert reaction_smiles_batches[-1] == [(len(reaction_smiles_strings) - 1, reaction_smiles_strings[-1]), ]
+
+    def test_unfinished_batches_are_mapped_after_a_worker_process_crash(
+            self,
+            monkeypatch
+    ) -> None:
+        """
+        Test whether the batches that were finished before a worker process terminated abruptly are kept, and whether
+        only the unfinished batches are mapped in the current process.
+        """
+
+        importorskip("torch")
+
+        rxnmapper_model = _CrashingRxnMapperModel()
+
+        monkeypatch.setattr(
+            RxnMapperReactionAtomMappingUtilities,
+            "get_rxnmapper_model",
+            staticmethod(lambda **kwargs: rxnmapper_model)
+        )
+
+        reaction_smiles_strings = ["C{0}O>>C{0}=O".format("C" * index) for index in range(8)]
+        reaction_smiles_strings[5] = "CX>>C"
+
+        reaction_smiles_batches = list(RxnMapperReactionAtomMappingUtilities._get_reaction_smiles_batches_by_size(
+            reaction_smiles_strings=reaction_smiles_strings,
+            rxnmapper_model_batch_size=2
+        ))
+
+        indexed_atom_mapping_results = [
+            indexed_atom_mapping_result
+            for batch_indexed_atom_mapping_results in
+            RxnMapperReactionAtomMappingUtilities._iterate_data_parallel_atom_mapping_results(
+                reaction_smiles_batches=reaction_smiles_batches,
+                number_of_cpu_cores=2,
+                rxnmapper_model_configuration=None,
+                rxnmapper_model_quantization=None,
+                atom_mapping_statistics=Counter()
+            ) for indexed_atom_mapping_result in batch_indexed_atom_mapping_results
+        ]
+
+        assert sorted(indexed_atom_mapping_results) == [
+            (reaction_smiles_index, ("mapped:{0}".format(reaction_smiles), 0.5))
+            for reaction_smiles_index, reaction_smiles in enumerate(reaction_smiles_strings)
+        ]
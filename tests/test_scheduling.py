@@ -0,0 +1,176 @@
+""" The 'tests' package 'test_scheduling' module. """
+
+from threading import current_thread
+from typing import Any, Dict, List, Optional, Tuple
+
+from chemical_reaction_atom_mapping.utilities.reaction_smiles import ReactionSmilesUtilities
+from chemical_reaction_atom_mapping.utilities.scheduling import SchedulingUtilities
+
+
+class _RecordingAtomMappingProcedure:
+    """ The chemical reaction atom mapping procedure test double class, which records the lanes that it maps. """
+
+    def __init__(
+            self,
+            fails: bool = False
+    ) -> None:
+        """
+        The constructor method of the class.
+
+        :parameter fails: The indicator whether the chemical reaction atom mapping procedure fails on the whole lane.
+        """
+
+        self.fails = fails
+
+        self.lanes = list()  # type: List[Dict[str, Any]]
+
+    def __call__(
+            self,
+            reaction_smiles_strings: List[str],
+            number_of_cpu_cores: int,
+            task_timeout_period_s: Optional[float]
+    ) -> Optional[List[Tuple[Optional[str], Any]]]:
+        """
+        Map a lane of chemical reaction SMILES strings.
+
+        :parameter reaction_smiles_strings: The chemical reaction SMILES strings of the lane.
+        :parameter number_of_cpu_cores: The number of CPU cores of the lane.
+        :parameter task_timeout_period_s: The task timeout period of the lane.
+
+        :returns: The chemical reaction atom mapping results of the lane.
+        """
+
+        self.lanes.append({
+            "reaction_smiles_strings": reaction_smiles_strings,
+            "number_of_cpu_cores": number_of_cpu_cores,
+            "task_timeout_period_s": task_timeout_period_s,
+            "thread_name": current_thread().name,
+        })
+
+        if self.fails:
+            return None
+
+        return [("mapped:{0}".format(reaction_smiles), 1.0) for reaction_smiles in reaction_smiles_strings]
+
+
+class TestSchedulingUtilities:
+    """ The cost-based chemical reaction SMILES string scheduling utilities test class. """
+
+    reaction_smiles_strings = [
+        "CO>>C=O",
+        "c1ccc2ccccc2c1CCCCCCCCCC(=O)O.OCCCCCCCCCCCC>>c1ccc2ccccc2c1CCCCCCCCCC(=O)OCCCCCCCCCCCC.O",
+        "CCO>>CC=O",
+        "CCCCCCCCCCCCCCCCCC(=O)O.OCC>>CCCCCCCCCCCCCCCCCC(=O)OCC.O",
+        "C>>C",
+    ]
+
+    def get_reaction_cost_estimates(
+            self
+    ) -> List[float]:
+        """
+        Get the cost estimates of the chemical reaction SMILES strings.
+
+        :returns: The cost estimates of the chemical reaction SMILES strings.
+        """
+
+        return [
+            ReactionSmilesUtilities.get_reaction_cost_estimate(
+                reaction_smiles=reaction_smiles
+            ) for reaction_smiles in self.reaction_smiles_strings
+        ]
+
+    def test_lanes_are_split_and_the_order_is_restored(
+            self
+    ) -> None:
+        """
+        Test whether the chemical reaction SMILES strings are split into the heavy and the regular lane by the cost
+        threshold, whether each lane is dispatched from the most to the least expensive chemical reaction SMILES
+        string, and whether the results are restored to the order of the chemical reaction SMILES strings.
+        """
+
+        reaction_cost_estimates = self.get_reaction_cost_estimates()
+
+        atom_mapping_procedure = _RecordingAtomMappingProcedure()
+
+        assert SchedulingUtilities.run_with_cost_based_scheduling(
+            reaction_smiles_strings=self.reaction_smiles_strings,
+            atom_mapping_procedure=atom_mapping_procedure,
+            number_of_cpu_cores=4,
+            task_timeout_period_s=5.0,
+            heavy_reaction_cost_threshold=sorted(reaction_cost_estimates)[-2],
+            heavy_reaction_task_timeout_period_s=50.0
+        ) == [("mapped:{0}".format(reaction_smiles), 1.0) for reaction_smiles in self.reaction_smiles_strings]
+
+        assert [
+            (lane["reaction_smiles_strings"], lane["number_of_cpu_cores"], lane["task_timeout_period_s"], )
+            for lane in atom_mapping_procedure.lanes
+        ] == [
+            ([self.reaction_smiles_strings[1], self.reaction_smiles_strings[3], ], 4, 50.0, ),
+            (sorted(
+                [self.reaction_smiles_strings[index] for index in [0, 2, 4, ]],
+                key=lambda reaction_smiles: -reaction_cost_estimates[self.reaction_smiles_strings.index(
+                    reaction_smiles
+                )]
+            ), 4, 5.0, ),
+        ]
+
+        atom_mapping_procedure = _RecordingAtomMappingProcedure()
+
+        SchedulingUtilities.run_with_cost_based_scheduling(
+            reaction_smiles_strings=self.reaction_smiles_strings,
+            atom_mapping_procedure=atom_mapping_procedure
+        )
+
+        assert [len(lane["reaction_smiles_strings"]) for lane in atom_mapping_procedure.lanes] == [5, ]
+
+    def test_lanes_are_run_concurrently_only_in_worker_processes(
+            self
+    ) -> None:
+        """
+        Test whether the lanes are run concurrently only if both of them run in worker processes, and whether the heavy
+        lane is run first with all of the CPU cores otherwise.
+        """
+
+        heavy_reaction_cost_threshold = max(self.get_reaction_cost_estimates())
+
+        for number_of_cpu_cores, task_timeout_period_s, heavy_reaction_task_timeout_period_s, lanes in [
+            (3, 5.0, 50.0, [("heavy_reaction_lane", 1, 50.0, ), ("MainThread", 2, 5.0, ), ], ),
+            (3, 5.0, None, [("heavy_reaction_lane", 1, 5.0, ), ("MainThread", 2, 5.0, ), ], ),
+            (3, None, None, [("MainThread", 3, None, ), ("MainThread", 3, None, ), ], ),
+            (2, None, 50.0, [("MainThread", 2, 50.0, ), ("MainThread", 2, None, ), ], ),
+            (1, 5.0, 50.0, [("MainThread", 1, 50.0, ), ("MainThread", 1, 5.0, ), ], ),
+        ]:
+            atom_mapping_procedure = _RecordingAtomMappingProcedure()
+
+            SchedulingUtilities.run_with_cost_based_scheduling(
+                reaction_smiles_strings=self.reaction_smiles_strings,
+                atom_mapping_procedure=atom_mapping_procedure,
+                number_of_cpu_cores=number_of_cpu_cores,
+                task_timeout_period_s=task_timeout_period_s,
+                heavy_reaction_cost_threshold=heavy_reaction_cost_threshold,
+                heavy_reaction_task_timeout_period_s=heavy_reaction_task_timeout_period_s,
+                run_lanes_concurrently=True
+            )
+
+            assert sorted((
+                (lane["thread_name"].split("_0")[0], lane["number_of_cpu_cores"], lane["task_timeout_period_s"], )
+                for lane in atom_mapping_procedure.lanes
+            ), key=str) == sorted(lanes, key=str), number_of_cpu_cores
+
+            if lanes[0][0] == "MainThread":
+                assert atom_mapping_procedure.lanes[0]["reaction_smiles_strings"] == [
+                    self.reaction_smiles_strings[1],
+                ]
+
+    def test_failed_lane(
+            self
+    ) -> None:
+        """ Test whether the chemical reaction atom mapping results are None if a lane fails. """
+
+        assert SchedulingUtilities.run_with_cost_based_scheduling(
+            reaction_smiles_strings=self.reaction_smiles_strings,
+            atom_mapping_procedure=_RecordingAtomMappingProcedure(
+                fails=True
+            ),
+            heavy_reaction_cost_threshold=max(self.get_reaction_cost_estimates())
+        ) is None
@@ -0,0 +1,169 @@
+""" The 'tests' package 'test_server' module. """
+
+from asyncio import CancelledError, current_task, get_running_loop, run
+from os import getpid
+from os.path import exists
+from threading import Thread
+from time import sleep
+from typing import Any, List, Optional, Tuple
+
+from chemical_reaction_atom_mapping.server import AtomMappingClient, AtomMappingServer
+from chemical_reaction_atom_mapping.utilities.atom_mapper import ReactionAtomMapper
+from chemical_reaction_atom_mapping.utilities.backend_registry import BackendRegistryUtilities
+
+
+class _StubReactionAtomMapper(ReactionAtomMapper):
+    """
+    The stub chemical reaction atom mapper test double class, which reverses the chemical reaction SMILES and records
+    the sizes of the micro-batches.
+    """
+
+    library = "stub"
+    library_display_name = "Stub"
+
+    honours_task_timeout = True
+
+    micro_batch_sizes = list()  # type: List[int]
+
+    def map_one(
+            self,
+            reaction_smiles: str
+    ) -> Tuple[Optional[str], Any]:
+        """
+        Map a chemical reaction SMILES string.
+
+        :parameter reaction_smiles: The chemical reaction SMILES string.
+
+        :returns: The reversed chemical reaction SMILES string, and the identifier of the worker process.
+        """
+
+        return reaction_smiles[::-1], getpid()
+
+    def map_batch(
+            self,
+            reaction_smiles_strings: List[str],
+            **kwargs
+    ) -> List[Tuple[Optional[str], Any]]:
+        """
+        Map a micro-batch of chemical reaction SMILES strings, and record its size.
+
+        :parameter reaction_smiles_strings: The chemical reaction SMILES strings of the micro-batch.
+        :parameter kwargs: The keyword arguments of the 'map_batch' method of the base class.
+
+        :returns: The mapped chemical reaction SMILES strings, and the identifiers of the worker processes.
+        """
+
+        _StubReactionAtomMapper.micro_batch_sizes.append(len(reaction_smiles_strings))
+
+        return super().map_batch(
+            reaction_smiles_strings=reaction_smiles_strings,
+            **kwargs
+        )
+
+
+class TestAtomMappingServer:
+    """ The chemical reaction atom mapping server test class. """
+
+    def test_micro_batches_reuse_the_worker_processes(
+            self,
+            monkeypatch,
+            tmp_path,
+            capfd
+    ) -> None:
+        """
+        Test whether the pipelined requests are mapped in micro-batches of at most the maximum batch size and answered
+        in their order, whether the worker processes of the library are reused by all of the micro-batches, and
+        whether no progress bars are written.
+        """
+
+        monkeypatch.setattr(BackendRegistryUtilities, "_backends", dict(BackendRegistryUtilities._backends))
+        monkeypatch.setattr(BackendRegistryUtilities, "_atom_mapper_classes", dict())
+        monkeypatch.setattr(BackendRegistryUtilities, "_are_plugin_backends_discovered", True)
+        monkeypatch.setattr(_StubReactionAtomMapper, "micro_batch_sizes", list())
+
+        BackendRegistryUtilities.register_backend(
+            library="stub",
+            module_name=__name__,
+            class_name="_StubReactionAtomMapper"
+        )
+
+        socket_file_path = str(tmp_path / "server.sock")
+
+        atom_mapping_server = AtomMappingServer(
+            libraries=["stub", ],
+            maximum_batch_size=4,
+            maximum_batch_wait_time_ms=50.0,
+            number_of_cpu_cores=2,
+            task_timeout_period_s=10.0
+        )
+
+        server_tasks = list()
+
+        async def serve() -> None:
+            """ Record the event loop and the task of the server, and serve the requests until it is cancelled. """
+
+            server_tasks.append((get_running_loop(), current_task(), ))
+
+            await atom_mapping_server.serve(
+                server_address="unix:{0}".format(socket_file_path)
+            )
+
+        def run_server() -> None:
+            """ Run the server in a new event loop until it is cancelled. """
+
+            try:
+                run(serve())
+
+            except CancelledError:
+                pass
+
+        server_thread = Thread(
+            target=run_server,
+            daemon=True
+        )
+
+        server_thread.start()
+
+        try:
+            for _ in range(100):
+                if exists(socket_file_path):
+                    break
+
+                sleep(0.1)
+
+            atom_mapping_client = AtomMappingClient(
+                server_address="unix:{0}".format(socket_file_path),
+                timeout_period_s=30.0
+            )
+
+            atom_mapping_results = list()
+
+            for reaction_smiles_strings in [["C" * index + ">>O" for index in range(1, 11)], ["CCO>>CC=O", ], ]:
+                atom_mapping_results.append(atom_mapping_client.run_atom_mapping_on_reaction_smiles_strings(
+                    library="stub",
+                    reaction_smiles_strings=reaction_smiles_strings
+                ))
+
+                assert [
+                    mapped_reaction_smiles for mapped_reaction_smiles, _ in atom_mapping_results[-1]
+                ] == [reaction_smiles[::-1] for reaction_smiles in reaction_smiles_strings]
+
+        finally:
+            event_loop, server_task = server_tasks[0]
+
+            event_loop.call_soon_threadsafe(server_task.cancel)
+
+            server_thread.join(timeout=10.0)
+
+        assert len(_StubReactionAtomMapper.micro_batch_sizes) >= 5
+        assert max(_StubReactionAtomMapper.micro_batch_sizes) <= 4
+
+        worker_process_identifiers = {
+            worker_process_identifier for atom_mapping_results_of_call in atom_mapping_results
+            for _, worker_process_identifier in atom_mapping_results_of_call
+        }
+
+        assert getpid() not in worker_process_identifiers
+        assert len(worker_process_identifiers) <= 2
+
+        assert "it/s" not in capfd.readouterr().err
@@ -0,0 +1,115 @@
+""" The 'tests' package 'test_spectator_compounds' module. """
+
+from typing import List, Optional, Tuple
+
+from chemical_reaction_atom_mapping.utilities.spectator_compounds import SpectatorCompoundUtilities
+
+
+class TestSpectatorCompoundUtilities:
+    """ The chemical reaction spectator compound utilities test class. """
+
+    def test_strip_spectator_compounds(
+            self
+    ) -> None:
+        """
+        Test whether the unchanged chemical compounds and the known reagents are stripped by their canonical forms, and
+        whether at least one reactant and one product are always kept.
+        """
+
+        for reaction_smiles, strip_unchanged_compounds, reagent_smiles_strings, stripped_reaction_smiles in [
+            (
+                "CCO.O.CC(C)=O>[Pd]>CC=O.O",
+                True,
+                ["CC(=O)C", "[Pd]", ],
+                ("CCO>>CC=O", (["O", "CC(C)=O", ], ["[Pd]", ], ["O", ], )),
+            ),
+            (
+                "CCO.O.CC(C)=O>[Pd]>CC=O.O",
+                False,
+                ["CC(=O)C", ],
+                ("CCO.O>[Pd]>CC=O.O", (["CC(C)=O", ], list(), list(), )),
+            ),
+            (
+                "CCO.O>>CC=O.O",
+                False,
+                None,
+                ("CCO.O>>CC=O.O", None),
+            ),
+            (
+                "O>>O",
+                True,
+                ["O", ],
+                ("O>>O", None),
+            ),
+            (
+                "CCO.O>[Pd]>CC=O.O |f:0.1|",
+                True,
+                ["[Pd]", ],
+                ("CCO.O>[Pd]>CC=O.O |f:0.1|", None),
+            ),
+        ]:
+            assert SpectatorCompoundUtilities.strip_spectator_compounds(
+                reaction_smiles=reaction_smiles,
+                strip_unchanged_compounds=strip_unchanged_compounds,
+                reagent_smiles_strings=reagent_smiles_strings
+            ) == stripped_reaction_smiles, reaction_smiles
+
+    def test_restore_spectator_compounds(
+            self
+    ) -> None:
+        """
+        Test whether the stripped chemical compounds are restored in their reaction roles without the atom map numbers.
+        """
+
+        assert SpectatorCompoundUtilities.restore_spectator_compounds(
+            mapped_reaction_smiles="[CH3:1][CH2:2][OH:3]>>[CH3:1][CH:2]=[O:3]",
+            stripped_compound_smiles=(["[OH2:4]", "CC(C)=O", ], ["[Pd]", ], ["O", ], )
+        ) == "[CH3:1][CH2:2][OH:3].[OH2].CC(C)=O>[Pd]>[CH3:1][CH:2]=[O:3].O"
+
+        assert SpectatorCompoundUtilities.restore_spectator_compounds(
+            mapped_reaction_smiles="[CH3:1][OH:2]>>[CH2:1]=[O:2] |f:0.1|",
+            stripped_compound_smiles=(list(), list(), ["O", ], )
+        ) == "[CH3:1][OH:2]>>[CH2:1]=[O:2].O"
+
+    def test_run_with_spectator_compound_stripping(
+            self
+    ) -> None:
+        """
+        Test whether the atom mapping procedure receives the stripped chemical reaction SMILES strings, and whether the
+        spectator chemical compounds are restored in the order of the chemical reaction SMILES strings.
+        """
+
+        mapped_reaction_smiles_batches = list()  # type: List[List[str]]
+
+        def atom_mapping_procedure(
+                reaction_smiles_strings: List[str]
+        ) -> List[Tuple[Optional[str], Optional[float]]]:
+            """
+            Map the chemical reaction SMILES strings.
+
+            :parameter reaction_smiles_strings: The chemical reaction SMILES strings.
+
+            :returns: The unchanged chemical reaction SMILES strings as the chemical reaction atom mapping results.
+            """
+
+            mapped_reaction_smiles_batches.append(reaction_smiles_strings)
+
+            return [
+                (reaction_smiles, 1.0) if isinstance(reaction_smiles, str) else (None, None)
+                for reaction_smiles in reaction_smiles_strings
+            ]
+
+        assert SpectatorCompoundUtilities.run_with_spectator_compound_stripping(
+            reaction_smiles_strings=["CCO.O>[Na+].[Cl-]>CC=O.O", None, "CCO>>CC=O", ],
+            atom_mapping_procedure=atom_mapping_procedure,
+            strip_unchanged_compounds=True,
+            reagent_smiles_strings=["[Cl-]", ]
+        ) == [("CCO.O>[Na+].[Cl-]>CC=O.O", 1.0), (None, None), ("CCO>>CC=O", 1.0), ]
+
+        assert mapped_reaction_smiles_batches == [["CCO>[Na+]>CC=O", None, "CCO>>CC=O", ], ]
+
+        assert SpectatorCompoundUtilities.run_with_spectator_compound_stripping(
+            reaction_smiles_strings=["C.O>>C.O", ],
+            atom_mapping_procedure=lambda reaction_smiles_strings: None,
+            strip_unchanged_compounds=True
+        ) is None